@@ -0,0 +1,31 @@
+"""
+《暗夜割草者：深渊轮回》 — 滚动网格背景
+========================================
+网格按分辨率预渲染成一张比屏幕各大一个格距的贴图,
+每帧只按 (偏移 mod 格距) 整张 blit 一次, 不再逐条 draw.line。
+分辨率变化时重新生成 (game_main.apply_display_settings)。
+========================================
+"""
+
+import pygame
+
+
+class GridTile:
+    def __init__(self, width, height, grid, bg_color, line_color):
+        self.size = (width, height)
+        self.grid = grid
+        surf = pygame.Surface((width + grid, height + grid))
+        surf.fill(bg_color)
+        tw, th = surf.get_size()
+        for x in range(0, tw, grid):
+            pygame.draw.line(surf, line_color, (x, 0), (x, th), 1)
+        for y in range(0, th, grid):
+            pygame.draw.line(surf, line_color, (0, y), (tw, y), 1)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        self.surface = surf
+
+    def draw(self, surface, ox, oy):
+        """ox/oy 为网格线的像素偏移 (任意整数, 内部取模)"""
+        g = self.grid
+        surface.blit(self.surface, (ox % g - g, oy % g - g))
@@ -0,0 +1,212 @@
+"""
+战斗热路径基准用例
+========================================
+每个用例是 (name, setup, run):
+  setup()      -> state   每轮重新构造, 不计入耗时
+  run(state)              被计时的热路径调用
+所有随机数据使用固定种子, 保证各轮/各机器输入一致。
+========================================
+"""
+
+import math
+import random
+
+import game_main as gm
+import boss as boss_module
+
+ENEMY_COUNTS = (100, 500, 2000)
+SEED = 20240601
+
+
+# ============================================================
+#  场景构造
+# ============================================================
+def _make_enemies(n, rng, radius=600):
+    """在玩家(屏幕中心)周围撒 n 个敌人"""
+    cx, cy = gm.WIDTH // 2, gm.HEIGHT // 2
+    out = []
+    for i in range(n):
+        a = rng.uniform(0, math.pi * 2)
+        r = rng.uniform(20, radius)
+        e = gm.Enemy(cx + math.cos(a) * r, cy + math.sin(a) * r,
+                     rng.randrange(len(gm.ENEMY_TYPES)), 1.0)
+        e.health = 1e9  # 避免死亡分支干扰计时
+        e.max_health = e.health
+        out.append(e)
+    return out
+
+
+def _ensure_run():
+    """boss 模块需要 player 引用, 复用 init_run 注入"""
+    if gm.run.character is None:
+        gm.init_run(0)
+
+
+def _weapon_ready(cls, enemies, rng):
+    """构造一件处于'攻击生效'状态的武器"""
+    w = cls()
+    w.level = 5
+    px, py = gm.WIDTH // 2, gm.HEIGHT // 2
+    if isinstance(w, gm.HolyWhip):
+        w._swing_active = True
+        w._swing_timer = 0.3
+        w._swing_angle = 0.0
+    elif isinstance(w, gm.IceNova):
+        w._nova_active = True
+        w._nova_max = 400
+        w._nova_radius = 250
+    elif isinstance(w, gm.LightningCircle):
+        for _ in range(6):
+            e = rng.choice(enemies)
+            w._circles.append({'x': e.x, 'y': e.y, 'timer': 2.0,
+                               'radius': 110, 'hit_cd': 0})
+    elif isinstance(w, gm.EarthSpikes):
+        for _ in range(8):
+            e = rng.choice(enemies)
+            w._spikes.append({'x': e.x, 'y': e.y, 'timer': 0.4,
+                              'phase': 'spike', 'hit': False})
+    elif isinstance(w, gm.BoneShield):
+        w._rebuild()
+    else:
+        # 投射物类武器: 在场上铺 30 发
+        for _ in range(30):
+            a = rng.uniform(0, math.pi * 2)
+            r = rng.uniform(0, 500)
+            proj = {
+                'x': px + math.cos(a) * r, 'y': py + math.sin(a) * r,
+                'vx': 0, 'vy': 0, 'life': 3.0,
+                'damage': 20, 'radius': 12, 'pierce': 3,
+                'hit': False,
+            }
+            if isinstance(w, gm.Boomerang):
+                proj.update({'pierce': 999, 'phase': 'out', 'spin': 0,
+                             '_hit_ids': set(), 'start_x': px, 'start_y': py})
+            w.projectiles.append(proj)
+    return w
+
+
+# ============================================================
+#  用例
+# ============================================================
+def _case_check_hits(cls, n):
+    def setup():
+        gm.particles.clear()
+        rng = random.Random(SEED + n)
+        enemies = _make_enemies(n, rng)
+        return _weapon_ready(cls, enemies, rng), enemies
+
+    if cls is gm.BoneShield:
+        # 骨盾的命中判定写在 update 里, check_hits 恒为空
+        def run(state):
+            w, enemies = state
+            w.update(1 / 60, gm.WIDTH // 2, gm.HEIGHT // 2, enemies)
+    else:
+        def run(state):
+            w, enemies = state
+            w.check_hits(enemies)
+    return f"check_hits/{cls.__name__}/{n}", setup, run
+
+
+def _case_enemy_update(n):
+    def setup():
+        return _make_enemies(n, random.Random(SEED))
+
+    def run(enemies):
+        px, py = gm.WIDTH // 2, gm.HEIGHT // 2
+        for e in enemies:
+            e.update(1 / 60, px, py, 60.0)
+    return f"enemy_update/{n}", setup, run
+
+
+def _case_create_particles():
+    def setup():
+        gm.particles.clear()
+        return None
+
+    def run(_):
+        for i in range(100):
+            gm.create_particles(100 + i, 100, 20, 'explosion')
+    return "create_particles/100x20", setup, run
+
+
+def _case_particle_update(n):
+    def setup():
+        random.seed(SEED)
+        gm.particles.clear()
+        for i in range(n // 20):
+            gm.create_particles(100 + i, 100, 20, 'blood')
+        return list(gm.particles)
+
+    def run(ps):
+        for p in ps:
+            p.update(1 / 60)
+    return f"particle_update/{n}", setup, run
+
+
+def _case_exp_gem_update(n):
+    def setup():
+        rng = random.Random(SEED)
+        gems = []
+        for _ in range(n):
+            g = gm.ExpGem(rng.uniform(0, gm.WIDTH), rng.uniform(0, gm.HEIGHT))
+            g.magnet = True
+            gems.append(g)
+        return gems
+
+    def run(gems):
+        px, py = gm.WIDTH // 2, gm.HEIGHT // 2
+        for g in gems:
+            g.update(1 / 60, px, py, 80)
+    return f"exp_gem_update/magnet/{n}", setup, run
+
+
+def _case_boss_update(n):
+    def setup():
+        _ensure_run()
+        rng = random.Random(SEED)
+        b = boss_module.SkullKing(gm.WIDTH // 2, gm.HEIGHT // 4, 1)
+        b.entrance_active = False
+        b.roar_played = True
+        b.attack_timer = 1e9  # 只计弹幕推进, 不触发新一轮攻击
+        px, py = gm.run.x, gm.run.y
+        for _ in range(n):
+            a = rng.uniform(0, math.pi * 2)
+            r = rng.uniform(60, 700)
+            sp = rng.uniform(100, 200)
+            b.boss_bullets.spawn(px + math.cos(a) * r, py + math.sin(a) * r,
+                                 math.cos(a) * sp, math.sin(a) * sp, 3.0)
+        return b
+
+    def run(b):
+        b.update(1 / 60, 60.0)
+    return f"boss_update/bullets/{n}", setup, run
+
+
+def _case_upgrade_options():
+    def setup():
+        random.seed(SEED)
+        weapons = [gm.MagicMissile(), gm.Fireball(), gm.IceNova()]
+        passives = list(gm.PASSIVE_ITEMS[:3])
+        return weapons, passives
+
+    def run(state):
+        weapons, passives = state
+        for _ in range(200):
+            gm.generate_upgrade_options(weapons, passives, 4)
+    return "generate_upgrade_options/200", setup, run
+
+
+def all_cases():
+    cases = []
+    for cls in gm.WEAPON_CLASSES:
+        for n in ENEMY_COUNTS:
+            cases.append(_case_check_hits(cls, n))
+    for n in (500, 2000):
+        cases.append(_case_enemy_update(n))
+    cases.append(_case_create_particles())
+    cases.append(_case_particle_update(5000))
+    cases.append(_case_exp_gem_update(2000))
+    for n in (500, 2000):
+        cases.append(_case_boss_update(n))
+    cases.append(_case_upgrade_options())
+    return cases
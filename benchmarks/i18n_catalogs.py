@@ -0,0 +1,105 @@
+"""
+i18n 语言包加载开销报告
+========================================
+用法 (在仓库根目录):
+  python benchmarks/i18n_catalogs.py                    按需加载 vs 一次性加载全部语言包
+  python benchmarks/i18n_catalogs.py --lang ja --runs 9
+  python benchmarks/i18n_catalogs.py --legacy old_i18n.py
+        额外对比拆分前的单文件 i18n 模块
+        (例如 git show <旧版本>:i18n.py > old_i18n.py)
+
+每个场景在全新子进程中运行 runs 次, 取导入耗时中位数;
+内存为 tracemalloc 统计的 Python 分配量 (导入 + 首次取词后仍占用的部分)。
+最后给出 t() 单次调用耗时: 无参数 (命中缓存) 与带参数 (预编译模板)。
+========================================
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+# 在子进程中执行: 导入 → 切换语言 → 取一个词, 输出 JSON
+_PROBE = r'''
+import sys, time, json, tracemalloc, importlib.util
+sys.path.insert(0, {root!r})
+tracemalloc.start()
+t0 = time.perf_counter()
+if {legacy!r}:
+    spec = importlib.util.spec_from_file_location("i18n", {legacy!r})
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+else:
+    import i18n as mod
+mod.set_language({lang!r})
+if {eager!r}:
+    for code in mod.LANGS:
+        mod.catalog(code)
+mod.t("开始游戏")
+elapsed = time.perf_counter() - t0
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{"time": elapsed, "current": current, "peak": peak}}))
+'''
+
+
+def _probe(lang, eager=False, legacy=None):
+    code = _PROBE.format(root=ROOT_DIR, lang=lang, eager=eager, legacy=legacy or '')
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _measure(runs, **kw):
+    _probe(**kw)                       # 预热: 生成 .pyc, 填充磁盘缓存
+    samples = [_probe(**kw) for _ in range(runs)]
+    return {
+        'time': statistics.median(s['time'] for s in samples),
+        'current': statistics.median(s['current'] for s in samples),
+        'peak': statistics.median(s['peak'] for s in samples),
+    }
+
+
+def _call_cost(lang, number=200000):
+    import timeit
+    sys.path.insert(0, ROOT_DIR)
+    import i18n
+    i18n.set_language(lang)
+    plain = min(timeit.repeat(lambda: i18n.t("开始游戏"), number=number, repeat=5))
+    fmt = min(timeit.repeat(lambda: i18n.t("等级提升! Lv.{level}", level=12),
+                            number=number, repeat=5))
+    return plain / number, fmt / number
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lang', default='en')
+    ap.add_argument('--runs', type=int, default=7)
+    ap.add_argument('--legacy', help='拆分前的 i18n.py 路径')
+    args = ap.parse_args()
+
+    rows = [('按需加载 (当前语言)', _measure(args.runs, lang=args.lang)),
+            ('全部语言包', _measure(args.runs, lang=args.lang, eager=True))]
+    if args.legacy:
+        rows.append(('旧单文件模块', _measure(args.runs, lang=args.lang,
+                                            legacy=os.path.abspath(args.legacy))))
+
+    base = rows[0][1]
+    print(f"语言: {args.lang}   每项 {args.runs} 次取中位数")
+    print(f"{'场景':<16}{'导入+取词 ms':>14}{'常驻 KiB':>12}{'峰值 KiB':>12}")
+    for name, r in rows:
+        print(f"{name:<16}{r['time'] * 1000:>14.2f}{r['current'] / 1024:>12.0f}{r['peak'] / 1024:>12.0f}")
+    for name, r in rows[1:]:
+        print(f"相对{name}: 节省 {(r['time'] - base['time']) * 1000:.2f} ms, "
+              f"常驻内存少 {(r['current'] - base['current']) / 1024:.0f} KiB")
+
+    plain, fmt = _call_cost(args.lang)
+    print(f"t() 无参数 {plain * 1e9:.0f} ns/次, 带参数 {fmt * 1e9:.0f} ns/次")
+
+
+if __name__ == '__main__':
+    main()
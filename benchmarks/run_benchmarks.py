@@ -0,0 +1,155 @@
+"""
+战斗热路径基准测试
+========================================
+用法 (在仓库根目录):
+  python benchmarks/run_benchmarks.py                  对比基线, 退化则退出码 1
+  python benchmarks/run_benchmarks.py --update-baseline 重新生成基线
+  python benchmarks/run_benchmarks.py --filter check_hits
+
+使用 SDL dummy 驱动, 无需窗口/声卡, 可在 CI 中运行。
+耗时以"校准单位"存储: 每轮用例耗时 / 紧邻测得的固定纯 Python 循环
+耗时, 取中位数, 以抵消不同机器及机器负载波动带来的绝对速度差异。
+========================================
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+if BENCH_DIR not in sys.path:
+    sys.path.insert(0, BENCH_DIR)
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_ROUNDS = 11
+# 小于该绝对差值(校准单位)的波动视为噪声, 避免亚毫秒用例误报
+NOISE_FLOOR = 0.002
+
+
+def _calibrate():
+    """固定工作量的纯 Python 循环, 作为机器速度单位 (秒)"""
+    t0 = time.perf_counter()
+    acc = 0.0
+    for i in range(20000):
+        acc += math.hypot(i * 0.5, 3.0)
+    return time.perf_counter() - t0
+
+
+def _time_case(setup, run, rounds):
+    """
+    每轮紧挨着测一次校准循环, 取 用例耗时/校准耗时 的中位数。
+    共享机器上 CPU 速度会整体漂移, 相邻测量的比值比绝对耗时稳定得多。
+    返回 (单位数, 最快一轮秒数)
+    """
+    ratios = []
+    best = float('inf')
+    for _ in range(rounds):
+        state = setup()
+        unit = _calibrate()
+        t0 = time.perf_counter()
+        run(state)
+        sec = time.perf_counter() - t0
+        unit = min(unit, _calibrate())
+        ratios.append(sec / unit)
+        best = min(best, sec)
+    return statistics.median(ratios), best
+
+
+def _load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f).get('cases', {})
+
+
+def _save_baseline(results):
+    data = {
+        'unit': 'calibration',
+        'cases': {name: round(v, 5) for name, v in sorted(results.items())},
+    }
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="战斗热路径基准测试")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="用本次结果覆盖 baseline.json")
+    parser.add_argument('--filter', default='',
+                        help="只运行名称包含该子串的用例")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="允许相对基线变慢的比例 (默认 0.5)")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS,
+                        help="每个用例的计时轮数, 取中位数")
+    args = parser.parse_args(argv)
+
+    import bench_combat
+
+    baseline = _load_baseline()
+    results = {}
+    regressions = []
+    missing = []
+
+    print(f"{'case':<42}{'ms':>10}{'units':>10}{'base':>10}{'ratio':>9}")
+    print("-" * 81)
+    def _is_regression(units, base):
+        return units / base > 1.0 + args.tolerance and units - base > NOISE_FLOOR
+
+    for name, setup, run in bench_combat.all_cases():
+        if args.filter and args.filter not in name:
+            continue
+        units, sec = _time_case(setup, run, args.rounds)
+        base = baseline.get(name)
+        if base is not None and base > 0 and _is_regression(units, base):
+            # 超出容差时加倍轮数复测一次, 排除偶发的机器负载尖峰
+            units2, sec2 = _time_case(setup, run, args.rounds * 2)
+            units, sec = min(units, units2), min(sec, sec2)
+        results[name] = units
+        if base is None:
+            missing.append(name)
+            ratio_s, base_s, mark = "-", "-", ""
+        else:
+            ratio = units / base if base > 0 else float('inf')
+            ratio_s, base_s = f"{ratio:.2f}", f"{base:.4f}"
+            mark = ""
+            if base <= 0 or _is_regression(units, base):
+                regressions.append((name, ratio))
+                mark = "  << REGRESSION"
+        print(f"{name:<42}{sec * 1000:>10.3f}{units:>10.4f}{base_s:>10}{ratio_s:>9}{mark}")
+
+    if args.update_baseline:
+        if args.filter:
+            merged = dict(baseline)
+            merged.update(results)
+            results = merged
+        _save_baseline(results)
+        print(f"\n基线已写入 {BASELINE_PATH}")
+        return 0
+
+    if missing:
+        print(f"\n{len(missing)} 个用例没有基线记录 (用 --update-baseline 生成):")
+        for name in missing:
+            print(f"  {name}")
+    if regressions:
+        print(f"\n性能退化 {len(regressions)} 项 (容差 {args.tolerance:.0%}):")
+        for name, ratio in regressions:
+            print(f"  {name}: {ratio:.2f}x")
+        return 1
+    print("\n全部用例在基线容差内")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,8 @@ import pygame
 import math
 import random
 import i18n
+import bullet_pool
+import boss_atlas
 
 # ============================================================
 #  常量 (会在 init() 中从主模块同步)
@@ -20,6 +22,8 @@ CYAN = (78, 205, 196)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 170, 0)
 PURPLE = (170, 68, 255)
+# 画质档位的 Boss 装饰效果 (光环 / 额外效果 / 骨刺、毒液滴、火焰轨迹粒子), 由 set_detail() 同步
+DETAIL = True
 
 # ---- 描边文字渲染 ----
 def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
@@ -36,6 +40,10 @@ def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
     surf.blit(base, (offset, offset))
     return surf
 
+
+def _draw_glow(surf, ax, ay, radius, color):
+    pygame.draw.circle(surf, (*color, 30), (ax, ay), radius)
+
 # 外部引用 (在 init() 中注入)
 _player = None
 _swords = None
@@ -60,6 +68,19 @@ def init(player, swords_ref, screen_shake, create_particles_fn, play_sfx_fn, fon
     HEIGHT = height
 
 
+def resize(width, height):
+    """内部画布尺寸变化 (渲染比例调整) 时由主模块调用"""
+    global WIDTH, HEIGHT
+    WIDTH = width
+    HEIGHT = height
+
+
+def set_detail(detail):
+    """画质档位变化时由主模块调用; 关闭后战斗中只画 Boss 本体、血条和弹幕"""
+    global DETAIL
+    DETAIL = detail
+
+
 # ============================================================
 #  Boss基类
 # ============================================================
@@ -101,7 +122,7 @@ class BossBase:
         self.color_cycle = 0
         self.alive = True
         self.roar_played = False
-        self.boss_bullets = []
+        self.boss_bullets = bullet_pool.BulletPool()
         self.anim_timer = 0     # 动画计时器
         # 入场专用粒子/效果
         self._entrance_particles = []
@@ -109,6 +130,12 @@ class BossBase:
         self._shockwave_alpha = 0
         self.entrance_scale = 0.1    # 入场缩放 0.1 → 1.0
         self.entrance_alpha = 0      # 入场透明度 0 → 255
+        # 帧图集 (同类型 Boss 共享, 首次生成时预渲染)
+        self._atlas = boss_atlas.atlas_for(type(self), self.size)
+        self._glow_atlas = boss_atlas.atlas_for(BossBase, self.size)
+        if not self._atlas.warmed:
+            self._prewarm_atlas()
+            self._atlas.warmed = True
 
     # ---- 显示属性 (用于UI显示翻译后的文本) ----
     @property
@@ -164,6 +191,23 @@ class BossBase:
         """子类覆盖 - 绘制额外效果"""
         pass
 
+    def _prewarm_atlas(self):
+        """子类覆盖 - 预渲染图集帧 (每种类型只调用一次, 此时子类 __init__ 尚未执行)"""
+        r = self.size * 2
+        for tint in boss_atlas.all_tints(boss_atlas.GLOW_TINT_STEPS):
+            self._glow_atlas.frame(tint, (-r, -r, r * 2, r * 2), _draw_glow,
+                                   r, boss_atlas.tint_color(tint, boss_atlas.GLOW_TINT_STEPS))
+
+    def _draw_body_atlas(self, surface, sx, sy, color, tint):
+        """子类覆盖 - 战斗中用图集绘制身体 (tint 为 color 的量化档); 返回 False 时退回 _draw_body 程序化绘制"""
+        return False
+
+    def _draw_glow(self, surface, sx, sy):
+        tint = boss_atlas.tint_index(self.color_cycle, self.flash_timer > 0, boss_atlas.GLOW_TINT_STEPS)
+        r = self.size * 2
+        self._glow_atlas.blit(surface, tint, sx, sy, (-r, -r, r * 2, r * 2), _draw_glow,
+                              r, boss_atlas.tint_color(tint, boss_atlas.GLOW_TINT_STEPS))
+
     def _update_entrance(self, dt):
         """更新入场动画"""
         self.entrance_timer += dt
@@ -417,17 +461,11 @@ class BossBase:
             self.attack_timer = interval
             self._do_attack(dt)
 
-        # 更新弹幕
+        # 更新弹幕 (推进 + 与玩家碰撞, 命中的子弹移除)
         if _player:
-            for b in self.boss_bullets:
-                b[0] += b[2] * dt
-                b[1] += b[3] * dt
-                b[4] -= dt
-                pd = math.hypot(b[0] - _player.x, b[1] - _player.y)
-                if pd < 25:
-                    _player.take_damage(self.damage * 0.5 * dt * 60)
-                    b[4] = 0
-            self.boss_bullets = [b for b in self.boss_bullets if b[4] > 0]
+            hits = self.boss_bullets.step(dt, _player.x, _player.y, 25)
+            for _ in range(hits):
+                _player.take_damage(self.damage * 0.5 * dt * 60)
 
         # 武器伤害判定
         self._check_weapon_damage(dt, now)
@@ -494,19 +532,17 @@ class BossBase:
 
         # --- 正常战斗绘制 ---
         # 光环
-        glow_surf = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
-        r_c = max(0, min(255, int(color[0])))
-        g_c = max(0, min(255, int(color[1])))
-        b_c = max(0, min(255, int(color[2])))
-        pygame.draw.circle(glow_surf, (r_c, g_c, b_c, 30),
-                           (self.size * 2, self.size * 2), self.size * 2)
-        surface.blit(glow_surf, (sx - self.size * 2, sy - self.size * 2))
-
-        # 身体 (子类可覆盖)
-        self._draw_body(surface, sx, sy, color)
+        if DETAIL:
+            self._draw_glow(surface, sx, sy)
+
+        # 身体 (子类可覆盖; 有图集时直接 blit 预渲染帧)
+        tint = boss_atlas.tint_index(self.color_cycle, self.flash_timer > 0)
+        if not self._draw_body_atlas(surface, sx, sy, color, tint):
+            self._draw_body(surface, sx, sy, color)
 
         # 额外效果 (子类可覆盖)
-        self._draw_extra(surface, sx, sy, shake)
+        if DETAIL:
+            self._draw_extra(surface, sx, sy, shake)
 
         # 血条 (屏幕顶部)
         self._draw_health_bar(surface, shake, color)
@@ -551,13 +587,8 @@ class BossBase:
                                bar_y + bar_h + 24 + int(shake[1])))
 
     def _draw_bullets(self, surface, shake):
-        for b in self.boss_bullets:
-            bsx = int(b[0] + shake[0])
-            bsy = int(b[1] + shake[1])
-            # 弹幕颜色根据Boss类型不同
-            bullet_color = self._get_bullet_color()
-            pygame.draw.circle(surface, bullet_color, (bsx, bsy), 5)
-            pygame.draw.circle(surface, WHITE, (bsx, bsy), 5, 1)
+        # 弹幕颜色根据Boss类型不同
+        self.boss_bullets.draw(surface, shake, self._get_bullet_color())
 
     def _get_bullet_color(self):
         return PINK
@@ -766,7 +797,7 @@ class SkullKing(BossBase):
             speed = 150 + self.phase * 30
             bvx = math.cos(angle) * speed
             bvy = math.sin(angle) * speed
-            self.boss_bullets.append([self.x, self.y, bvx, bvy, 3.0])
+            self.boss_bullets.spawn(self.x, self.y, bvx, bvy, 3.0)
 
         # 攻击时生成骨刺粒子
         for _ in range(6):
@@ -787,8 +818,20 @@ class SkullKing(BossBase):
         scale = self.entrance_scale if self.entrance_active else 1.0
         alpha = self.entrance_alpha if self.entrance_active else 255
         fy = sy + (self.float_offset if not self.entrance_active else 0)
-        sz = self.size
 
+        self._draw_cloak(surface, sx, fy, scale, alpha, color)
+        self._draw_skull(surface, sx, fy, scale, alpha, self.crown_angle)
+
+        # 骨刺粒子
+        for bx, by, _, _, bl in self.bone_particles:
+            if bl <= 0:
+                continue
+            pa = max(0, min(255, int(255 * bl)))
+            bps = pygame.Surface((8, 8), pygame.SRCALPHA)
+            pygame.draw.circle(bps, (255, 255, 255, pa), (4, 4), max(1, int(3 * bl)))
+            surface.blit(bps, (int(bx) - 4, int(by) - 4))
+
+    def _draw_cloak(self, surface, sx, fy, scale, alpha, color):
         # 披风 / 暗影
         cloak_w = int(90 * scale)
         cloak_h = int(130 * scale)
@@ -798,6 +841,9 @@ class SkullKing(BossBase):
             pygame.draw.ellipse(cs, cloak_c, (0, 0, cloak_w, cloak_h))
             surface.blit(cs, (sx - cloak_w // 2, int(fy - 30 * scale)))
 
+    def _draw_skull(self, surface, sx, fy, scale, alpha, crown_angle):
+        sz = self.size
+
         # 骷髅身体
         body_r = int(sz * 0.7 * scale)
         if body_r > 0:
@@ -842,7 +888,7 @@ class SkullKing(BossBase):
             for i in range(spikes * 2 + 1):
                 px = sx - crown_w // 2 + i * crown_w // (spikes * 2)
                 if i % 2 == 0:
-                    spike_h = int(20 * scale + math.sin(self.crown_angle + i) * 3 * scale)
+                    spike_h = int(20 * scale + math.sin(crown_angle + i) * 3 * scale)
                     py = crown_y - spike_h
                 else:
                     py = crown_y
@@ -867,14 +913,51 @@ class SkullKing(BossBase):
         if len(points) >= 2:
             pygame.draw.lines(surface, WHITE, False, points, max(1, int(3 * scale)))
 
+    # ---- 图集: 披风按色调, 骷髅 (身体/头/眼/王冠/嘴) 按王冠摆动相位, 骨刺粒子按寿命 ----
+    SKULL_FRAMES = 24
+    CLOAK_BOUNDS = (-45, -30, 90, 130)
+    SKULL_BOUNDS = (-50, -75, 100, 155)
+    BONE_STEPS = 32
+    BONE_BOUNDS = (-4, -4, 8, 8)
+
+    @staticmethod
+    def _draw_bone(surf, ax, ay, bl):
+        pa = max(0, min(255, int(255 * bl)))
+        pygame.draw.circle(surf, (255, 255, 255, pa), (ax, ay), max(1, int(3 * bl)))
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        atlas = self._atlas
+        for tint in boss_atlas.all_tints():
+            atlas.frame(('cloak', tint), self.CLOAK_BOUNDS, self._draw_cloak,
+                        1.0, 255, boss_atlas.tint_color(tint))
+        for f in range(self.SKULL_FRAMES):
+            atlas.frame(('skull', f), self.SKULL_BOUNDS, self._draw_skull,
+                        1.0, 255, boss_atlas.phase_value(f, self.SKULL_FRAMES))
+        for step in range(1, self.BONE_STEPS + 1):
+            atlas.frame(('bone', step), self.BONE_BOUNDS, self._draw_bone, step / self.BONE_STEPS)
+
+    def _draw_body_atlas(self, surface, sx, sy, color, tint):
+        atlas = self._atlas
+        fy = int(sy + self.float_offset)
+        atlas.blit(surface, ('cloak', tint), sx, fy, self.CLOAK_BOUNDS, self._draw_cloak,
+                   1.0, 255, boss_atlas.tint_color(tint))
+        f = boss_atlas.phase_index(self.crown_angle, self.SKULL_FRAMES)
+        atlas.blit(surface, ('skull', f), sx, fy, self.SKULL_BOUNDS, self._draw_skull,
+                   1.0, 255, boss_atlas.phase_value(f, self.SKULL_FRAMES))
         # 骨刺粒子
+        if not DETAIL:
+            return True
+        seq = []
         for bx, by, _, _, bl in self.bone_particles:
             if bl <= 0:
                 continue
-            pa = max(0, min(255, int(255 * bl)))
-            bps = pygame.Surface((8, 8), pygame.SRCALPHA)
-            pygame.draw.circle(bps, (255, 255, 255, pa), (4, 4), max(1, int(3 * bl)))
-            surface.blit(bps, (int(bx) - 4, int(by) - 4))
+            step = max(1, min(self.BONE_STEPS, round(bl * self.BONE_STEPS)))
+            seq.append(atlas.item(('bone', step), int(bx), int(by), self.BONE_BOUNDS,
+                                  self._draw_bone, step / self.BONE_STEPS))
+        surface.blits(seq, False)
+        return True
+
 
     def _get_bullet_color(self):
         return PINK
@@ -1096,7 +1179,7 @@ class VenomBeast(BossBase):
                 speed = 120 + j * 20
                 bvx = math.cos(angle) * speed
                 bvy = math.sin(angle) * speed
-                self.boss_bullets.append([self.x, self.y, bvx, bvy, 3.5])
+                self.boss_bullets.spawn(self.x, self.y, bvx, bvy, 3.5)
         self.spiral_angle += 0.5
 
         if _screen_shake:
@@ -1106,10 +1189,26 @@ class VenomBeast(BossBase):
 
     def _draw_body(self, surface, sx, sy, color):
         scale = self.entrance_scale if self.entrance_active else 1.0
-        alpha = self.entrance_alpha if self.entrance_active else 255
         sz = self.size
         pulse = 1 + math.sin(self.pulse_phase) * 0.06 if not self.entrance_active else 1
 
+        self._draw_beast(surface, sx, sy, color, scale, pulse)
+
+        # 毒液滴
+        for dx, dy, _, _, dl, ml in self.droplets:
+            if dl <= 0:
+                continue
+            drip_a = max(0, min(255, int(200 * (dl / ml))))
+            drip_r = max(1, int(4 * scale * (dl / ml)))
+            drip_x = int(sx + dx * scale)
+            drip_y = int(sy + dy * scale + sz * 0.5 * scale)
+            ds = pygame.Surface((drip_r * 2 + 2, drip_r * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(ds, (0, 255, 0, drip_a), (drip_r + 1, drip_r + 1), drip_r)
+            surface.blit(ds, (drip_x - drip_r - 1, drip_y - drip_r - 1))
+
+    def _draw_beast(self, surface, sx, sy, color, scale, pulse):
+        sz = self.size
+
         # 触手 (分段绘制)
         for i, ta in enumerate(self.tentacle_angles):
             ta += 0.02
@@ -1125,9 +1224,6 @@ class VenomBeast(BossBase):
                 seg_y = sy + math.sin(seg_angle) * (length * t) + wave * t * 0.5
                 width = max(1, int((6 - j) * scale))
                 g = max(0, min(255, int(color[1] * (1 - t * 0.5))))
-                seg_c = (0, g, 0, max(0, min(255, int(alpha * (1 - t * 0.3)))))
-                ls = pygame.Surface((abs(int(seg_x - prev[0])) + width * 2 + 2,
-                                     abs(int(seg_y - prev[1])) + width * 2 + 2), pygame.SRCALPHA)
                 # 简化: 直接画线
                 tentacle_c = (0, g, 0)
                 pygame.draw.line(surface, tentacle_c, (int(prev[0]), int(prev[1])),
@@ -1178,17 +1274,37 @@ class VenomBeast(BossBase):
             pygame.draw.circle(surface, WHITE, (sx - eye_r // 3, eye_y - eye_r // 3),
                                max(1, eye_r // 5))
 
+    # ---- 图集: 毒液滴按寿命比例 ----
+    # 触手 / 背刺 / 身体是直接画在屏幕上的实心图元, 随多个互不同步的相位连续变化, 仍直接绘制
+    DROP_RES = 16              # 寿命比例 dl/ml 每 1/16 一档 (比例最大为 2)
+    DROP_BOUNDS = (-9, -9, 18, 18)
+
+    @staticmethod
+    def _draw_drop(surf, ax, ay, ratio):
+        drip_a = max(0, min(255, int(200 * ratio)))
+        pygame.draw.circle(surf, (0, 255, 0, drip_a), (ax, ay), max(1, int(4 * ratio)))
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        for step in range(1, self.DROP_RES * 2 + 1):
+            self._atlas.frame(('drop', step), self.DROP_BOUNDS, self._draw_drop, step / self.DROP_RES)
+
+    def _draw_body_atlas(self, surface, sx, sy, color, tint):
+        self._draw_beast(surface, sx, sy, color, 1.0, 1 + math.sin(self.pulse_phase) * 0.06)
         # 毒液滴
+        if not DETAIL:
+            return True
+        atlas = self._atlas
+        base_y = sy + self.size * 0.5
+        seq = []
         for dx, dy, _, _, dl, ml in self.droplets:
             if dl <= 0:
                 continue
-            drip_a = max(0, min(255, int(200 * (dl / ml))))
-            drip_r = max(1, int(4 * scale * (dl / ml)))
-            drip_x = int(sx + dx * scale)
-            drip_y = int(sy + dy * scale + sz * 0.5 * scale)
-            ds = pygame.Surface((drip_r * 2 + 2, drip_r * 2 + 2), pygame.SRCALPHA)
-            pygame.draw.circle(ds, (0, 255, 0, drip_a), (drip_r + 1, drip_r + 1), drip_r)
-            surface.blit(ds, (drip_x - drip_r - 1, drip_y - drip_r - 1))
+            step = max(1, min(self.DROP_RES * 2, round(dl / ml * self.DROP_RES)))
+            seq.append(atlas.item(('drop', step), int(sx + dx), int(base_y + dy), self.DROP_BOUNDS,
+                                  self._draw_drop, step / self.DROP_RES))
+        surface.blits(seq, False)
+        return True
 
     def _get_bullet_color(self):
         return (100, 255, 100)
@@ -1414,7 +1530,7 @@ class FlameGeneral(BossBase):
                 speed = 180 + self.phase * 40
                 bvx = math.cos(angle) * speed
                 bvy = math.sin(angle) * speed
-                self.boss_bullets.append([self.x, self.y, bvx, bvy, 2.5])
+                self.boss_bullets.spawn(self.x, self.y, bvx, bvy, 2.5)
 
             if _screen_shake:
                 _screen_shake.trigger(5, 0.15)
@@ -1461,6 +1577,15 @@ class FlameGeneral(BossBase):
             pygame.draw.circle(fs, (255, 100, 0, alpha), (size, size), size)
             surface.blit(fs, (fsx - size, fsy - size))
 
+        self._draw_core(surface, sx, sy, color)
+
+        # 冲锋指示
+        if self.charging:
+            indicator = pygame.Surface((self.size * 3, self.size * 3), pygame.SRCALPHA)
+            pygame.draw.circle(indicator, (255, 50, 0, 60), (self.size * 3 // 2, self.size * 3 // 2), self.size * 3 // 2)
+            surface.blit(indicator, (sx - self.size * 3 // 2, sy - self.size * 3 // 2))
+
+    def _draw_core(self, surface, sx, sy, color):
         # 主体 (橙红色调)
         body_color = (max(0, min(255, int(color[0]))), max(0, min(255, int(color[1]) // 3)), 0)
         pygame.draw.circle(surface, body_color, (sx, sy), self.size)
@@ -1482,11 +1607,59 @@ class FlameGeneral(BossBase):
             # 瞳孔
             pygame.draw.circle(surface, RED, (sx + ex_offset, sy - self.size // 5), eye_r // 2)
 
+    # ---- 图集: 主体按色调, 火焰轨迹按寿命, 冲锋指示一帧 ----
+    FLAME_STEPS = 32
+
+    @staticmethod
+    def _flame_bounds(fl):
+        size = max(1, int(10 * fl))
+        return (-size, -size, size * 2, size * 2)
+
+    @staticmethod
+    def _draw_flame(surf, ax, ay, fl):
+        alpha = max(0, min(255, int(fl * 200)))
+        pygame.draw.circle(surf, (255, 100, 0, alpha), (ax, ay), max(1, int(10 * fl)))
+
+    @staticmethod
+    def _draw_charge(surf, ax, ay, r):
+        pygame.draw.circle(surf, (255, 50, 0, 60), (ax, ay), r)
+
+    def _core_bounds(self):
+        r = self.size + 2
+        return (-r, -r, r * 2, r * 2)
+
+    def _charge_bounds(self):
+        r = self.size * 3 // 2
+        return (-r, -r, self.size * 3, self.size * 3)
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        atlas = self._atlas
+        for tint in boss_atlas.all_tints():
+            atlas.frame(('core', tint), self._core_bounds(), self._draw_core, boss_atlas.tint_color(tint))
+        for step in range(1, self.FLAME_STEPS + 1):
+            fl = step / self.FLAME_STEPS
+            atlas.frame(('flame', step), self._flame_bounds(fl), self._draw_flame, fl)
+        atlas.frame('charge', self._charge_bounds(), self._draw_charge, self.size * 3 // 2)
+
+    def _draw_body_atlas(self, surface, sx, sy, color, tint):
+        atlas = self._atlas
+        # 火焰轨迹
+        if DETAIL:
+            seq = []
+            for fx, fy, fl in self.flame_trail:
+                step = max(1, min(self.FLAME_STEPS, round(fl * self.FLAME_STEPS)))
+                q = step / self.FLAME_STEPS
+                seq.append(atlas.item(('flame', step), int(fx), int(fy), self._flame_bounds(q),
+                                      self._draw_flame, q))
+            surface.blits(seq, False)
+        atlas.blit(surface, ('core', tint), sx, sy, self._core_bounds(), self._draw_core,
+                   boss_atlas.tint_color(tint))
         # 冲锋指示
         if self.charging:
-            indicator = pygame.Surface((self.size * 3, self.size * 3), pygame.SRCALPHA)
-            pygame.draw.circle(indicator, (255, 50, 0, 60), (self.size * 3 // 2, self.size * 3 // 2), self.size * 3 // 2)
-            surface.blit(indicator, (sx - self.size * 3 // 2, sy - self.size * 3 // 2))
+            atlas.blit(surface, 'charge', sx, sy, self._charge_bounds(), self._draw_charge,
+                       self.size * 3 // 2)
+        return True
 
     def _get_bullet_color(self):
         return ORANGE
@@ -1704,7 +1877,7 @@ class VoidEye(BossBase):
             bvx = math.cos(angle) * speed
             bvy = math.sin(angle) * speed
             # 追踪弹用额外数据标记 [x, y, vx, vy, life, is_tracking]
-            self.boss_bullets.append([self.x, self.y, bvx, bvy, 4.0])
+            self.boss_bullets.spawn(self.x, self.y, bvx, bvy, 4.0)
 
         if _screen_shake:
             _screen_shake.trigger(4, 0.15)
@@ -1718,20 +1891,9 @@ class VoidEye(BossBase):
             return
         # 让弹幕有轻微追踪效果
         if _player:
-            for b in self.boss_bullets:
-                dx = _player.x - b[0]
-                dy = _player.y - b[1]
-                d = max(1, math.hypot(dx, dy))
-                # 轻微转向
-                tracking_force = 30 + self.phase * 15
-                b[2] += (dx / d) * tracking_force * dt
-                b[3] += (dy / d) * tracking_force * dt
-                # 限速
-                spd = math.hypot(b[2], b[3])
-                max_spd = 180
-                if spd > max_spd:
-                    b[2] = b[2] / spd * max_spd
-                    b[3] = b[3] / spd * max_spd
+            # 轻微转向 + 限速
+            tracking_force = 30 + self.phase * 15
+            self.boss_bullets.steer(_player.x, _player.y, tracking_force, 180, dt)
 
         # 旋转环
         for i in range(len(self.ring_angles)):
@@ -1739,10 +1901,11 @@ class VoidEye(BossBase):
 
         super().update(dt, game_time)
 
+    RING_COLORS = [(100, 0, 200), (150, 0, 255), (80, 0, 180)]
+
     def _draw_body(self, surface, sx, sy, color):
         # 旋转环
-        ring_colors = [(100, 0, 200), (150, 0, 255), (80, 0, 180)]
-        for i, (ra, rc) in enumerate(zip(self.ring_angles, ring_colors)):
+        for i, (ra, rc) in enumerate(zip(self.ring_angles, self.RING_COLORS)):
             ring_r = self.size + 10 + i * 12
             ring_surf = pygame.Surface((ring_r * 2 + 10, ring_r * 2 + 10), pygame.SRCALPHA)
             center = (ring_r + 5, ring_r + 5)
@@ -1757,6 +1920,13 @@ class VoidEye(BossBase):
             pygame.draw.circle(ring_surf, (*rc, 60), center, ring_r, 2)
             surface.blit(ring_surf, (sx - ring_r - 5, sy - ring_r - 5))
 
+        self._draw_core(surface, sx, sy, color)
+
+        # 虹膜
+        ix, iy = self._iris_pos(sx, sy)
+        self._draw_iris(surface, ix, iy)
+
+    def _draw_core(self, surface, sx, sy, color):
         # 主体 (紫色漩涡)
         body_color = (max(0, min(255, int(color[0]) // 2)),
                       0,
@@ -1768,17 +1938,76 @@ class VoidEye(BossBase):
         eye_r = self.size * 3 // 4
         # 眼白
         pygame.draw.circle(surface, (220, 200, 255), (sx, sy), eye_r)
-        # 虹膜
-        iris_r = eye_r * 2 // 3
+
+    def _iris_pos(self, sx, sy):
+        eye_r = self.size * 3 // 4
         self.iris_angle += 0.03
         ix = sx + int(math.cos(self.iris_angle) * eye_r // 6)
         iy = sy + int(math.sin(self.iris_angle) * eye_r // 6)
+        return ix, iy
+
+    def _draw_iris(self, surface, ix, iy):
+        iris_r = self.size * 3 // 4 * 2 // 3
         pygame.draw.circle(surface, PURPLE, (ix, iy), iris_r)
         # 瞳孔
         pygame.draw.circle(surface, BLACK, (ix, iy), iris_r // 2)
         # 高光
         pygame.draw.circle(surface, WHITE, (ix - iris_r // 3, iy - iris_r // 3), iris_r // 5)
 
+    # ---- 图集: 主体+眼白按色调; 环线、环节点、虹膜各一帧, 节点按实际角度逐个摆放 ----
+    NODE_BOUNDS = (-5, -5, 10, 10)
+
+    @staticmethod
+    def _draw_node(surf, ax, ay, rc):
+        pygame.draw.circle(surf, (*rc, 180), (ax, ay), 4)
+
+    @staticmethod
+    def _draw_ring_line(surf, ax, ay, rc, ring_r):
+        pygame.draw.circle(surf, (*rc, 60), (ax, ay), ring_r, 2)
+
+    def _ring_bounds(self, i):
+        r = self.size + 15 + i * 12
+        return (-r, -r, r * 2, r * 2)
+
+    def _core_bounds(self):
+        r = self.size + 1
+        return (-r, -r, r * 2, r * 2)
+
+    def _iris_bounds(self):
+        r = self.size * 3 // 4 * 2 // 3 + 1
+        return (-r, -r, r * 2, r * 2)
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        atlas = self._atlas
+        for tint in boss_atlas.all_tints():
+            atlas.frame(('core', tint), self._core_bounds(), self._draw_core, boss_atlas.tint_color(tint))
+        for i, rc in enumerate(self.RING_COLORS):
+            atlas.frame(('node', i), self.NODE_BOUNDS, self._draw_node, rc)
+            atlas.frame(('ring', i), self._ring_bounds(i), self._draw_ring_line, rc, self.size + 10 + i * 12)
+        atlas.frame('iris', self._iris_bounds(), self._draw_iris)
+
+    def _draw_body_atlas(self, surface, sx, sy, color, tint):
+        atlas = self._atlas
+        # 旋转环: 先节点后环线, 一次 blits
+        seq = []
+        for i, (ra, rc) in enumerate(zip(self.ring_angles, self.RING_COLORS)):
+            ring_r = self.size + 10 + i * 12
+            nodes = 4 + i * 2
+            for j in range(nodes):
+                na = ra + (2 * math.pi / nodes) * j
+                seq.append(atlas.item(('node', i), sx + int(math.cos(na) * ring_r),
+                                      sy + int(math.sin(na) * ring_r), self.NODE_BOUNDS,
+                                      self._draw_node, rc))
+            seq.append(atlas.item(('ring', i), sx, sy, self._ring_bounds(i),
+                                  self._draw_ring_line, rc, ring_r))
+        surface.blits(seq, False)
+        atlas.blit(surface, ('core', tint), sx, sy, self._core_bounds(), self._draw_core,
+                   boss_atlas.tint_color(tint))
+        ix, iy = self._iris_pos(sx, sy)
+        atlas.blit(surface, 'iris', ix, iy, self._iris_bounds(), self._draw_iris)
+        return True
+
     def _get_bullet_color(self):
         return PURPLE
 
@@ -2082,9 +2311,7 @@ if __name__ == '__main__':
         for boss in bosses_list:
             boss.x += mx_move * dt
             boss.y += my_move * dt
-            for bb in boss.boss_bullets:
-                bb[0] += mx_move * dt
-                bb[1] += my_move * dt
+            boss.boss_bullets.shift(mx_move * dt, my_move * dt)
         for b in test_bullets:
             b.x += mx_move * dt
             b.y += my_move * dt
@@ -0,0 +1,95 @@
+"""
+《暗夜割草者：深渊轮回》 — Boss 帧图集
+========================================
+战斗中的 Boss 身体原本每帧用几十个 circle / polygon / 临时 SRCALPHA Surface 程序化绘制,
+光环还要每帧新建一张 4 倍尺寸的 Surface。
+FrameAtlas 把这些部件按 key 预渲染成贴图, 绘制时只做 blit。key 由各 Boss 自己组合:
+  色调    get_color() 的颜色循环量化为 TINT_STEPS 档, 受击闪白单独一档 (FLASH)
+  动画帧  王冠摆动、虹膜、粒子寿命等连续量量化为若干帧
+图集按 (Boss 类型, 尺寸) 共享: 第一次生成该类型 Boss 时预渲染, 之后同类型 Boss 直接复用。
+入场动画的缩放 / 透明度连续变化, 仍走各 Boss 原有的程序化绘制。
+FrameAtlas / atlas_for 本身与 Boss 无关, 角色 (characters.py) 也用它缓存外观帧。
+========================================
+"""
+
+import math
+
+import pygame
+
+TINT_STEPS = 48          # 身体色调档数 (颜色循环一周约 5 秒, 每档约 6 帧)
+GLOW_TINT_STEPS = 16     # 光环 alpha 只有 30, 色调分档可以粗一些
+FLASH = -1               # 受击闪白
+
+_atlases = {}
+
+
+def tint_index(color_cycle, flash=False, steps=TINT_STEPS):
+    """BossBase.color_cycle → 色调档"""
+    if flash:
+        return FLASH
+    return int(round(color_cycle / (2 * math.pi) * steps)) % steps
+
+
+def tint_color(tint, steps=TINT_STEPS):
+    """色调档 → RGB, 与 BossBase.get_color 同一公式"""
+    if tint == FLASH:
+        return (255, 255, 255)
+    c = 2 * math.pi * tint / steps
+    return (int(128 + 127 * math.sin(c)),
+            int(128 + 127 * math.sin(c + 2.1)),
+            int(128 + 127 * math.sin(c + 4.2)))
+
+
+def all_tints(steps=TINT_STEPS):
+    return list(range(steps)) + [FLASH]
+
+
+def phase_index(angle, frames, period=2 * math.pi):
+    """周期量 (角度等) → 帧号"""
+    return int(round(angle / period * frames)) % frames
+
+
+def phase_value(frame, frames, period=2 * math.pi):
+    return period * frame / frames
+
+
+class FrameAtlas:
+    def __init__(self):
+        self._frames = {}        # key → (surface, left, top)
+        self.warmed = False      # 预渲染是否已做过
+
+    def __len__(self):
+        return len(self._frames)
+
+    def frame(self, key, bounds, draw, *args):
+        """
+        取出 key 对应的帧, 没有则生成。
+        bounds = (left, top, w, h), 相对锚点; draw(surf, ax, ay, *args) 以 (ax, ay) 为锚点绘制。
+        """
+        f = self._frames.get(key)
+        if f is None:
+            left, top, w, h = bounds
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            draw(surf, -left, -top, *args)
+            f = (surf, left, top)
+            self._frames[key] = f
+        return f
+
+    def blit(self, surface, key, x, y, bounds, draw, *args):
+        """把帧的锚点对齐 (x, y) 画到 surface 上"""
+        surf, left, top = self.frame(key, bounds, draw, *args)
+        surface.blit(surf, (x + left, y + top))
+
+    def item(self, key, x, y, bounds, draw, *args):
+        """(surf, pos) 二元组, 供 surface.blits 批量绘制"""
+        surf, left, top = self.frame(key, bounds, draw, *args)
+        return surf, (x + left, y + top)
+
+
+def atlas_for(owner, size=None):
+    """owner (Boss / 角色类) + 尺寸 → 共享图集"""
+    key = (owner, size)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = FrameAtlas()
+    return atlas
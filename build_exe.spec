@@ -8,13 +8,29 @@ a = Analysis(
     binaries=[],
     datas=[
         ('思源黑体', '思源黑体'),  # 包含字体文件夹
+        ('locales', 'locales'),  # 语言包 (i18n 按需加载)
     ],
     hiddenimports=[
         'pygame',
         'i18n',
+        'startup',
+        'font_manager',
+        'background',
+        'minimap',
+        'freeze_frame',
+        'retained_ui',
+        'bullet_pool',
+        'boss_atlas',
+        'quality',
+        'render_scale',
         'characters',
         'boss',
         'meta_systems',
+        'equipment_catalog',
+        'gacha_engine',
+        'save_store',
+        'warehouse',
+        'synth',
         'dialogue_system',
         'gacha_animation',
         'town_map',
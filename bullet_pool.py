@@ -0,0 +1,217 @@
+"""
+《暗夜割草者：深渊轮回》 — Boss 弹幕池
+========================================
+BulletPool  固定容量的列式弹幕存储 (x, y, vx, vy, life 各一列, 预先分配),
+            取代每颗子弹一个 [x, y, vx, vy, life] 列表。
+  step()    一趟完成 推进 → 寿命递减 → 与玩家碰撞 → 剔除 (命中或过期),
+            返回命中数, 伤害由调用方按命中数结算 (原先 Boss 和主循环各做一次距离判定)。
+  steer()   追踪弹转向 + 限速 (虚空之眼)。
+  shift()   世界滚动时整体平移。
+  draw()    同色子弹共用一张预渲染贴图, 屏幕内的子弹用一次 blits 画完。
+子弹较多时走 numpy 向量化路径 (列直接以 numpy 视图访问, 不复制),
+未安装 numpy 或子弹很少时走纯 Python 循环, 结果一致。
+容量满时新子弹直接丢弃。
+========================================
+"""
+
+import math
+from array import array
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BULLET_CAPACITY = 4096
+BULLET_NUMPY_MIN = 48      # 子弹数达到这个值才走 numpy (数组运算有固定开销)
+BULLET_RADIUS = 5
+
+_COLUMNS = ('x', 'y', 'vx', 'vy', 'life')
+_sprites = {}              # 颜色 → 子弹贴图
+
+
+def bullet_sprite(color, radius=BULLET_RADIUS):
+    """实心圆 + 白色描边, 与逐颗 pygame.draw.circle 的结果逐像素一致"""
+    key = (color, radius)
+    s = _sprites.get(key)
+    if s is None:
+        size = radius * 2 + 1
+        s = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(s, color, (radius, radius), radius)
+        pygame.draw.circle(s, (255, 255, 255), (radius, radius), radius, 1)
+        _sprites[key] = s
+    return s
+
+
+class BulletPool:
+    def __init__(self, capacity=BULLET_CAPACITY):
+        self.capacity = capacity
+        self.n = 0
+        self.cols = {c: array('d', bytes(8 * capacity)) for c in _COLUMNS}
+        self.x = self.cols['x']
+        self.y = self.cols['y']
+        self.vx = self.cols['vx']
+        self.vy = self.cols['vy']
+        self.life = self.cols['life']
+        if np is not None:
+            self._np = {c: np.frombuffer(a, dtype=np.float64) for c, a in self.cols.items()}
+
+    def __len__(self):
+        return self.n
+
+    def __bool__(self):
+        return self.n > 0
+
+    def clear(self):
+        self.n = 0
+
+    def spawn(self, x, y, vx, vy, life):
+        """新增一颗子弹; 池满时丢弃并返回 False"""
+        i = self.n
+        if i >= self.capacity:
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.n = i + 1
+        return True
+
+    def _use_numpy(self):
+        return np is not None and self.n >= BULLET_NUMPY_MIN
+
+    # ==== 批量更新 ====
+    def shift(self, dx, dy):
+        n = self.n
+        if not n or (not dx and not dy):
+            return
+        if self._use_numpy():
+            self._np['x'][:n] += dx
+            self._np['y'][:n] += dy
+            return
+        x, y = self.x, self.y
+        for i in range(n):
+            x[i] += dx
+            y[i] += dy
+
+    def step(self, dt, px=None, py=None, radius=25):
+        """
+        推进 dt 秒; 给出玩家坐标时同时做碰撞, 命中 (距离 < radius) 的子弹移除。
+        返回命中数。
+        """
+        n = self.n
+        if not n:
+            return 0
+        if self._use_numpy():
+            return self._step_numpy(n, dt, px, py, radius)
+        x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+        r2 = radius * radius
+        check = px is not None
+        hits = 0
+        j = 0
+        for i in range(n):
+            bx = x[i] + vx[i] * dt
+            by = y[i] + vy[i] * dt
+            bl = life[i] - dt
+            if check:
+                ddx = bx - px
+                ddy = by - py
+                if ddx * ddx + ddy * ddy < r2:
+                    hits += 1
+                    continue
+            if bl <= 0:
+                continue
+            x[j] = bx
+            y[j] = by
+            vx[j] = vx[i]
+            vy[j] = vy[i]
+            life[j] = bl
+            j += 1
+        self.n = j
+        return hits
+
+    def _step_numpy(self, n, dt, px, py, radius):
+        c = self._np
+        x, y, vx, vy, life = (c[k][:n] for k in _COLUMNS)
+        x += vx * dt
+        y += vy * dt
+        life -= dt
+        keep = life > 0
+        hits = 0
+        if px is not None:
+            dx = x - px
+            dy = y - py
+            hit = dx * dx + dy * dy < radius * radius
+            hits = int(np.count_nonzero(hit))
+            if hits:
+                keep &= ~hit
+        m = int(np.count_nonzero(keep))
+        if m != n:
+            for k in _COLUMNS:
+                col = c[k]
+                col[:m] = col[:n][keep]
+            self.n = m
+        return hits
+
+    def steer(self, tx, ty, force, max_speed, dt):
+        """所有子弹朝 (tx, ty) 加速 force·dt, 速度不超过 max_speed"""
+        n = self.n
+        if not n:
+            return
+        if self._use_numpy():
+            c = self._np
+            x, y, vx, vy = (c[k][:n] for k in ('x', 'y', 'vx', 'vy'))
+            dx = tx - x
+            dy = ty - y
+            d = np.maximum(1, np.hypot(dx, dy))
+            vx += dx / d * (force * dt)
+            vy += dy / d * (force * dt)
+            spd = np.hypot(vx, vy)
+            fast = spd > max_speed
+            if fast.any():
+                scale = max_speed / spd[fast]
+                vx[fast] *= scale
+                vy[fast] *= scale
+            return
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        hypot = math.hypot
+        for i in range(n):
+            dx = tx - x[i]
+            dy = ty - y[i]
+            d = max(1, hypot(dx, dy))
+            vx[i] += (dx / d) * force * dt
+            vy[i] += (dy / d) * force * dt
+            spd = hypot(vx[i], vy[i])
+            if spd > max_speed:
+                vx[i] = vx[i] / spd * max_speed
+                vy[i] = vy[i] / spd * max_speed
+
+    # ==== 绘制 ====
+    def draw(self, surface, shake, color, radius=BULLET_RADIUS):
+        n = self.n
+        if not n:
+            return
+        sprite = bullet_sprite(color, radius)
+        w, h = surface.get_size()
+        ox = shake[0]
+        oy = shake[1]
+        if self._use_numpy():
+            c = self._np
+            sx = (c['x'][:n] + ox).astype(np.int64)
+            sy = (c['y'][:n] + oy).astype(np.int64)
+            vis = (sx > -radius) & (sx < w + radius) & (sy > -radius) & (sy < h + radius)
+            sx = (sx[vis] - radius).tolist()
+            sy = (sy[vis] - radius).tolist()
+            surface.blits([(sprite, p) for p in zip(sx, sy)], False)
+            return
+        x, y = self.x, self.y
+        seq = []
+        for i in range(n):
+            bsx = int(x[i] + ox)
+            bsy = int(y[i] + oy)
+            if -radius < bsx < w + radius and -radius < bsy < h + radius:
+                seq.append((sprite, (bsx - radius, bsy - radius)))
+        surface.blits(seq, False)
@@ -1,12 +1,17 @@
 """
 角色模块 - 割草游戏可选角色系统
 每个角色拥有独特的外观、属性和被动技能
+
+外观按帧预渲染 (boss_atlas.FrameAtlas, 同类型角色共享, create_character 时生成):
+  静态身体一帧; 随时间变化的部件 (指示光环、核心、粒子) 按其整数 alpha / 半径取帧;
+  冲刺残影按 GHOST_LEVELS 档 alpha 预渲染。绘制玩家只需几次 blit。
 """
 
 import pygame
 import math
 import random
 import i18n
+import boss_atlas
 
 # ---- 描边文字渲染 ----
 def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
@@ -36,6 +41,10 @@ ORANGE = (255, 170, 0)
 PURPLE = (170, 68, 255)
 GREEN = (68, 255, 68)
 
+GHOST_LEVELS = 16                  # 冲刺残影 alpha 档数
+GHOST_BOUNDS = (-22, -22, 44, 44)
+BODY_BOUNDS = (-32, -36, 64, 72)   # 身体帧范围 (相对角色中心)
+
 # ============================================================
 #  角色基类
 # ============================================================
@@ -73,6 +82,7 @@ class CharacterBase:
         self.dash_trail = []   # 冲刺残影 [x, y, alpha]
         self._passive_timer = 0
         self._passive_active = False
+        self._atlas = boss_atlas.atlas_for(type(self))
 
     # ---- 显示属性 (用于UI显示翻译后的文本) ----
     @property
@@ -140,26 +150,43 @@ class CharacterBase:
         sx = int(self.x + shake[0])
         sy = int(self.y + shake[1])
         # 残影
-        for tx, ty, ta in self.dash_trail:
-            tsx = int(tx + shake[0])
-            tsy = int(ty + shake[1])
-            a = max(0, min(255, int(ta)))
-            ts = pygame.Surface((44, 44), pygame.SRCALPHA)
-            self._draw_body_on(ts, 22, 22, a)
-            surface.blit(ts, (tsx - 22, tsy - 22))
+        if self.dash_trail:
+            atlas = self._atlas
+            seq = []
+            for tx, ty, ta in self.dash_trail:
+                level = max(1, min(GHOST_LEVELS, round(ta * GHOST_LEVELS / 255)))
+                seq.append(atlas.item(('ghost', level), int(tx + shake[0]), int(ty + shake[1]),
+                                      GHOST_BOUNDS, self._draw_body_on, _ghost_alpha(level)))
+            surface.blits(seq, False)
         # 绘制本体
         self._draw_character(surface, sx, sy)
 
+    def prewarm_frames(self):
+        """预渲染外观帧 (同类型只做一次)"""
+        if not self._atlas.warmed:
+            self._prewarm_atlas()
+            self._atlas.warmed = True
+
+    def _prewarm_atlas(self):
+        """子类覆盖 - 追加预渲染动画部件"""
+        self._atlas.frame('body', BODY_BOUNDS, self._draw_body_frame)
+        for level in range(1, GHOST_LEVELS + 1):
+            self._atlas.frame(('ghost', level), GHOST_BOUNDS, self._draw_body_on, _ghost_alpha(level))
+
     def _draw_body_on(self, surface, sx, sy, alpha):
         """在Surface上绘制角色简化版 (用于残影)"""
         c = (*self.CHAR_COLOR, alpha)
         pygame.draw.circle(surface, c, (sx, sy), 18)
 
-    def _draw_character(self, surface, sx, sy):
-        """绘制角色完整外观 (子类覆盖)"""
+    def _draw_body_frame(self, surface, sx, sy):
+        """静态身体 (子类覆盖), 预渲染为 'body' 帧"""
         pygame.draw.circle(surface, self.CHAR_COLOR, (sx, sy), 20)
         pygame.draw.circle(surface, WHITE, (sx, sy), 20, 3)
 
+    def _draw_character(self, surface, sx, sy):
+        """绘制角色完整外观 (有动画部件的子类覆盖)"""
+        self._atlas.blit(surface, 'body', sx, sy, BODY_BOUNDS, self._draw_body_frame)
+
     def get_stats_dict(self):
         """返回属性字典 (用于UI显示)"""
         return {
@@ -173,6 +200,28 @@ class CharacterBase:
         }
 
 
+def _ghost_alpha(level):
+    return round(level * 255 / GHOST_LEVELS)
+
+
+def _draw_dot(surface, cx, cy, color, r):
+    """粒子帧: 以锚点为圆心的实心圆"""
+    pygame.draw.circle(surface, color, (cx, cy), r)
+
+
+def _dot_bounds(r):
+    """与原先 (2r+2) 见方、圆心在 (r+1, r+1) 的临时 Surface 覆盖范围一致"""
+    return (-r - 1, -r - 1, r * 2 + 2, r * 2 + 2)
+
+
+def _draw_ring(surface, cx, cy, color, r, width):
+    pygame.draw.circle(surface, color, (cx, cy), r, width)
+
+
+def _ring_bounds(r):
+    return (-r, -r, r * 2, r * 2)
+
+
 # ============================================================
 #  角色1: 守墓人·阿什 [初始角色 - 均衡型]
 # ============================================================
@@ -192,7 +241,7 @@ class GravekeeperAsh(CharacterBase):
         if random.random() < 0.05:
             self.health = min(self.max_health, self.health + 5)
 
-    def _draw_character(self, surface, sx, sy):
+    def _draw_body_frame(self, surface, sx, sy):
         # 斗篷 (深青色)
         cloak_pts = [
             (sx, sy - 16),
@@ -261,15 +310,27 @@ class ShadowAssassinLila(CharacterBase):
                 self.move_speed = self._original_speed
                 self._shadow_boost_timer = 0
 
+    BOOST_BOUNDS = (-38, -20, 52, 40)
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        self._atlas.frame('boost', self.BOOST_BOUNDS, self._draw_boost)
+
     def _draw_character(self, surface, sx, sy):
-        # 暗影残影效果
         if self._shadow_boost_timer > 0:
-            for i in range(3):
-                a = max(0, min(120, int(80 - i * 25)))
-                offset = (i + 1) * 6
-                ss = pygame.Surface((40, 40), pygame.SRCALPHA)
-                pygame.draw.circle(ss, (170, 68, 255, a), (20, 20), 14)
-                surface.blit(ss, (sx - 20 - offset, sy - 20))
+            self._atlas.blit(surface, 'boost', sx, sy, self.BOOST_BOUNDS, self._draw_boost)
+        super()._draw_character(surface, sx, sy)
+
+    def _draw_boost(self, surface, sx, sy):
+        # 暗影残影效果
+        for i in range(3):
+            a = max(0, min(120, int(80 - i * 25)))
+            offset = (i + 1) * 6
+            ss = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.circle(ss, (170, 68, 255, a), (20, 20), 14)
+            surface.blit(ss, (sx - 20 - offset, sy - 20))
+
+    def _draw_body_frame(self, surface, sx, sy):
         # 身体 (紫色 + 尖锐轮廓)
         body_pts = [
             (sx, sy - 18),   # 头顶
@@ -324,7 +385,20 @@ class IronKnightGaron(CharacterBase):
                 self._fortified = False
                 self.armor = self._base_armor_val
 
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        for pa in range(40, 121):
+            self._atlas.frame(('fort', pa), _ring_bounds(24), _draw_ring, (100, 150, 255, pa), 24, 3)
+
     def _draw_character(self, surface, sx, sy):
+        super()._draw_character(surface, sx, sy)
+        # 强化指示
+        if self._fortified:
+            pa = max(0, min(120, int(80 + 40 * math.sin(self.anim_timer * 5))))
+            self._atlas.blit(surface, ('fort', pa), sx, sy, _ring_bounds(24), _draw_ring,
+                             (100, 150, 255, pa), 24, 3)
+
+    def _draw_body_frame(self, surface, sx, sy):
         # 盾牌 (左侧)
         shield_x = sx - 16
         shield_pts = [
@@ -350,12 +424,6 @@ class IronKnightGaron(CharacterBase):
         pygame.draw.rect(surface, (60, 80, 100), (sx - 6, head_y - 3, 12, 8))
         # 眼缝
         pygame.draw.line(surface, (200, 220, 255), (sx - 4, head_y), (sx + 4, head_y), 2)
-        # 强化指示
-        if self._fortified:
-            fs = pygame.Surface((48, 48), pygame.SRCALPHA)
-            pa = max(0, min(120, int(80 + 40 * math.sin(self.anim_timer * 5))))
-            pygame.draw.circle(fs, (100, 150, 255, pa), (24, 24), 24, 3)
-            surface.blit(fs, (sx - 24, sy - 24))
 
 
 # ============================================================
@@ -388,16 +456,23 @@ class AlchemistFio(CharacterBase):
             b[0] += b[2] * dt; b[1] += b[3] * dt; b[4] -= dt
         self._potion_bubbles = [b for b in self._potion_bubbles if b[4] > 0]
 
+    BUBBLE_COLORS = [(255, 200, 50), (255, 100, 0), (100, 255, 100)]
+
     def _draw_character(self, surface, sx, sy):
-        # 药水气泡
+        # 药水气泡 (每帧随机换色)
+        atlas = self._atlas
+        seq = []
         for dx, dy, _, _, bl in self._potion_bubbles:
             if bl > 0:
                 pa = max(0, min(200, int(200 * bl)))
                 pr = max(1, int(3 * bl))
-                bsf = pygame.Surface((pr * 2 + 2, pr * 2 + 2), pygame.SRCALPHA)
-                col = random.choice([(255, 200, 50, pa), (255, 100, 0, pa), (100, 255, 100, pa)])
-                pygame.draw.circle(bsf, col, (pr + 1, pr + 1), pr)
-                surface.blit(bsf, (sx + int(dx) - pr, sy + int(dy) - 20 - pr))
+                col = (*random.choice(self.BUBBLE_COLORS), pa)
+                seq.append(atlas.item(('bubble', col, pr), sx + int(dx) + 1, sy + int(dy) - 19,
+                                      _dot_bounds(pr), _draw_dot, col, pr))
+        surface.blits(seq, False)
+        super()._draw_character(surface, sx, sy)
+
+    def _draw_body_frame(self, surface, sx, sy):
         # 长袍
         robe_pts = [(sx, sy - 14), (sx - 16, sy + 14), (sx + 16, sy + 14)]
         pygame.draw.polygon(surface, (120, 70, 20), robe_pts)
@@ -462,46 +537,77 @@ class RiftWalkerVoid(CharacterBase):
             p[0] += p[2] * dt; p[1] += p[3] * dt; p[4] -= dt
         self._rift_particles = [p for p in self._rift_particles if p[4] > 0]
 
+    SWIRL_BOUNDS = (-20, -20, 40, 40)
+    CORE_BOUNDS = (-10, -10, 20, 20)
+
+    @staticmethod
+    def _swirl_key(phase_shift):
+        """漩涡线端点 (相对中心的整数坐标), 端点相同则画出的帧完全相同"""
+        pts = []
+        for i in range(3):
+            a = phase_shift * 2 + i * math.pi * 2 / 3
+            pts.append((int(math.cos(a) * 8), int(math.sin(a) * 8),
+                        int(math.cos(a + 1) * 14), int(math.sin(a + 1) * 14)))
+        # 三条线互不相交, 排序后每 1/3 圈的同一形状共用一帧
+        return tuple(sorted(pts))
+
+    @staticmethod
+    def _draw_swirl(surface, cx, cy, lines):
+        # 外环
+        pygame.draw.circle(surface, (100, 30, 180, 150), (cx, cy), 16)
+        # 漩涡线
+        for x1, y1, x2, y2 in lines:
+            pygame.draw.line(surface, (200, 130, 255, 200), (cx + x1, cy + y1), (cx + x2, cy + y2), 2)
+
+    @staticmethod
+    def _draw_core(surface, cx, cy, core_a):
+        pygame.draw.circle(surface, (255, 200, 255, core_a), (cx, cy), 6)
+        pygame.draw.circle(surface, (255, 255, 255, max(0, core_a - 50)), (cx, cy), 3)
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        atlas = self._atlas
+        # 漩涡每 1/3 圈重复一次, 按 1/4 度采样覆盖全部端点组合
+        for k in range(480):
+            lines = self._swirl_key(k * math.pi / 1440)
+            atlas.frame(('swirl', lines), self.SWIRL_BOUNDS, self._draw_swirl, lines)
+        for core_a in range(120, 241):
+            atlas.frame(('core', core_a), self.CORE_BOUNDS, self._draw_core, core_a)
+        for bt_a in range(201):
+            atlas.frame(('blink', bt_a), _ring_bounds(20), _draw_ring, (200, 100, 255, bt_a), 20, 2)
+
     def _draw_character(self, surface, sx, sy):
+        atlas = self._atlas
         # 裂隙粒子
+        seq = []
         for dx, dy, _, _, pl in self._rift_particles:
             if pl > 0:
                 pa = max(0, min(200, int(200 * pl)))
                 pr = max(1, int(3 * pl))
-                psf = pygame.Surface((pr * 2 + 2, pr * 2 + 2), pygame.SRCALPHA)
-                pygame.draw.circle(psf, (200, 100, 255, pa), (pr + 1, pr + 1), pr)
-                surface.blit(psf, (sx + int(dx) - pr, sy + int(dy) - pr))
+                col = (200, 100, 255, pa)
+                seq.append(atlas.item(('rift', pa, pr), sx + int(dx) + 1, sy + int(dy) + 1,
+                                      _dot_bounds(pr), _draw_dot, col, pr))
         # 身体 (半透明紫色漩涡)
-        body_s = pygame.Surface((40, 40), pygame.SRCALPHA)
-        # 外环
-        pygame.draw.circle(body_s, (100, 30, 180, 150), (20, 20), 16)
-        # 漩涡线
-        for i in range(3):
-            a = self._phase_shift * 2 + i * math.pi * 2 / 3
-            x1 = 20 + int(math.cos(a) * 8)
-            y1 = 20 + int(math.sin(a) * 8)
-            x2 = 20 + int(math.cos(a + 1) * 14)
-            y2 = 20 + int(math.sin(a + 1) * 14)
-            pygame.draw.line(body_s, (200, 130, 255, 200), (x1, y1), (x2, y2), 2)
-        surface.blit(body_s, (sx - 20, sy - 20))
+        lines = self._swirl_key(self._phase_shift)
+        seq.append(atlas.item(('swirl', lines), sx, sy, self.SWIRL_BOUNDS, self._draw_swirl, lines))
         # 核心
         core_a = max(0, min(255, int(180 + 60 * math.sin(self._phase_shift * 3))))
-        cs = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(cs, (255, 200, 255, core_a), (10, 10), 6)
-        pygame.draw.circle(cs, (255, 255, 255, max(0, core_a - 50)), (10, 10), 3)
-        surface.blit(cs, (sx - 10, sy - 10))
+        seq.append(atlas.item(('core', core_a), sx, sy, self.CORE_BOUNDS, self._draw_core, core_a))
+        # 眼 + 边框
+        seq.append(atlas.item('body', sx, sy, BODY_BOUNDS, self._draw_body_frame))
+        # 闪烁计时器指示
+        if self._blink_timer < 5:
+            bt_a = max(0, min(255, int(200 * (1 - self._blink_timer / 5) * abs(math.sin(self.anim_timer * 5)))))
+            seq.append(atlas.item(('blink', bt_a), sx, sy, _ring_bounds(20), _draw_ring,
+                                  (200, 100, 255, bt_a), 20, 2))
+        surface.blits(seq, False)
+
+    def _draw_body_frame(self, surface, sx, sy):
         # 眼
-        eye_a = max(0, min(255, int(200 + 55 * math.sin(self._phase_shift * 4))))
         pygame.draw.circle(surface, (255, 200, 255), (sx, sy - 8), 4)
         pygame.draw.circle(surface, (80, 0, 120), (sx, sy - 8), 2)
         # 边框
         pygame.draw.circle(surface, (200, 100, 255), (sx, sy), 16, 2)
-        # 闪烁计时器指示
-        if self._blink_timer < 5:
-            bt_a = max(0, min(255, int(200 * (1 - self._blink_timer / 5) * abs(math.sin(self.anim_timer * 5)))))
-            bts = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(bts, (200, 100, 255, bt_a), (20, 20), 20, 2)
-            surface.blit(bts, (sx - 20, sy - 20))
 
 
 # ============================================================
@@ -545,34 +651,40 @@ class ReaperDeath(CharacterBase):
             p[0] += p[2] * dt; p[1] += p[3] * dt; p[4] -= dt
         self._soul_particles = [p for p in self._soul_particles if p[4] > 0]
 
+    SOUL_BOUNDS = (-4, -4, 8, 8)
+    EYE_BOUNDS = (-5, -5, 10, 10)
+
+    @staticmethod
+    def _draw_eye(surface, cx, cy, eye_a):
+        pygame.draw.circle(surface, (255, 0, 0, eye_a), (cx, cy), 3)
+        pygame.draw.circle(surface, (255, 100, 100, max(0, eye_a - 80)), (cx, cy), 5)
+
+    def _prewarm_atlas(self):
+        super()._prewarm_atlas()
+        atlas = self._atlas
+        for eye_a in range(145, 256):
+            atlas.frame(('eye', eye_a), self.EYE_BOUNDS, self._draw_eye, eye_a)
+        for ha in range(201):
+            atlas.frame(('harvest', ha), _ring_bounds(25), _draw_ring, (255, 0, 0, ha), 25, 3)
+
     def _draw_character(self, surface, sx, sy):
+        atlas = self._atlas
         # 灵魂粒子
+        seq = []
         for dx, dy, _, _, pl in self._soul_particles:
             if pl > 0:
                 pa = max(0, min(150, int(150 * pl)))
-                psf = pygame.Surface((8, 8), pygame.SRCALPHA)
-                pygame.draw.circle(psf, (255, 50, 50, pa), (4, 4), max(1, int(3 * pl)))
-                surface.blit(psf, (sx + int(dx) - 4, sy + int(dy) - 4))
-        # 黑色斗篷
-        cloak_pts = [
-            (sx, sy - 20),
-            (sx - 20, sy + 8),
-            (sx - 14, sy + 16),
-            (sx + 14, sy + 16),
-            (sx + 20, sy + 8),
-        ]
-        pygame.draw.polygon(surface, (20, 0, 0), cloak_pts)
-        pygame.draw.polygon(surface, (80, 0, 0), cloak_pts, 2)
-        # 兜帽
-        hood_pts = [(sx - 12, sy - 8), (sx + 12, sy - 8), (sx, sy - 24)]
-        pygame.draw.polygon(surface, (30, 0, 0), hood_pts)
+                pr = max(1, int(3 * pl))
+                col = (255, 50, 50, pa)
+                seq.append(atlas.item(('soul', pa, pr), sx + int(dx), sy + int(dy),
+                                      self.SOUL_BOUNDS, _draw_dot, col, pr))
+        # 斗篷 + 兜帽
+        seq.append(atlas.item('body', sx, sy, BODY_BOUNDS, self._draw_body_frame))
         # 红色发光眼睛
         eye_a = max(0, min(255, int(200 + 55 * math.sin(self.anim_timer * 4))))
         for ex in [-4, 4]:
-            es = pygame.Surface((10, 10), pygame.SRCALPHA)
-            pygame.draw.circle(es, (255, 0, 0, eye_a), (5, 5), 3)
-            pygame.draw.circle(es, (255, 100, 100, max(0, eye_a - 80)), (5, 5), 5)
-            surface.blit(es, (sx + ex - 5, sy - 15))
+            seq.append(atlas.item(('eye', eye_a), sx + ex, sy - 10, self.EYE_BOUNDS, self._draw_eye, eye_a))
+        surface.blits(seq, False)
         # 镰刀
         sa = self._scythe_angle
         blade_r = 22
@@ -585,9 +697,22 @@ class ReaperDeath(CharacterBase):
         # 收割buff指示
         if self._harvest_timer > 0:
             ha = max(0, min(200, int(200 * self._harvest_timer * abs(math.sin(self.anim_timer * 8)))))
-            hs = pygame.Surface((50, 50), pygame.SRCALPHA)
-            pygame.draw.circle(hs, (255, 0, 0, ha), (25, 25), 25, 3)
-            surface.blit(hs, (sx - 25, sy - 25))
+            atlas.blit(surface, ('harvest', ha), sx, sy, _ring_bounds(25), _draw_ring, (255, 0, 0, ha), 25, 3)
+
+    def _draw_body_frame(self, surface, sx, sy):
+        # 黑色斗篷
+        cloak_pts = [
+            (sx, sy - 20),
+            (sx - 20, sy + 8),
+            (sx - 14, sy + 16),
+            (sx + 14, sy + 16),
+            (sx + 20, sy + 8),
+        ]
+        pygame.draw.polygon(surface, (20, 0, 0), cloak_pts)
+        pygame.draw.polygon(surface, (80, 0, 0), cloak_pts, 2)
+        # 兜帽
+        hood_pts = [(sx - 12, sy - 8), (sx + 12, sy - 8), (sx, sy - 24)]
+        pygame.draw.polygon(surface, (30, 0, 0), hood_pts)
 
 
 # ============================================================
@@ -605,7 +730,9 @@ CHARACTER_TYPES = [
 def create_character(index, x, y):
     """根据索引创建角色"""
     char_type = CHARACTER_TYPES[index % len(CHARACTER_TYPES)]
-    return char_type(x, y)
+    ch = char_type(x, y)
+    ch.prewarm_frames()
+    return ch
 
 def get_character_count():
     return len(CHARACTER_TYPES)
@@ -8,7 +8,11 @@
 import pygame
 import random
 import math
+import unicodedata
+from collections import OrderedDict
 import i18n
+import meta_systems
+import render_scale
 
 # ============================================================
 #  引用 (由 init() 注入)
@@ -39,6 +43,10 @@ def init(screen, font_lg, font_md, font_sm, font_xs, width=1200, height=800):
     _font_xs = font_xs
     WIDTH = width
     HEIGHT = height
+    # 字体 / 分辨率变了, 之前排好的文字和底板都作废
+    _layouts.clear()
+    _labels.clear()
+    _chrome.clear()
 
 
 def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=2):
@@ -158,51 +166,95 @@ NPCS = {
 #  对话内容数据库 (上下文感知)
 # ============================================================
 
-def _get_context_tags(save_data):
-    """根据存档数据生成上下文标签"""
-    tags = set()
-    kills = save_data.get('best_kills', 0)
-    runs = save_data.get('total_runs', 0)
-    gold = save_data.get('gold', 0)
-    souls = save_data.get('soul_shards', 0)
-    equip_count = len(save_data.get('meta_equipment', []))
-
+def _runs_tags(runs):
     if runs == 0:
-        tags.add('first_time')
-    elif runs <= 3:
-        tags.add('newbie')
-    elif runs <= 10:
-        tags.add('experienced')
-    else:
-        tags.add('veteran')
+        return ('first_time',)
+    if runs <= 3:
+        return ('newbie',)
+    if runs <= 10:
+        return ('experienced',)
+    return ('veteran',)
 
+
+def _kills_tags(kills):
     if kills >= 1000:
-        tags.add('elite_killer')
-    elif kills >= 500:
-        tags.add('skilled')
-    elif kills >= 100:
-        tags.add('decent')
+        return ('elite_killer',)
+    if kills >= 500:
+        return ('skilled',)
+    if kills >= 100:
+        return ('decent',)
+    return ()
+
 
+def _gold_tags(gold):
     if gold >= 50000:
-        tags.add('rich')
-    elif gold <= 100:
-        tags.add('poor')
+        return ('rich',)
+    if gold <= 100:
+        return ('poor',)
+    return ()
+
 
+def _equip_tags(equip_count):
     if equip_count >= 10:
-        tags.add('well_equipped')
-    elif equip_count == 0:
-        tags.add('no_equipment')
+        return ('well_equipped',)
+    if equip_count == 0:
+        return ('no_equipment',)
+    return ()
 
-    if souls >= 1000:
-        tags.add('soul_rich')
 
-    unlocked = save_data.get('unlocked_chars', [0])
-    if len(unlocked) >= 4:
-        tags.add('many_chars')
+# 上下文标签规则: (名称, 从存档取输入值, 输入值 → 标签)
+# 取值都是 O(1) 的 (装备数量由仓库对象增量维护), 分档只在输入值变化时重算
+CONTEXT_RULES = (
+    ('runs',   lambda sd: sd.get('total_runs', 0),          _runs_tags),
+    ('kills',  lambda sd: sd.get('best_kills', 0),          _kills_tags),
+    ('gold',   lambda sd: sd.get('gold', 0),                _gold_tags),
+    ('equip',  meta_systems.warehouse_size,                 _equip_tags),
+    ('souls',  lambda sd: sd.get('soul_shards', 0) >= 1000, lambda v: ('soul_rich',) if v else ()),
+    ('chars',  lambda sd: len(sd.get('unlocked_chars', [0])) >= 4,
+               lambda v: ('many_chars',) if v else ()),
+)
 
+
+def _get_context_tags(save_data):
+    """根据存档数据生成上下文标签 (完整计算)"""
+    tags = set()
+    for _, value_of, classify in CONTEXT_RULES:
+        tags.update(classify(value_of(save_data)))
     return tags
 
 
+class ContextTags:
+    """
+    增量维护的上下文标签: 记住每条规则上次的输入值和结果,
+    存档变化后只重算输入值变了的规则; 换了存档对象则全部重建。
+    """
+
+    def __init__(self):
+        self._save_id = None
+        self._inputs = [None] * len(CONTEXT_RULES)
+        self._parts = [()] * len(CONTEXT_RULES)
+        self._tags = frozenset()
+
+    def get(self, save_data):
+        fresh = id(save_data) != self._save_id
+        self._save_id = id(save_data)
+        changed = False
+        for i, (_, value_of, classify) in enumerate(CONTEXT_RULES):
+            v = value_of(save_data)
+            if fresh or v != self._inputs[i]:
+                self._inputs[i] = v
+                part = classify(v)
+                if part != self._parts[i]:
+                    self._parts[i] = part
+                    changed = True
+        if changed or fresh:
+            self._tags = frozenset(t for part in self._parts for t in part)
+        return self._tags
+
+
+context_tags = ContextTags()
+
+
 # 每个NPC的对话数据库
 # 格式: (优先级标签集合, 对话行列表, 选项列表)
 #   标签集合: 如果玩家上下文包含这些标签之一则可触发, 空集=总是可选
@@ -406,6 +458,67 @@ DIALOGUE_DB = {
 }
 
 
+# ============================================================
+#  对话索引 (加载时构建)
+# ============================================================
+# DIALOGUE_DB 条目可带第 4 项优先级 (默认 0, 越大越优先, 同优先级按书写顺序)
+class DialogueIndex:
+    """
+    每个NPC: 标签 → 候选条目位掩码。位号按优先级排列 (0 号最优先),
+    当前标签各自的掩码取并集后最低位即为命中条目, 开销只与标签数有关;
+    无命中时的兜底条目 (最后一个无标签条目, 否则最后一个条目) 预先算好。
+    """
+
+    def __init__(self, db):
+        self.entries = {}       # npc_id → [(lines, choices)], 按优先级排好
+        self.masks = {}         # npc_id → {tag: 位掩码}
+        self.fallback = {}      # npc_id → (lines, choices) | None
+        for npc_id, dialogues in db.items():
+            self.add_npc(npc_id, dialogues)
+
+    def add_npc(self, npc_id, dialogues):
+        order = sorted(range(len(dialogues)),
+                       key=lambda i: (-(dialogues[i][3] if len(dialogues[i]) > 3 else 0), i))
+        entries = []
+        masks = {}
+        for bit, i in enumerate(order):
+            req_tags, lines, choices = dialogues[i][:3]
+            entries.append((lines, choices))
+            for tag in req_tags or ():
+                masks[tag] = masks.get(tag, 0) | (1 << bit)
+        fallback = None
+        for req_tags, lines, choices in (d[:3] for d in reversed(dialogues)):
+            if not req_tags:
+                fallback = (lines, choices)
+                break
+        if fallback is None and dialogues:
+            fallback = (dialogues[-1][1], dialogues[-1][2])
+        self.entries[npc_id] = entries
+        self.masks[npc_id] = masks
+        self.fallback[npc_id] = fallback
+
+    def match(self, npc_id, tags):
+        """→ (lines, choices) | None"""
+        masks = self.masks.get(npc_id)
+        if masks is None:
+            return None
+        hit = 0
+        for tag in tags:
+            hit |= masks.get(tag, 0)
+        if hit:
+            return self.entries[npc_id][(hit & -hit).bit_length() - 1]
+        return self.fallback[npc_id]
+
+
+DIALOGUE_INDEX = DialogueIndex(DIALOGUE_DB)
+
+
+def rebuild_dialogue_index():
+    """DIALOGUE_DB 被修改 (例如载入内容包) 后调用"""
+    global DIALOGUE_INDEX
+    DIALOGUE_INDEX = DialogueIndex(DIALOGUE_DB)
+
+
 # ============================================================
 #  对话状态管理
 # ============================================================
@@ -432,23 +545,7 @@ class DialogueState:
         self.char_timer = 0
 
         # 根据上下文选择对话
-        tags = _get_context_tags(save_data)
-        dialogues = DIALOGUE_DB.get(npc_id, [])
-
-        # 按优先级匹配
-        matched = None
-        for req_tags, lines, choices in dialogues:
-            if req_tags and req_tags & tags:
-                matched = (lines, choices)
-                break
-        if not matched:
-            # 用最后一个兜底
-            for req_tags, lines, choices in reversed(dialogues):
-                if not req_tags:
-                    matched = (lines, choices)
-                    break
-        if not matched and dialogues:
-            matched = (dialogues[-1][1], dialogues[-1][2])
+        matched = DIALOGUE_INDEX.match(npc_id, context_tags.get(save_data))
 
         if matched:
             self.lines = matched[0]
@@ -520,6 +617,189 @@ class DialogueState:
 dialogue_state = DialogueState()
 
 
+# ============================================================
+#  文字排版 (按像素宽度换行, 每行只渲染一次)
+# ============================================================
+DIALOGUE_BOX_W = 900
+DIALOGUE_BOX_H = 260
+DIALOGUE_TEXT_W = 760       # 正文换行宽度 (约等于旧版 38 个汉字)
+DIALOGUE_LINE_H = 30
+OUTLINE = 2                 # 对话框文字描边宽度
+LAYOUT_CACHE_SIZE = 32
+LABEL_CACHE_SIZE = 128
+
+# 不能出现在行首的标点 (挂在上一行末尾)
+_NO_LINE_START = set('，。、；：？！）》」』】〕～,.;:?!)')
+
+_layouts = OrderedDict()    # (id(font), text, color, max_w) → TextLayout
+_labels = OrderedDict()     # (id(font), text, color) → 描边文字 Surface
+_chrome = {}                # 对话框底板 / 遮罩 / 选项底板
+
+
+def _is_wide(ch):
+    """CJK 等全角字符: 每个字符之间都可以断行"""
+    return unicodedata.east_asian_width(ch) in ('W', 'F')
+
+
+def _tokens(text):
+    """拆成换行单位: 全角字符逐个, 拉丁单词连同其后的空格为一个整体"""
+    tokens = []
+    word = ''
+    for ch in text:
+        if _is_wide(ch):
+            if word:
+                tokens.append(word)
+                word = ''
+            tokens.append(ch)
+        elif ch == ' ':
+            word += ch
+            tokens.append(word)
+            word = ''
+        else:
+            if word.endswith(' '):
+                tokens.append(word)
+                word = ''
+            word += ch
+    if word:
+        tokens.append(word)
+    return tokens
+
+
+def wrap_text(font, text, max_w):
+    """按像素宽度换行 → [行文本, ...]; 过长的单词按字符拆开"""
+    lines = []
+    for para in text.split('\n'):
+        line = ''
+        line_w = 0
+        for tok in _tokens(para):
+            tw = font.size(tok)[0]
+            if line and line_w + font.size(tok.rstrip())[0] > max_w and tok.rstrip()[:1] not in _NO_LINE_START:
+                lines.append(line.rstrip())
+                line, line_w = '', 0
+                tok = tok.lstrip()
+                tw = font.size(tok)[0]
+            if tw > max_w and not line:
+                # 单个单词就超宽: 逐字符切
+                for ch in tok:
+                    cw = font.size(ch)[0]
+                    if line and line_w + cw > max_w:
+                        lines.append(line)
+                        line, line_w = '', 0
+                    line += ch
+                    line_w += cw
+                continue
+            line += tok
+            line_w += tw
+        lines.append(line.rstrip())
+    return lines
+
+
+class TextLayout:
+    """
+    一段文字排好版后的结果: 每行一张描边 Surface, 外加每个前缀的像素宽度。
+    打字机效果只需按已显示字符数裁剪 blit, 不再逐帧重新渲染。
+    """
+
+    def __init__(self, font, text, color, max_w, line_h=DIALOGUE_LINE_H):
+        self.line_h = line_h
+        self.lines = []         # [(起始字符下标, 行文本, Surface, 前缀宽度表)]
+        self.length = len(text)
+        pos = 0
+        for line in wrap_text(font, text, max_w):
+            start = text.find(line, pos) if line else pos
+            if start < 0:
+                start = pos
+            widths = [0]
+            for k in range(1, len(line) + 1):
+                widths.append(font.size(line[:k])[0])
+            surf = _render_outlined(font, line, color, offset=OUTLINE) if line else None
+            self.lines.append((start, line, surf, widths))
+            pos = start + len(line)
+
+    def draw(self, surface, x, y, reveal=None):
+        """reveal: 已显示的原文字符数 (None = 全部)"""
+        dy = 0
+        for start, line, surf, widths in self.lines:
+            if reveal is not None and reveal <= start:
+                break
+            if surf is not None:
+                shown = len(line) if reveal is None else min(len(line), reveal - start)
+                if shown >= len(line):
+                    surface.blit(surf, (x, y + dy))
+                else:
+                    w = widths[shown] + OUTLINE
+                    surface.blit(surf, (x, y + dy), (0, 0, w, surf.get_height()))
+            dy += self.line_h
+        return dy
+
+
+def _lru_get(cache, key, limit, build):
+    item = cache.get(key)
+    if item is None:
+        item = build()
+        cache[key] = item
+        if len(cache) > limit:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return item
+
+
+def get_layout(font, text, color, max_w=DIALOGUE_TEXT_W):
+    return _lru_get(_layouts, (id(font), text, color, max_w), LAYOUT_CACHE_SIZE,
+                    lambda: TextLayout(font, text, color, max_w))
+
+
+def _label(font, text, color):
+    """单行描边文字 (名称、提示、选项等), 按内容缓存"""
+    return _lru_get(_labels, (id(font), text, color), LABEL_CACHE_SIZE,
+                    lambda: _render_outlined(font, text, color))
+
+
+# ============================================================
+#  对话框底板缓存
+# ============================================================
+def _overlay():
+    surf = _chrome.get('overlay')
+    if surf is None or surf.get_size() != (WIDTH, HEIGHT):
+        surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 140))
+        _chrome['overlay'] = surf
+    return surf
+
+
+def _box_surface(color):
+    """对话框背景 + 边框 + 内发光, 每种 NPC 颜色烘焙一次"""
+    key = ('box', color)
+    surf = _chrome.get(key)
+    if surf is None:
+        box_w, box_h = DIALOGUE_BOX_W, DIALOGUE_BOX_H
+        surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (12, 10, 25, 220), (0, 0, box_w, box_h), border_radius=12)
+        pygame.draw.rect(surf, (*color, 150), (0, 0, box_w, box_h), 3, border_radius=12)
+        # 内发光效果
+        glow = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        pygame.draw.rect(glow, (*color, 15), (4, 4, box_w - 8, box_h - 8), border_radius=10)
+        surf.blit(glow, (0, 0))
+        _chrome[key] = surf
+    return surf
+
+
+def _choice_surface(color, w, h, hover):
+    key = ('choice', color, w, h, hover)
+    cs = _chrome.get(key)
+    if cs is None:
+        cs = pygame.Surface((w, h), pygame.SRCALPHA)
+        if hover:
+            pygame.draw.rect(cs, (*color, 40), (0, 0, w, h), border_radius=6)
+            pygame.draw.rect(cs, (*color, 180), (0, 0, w, h), 2, border_radius=6)
+        else:
+            pygame.draw.rect(cs, (255, 255, 255, 10), (0, 0, w, h), border_radius=6)
+            pygame.draw.rect(cs, (255, 255, 255, 60), (0, 0, w, h), 1, border_radius=6)
+        _chrome[key] = cs
+    return cs
+
+
 # ============================================================
 #  绘制系统
 # ============================================================
@@ -538,26 +818,15 @@ def draw_dialogue_box(surface, save_data):
         return buttons
 
     # 半透明遮罩
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 140))
-    surface.blit(overlay, (0, 0))
+    surface.blit(_overlay(), (0, 0))
 
     # 对话框背景
-    box_w = 900
-    box_h = 260
+    box_w = DIALOGUE_BOX_W
+    box_h = DIALOGUE_BOX_H
     box_x = WIDTH // 2 - box_w // 2
     box_y = HEIGHT - box_h - 30
     box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
-
-    # 绘制对话框
-    box_surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    pygame.draw.rect(box_surf, (12, 10, 25, 220), (0, 0, box_w, box_h), border_radius=12)
-    pygame.draw.rect(box_surf, (*npc.color, 150), (0, 0, box_w, box_h), 3, border_radius=12)
-    # 内发光效果
-    glow = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    pygame.draw.rect(glow, (*npc.color, 15), (4, 4, box_w - 8, box_h - 8), border_radius=10)
-    box_surf.blit(glow, (0, 0))
-    surface.blit(box_surf, (box_x, box_y))
+    surface.blit(_box_surface(npc.color), (box_x, box_y))
 
     # NPC头像
     avatar_x = box_x + 70
@@ -568,7 +837,7 @@ def draw_dialogue_box(surface, save_data):
     npc.draw_avatar(surface, avatar_x, avatar_y, 38)
 
     # NPC名称
-    name_t = _render_outlined(_font_sm, f"{i18n.t(npc.title)}·{i18n.t(npc.name.split('·')[-1])}", npc.color)
+    name_t = _label(_font_sm, f"{i18n.t(npc.title)}·{i18n.t(npc.name.split('·')[-1])}", npc.color)
     surface.blit(name_t, (avatar_x + 58, avatar_y - 15))
 
     # 对话内容
@@ -576,55 +845,40 @@ def draw_dialogue_box(surface, save_data):
     text_y = box_y + 25
 
     if not ds.showing_choices:
-        # 显示当前对话行
+        # 显示当前对话行 (整段排版一次, 按已显示字符数裁剪)
         if ds.line_index < len(ds.lines):
             speaker_id, full_text = ds.lines[ds.line_index]
-            displayed = full_text[:ds.char_reveal]
-
-            # 分行显示 (自动换行)
-            max_chars = 38
-            dy = 0
-            for start in range(0, len(displayed), max_chars):
-                chunk = displayed[start:start + max_chars]
-                lt = _render_outlined(_font_sm, chunk, (240, 240, 250))
-                surface.blit(lt, (text_x, text_y + dy))
-                dy += 30
+            layout = get_layout(_font_sm, full_text, (240, 240, 250))
+            layout.draw(surface, text_x, text_y, ds.char_reveal)
 
             # 提示继续
             if ds.char_reveal >= len(full_text):
                 blink = int(pygame.time.get_ticks() / 500) % 2
                 if blink:
-                    cont = _render_outlined(_font_xs, "▼ 点击继续", (180, 180, 200))
+                    cont = _label(_font_xs, "▼ 点击继续", (180, 180, 200))
                     surface.blit(cont, (box_x + box_w - 150, box_y + box_h - 35))
 
         # 点击区域 (整个对话框)
         buttons['dialogue_advance'] = box_rect
     else:
         # 显示选项
-        prompt = _render_outlined(_font_sm, "请选择:", (200, 200, 220))
+        prompt = _label(_font_sm, "请选择:", (200, 200, 220))
         surface.blit(prompt, (text_x, text_y))
 
         if ds.choices:
-            mx, my = pygame.mouse.get_pos()
+            mx, my = render_scale.mouse_pos()
             for ci, (ctext, _, _) in enumerate(ds.choices):
                 cy = text_y + 40 + ci * 45
                 crect = pygame.Rect(text_x, cy, box_w - 60, 38)
                 hover = crect.collidepoint(mx, my)
-
-                cs = pygame.Surface((crect.width, crect.height), pygame.SRCALPHA)
-                if hover:
-                    pygame.draw.rect(cs, (*npc.color, 40), (0, 0, crect.width, crect.height), border_radius=6)
-                    pygame.draw.rect(cs, (*npc.color, 180), (0, 0, crect.width, crect.height), 2, border_radius=6)
-                else:
-                    pygame.draw.rect(cs, (255, 255, 255, 10), (0, 0, crect.width, crect.height), border_radius=6)
-                    pygame.draw.rect(cs, (255, 255, 255, 60), (0, 0, crect.width, crect.height), 1, border_radius=6)
-                surface.blit(cs, (crect.x, crect.y))
+                surface.blit(_choice_surface(npc.color, crect.width, crect.height, hover),
+                             (crect.x, crect.y))
 
                 # 选项序号
-                num = _render_outlined(_font_xs, f"{ci+1}.", npc.color)
+                num = _label(_font_xs, f"{ci+1}.", npc.color)
                 surface.blit(num, (crect.x + 10, crect.y + 8))
                 # 选项文本
-                ct = _render_outlined(_font_sm, ctext, WHITE if hover else (200, 200, 210))
+                ct = _label(_font_sm, ctext, WHITE if hover else (200, 200, 210))
                 surface.blit(ct, (crect.x + 35, crect.y + 6))
 
                 buttons[('dialogue_choice', ci)] = crect
@@ -658,7 +912,7 @@ def draw_npc_select(surface, save_data):
     spacing = 30
     total_w = len(npc_list) * card_w + (len(npc_list) - 1) * spacing
     start_x = WIDTH // 2 - total_w // 2
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
 
     t = pygame.time.get_ticks() / 1000.0
 
@@ -0,0 +1,110 @@
+"""
+《暗夜割草者：深渊轮回》 — 装备目录
+========================================
+EQUIPMENT_DB 的只读索引: 按品质 / 部位 / (品质, 部位) 预先分组,
+并为各掉落池、抽卡池预计算累积权重表, 抽样为 O(log n)。
+game_main 在导入时构建一次, meta_systems 通过 get_catalog(equipment_db)
+取得同一个实例。
+========================================
+"""
+
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+RARITY_ORDER = ('common', 'uncommon', 'rare', 'epic', 'legendary')
+
+
+class WeightTable:
+    """累积权重表: keys 与 cumulative 一一对应, 抽样用二分查找"""
+    __slots__ = ('keys', 'cumulative', 'total')
+
+    def __init__(self, weights):
+        # 权重为 0 的项直接剔除, 不会被抽中
+        items = [(k, w) for k, w in weights.items() if w > 0]
+        if not items:
+            raise ValueError("权重表不能为空")
+        self.keys = tuple(k for k, _ in items)
+        self.cumulative = tuple(accumulate(w for _, w in items))
+        self.total = self.cumulative[-1]
+
+    def sample(self, rng=random):
+        return self.keys[bisect_right(self.cumulative, rng.random() * self.total)]
+
+    def __repr__(self):
+        return f"WeightTable({dict(zip(self.keys, self.cumulative))})"
+
+
+class EquipmentCatalog:
+    """装备模板的不可变索引, 构建后不再修改"""
+    __slots__ = ('templates', '_by_rarity', '_by_slot', '_by_rarity_slot', '_pools')
+
+    def __init__(self, equipment_db, pools=None):
+        templates = tuple(equipment_db)
+        by_rarity, by_slot, by_pair = {}, {}, {}
+        for idx, tpl in enumerate(templates):
+            slot, rarity = tpl[1], tpl[2]
+            by_rarity.setdefault(rarity, []).append(idx)
+            by_slot.setdefault(slot, []).append(idx)
+            by_pair.setdefault((rarity, slot), []).append(idx)
+        object.__setattr__(self, 'templates', templates)
+        object.__setattr__(self, '_by_rarity', {k: tuple(v) for k, v in by_rarity.items()})
+        object.__setattr__(self, '_by_slot', {k: tuple(v) for k, v in by_slot.items()})
+        object.__setattr__(self, '_by_rarity_slot', {k: tuple(v) for k, v in by_pair.items()})
+        object.__setattr__(self, '_pools',
+                           {name: WeightTable(w) for name, w in (pools or {}).items()})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EquipmentCatalog 是只读的")
+
+    def __len__(self):
+        return len(self.templates)
+
+    def __getitem__(self, idx):
+        return self.templates[idx]
+
+    # ---- 索引查询 ----
+    def by_rarity(self, rarity):
+        return self._by_rarity.get(rarity, ())
+
+    def by_slot(self, slot):
+        return self._by_slot.get(slot, ())
+
+    def by_rarity_slot(self, rarity, slot):
+        return self._by_rarity_slot.get((rarity, slot), ())
+
+    def pool(self, name):
+        return self._pools[name]
+
+    # ---- 抽样 ----
+    def roll_rarity(self, pool, rng=random):
+        """按指定权重池抽一个品质"""
+        return self._pools[pool].sample(rng)
+
+    def pick(self, rarity, slot=None, rng=random):
+        """从该品质(可选限定部位)中等概率选一个模板索引, 无候选返回 None"""
+        cands = self.by_rarity(rarity) if slot is None else self.by_rarity_slot(rarity, slot)
+        if not cands:
+            return None
+        return cands[int(rng.random() * len(cands))]
+
+
+# ============================================================
+#  共享实例
+# ============================================================
+_catalogs = {}   # id(equipment_db) -> (equipment_db, EquipmentCatalog)
+
+
+def build_catalog(equipment_db, pools=None):
+    """构建目录并登记, 之后 get_catalog(equipment_db) 返回同一实例"""
+    cat = EquipmentCatalog(equipment_db, pools)
+    _catalogs[id(equipment_db)] = (equipment_db, cat)
+    return cat
+
+
+def get_catalog(equipment_db, pools=None):
+    """取 equipment_db 对应的目录; 未登记时用 pools 现场构建并登记"""
+    hit = _catalogs.get(id(equipment_db))
+    if hit is not None and hit[0] is equipment_db:
+        return hit[1]
+    return build_catalog(equipment_db, pools)
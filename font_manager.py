@@ -0,0 +1,163 @@
+"""
+《暗夜割草者：深渊轮回》 — 字体管理
+========================================
+每种语言的候选字体只解析一次 (系统字体名 → 文件路径, 不命中再试固定路径),
+解析结果写入 font_index.json, 之后启动直接读路径, 不再扫描系统字体。
+Font 对象按 (路径, 字号) 缓存, 切换语言 / 分辨率时已有字号直接复用。
+prewarm() 把当前语言译文中出现的字符预先过一遍 metrics,
+让字形进入 SDL_ttf 的缓存, 首帧绘制不再逐字加载。
+========================================
+"""
+
+import os
+import sys
+import json
+import threading
+
+import pygame
+
+INDEX_VERSION = 1
+
+if getattr(sys, 'frozen', False):
+    INDEX_PATH = os.path.join(os.path.dirname(sys.executable), 'font_index.json')
+else:
+    INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'font_index.json')
+
+# 按语言优先选择Windows自带系统字体，无需打包额外字体
+FONT_PRIORITY = {
+    'ko': [
+        ('Malgun Gothic',        'C:/Windows/Fonts/malgun.ttf'),
+        ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
+        ('Arial',                'C:/Windows/Fonts/arial.ttf'),
+    ],
+    'ja': [
+        ('Yu Gothic',            'C:/Windows/Fonts/YuGothM.ttc'),
+        ('MS Gothic',            'C:/Windows/Fonts/msgothic.ttc'),
+        ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
+        ('Arial',                'C:/Windows/Fonts/arial.ttf'),
+    ],
+    'zh': [
+        ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
+        ('SimHei',               'C:/Windows/Fonts/simhei.ttf'),
+        ('Arial',                'C:/Windows/Fonts/arial.ttf'),
+    ],
+    'ru': [
+        ('Arial',                'C:/Windows/Fonts/arial.ttf'),
+        ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
+    ],
+    'en': [
+        ('Arial',                'C:/Windows/Fonts/arial.ttf'),
+        ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
+    ],
+}
+
+_index = None           # {lang: {'candidates': [...], 'path': str | None}}
+_fonts = {}             # (path, size) → pygame.font.Font
+_warmed = set()         # 已预热的 (path, size, lang)
+_lock = threading.Lock()
+
+
+# ============================================================
+#  路径索引
+# ============================================================
+def _candidates(lang):
+    return FONT_PRIORITY.get(lang, FONT_PRIORITY['en'])
+
+
+def _load_index():
+    global _index
+    if _index is not None:
+        return _index
+    _index = {}
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        if raw.get('version') == INDEX_VERSION:
+            _index = raw.get('langs', {})
+    except (OSError, ValueError, AttributeError):
+        pass
+    return _index
+
+
+def _save_index():
+    try:
+        tmp = INDEX_PATH + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'langs': _index}, f,
+                      ensure_ascii=False, indent=1)
+        os.replace(tmp, INDEX_PATH)
+    except OSError:
+        pass   # 只读目录: 本次照常使用, 下次启动重新解析
+
+
+def _cached_entry(lang):
+    """索引中仍然有效的条目 (候选表没改过且文件还在), 否则 None"""
+    entry = _load_index().get(lang)
+    if not entry or entry.get('candidates') != [list(c) for c in _candidates(lang)]:
+        return None
+    path = entry.get('path')
+    if path is not None and not os.path.exists(path):
+        return None
+    return entry
+
+
+def _resolve(lang):
+    """按候选顺序找到第一个可用的字体文件; 都不可用返回 None (pygame 默认字体)"""
+    for name, path in _candidates(lang):
+        try:
+            found = pygame.font.match_font(name)
+        except Exception:
+            found = None
+        if found:
+            return found
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def font_path(lang):
+    """语言 → 字体文件路径 (None 表示默认字体); 首次解析后持久化"""
+    with _lock:
+        entry = _cached_entry(lang)
+        if entry is None:
+            entry = {'candidates': [list(c) for c in _candidates(lang)],
+                     'path': _resolve(lang)}
+            _index[lang] = entry
+            _save_index()
+        return entry['path']
+
+
+def index_complete():
+    """所有语言都已在索引中 (为 False 时值得在后台预先扫描系统字体)"""
+    return all(_cached_entry(lang) is not None for lang in FONT_PRIORITY)
+
+
+# ============================================================
+#  Font 缓存
+# ============================================================
+def get_font(size, lang):
+    path = font_path(lang)
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(path, size)
+        except Exception:
+            font = pygame.font.Font(None, size)
+        _fonts[key] = font
+    return font
+
+
+def prewarm(lang, sizes, text):
+    """把 text 中出现的字符按每个字号各过一遍 metrics, 让字形进入缓存"""
+    chars = ''.join(sorted(set(text) - {'\n', '\r', '\t'}))
+    if not chars:
+        return
+    for size in sizes:
+        font = get_font(size, lang)
+        key = (font_path(lang), size, lang)
+        if key in _warmed:
+            continue
+        for i in range(0, len(chars), 256):
+            font.metrics(chars[i:i + 256])
+        _warmed.add(key)
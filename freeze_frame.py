@@ -0,0 +1,58 @@
+"""
+《暗夜割草者：深渊轮回》 — 冻结画面
+========================================
+暂停 / 升级选择 / 背包 / Boss警告 期间场景不会变化,
+进入这些状态时把最后一帧战斗画面拷贝成快照, 之后每帧只 blit 快照再叠加界面,
+不再重画背景、宝石、敌人、Boss、角色和 HUD。
+各界面原本每帧新建的全屏暗化遮罩也按 alpha 烘焙进快照 (每种 alpha 只做一次)。
+========================================
+"""
+
+import pygame
+
+
+class FreezeFrame:
+    def __init__(self):
+        self.surface = None
+        self._variants = {}      # (dim, blur) → 处理后的快照
+
+    @property
+    def active(self):
+        return self.surface is not None
+
+    def capture(self, screen):
+        """拷贝 screen 当前内容 (即最后一帧已绘制的画面)"""
+        self.surface = screen.copy()
+        self._variants.clear()
+
+    def clear(self):
+        self.surface = None
+        self._variants.clear()
+
+    def frame(self, dim=0, blur=0):
+        """
+        dim:  叠加黑色遮罩的 alpha (0 = 不暗化)
+        blur: 模糊程度, 先缩小到 1/(blur+1) 再放大 (0 = 不模糊)
+        """
+        if not dim and not blur:
+            return self.surface
+        key = (dim, blur)
+        surf = self._variants.get(key)
+        if surf is None:
+            surf = self.surface
+            if blur:
+                w, h = surf.get_size()
+                k = blur + 1
+                small = pygame.transform.smoothscale(surf, (max(1, w // k), max(1, h // k)))
+                surf = pygame.transform.smoothscale(small, (w, h))
+            else:
+                surf = surf.copy()
+            if dim:
+                shade = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+                shade.fill((0, 0, 0, dim))
+                surf.blit(shade, (0, 0))
+            self._variants[key] = surf
+        return surf
+
+    def draw(self, surface, dim=0, blur=0, offset=(0, 0)):
+        surface.blit(self.frame(dim, blur), (int(offset[0]), int(offset[1])))
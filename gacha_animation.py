@@ -21,7 +21,14 @@ Phase 4 (8+s):   3D UI结果展示、环绕镜头
 import pygame
 import math
 import random
+from array import array
 import i18n
+import render_scale
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ---- 描边文字渲染 ----
 def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
@@ -125,6 +132,41 @@ class Vec3:
     def copy(self):
         return Vec3(self.x, self.y, self.z)
 
+    # ---- 原地运算: 每帧更新的向量直接改写, 不创建新对象 ----
+    def set(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def iadd(self, o):
+        self.x += o.x
+        self.y += o.y
+        self.z += o.z
+        return self
+
+    def imul_add(self, o, s):
+        """self += o * s"""
+        self.x += o.x * s
+        self.y += o.y * s
+        self.z += o.z * s
+        return self
+
+    def set_lerp(self, a, b, t):
+        """self = a.lerp(b, t); a 可以就是 self"""
+        t = max(0.0, min(1.0, t))
+        self.x = a.x + (b.x - a.x) * t
+        self.y = a.y + (b.y - a.y) * t
+        self.z = a.z + (b.z - a.z) * t
+        return self
+
+
+def _points(seq):
+    """[(x, y, z), ...] → project_many 的输入 (有 NumPy 时预先转成数组, 静态点集只转一次)"""
+    if np is not None:
+        return np.asarray(seq, dtype=np.float64).reshape(-1, 3)
+    return list(seq)
+
 
 def _ease_in_out(t):
     t = max(0.0, min(1.0, t))
@@ -151,6 +193,9 @@ def _ease_out_back(t):
 # ============================================================
 #  3D 相机系统
 # ============================================================
+# 点数不少于此值时 project_many 走 NumPy (更少时逐点计算开销反而更小)
+PROJECT_NUMPY_MIN = 24
+
 class Camera3D:
     """透视投影3D相机"""
 
@@ -172,6 +217,10 @@ class Camera3D:
         self._move_duration = 0.0
         self._move_timer = 0.0
         self._move_ease = _ease_in_out
+        # 视图缓存: 相机参数不变时复用基向量与投影系数
+        self._view_key = None
+        self._view = None
+        self._view_mat = None
 
     def move_to(self, pos, target, duration, ease=None):
         self._move_from_pos = self.position.copy()
@@ -191,45 +240,61 @@ class Camera3D:
             self._move_timer += dt
             t = min(1.0, self._move_timer / self._move_duration)
             et = self._move_ease(t)
-            self.position = self._move_from_pos.lerp(self._move_to_pos, et)
-            self.target = self._move_from_tgt.lerp(self._move_to_tgt, et)
+            self.position.set_lerp(self._move_from_pos, self._move_to_pos, et)
+            self.target.set_lerp(self._move_from_tgt, self._move_to_tgt, et)
             if t >= 1.0:
                 self._move_from_pos = None
 
         if self._shake_timer > 0:
             self._shake_timer -= dt
             decay = min(1.0, self._shake_timer * 5)
-            self._shake_offset = Vec3(
+            self._shake_offset.set(
                 random.uniform(-1, 1) * self._shake_intensity * decay,
                 random.uniform(-1, 1) * self._shake_intensity * decay,
                 random.uniform(-0.3, 0.3) * self._shake_intensity * decay,
             )
         else:
-            self._shake_offset = Vec3()
+            self._shake_offset.set(0.0, 0.0, 0.0)
+
+    def _view_params(self):
+        """(相机位置, forward, right, up, f, aspect); 每帧参数变化时才重算"""
+        pos, tgt, sh = self.position, self.target, self._shake_offset
+        key = (pos.x, pos.y, pos.z, tgt.x, tgt.y, tgt.z,
+               sh.x, sh.y, sh.z, self.fov, WIDTH, HEIGHT)
+        if key != self._view_key:
+            cam_pos = pos + sh
+            forward = (tgt - cam_pos).normalized()
+            world_up = Vec3(0, 1, 0)
+            right = forward.cross(world_up)
+            if right.length() < 1e-6:
+                right = Vec3(1, 0, 0)
+            else:
+                right = right.normalized()
+            up = right.cross(forward).normalized()
+            f = 1.0 / math.tan(math.radians(self.fov) / 2.0)
+            aspect = WIDTH / max(1, HEIGHT)
+            self._view_key = key
+            self._view = (cam_pos, forward, right, up, f, aspect)
+            if np is not None:
+                # 行: right / up / forward, 相对坐标右乘转置即得相机空间坐标
+                self._view_mat = np.array([
+                    (right.x, right.y, right.z),
+                    (up.x, up.y, up.z),
+                    (forward.x, forward.y, forward.z),
+                ])
+        return self._view
 
     def project(self, world_pos):
         """将3D世界坐标投影到2D屏幕坐标 → (sx, sy, depth, scale) | None"""
-        cam_pos = self.position + self._shake_offset
-
-        forward = (self.target - cam_pos).normalized()
-        world_up = Vec3(0, 1, 0)
-        right = forward.cross(world_up)
-        if right.length() < 1e-6:
-            right = Vec3(1, 0, 0)
-        else:
-            right = right.normalized()
-        up = right.cross(forward).normalized()
-
-        rel = world_pos - cam_pos
-        cz = rel.dot(forward)
+        cam_pos, fw, rt, up, f, aspect = self._view_params()
+        rx = world_pos.x - cam_pos.x
+        ry = world_pos.y - cam_pos.y
+        rz = world_pos.z - cam_pos.z
+        cz = rx * fw.x + ry * fw.y + rz * fw.z
         if cz < self.near:
             return None
-        cx = rel.dot(right)
-        cy = -rel.dot(up)
-
-        aspect = WIDTH / max(1, HEIGHT)
-        fov_rad = math.radians(self.fov)
-        f = 1.0 / math.tan(fov_rad / 2.0)
+        cx = rx * rt.x + ry * rt.y + rz * rt.z
+        cy = -(rx * up.x + ry * up.y + rz * up.z)
 
         sx = (cx * f / (cz * aspect)) * (WIDTH / 2) + WIDTH / 2
         sy = (cy * f / cz) * (HEIGHT / 2) + HEIGHT / 2
@@ -237,6 +302,48 @@ class Camera3D:
 
         return (sx, sy, cz, scale)
 
+    def project_many(self, points):
+        """
+        批量投影。points: (N,3) 数组 或 [(x, y, z), ...]
+        返回 (sx, sy, depth, scale, visible) 五个等长列表;
+        visible 为 False (在近裁剪面之前) 的项其余值无意义。
+        """
+        n = len(points)
+        if n == 0:
+            return [], [], [], [], []
+        cam_pos, fw, rt, up, f, aspect = self._view_params()
+        hw, hh = WIDTH / 2, HEIGHT / 2
+        if np is not None and n >= PROJECT_NUMPY_MIN:
+            rel = np.asarray(points, dtype=np.float64).reshape(-1, 3) - (cam_pos.x, cam_pos.y, cam_pos.z)
+            cam = rel @ self._view_mat.T
+            cz = cam[:, 2]
+            visible = cz >= self.near
+            scale = f / np.where(visible, cz, 1.0)
+            sx = cam[:, 0] * (scale / aspect) * hw + hw
+            sy = -cam[:, 1] * scale * hh + hh
+            return sx.tolist(), sy.tolist(), cz.tolist(), scale.tolist(), visible.tolist()
+        sxs, sys_, depths, scales, vis = [], [], [], [], []
+        near = self.near
+        for x, y, z in points:
+            rx = x - cam_pos.x
+            ry = y - cam_pos.y
+            rz = z - cam_pos.z
+            cz = rx * fw.x + ry * fw.y + rz * fw.z
+            ok = cz >= near
+            sc = f / cz if ok else 0.0
+            sxs.append((rx * rt.x + ry * rt.y + rz * rt.z) * (sc / aspect) * hw + hw)
+            sys_.append(-(rx * up.x + ry * up.y + rz * up.z) * sc * hh + hh)
+            depths.append(cz)
+            scales.append(sc)
+            vis.append(ok)
+        return sxs, sys_, depths, scales, vis
+
+    def project_all(self, points):
+        """批量投影, 结果与逐个 project() 相同形式: [(sx, sy, depth, scale) | None, ...]"""
+        sx, sy, depth, scale, vis = self.project_many(points)
+        return [(a, b, c, d) if v else None
+                for a, b, c, d, v in zip(sx, sy, depth, scale, vis)]
+
     def get_effective_pos(self):
         return self.position + self._shake_offset
 
@@ -244,103 +351,259 @@ class Camera3D:
 # ============================================================
 #  3D 粒子系统
 # ============================================================
-class Particle3D:
-    __slots__ = ('pos', 'vel', 'life', 'max_life', 'color', 'size', 'kind',
-                 'trail', 'gravity')
-
-    def __init__(self, pos, vel, life, color, size=3.0, kind='dot', gravity=0.0):
-        self.pos = pos.copy() if isinstance(pos, Vec3) else Vec3(*pos)
-        self.vel = vel.copy() if isinstance(vel, Vec3) else Vec3(*vel)
-        self.life = life
-        self.max_life = life
-        self.color = color
-        self.size = size
-        self.kind = kind
-        self.trail = []
-        self.gravity = gravity
+# 粒子数不少于此值时 update 走 NumPy
+PARTICLE_NUMPY_MIN = 32
+TRAIL_LEN = 8
+_PARTICLE_COLS = ('x', 'y', 'z', 'vx', 'vy', 'vz', 'life', 'max_life', 'size', 'gravity')
+_TRAIL_ZERO = array('d', bytes(8 * 3 * TRAIL_LEN))
+
+
+class ParticleStore3D:
+    """
+    列式粒子存储: 位置、速度、寿命等每个分量一条连续的 array('d'),
+    有 NumPy 时 update 直接在这些缓冲上做整批运算 (np.frombuffer, 不拷贝)。
+    拖尾是每个粒子固定 TRAIL_LEN 个点的环形缓冲, 写入槽位按帧号轮转,
+    所有粒子共用, 有效点数由出生帧号推出, 不再逐帧 append/pop。
+    颜色和类型是少量引用, 仍用普通列表。
+    """
 
-    def update(self, dt):
-        if self.kind == 'trail':
-            self.trail.append(self.pos.copy())
-            if len(self.trail) > 8:
-                self.trail.pop(0)
-        self.vel.y -= self.gravity * dt
-        self.pos = self.pos + self.vel * dt
-        self.life -= dt
+    def __init__(self):
+        self.cols = {name: array('d') for name in _PARTICLE_COLS}
+        self.trail = array('d')        # 每粒子 TRAIL_LEN*3 个数
+        self.born = array('q')         # 出生时的帧号
+        self.color = []
+        self.kind = []
+        self.frame = 0
+
+    def __len__(self):
+        return len(self.kind)
+
+    def clear(self):
+        for col in self.cols.values():
+            del col[:]
+        del self.trail[:]
+        del self.born[:]
+        self.color.clear()
+        self.kind.clear()
+
+    def spawn(self, pos, vel, life, color, size=3.0, kind='dot', gravity=0.0):
+        c = self.cols
+        c['x'].append(pos.x)
+        c['y'].append(pos.y)
+        c['z'].append(pos.z)
+        c['vx'].append(vel.x)
+        c['vy'].append(vel.y)
+        c['vz'].append(vel.z)
+        c['life'].append(life)
+        c['max_life'].append(life)
+        c['size'].append(size)
+        c['gravity'].append(gravity)
+        self.trail.extend(_TRAIL_ZERO)
+        self.born.append(self.frame)
+        self.color.append(color)
+        self.kind.append(kind)
 
-    def draw(self, surface, camera):
-        if self.life <= 0:
+    def update(self, dt):
+        n = len(self)
+        slot = self.frame % TRAIL_LEN
+        self.frame += 1
+        if n == 0:
             return
-        proj = camera.project(self.pos)
-        if proj is None:
+        if np is not None and n >= PARTICLE_NUMPY_MIN:
+            self._update_numpy(n, slot, dt)
+        else:
+            self._update_python(n, slot, dt)
+
+    def _update_numpy(self, n, slot, dt):
+        v = {name: np.frombuffer(col) for name, col in self.cols.items()}
+        trail = np.frombuffer(self.trail).reshape(n, TRAIL_LEN, 3)
+        # 拖尾记录移动前的位置 (非 trail 粒子顺带写入, 绘制时不读)
+        trail[:, slot, 0] = v['x']
+        trail[:, slot, 1] = v['y']
+        trail[:, slot, 2] = v['z']
+        v['vy'] -= v['gravity'] * dt
+        v['x'] += v['vx'] * dt
+        v['y'] += v['vy'] * dt
+        v['z'] += v['vz'] * dt
+        v['life'] -= dt
+        alive = v['life'] > 0
+        if alive.all():
             return
-        sx, sy, depth, scale = proj
-        if sx < -100 or sx > WIDTH + 100 or sy < -100 or sy > HEIGHT + 100:
+        keep = np.flatnonzero(alive)
+        self.cols = {name: array('d', v[name][keep].tobytes()) for name in _PARTICLE_COLS}
+        self.trail = array('d', trail[keep].tobytes())
+        self.born = array('q', np.frombuffer(self.born, dtype=np.int64)[keep].tobytes())
+        self.color = [self.color[i] for i in keep.tolist()]
+        self.kind = [self.kind[i] for i in keep.tolist()]
+
+    def _update_python(self, n, slot, dt):
+        c = self.cols
+        xs, ys, zs = c['x'], c['y'], c['z']
+        vxs, vys, vzs = c['vx'], c['vy'], c['vz']
+        lifes, gravs = c['life'], c['gravity']
+        trail, kinds = self.trail, self.kind
+        dead = False
+        for i in range(n):
+            x, y, z = xs[i], ys[i], zs[i]
+            if kinds[i] == 'trail':
+                k = (i * TRAIL_LEN + slot) * 3
+                trail[k] = x
+                trail[k + 1] = y
+                trail[k + 2] = z
+            vy = vys[i] - gravs[i] * dt
+            vys[i] = vy
+            xs[i] = x + vxs[i] * dt
+            ys[i] = y + vy * dt
+            zs[i] = z + vzs[i] * dt
+            lifes[i] -= dt
+            if lifes[i] <= 0:
+                dead = True
+        if not dead:
             return
+        keep = [i for i in range(n) if lifes[i] > 0]
+        self.cols = {name: array('d', [col[i] for i in keep]) for name, col in c.items()}
+        step = TRAIL_LEN * 3
+        new_trail = array('d')
+        for i in keep:
+            new_trail.extend(trail[i * step:(i + 1) * step])
+        self.trail = new_trail
+        self.born = array('q', [self.born[i] for i in keep])
+        self.color = [self.color[i] for i in keep]
+        self.kind = [kinds[i] for i in keep]
+
+    def trail_points(self, i):
+        """第 i 个粒子的拖尾点, 从旧到新 [(x, y, z), ...]"""
+        count = min(self.frame - self.born[i], TRAIL_LEN)
+        base = i * TRAIL_LEN
+        tr = self.trail
+        pts = []
+        for k in range(self.frame - count, self.frame):
+            j = (base + k % TRAIL_LEN) * 3
+            pts.append((tr[j], tr[j + 1], tr[j + 2]))
+        return pts
 
-        alpha_frac = max(0.0, self.life / self.max_life)
-        alpha = int(255 * alpha_frac)
-        r, g, b = self.color
-        draw_size = max(1, int(self.size * scale * 80))
-
-        if self.kind == 'dot':
-            if draw_size > 0:
-                ds = min(draw_size, 30)
-                ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ps, (r, g, b, alpha), (ds, ds), ds)
-                surface.blit(ps, (int(sx - ds), int(sy - ds)))
-
-        elif self.kind == 'spark':
-            ds = min(draw_size, 25)
-            if ds > 0:
-                # 核心
-                ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
-                cr = min(255, r + 60)
-                cg = min(255, g + 60)
-                cb = min(255, b + 60)
-                pygame.draw.circle(ps, (cr, cg, cb, alpha), (ds, ds), ds)
-                surface.blit(ps, (int(sx - ds), int(sy - ds)))
-                # 光晕
-                gr = ds * 3
-                if gr > 3 and gr < 150:
-                    gs = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(gs, (r, g, b, max(1, alpha // 4)),
-                                       (gr, gr), gr)
-                    surface.blit(gs, (int(sx - gr), int(sy - gr)))
-
-        elif self.kind == 'trail':
-            for i, tp in enumerate(self.trail):
-                tp_proj = camera.project(tp)
-                if tp_proj is None:
-                    continue
-                tpx, tpy, _, tps = tp_proj
-                trail_a = int(alpha * (i + 1) / (len(self.trail) + 1) * 0.5)
-                ts = max(1, min(20, int(self.size * tps * 60)))
-                tsurf = pygame.Surface((ts * 2, ts * 2), pygame.SRCALPHA)
-                pygame.draw.circle(tsurf, (r, g, b, trail_a), (ts, ts), ts)
-                surface.blit(tsurf, (int(tpx - ts), int(tpy - ts)))
-            ds = min(draw_size, 25)
-            if ds > 0:
-                ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ps, (min(255, r + 80), min(255, g + 80),
-                                        min(255, b + 80), alpha),
-                                   (ds, ds), ds)
-                surface.blit(ps, (int(sx - ds), int(sy - ds)))
-
-        elif self.kind == 'ring':
-            ds = min(draw_size, 40)
-            if ds > 2:
-                ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ps, (r, g, b, alpha), (ds, ds), ds,
-                                   max(1, ds // 4))
-                surface.blit(ps, (int(sx - ds), int(sy - ds)))
+    def draw(self, surface, camera):
+        """位置、拖尾点各一次批量投影, 按深度从远到近绘制"""
+        n = len(self)
+        if n == 0:
+            return
+        c = self.cols
+        if np is not None and n >= PROJECT_NUMPY_MIN:
+            pts = np.column_stack((np.frombuffer(c['x']), np.frombuffer(c['y']),
+                                   np.frombuffer(c['z'])))
+        else:
+            pts = list(zip(c['x'], c['y'], c['z']))
+        sxs, sys_, depths, scales, vis = camera.project_many(pts)
+        order = [i for i in range(n) if vis[i]]
+        trails = {i: self.trail_points(i) for i in order if self.kind[i] == 'trail'}
+        trail_projs = camera.project_all([p for pts in trails.values() for p in pts])
+        trail_proj = {}
+        k = 0
+        for i, tp in trails.items():
+            trail_proj[i] = trail_projs[k:k + len(tp)]
+            k += len(tp)
+        order.sort(key=lambda i: -depths[i])
+        lifes, max_lifes, sizes = c['life'], c['max_life'], c['size']
+        for i in order:
+            _draw_particle(surface, self.kind[i], self.color[i], sizes[i],
+                           lifes[i] / max_lifes[i], sxs[i], sys_[i], scales[i],
+                           trail_proj.get(i))
+
+
+def _draw_particle(surface, kind, color, size, life_frac, sx, sy, scale, trail_proj):
+    if sx < -100 or sx > WIDTH + 100 or sy < -100 or sy > HEIGHT + 100:
+        return
+
+    alpha = int(255 * max(0.0, life_frac))
+    r, g, b = color
+    draw_size = max(1, int(size * scale * 80))
+
+    if kind == 'dot':
+        if draw_size > 0:
+            ds = min(draw_size, 30)
+            ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ps, (r, g, b, alpha), (ds, ds), ds)
+            surface.blit(ps, (int(sx - ds), int(sy - ds)))
+
+    elif kind == 'spark':
+        ds = min(draw_size, 25)
+        if ds > 0:
+            # 核心
+            ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
+            cr = min(255, r + 60)
+            cg = min(255, g + 60)
+            cb = min(255, b + 60)
+            pygame.draw.circle(ps, (cr, cg, cb, alpha), (ds, ds), ds)
+            surface.blit(ps, (int(sx - ds), int(sy - ds)))
+            # 光晕
+            gr = ds * 3
+            if gr > 3 and gr < 150:
+                gs = pygame.Surface((gr * 2, gr * 2), pygame.SRCALPHA)
+                pygame.draw.circle(gs, (r, g, b, max(1, alpha // 4)),
+                                   (gr, gr), gr)
+                surface.blit(gs, (int(sx - gr), int(sy - gr)))
+
+    elif kind == 'trail':
+        for i, tp_proj in enumerate(trail_proj):
+            if tp_proj is None:
+                continue
+            tpx, tpy, _, tps = tp_proj
+            trail_a = int(alpha * (i + 1) / (len(trail_proj) + 1) * 0.5)
+            ts = max(1, min(20, int(size * tps * 60)))
+            tsurf = pygame.Surface((ts * 2, ts * 2), pygame.SRCALPHA)
+            pygame.draw.circle(tsurf, (r, g, b, trail_a), (ts, ts), ts)
+            surface.blit(tsurf, (int(tpx - ts), int(tpy - ts)))
+        ds = min(draw_size, 25)
+        if ds > 0:
+            ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ps, (min(255, r + 80), min(255, g + 80),
+                                    min(255, b + 80), alpha),
+                               (ds, ds), ds)
+            surface.blit(ps, (int(sx - ds), int(sy - ds)))
+
+    elif kind == 'ring':
+        ds = min(draw_size, 40)
+        if ds > 2:
+            ps = pygame.Surface((ds * 2, ds * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ps, (r, g, b, alpha), (ds, ds), ds,
+                               max(1, ds // 4))
+            surface.blit(ps, (int(sx - ds), int(sy - ds)))
 
 
 # ============================================================
 #  3D 星空背景
 # ============================================================
+SPACE_BG = (4, 3, 10)
+STAR_SIZES = range(2, 9)        # 大于 1px 的星星半径
+STAR_ALPHA_STEP = 8             # 星星透明度按此步长分桶, 每个 (半径, 桶) 预渲染一张贴图
+NEBULA_MARGIN = 48              # 星云背景层四周多留的像素, 平移复用时不露边
+NEBULA_REBAKE_PX = 3.0          # 各星云相对整体平移的偏差超过此值才重新烘焙
+NEBULA_REBAKE_SCALE = 0.04      # 半径相对变化超过此比例 (且超过 1px) 才重新烘焙
+
+_star_sprites = {}              # (半径, 透明度桶) → 星星贴图, 所有 Starfield 共用
+
+
+def _star_atlas():
+    """星星贴图集, 第一次创建 Starfield 时生成"""
+    if not _star_sprites:
+        for sz in STAR_SIZES:
+            for a in range(0, 256 + STAR_ALPHA_STEP, STAR_ALPHA_STEP):
+                ps = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+                pygame.draw.circle(ps, (220, 225, 255, min(255, a)), (sz, sz), sz)
+                _star_sprites[(sz, min(255, a))] = ps
+    return _star_sprites
+
+
 class Starfield:
-    def __init__(self, count=300):
+    """
+    星空背景。星云 (连同底色) 烘焙成一张不透明背景层:
+    相机小幅移动时各星云在屏幕上近似整体平移, 只平移 blit 该层;
+    偏差超过阈值、半径/亮度变化或出入屏幕时才重新烘焙。
+    星星用预渲染的 (半径, 透明度桶) 贴图。
+    """
+
+    def __init__(self, count=300, bg_color=SPACE_BG):
+        self.bg_color = bg_color
         self.stars = []
         for _ in range(count):
             self.stars.append({
@@ -368,10 +631,19 @@ class Starfield:
                 ]),
                 'alpha': random.uniform(8, 22),
             })
-
-    def draw(self, surface, camera, t):
-        for nb in self.nebula_blobs:
-            proj = camera.project(nb['pos'])
+        # 星星/星云位置不变, 预先整理成批量投影用的点集
+        self._star_pts = _points([(st['pos'].x, st['pos'].y, st['pos'].z) for st in self.stars])
+        self._nebula_pts = _points([(nb['pos'].x, nb['pos'].y, nb['pos'].z)
+                                    for nb in self.nebula_blobs])
+        self._star_sprites = _star_atlas()
+        # 星云背景层: (Surface, 烘焙时各星云 [(索引, sx, sy, r, a)], 屏幕尺寸)
+        self._nebula_layer = None
+
+    def _nebula_state(self, camera):
+        """当前帧可见星云的 [(索引, sx, sy, r, a)]"""
+        out = []
+        for i, (nb, proj) in enumerate(zip(self.nebula_blobs,
+                                           camera.project_all(self._nebula_pts))):
             if proj is None:
                 continue
             sx, sy, depth, scale = proj
@@ -379,19 +651,64 @@ class Starfield:
             if sx < -r or sx > WIDTH + r or sy < -r or sy > HEIGHT + r:
                 continue
             a = int(nb['alpha'] * max(0.2, min(1.0, 30.0 / depth)))
+            out.append((i, sx, sy, r, a))
+        return out
+
+    def _bake_nebula(self, blobs):
+        m = NEBULA_MARGIN
+        size = (WIDTH + m * 2, HEIGHT + m * 2)
+        layer = self._nebula_layer[0] if self._nebula_layer else None
+        if layer is None or layer.get_size() != size:
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+        layer.fill(self.bg_color)
+        for i, sx, sy, r, a in blobs:
+            color = self.nebula_blobs[i]['color']
             ns = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            pygame.draw.circle(ns, (*nb['color'], min(255, a)), (r, r), r)
+            pygame.draw.circle(ns, (*color, min(255, a)), (r, r), r)
             r2 = r // 2
             if r2 > 2:
-                pygame.draw.circle(ns, (*nb['color'], min(255, a // 2)),
-                                   (r, r), r2)
-            surface.blit(ns, (int(sx - r), int(sy - r)))
+                pygame.draw.circle(ns, (*color, min(255, a // 2)), (r, r), r2)
+            layer.blit(ns, (int(sx - r) + m, int(sy - r) + m))
+        self._nebula_layer = (layer, blobs, (WIDTH, HEIGHT))
 
-        for star in self.stars:
-            proj = camera.project(star['pos'])
-            if proj is None:
+    def _nebula_offset(self, blobs):
+        """可平移复用时返回 (dx, dy), 否则 None"""
+        if self._nebula_layer is None:
+            return None
+        _, baked, size = self._nebula_layer
+        if size != (WIDTH, HEIGHT) or len(baked) != len(blobs):
+            return None
+        if not blobs:
+            return (0, 0)
+        dx = sum(b[1] - o[1] for b, o in zip(blobs, baked)) / len(blobs)
+        dy = sum(b[2] - o[2] for b, o in zip(blobs, baked)) / len(blobs)
+        if abs(dx) > NEBULA_MARGIN / 2 or abs(dy) > NEBULA_MARGIN / 2:
+            return None
+        for (i, sx, sy, r, a), (oi, ox, oy, orr, oa) in zip(blobs, baked):
+            if (i != oi or abs(r - orr) > max(1, orr * NEBULA_REBAKE_SCALE) or abs(a - oa) > 1
+                    or abs(sx - ox - dx) > NEBULA_REBAKE_PX
+                    or abs(sy - oy - dy) > NEBULA_REBAKE_PX):
+                return None
+        return (round(dx), round(dy))
+
+    def draw(self, surface, camera, t):
+        """绘制整屏星空 (含底色, 无需事先 fill)"""
+        blobs = self._nebula_state(camera)
+        offset = self._nebula_offset(blobs)
+        if offset is None:
+            self._bake_nebula(blobs)
+            offset = (0, 0)
+        surface.blit(self._nebula_layer[0],
+                     (offset[0] - NEBULA_MARGIN, offset[1] - NEBULA_MARGIN))
+
+        sprites = self._star_sprites
+        step = STAR_ALPHA_STEP
+        sxs, sys_, depths, scales, vis = camera.project_many(self._star_pts)
+        for star, sx, sy, depth, scale, v in zip(self.stars, sxs, sys_, depths, scales, vis):
+            if not v:
                 continue
-            sx, sy, depth, scale = proj
             if sx < -5 or sx > WIDTH + 5 or sy < -5 or sy > HEIGHT + 5:
                 continue
             twinkle = (math.sin(t * 3 + star['twinkle_phase']) + 1) * 0.5
@@ -406,9 +723,8 @@ class Starfield:
                     except Exception:
                         pass
             else:
-                ps = pygame.Surface((s * 2, s * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ps, (220, 225, 255, alpha), (s, s), s)
-                surface.blit(ps, (int(sx - s), int(sy - s)))
+                ab = min(255, (alpha + step // 2) // step * step)
+                surface.blit(sprites[(s, ab)], (int(sx - s), int(sy - s)))
 
 
 # ============================================================
@@ -436,26 +752,35 @@ class Altar3D:
             (2.0, -0.3, 1),
             (1.5,  0.0, 2),
         ]
+        segments = 16
+        # 四根符文柱 (底/顶)
+        pillar_xz = [(cx + 1.8, cz + 1.8), (cx - 1.8, cz + 1.8),
+                     (cx + 1.8, cz - 1.8), (cx - 1.8, cz - 1.8)]
+        crystal_y = cy + 2.0 + math.sin(t * 2) * 0.15
+
+        # 平台环点 + 柱子端点 + 水晶球一次批量投影
+        pts = []
         for radius, y_off, ai in platform_params:
-            self._draw_platform_ring(surface, camera,
-                                     Vec3(cx, cy + y_off, cz),
-                                     radius, self.platform_angles[ai],
-                                     color, 16)
-
-        # 四根符文柱
-        pillar_positions = [
-            Vec3(cx + 1.8, cy, cz + 1.8),
-            Vec3(cx - 1.8, cy, cz + 1.8),
-            Vec3(cx + 1.8, cy, cz - 1.8),
-            Vec3(cx - 1.8, cy, cz - 1.8),
-        ]
-        for pp in pillar_positions:
-            self._draw_pillar(surface, camera, t, pp, color, energy)
+            angle = self.platform_angles[ai]
+            for i in range(segments):
+                a = angle + 2 * math.pi * i / segments
+                pts.append((cx + math.cos(a) * radius, cy + y_off,
+                            cz + math.sin(a) * radius))
+        for px, pz in pillar_xz:
+            pts.append((px, cy, pz))
+            pts.append((px, cy + 2.5, pz))
+        pts.append((cx, crystal_y, cz))
+        projs = camera.project_all(pts)
+
+        for k in range(len(platform_params)):
+            self._draw_platform_ring(surface, projs[k * segments:(k + 1) * segments], color)
+        base = len(platform_params) * segments
+        for k in range(len(pillar_xz)):
+            self._draw_pillar(surface, t, projs[base + 2 * k], projs[base + 2 * k + 1],
+                              color, energy)
 
         # 水晶球
-        crystal_y = cy + 2.0 + math.sin(t * 2) * 0.15
-        crystal_pos = Vec3(cx, crystal_y, cz)
-        proj = camera.project(crystal_pos)
+        proj = projs[-1]
         if proj:
             sx, sy, depth, scale = proj
             cr = max(4, min(50, int(1.2 * scale * 80)))
@@ -500,17 +825,9 @@ class Altar3D:
                                        (es, es), es)
                     surface.blit(eps, (epx - es, epy - es))
 
-    def _draw_platform_ring(self, surface, camera, center, radius, angle,
-                            color, segments):
-        points_2d = []
-        for i in range(segments):
-            a = angle + 2 * math.pi * i / segments
-            wp = Vec3(center.x + math.cos(a) * radius,
-                      center.y,
-                      center.z + math.sin(a) * radius)
-            proj = camera.project(wp)
-            if proj:
-                points_2d.append((int(proj[0]), int(proj[1]), proj[2]))
+    def _draw_platform_ring(self, surface, projs, color):
+        """projs: 环上各点的投影结果 (已批量投影)"""
+        points_2d = [(int(proj[0]), int(proj[1]), proj[2]) for proj in projs if proj]
 
         if len(points_2d) >= 3:
             poly = [(p[0], p[1]) for p in points_2d]
@@ -526,11 +843,7 @@ class Altar3D:
                     pygame.draw.circle(dp, (*color, 140), (ds, ds), ds)
                     surface.blit(dp, (px - ds, py - ds))
 
-    def _draw_pillar(self, surface, camera, t, pos, color, energy):
-        base_pos = pos
-        top_pos = Vec3(pos.x, pos.y + 2.5, pos.z)
-        p_base = camera.project(base_pos)
-        p_top = camera.project(top_pos)
+    def _draw_pillar(self, surface, t, p_base, p_top, color, energy):
         if p_base is None or p_top is None:
             return
 
@@ -587,30 +900,33 @@ class MagicCircle3D:
         if self.expand < 0.01:
             return
 
-        for ri, ring in enumerate(self.rings):
+        # 所有环的 外圈点 / 内圈点 / 圆心 一次批量投影
+        pts = []
+        for ring in self.rings:
             r = ring['radius'] * self.expand
             y = center.y + ring['y_offset'] * self.expand
             angle = ring['angle']
             segments = ring['segments']
-            alpha = int(ring['alpha'] * min(1.0, self.expand))
             inner_r = r * ring['inner_ratio']
-
-            outer_pts = []
-            inner_pts = []
             for i in range(segments):
                 a = angle + 2 * math.pi * i / segments
-                wp = Vec3(center.x + math.cos(a) * r, y,
-                          center.z + math.sin(a) * r)
-                proj = camera.project(wp)
-                if proj:
-                    outer_pts.append((int(proj[0]), int(proj[1]), proj[2]))
-
+                pts.append((center.x + math.cos(a) * r, y, center.z + math.sin(a) * r))
+            for i in range(segments):
                 a2 = -angle * 0.7 + 2 * math.pi * i / segments
-                wp2 = Vec3(center.x + math.cos(a2) * inner_r, y,
-                           center.z + math.sin(a2) * inner_r)
-                proj2 = camera.project(wp2)
-                if proj2:
-                    inner_pts.append((int(proj2[0]), int(proj2[1]), proj2[2]))
+                pts.append((center.x + math.cos(a2) * inner_r, y,
+                            center.z + math.sin(a2) * inner_r))
+            pts.append((center.x, y, center.z))
+        projs = camera.project_all(pts)
+
+        k = 0
+        for ri, ring in enumerate(self.rings):
+            segments = ring['segments']
+            alpha = int(ring['alpha'] * min(1.0, self.expand))
+            outer_pts = [(int(p[0]), int(p[1]), p[2]) for p in projs[k:k + segments] if p]
+            inner_pts = [(int(p[0]), int(p[1]), p[2])
+                         for p in projs[k + segments:k + 2 * segments] if p]
+            center_proj = projs[k + 2 * segments]
+            k += 2 * segments + 1
 
             if len(outer_pts) >= 3:
                 poly = [(p[0], p[1]) for p in outer_pts]
@@ -620,7 +936,6 @@ class MagicCircle3D:
                 pygame.draw.polygon(ps, (*col, min(255, alpha)), poly, 1)
                 surface.blit(ps, (0, 0))
 
-                center_proj = camera.project(Vec3(center.x, y, center.z))
                 if center_proj:
                     cpx, cpy = int(center_proj[0]), int(center_proj[1])
                     for px, py, pd in outer_pts:
@@ -665,22 +980,23 @@ class LightBeam3D:
             return
 
         layers = 10
+        bx, bz = base_pos.x, base_pos.z
+        pts = []
         for i in range(layers):
             frac = i / layers
             y = base_pos.y + 2.0 + frac * self.height * self.intensity
             w = self.width * (1.0 - frac * 0.3) * self.intensity
+            pts += [(bx - w, y, bz), (bx + w, y, bz),
+                    (bx + w, y + self.height / layers, bz),
+                    (bx - w, y + self.height / layers, bz)]
+        # 中心亮线两端
+        pts.append((bx, base_pos.y + 2.0, bz))
+        pts.append((bx, base_pos.y + 2.0 + self.height * self.intensity, bz))
+        projs = camera.project_all(pts)
 
-            pts_3d = [
-                Vec3(base_pos.x - w, y, base_pos.z),
-                Vec3(base_pos.x + w, y, base_pos.z),
-                Vec3(base_pos.x + w, y + self.height / layers, base_pos.z),
-                Vec3(base_pos.x - w, y + self.height / layers, base_pos.z),
-            ]
-            pts_2d = []
-            for p in pts_3d:
-                proj = camera.project(p)
-                if proj:
-                    pts_2d.append((int(proj[0]), int(proj[1])))
+        for i in range(layers):
+            frac = i / layers
+            pts_2d = [(int(proj[0]), int(proj[1])) for proj in projs[i * 4:i * 4 + 4] if proj]
             if len(pts_2d) >= 3:
                 a = int(50 * self.intensity * (1.0 - frac * 0.5))
                 ps = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -688,10 +1004,7 @@ class LightBeam3D:
                 surface.blit(ps, (0, 0))
 
         # 中心亮线
-        bp = camera.project(Vec3(base_pos.x, base_pos.y + 2.0, base_pos.z))
-        tp = camera.project(Vec3(base_pos.x,
-                                 base_pos.y + 2.0 + self.height * self.intensity,
-                                 base_pos.z))
+        bp, tp = projs[-2], projs[-1]
         if bp and tp:
             a = min(255, int(180 * self.intensity))
             lw = max(1, int(3 * self.intensity))
@@ -749,15 +1062,11 @@ class Shockwave3D:
         alpha = int(200 * (1.0 - frac))
 
         segments = 24
-        pts = []
-        for i in range(segments):
-            a = 2 * math.pi * i / segments
-            wp = Vec3(self.center.x + math.cos(a) * radius,
-                      self.center.y,
-                      self.center.z + math.sin(a) * radius)
-            proj = camera.project(wp)
-            if proj:
-                pts.append((int(proj[0]), int(proj[1])))
+        ring = [(self.center.x + math.cos(2 * math.pi * i / segments) * radius,
+                 self.center.y,
+                 self.center.z + math.sin(2 * math.pi * i / segments) * radius)
+                for i in range(segments)]
+        pts = [(int(proj[0]), int(proj[1])) for proj in camera.project_all(ring) if proj]
 
         if len(pts) >= 3:
             ps = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -780,14 +1089,16 @@ class OrbitalOrb:
         self.phase = phase
         self.size = 0.15
 
-    def draw(self, surface, camera, t):
+    def position(self, t):
         a = t * self.speed + self.phase
-        pos = Vec3(
-            self.center.x + math.cos(a) * self.radius,
-            self.center.y + self.y_offset + math.sin(t * 2 + self.phase) * 0.3,
-            self.center.z + math.sin(a) * self.radius,
-        )
-        proj = camera.project(pos)
+        return (self.center.x + math.cos(a) * self.radius,
+                self.center.y + self.y_offset + math.sin(t * 2 + self.phase) * 0.3,
+                self.center.z + math.sin(a) * self.radius)
+
+    def draw(self, surface, camera, t, proj=None):
+        """proj 可由调用方批量投影后传入"""
+        if proj is None:
+            proj = camera.project(Vec3(*self.position(t)))
         if proj is None:
             return
         sx, sy, depth, scale = proj
@@ -856,7 +1167,7 @@ class GachaAnimation:
 
         self.starfield = Starfield(350)
         self.altar = Altar3D()
-        self.particles = []
+        self.particles = ParticleStore3D()
 
         # 魔法阵层数
         ring_counts = [1, 2, 2, 3, 5]
@@ -950,9 +1261,7 @@ class GachaAnimation:
             sw.update(dt)
         self.shockwaves = [sw for sw in self.shockwaves if sw.active]
 
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.life > 0]
+        self.particles.update(dt)
 
         if self.flash_alpha > 0:
             self.flash_alpha = max(0, self.flash_alpha - dt * 300)
@@ -1020,13 +1329,13 @@ class GachaAnimation:
                 cam = self.camera.get_effective_pos()
                 offset = Vec3(random.uniform(-8, 8), random.uniform(-5, 5),
                               random.uniform(-3, 3))
-                self.particles.append(Particle3D(
+                self.particles.spawn(
                     cam + offset,
                     Vec3(random.uniform(-1, 1), random.uniform(0.5, 2),
                          random.uniform(-1, 1)),
                     random.uniform(1.0, 2.5), self.glow_color,
                     random.uniform(0.03, 0.08), 'dot'
-                ))
+                )
             energy = min(1.0, self.phase_timer / self.phase_durations[0])
             self.altar.crystal_energy = energy * 0.3
 
@@ -1038,8 +1347,8 @@ class GachaAnimation:
             orbit_y = 5 + frac * 2
             target_pos = Vec3(math.sin(orbit_angle) * orbit_r, orbit_y,
                               -math.cos(orbit_angle) * orbit_r)
-            self.camera.position = self.camera.position.lerp(target_pos, dt * 2)
-            self.camera.target = Vec3(0, 1.5, 0)
+            self.camera.position.set_lerp(self.camera.position, target_pos, dt * 2)
+            self.camera.target.set(0.0, 1.5, 0.0)
 
             # 汇聚粒子
             spawn_count = 2 + self.rarity_index * 2
@@ -1050,10 +1359,10 @@ class GachaAnimation:
                              math.sin(angle) * dist)
                 diff = Vec3(0, 2.0, 0) - start
                 vel = diff.normalized() * random.uniform(3, 7)
-                self.particles.append(Particle3D(
+                self.particles.spawn(
                     start, vel, random.uniform(1.0, 2.5), self.color,
                     random.uniform(0.04, 0.1), 'trail'
-                ))
+                )
 
             energy = min(1.0, self.phase_timer / self.phase_durations[1])
             self.altar.crystal_energy = 0.3 + energy * 0.7
@@ -1079,11 +1388,11 @@ class GachaAnimation:
                         math.sin(elev) * spd + 2,
                         math.sin(angle) * math.cos(elev) * spd
                     )
-                    self.particles.append(Particle3D(
+                    self.particles.spawn(
                         Vec3(0, 2, 0), vel,
                         random.uniform(0.8, 2.0), self.glow_color,
                         random.uniform(0.05, 0.15), 'spark'
-                    ))
+                    )
 
             self.magic_circle.update(dt, expand_target=1.0)
 
@@ -1102,43 +1411,43 @@ class GachaAnimation:
         elif self.phase == 3:
             frac = self.phase_timer / self.phase_durations[3]
             orbit_angle = frac * math.pi * 0.5
-            self.camera.position = Vec3(
+            self.camera.position.set(
                 math.sin(orbit_angle) * 9,
                 3.5 - frac * 0.5,
                 -math.cos(orbit_angle) * 9
             )
-            self.camera.target = Vec3(0, 2, 0)
+            self.camera.target.set(0.0, 2.0, 0.0)
 
             if random.random() < 0.3:
                 angle = random.uniform(0, math.pi * 2)
                 dist = random.uniform(1, 4)
-                self.particles.append(Particle3D(
+                self.particles.spawn(
                     Vec3(math.cos(angle) * dist, random.uniform(0, 4),
                          math.sin(angle) * dist),
                     Vec3(0, random.uniform(0.5, 1.5), 0),
                     random.uniform(1, 2.5), self.glow_color,
                     random.uniform(0.02, 0.06), 'dot'
-                ))
+                )
 
         elif self.phase == 4:
             orbit_angle = self.phase_timer * 0.15
-            self.camera.position = Vec3(
+            self.camera.position.set(
                 math.sin(orbit_angle) * 10,
                 3.0 + math.sin(self.total_timer * 0.3) * 0.3,
                 -math.cos(orbit_angle) * 10
             )
-            self.camera.target = Vec3(0, 1.5, 0)
+            self.camera.target.set(0.0, 1.5, 0.0)
 
             if random.random() < 0.12:
                 angle = random.uniform(0, math.pi * 2)
                 dist = random.uniform(3, 8)
-                self.particles.append(Particle3D(
+                self.particles.spawn(
                     Vec3(math.cos(angle) * dist, random.uniform(-1, 0),
                          math.sin(angle) * dist),
                     Vec3(0, random.uniform(0.3, 1.0), 0),
                     random.uniform(2, 4), self.glow_color,
                     random.uniform(0.02, 0.05), 'dot'
-                ))
+                )
 
     def draw(self, surface):
         if self.finished:
@@ -1146,8 +1455,7 @@ class GachaAnimation:
         buttons = {}
         t = self.total_timer
 
-        # 背景
-        surface.fill((4, 3, 10))
+        # 背景 (星空层自带底色)
         self.starfield.draw(surface, self.camera, t)
 
         # 场景元素
@@ -1159,21 +1467,16 @@ class GachaAnimation:
 
             for sw in self.shockwaves:
                 sw.draw(surface, self.camera, t)
-            for orb in self.orbs:
-                orb.draw(surface, self.camera, t)
+            orb_projs = self.camera.project_all([orb.position(t) for orb in self.orbs])
+            for orb, proj in zip(self.orbs, orb_projs):
+                if proj:
+                    orb.draw(surface, self.camera, t, proj)
 
             if self.phase == 2 and self._draw_constellation_flag:
                 self._draw_constellation(surface, t)
 
         # 深度排序粒子
-        visible = []
-        for p in self.particles:
-            proj = self.camera.project(p.pos)
-            if proj:
-                visible.append((proj[2], p))
-        visible.sort(key=lambda x: -x[0])
-        for _, p in visible:
-            p.draw(surface, self.camera)
+        self.particles.draw(surface, self.camera)
 
         # Phase 2 品质文字
         if self.phase == 2:
@@ -1224,9 +1527,9 @@ class GachaAnimation:
         return buttons
 
     def _draw_constellation(self, surface, t):
-        for p1, p2 in self.constellation_lines:
-            pr1 = self.camera.project(p1)
-            pr2 = self.camera.project(p2)
+        projs = self.camera.project_all(
+            [(p.x, p.y, p.z) for line in self.constellation_lines for p in line])
+        for pr1, pr2 in zip(projs[0::2], projs[1::2]):
             if pr1 and pr2:
                 a = int(60 + math.sin(t * 2) * 30)
                 ps = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -1402,7 +1705,7 @@ class GachaAnimation:
         # 确认按钮
         btn_w, btn_h = 220, 48
         btn_rect = pygame.Rect(cx - btn_w // 2, HEIGHT - 60, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = btn_rect.collidepoint(mx, my)
         bc = self.color if hover else tuple(max(0, c - 40) for c in self.color)
 
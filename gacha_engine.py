@@ -0,0 +1,225 @@
+"""
+《暗夜割草者：深渊轮回》 — 批量抽卡引擎
+========================================
+一次抽 N 发, 保底语义与逐发抽取完全一致:
+  计数 +1 后达到上限 → 本发强制为保底品质, 计数清零
+  否则按权重抽品质; 抽到 >= 保底品质也清零
+N 较大且装有 NumPy 时走向量化路径, 否则逐发计算。
+两条路径都可用 seed 复现。
+
+蒙特卡洛估算每个传说的期望花费:
+  python gacha_engine.py --pool super --pulls 5000000 --seed 1
+========================================
+"""
+
+import random
+import argparse
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RARITY_ORDER = ('common', 'uncommon', 'rare', 'epic', 'legendary')
+
+# 超过该抽数才使用 NumPy, 十连这种小批量逐发计算反而更快
+NUMPY_THRESHOLD = 256
+
+
+def _cumulative(weights):
+    """{rarity: w} 或装备目录的 WeightTable → (品质索引列表, 累积权重列表)"""
+    if hasattr(weights, 'cumulative'):
+        return [RARITY_ORDER.index(r) for r in weights.keys], list(weights.cumulative)
+    idx, cum, total = [], [], 0
+    for r, w in weights.items():
+        if w > 0:
+            total += w
+            idx.append(RARITY_ORDER.index(r))
+            cum.append(total)
+    return idx, cum
+
+
+# ============================================================
+#  品质序列 (含保底)
+# ============================================================
+def _make_rng(seed, use_numpy):
+    if use_numpy:
+        return np.random.default_rng(seed)
+    return random if seed is None else random.Random(seed)
+
+
+def _roll_py(weights, count, pity, limit, pity_rarity, rng):
+    idx, cum = _cumulative(weights)
+    total = cum[-1]
+    pity_ri = RARITY_ORDER.index(pity_rarity)
+    out = []
+    forced = 0
+    for _ in range(count):
+        pity += 1
+        if pity >= limit:
+            ri = pity_ri
+            pity = 0
+            forced += 1
+        else:
+            ri = idx[bisect_right(cum, rng.random() * total)]
+            if ri >= pity_ri:
+                pity = 0
+        out.append(ri)
+    return out, pity, forced
+
+
+def _roll_np(weights, count, pity, limit, pity_rarity, gen):
+    idx, cum = _cumulative(weights)
+    cum = np.asarray(cum, dtype=np.float64)
+    pity_ri = RARITY_ORDER.index(pity_rarity)
+    rolled = np.asarray(idx, dtype=np.int8)[
+        np.searchsorted(cum, gen.random(count) * cum[-1], side='right')]
+    # 只需按"清零点"跳跃: 下一个自然出货位置 h 与强制保底位置 forced_at 取先到者
+    hits = np.flatnonzero(rolled >= pity_ri).tolist()
+    n_hits = len(hits)
+    forced = 0
+    cur = 0
+    k = 0
+    while cur < count:
+        forced_at = cur + max(0, limit - 1 - pity)
+        while k < n_hits and hits[k] < cur:
+            k += 1
+        h = hits[k] if k < n_hits else count
+        if h < forced_at and h < count:
+            cur = h + 1
+            pity = 0
+        elif forced_at < count:
+            rolled[forced_at] = pity_ri
+            cur = forced_at + 1
+            pity = 0
+            forced += 1
+        else:
+            pity += count - cur
+            break
+    return rolled, pity, forced
+
+
+def _roll(weights, count, pity, limit, pity_rarity, rng, use_numpy):
+    if use_numpy:
+        return _roll_np(weights, count, pity, limit, pity_rarity, rng)
+    return _roll_py(weights, count, pity, limit, pity_rarity, rng)
+
+
+def _want_numpy(count, use_numpy):
+    if use_numpy is None:
+        return np is not None and count >= NUMPY_THRESHOLD
+    return bool(use_numpy) and np is not None
+
+
+def roll_rarities(weights, count, pity=0, limit=80, pity_rarity='legendary',
+                  seed=None, use_numpy=None):
+    """
+    抽 count 发品质。返回 (品质索引 list, 结束时的保底计数); numpy 路径也返回 list。
+    seed 为 None 时使用全局随机源 (random / numpy 默认生成器)。
+    """
+    use_numpy = _want_numpy(count, use_numpy)
+    rng = _make_rng(seed, use_numpy)
+    rarities, pity, _ = _roll(weights, count, pity, limit, pity_rarity, rng, use_numpy)
+    if use_numpy:
+        rarities = rarities.tolist()
+    return rarities, pity
+
+
+# ============================================================
+#  批量抽卡 (品质 + 装备模板)
+# ============================================================
+def pull_batch(catalog, weights, count, pity=0, limit=80, pity_rarity='legendary',
+               seed=None, use_numpy=None):
+    """
+    返回 ([(template_idx, rarity), ...], 新保底计数)。
+    某品质在装备库中无模板时该发跳过, 与 do_gacha_pull 返回 None 一致。
+    """
+    use_numpy = _want_numpy(count, use_numpy)
+    rng = _make_rng(seed, use_numpy)
+    rarities, pity, _ = _roll(weights, count, pity, limit, pity_rarity, rng, use_numpy)
+
+    if not use_numpy:
+        results = []
+        for ri in rarities:
+            rarity = RARITY_ORDER[ri]
+            tidx = catalog.pick(rarity, rng=rng)
+            if tidx is not None:
+                results.append((tidx, rarity))
+        return results, pity
+
+    # 各品质候选模板摊平成一个数组, 按 起点 + floor(u * 数量) 一次取出
+    flat, starts, sizes = [], [], []
+    for r in RARITY_ORDER:
+        cands = catalog.by_rarity(r)
+        starts.append(len(flat))
+        sizes.append(len(cands))
+        flat.extend(cands)
+    sizes = np.asarray(sizes)
+    ri = np.asarray(rarities, dtype=np.intp)
+    ri = ri[sizes[ri] > 0]
+    if not len(ri):
+        return [], pity
+    pos = np.asarray(starts)[ri] + (rng.random(len(ri)) * sizes[ri]).astype(np.intp)
+    tidx = np.asarray(flat)[pos]
+    return [(t, RARITY_ORDER[r]) for t, r in zip(tidx.tolist(), ri.tolist())], pity
+
+
+# ============================================================
+#  蒙特卡洛
+# ============================================================
+def simulate(weights, pulls, limit, pity_rarity, cost_per_pull, seed=None,
+             target='legendary', chunk=1_000_000):
+    """
+    模拟 pulls 发 (分块以限制内存), 保底计数跨块延续。
+    返回 dict: pulls / counts / forced / pulls_per_target / cost_per_target
+    """
+    use_numpy = np is not None
+    rng = _make_rng(seed, use_numpy)
+    counts = [0] * len(RARITY_ORDER)
+    pity = forced = done = 0
+    while done < pulls:
+        n = min(chunk, pulls - done)
+        rarities, pity, f = _roll(weights, n, pity, limit, pity_rarity, rng, use_numpy)
+        forced += f
+        if use_numpy:
+            for i, c in enumerate(np.bincount(rarities, minlength=len(RARITY_ORDER)).tolist()):
+                counts[i] += c
+        else:
+            for ri in rarities:
+                counts[ri] += 1
+        done += n
+    hits = counts[RARITY_ORDER.index(target)]
+    ppt = pulls / hits if hits else float('inf')
+    return {
+        'pulls': pulls,
+        'counts': dict(zip(RARITY_ORDER, counts)),
+        'forced': forced,
+        'pulls_per_target': ppt,
+        'cost_per_target': ppt * cost_per_pull,
+    }
+
+
+def _main():
+    import meta_systems
+    parser = argparse.ArgumentParser(description="抽卡期望花费蒙特卡洛估算")
+    parser.add_argument('--pool', choices=sorted(meta_systems.GACHA_POOLS), default='super')
+    parser.add_argument('--pulls', type=int, default=2_000_000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--single', action='store_true', help="按单抽价格计费 (默认十连)")
+    args = parser.parse_args()
+
+    cfg = meta_systems.GACHA_POOLS[args.pool]
+    cost = cfg['cost'] if args.single else cfg['cost10'] / 10
+    res = simulate(cfg['weights'], args.pulls, cfg['pity_limit'], cfg['pity_rarity'],
+                   cost, seed=args.seed)
+    print(f"pool={args.pool}  pulls={res['pulls']:,}  numpy={'yes' if np else 'no'}")
+    for r, c in res['counts'].items():
+        print(f"  {r:<10}{c:>12,}  {c / res['pulls']:8.4%}")
+    print(f"  forced pity pulls: {res['forced']:,}")
+    print(f"pulls per legendary: {res['pulls_per_target']:.2f}")
+    print(f"cost per legendary:  {res['cost_per_target']:.1f} ({cfg['currency']})")
+
+
+if __name__ == "__main__":
+    _main()
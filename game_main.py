@@ -14,18 +14,19 @@ import random
 import sys
 import os
 import json
-import array
-import meta_systems
-import dialogue_system
-import gacha_animation
-import town_map
-import i18n
 import threading
 import time
-try:
-    from net_integration import NetClient
-except Exception:
-    NetClient = None
+import i18n
+import font_manager
+import background
+import minimap
+import startup
+import freeze_frame
+import quality
+import render_scale
+
+# 启动耗时追踪: 各阶段耗时在进入主循环前写入 startup_report.txt
+STARTUP_TRACE = startup.StartupTrace()
 
 # ============================================================
 #  显示配置
@@ -39,21 +40,51 @@ AVAILABLE_RESOLUTIONS = [
     (2560, 1440),  # 2K
 ]
 DEFAULT_RESOLUTION = (1280, 720)
+FPS = 60   # 帧率上限, 也是画质 / 渲染比例自动调节的帧预算
 
 # ============================================================
 #  初始化
 # ============================================================
-pygame.init()
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-pygame.key.stop_text_input()  # 禁用IME，防止中文输入法拦截WASD按键
+with STARTUP_TRACE.phase("pygame.init"):
+    pygame.init()
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    pygame.key.stop_text_input()  # 禁用IME，防止中文输入法拦截WASD按键
+
+# 字体路径索引不全时 (首次启动 / 换了机器) 才需要扫描系统字体, 放到后台线程先做
+if not font_manager.index_complete():
+    threading.Thread(target=pygame.font.get_fonts, name="sysfont-scan", daemon=True).start()
 
 WIDTH, HEIGHT = DEFAULT_RESOLUTION
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption(i18n.t("暗夜割草者：深渊轮回"))
+with STARTUP_TRACE.phase("display"):
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = window        # 内部画布, 渲染比例低于 100% 时由 apply_render_scale 换成缩小的 Surface
+    pygame.display.set_caption(i18n.t("暗夜割草者：深渊轮回"))
 clock = pygame.time.Clock()
 NET_CLIENT = None
 NET_MODE = False
 
+# 窗口建好后立即显示加载界面, 之后主线程每进入 LOADING_PHASES 中的一个阶段推进一格
+# (sfx 生成 / 系统字体扫描在后台线程, 延迟模块在进入主循环后才加载, 都不计入)
+LOADING_PHASES = ("import modules", "import characters/boss", "load save", "display settings + fonts")
+loading_screen = startup.LoadingScreen(screen, LOADING_PHASES)
+loading_screen.draw()
+STARTUP_TRACE.on_phase = loading_screen.advance
+
+with STARTUP_TRACE.phase("import modules"):
+    import meta_systems
+    import dialogue_system
+    import equipment_catalog
+    import synth
+    from save_store import SaveStore
+    try:
+        from net_integration import NetClient
+    except Exception:
+        NetClient = None
+
+# 不常用的界面模块: 首次使用时才导入, 进入主循环后在后台预取
+gacha_animation = startup.LazyModule('gacha_animation', STARTUP_TRACE)
+town_map = startup.LazyModule('town_map', STARTUP_TRACE)
+
 # ============================================================
 #  颜色
 # ============================================================
@@ -79,64 +110,13 @@ LIME   = (180, 255, 60)
 #  字体
 # ============================================================
 def get_font(size, lang=None):
-    """加载支持多语言的字体，根据语言选择最佳系统字体"""
+    """加载支持多语言的字体，根据语言选择最佳系统字体 (路径索引与 Font 对象由 font_manager 缓存)"""
     if lang is None:
         lang = i18n.get_language()
+    return font_manager.get_font(size, lang)
 
-    # 按语言优先选择Windows自带系统字体，无需打包额外字体
-    _FONT_PRIORITY = {
-        'ko': [
-            ('Malgun Gothic',        'C:/Windows/Fonts/malgun.ttf'),
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'ja': [
-            ('Yu Gothic',            'C:/Windows/Fonts/YuGothM.ttc'),
-            ('MS Gothic',            'C:/Windows/Fonts/msgothic.ttc'),
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'zh': [
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('SimHei',               'C:/Windows/Fonts/simhei.ttf'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'ru': [
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-            ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
-        ],
-        'en': [
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-            ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
-        ],
-    }
-
-    candidates = _FONT_PRIORITY.get(lang, _FONT_PRIORITY['en'])
-
-    # 1) 先尝试 SysFont（按语言顺序）
-    sys_names = ','.join(name for name, _ in candidates)
-    try:
-        f = pygame.font.SysFont(sys_names, size)
-        if f:
-            return f
-    except:
-        pass
-
-    # 2) 直接按路径加载
-    for _, path in candidates:
-        if os.path.exists(path):
-            try:
-                return pygame.font.Font(path, size)
-            except:
-                continue
-
-    return pygame.font.Font(None, size)
-
-font_title = get_font(64)
-font_lg    = get_font(42)
-font_md    = get_font(28)
-font_sm    = get_font(20)
-font_xs    = get_font(14)
+# 读取存档确定语言后由 reload_fonts() 创建
+font_title = font_lg = font_md = font_sm = font_xs = None
 
 def reload_fonts():
     """重新加载字体（语言切换或分辨率改变时调用）"""
@@ -148,7 +128,11 @@ def reload_fonts():
     font_md    = get_font(28, lang)
     font_sm    = get_font(20, lang)
     font_xs    = get_font(14, lang)
-    # 重新初始化各模块的字体
+    font_manager.prewarm(lang, (64, 42, 28, 20, 14), i18n.glyph_text(lang))
+    init_ui_modules()
+
+def init_ui_modules():
+    """把当前画布、字体和尺寸交给各界面模块 (字体或内部画布变化时调用)"""
     meta_systems.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
     dialogue_system.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
     gacha_animation.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
@@ -173,46 +157,43 @@ def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
 #  音效生成
 # ============================================================
 SOUND_ENABLED = True
-try:
-    def gen_sound(freq=440, dur=0.1, vol=0.3, wave='sine'):
-        sr = 22050; n = int(sr * dur)
-        buf = array.array('h', [0] * n)
-        amp = int(32767 * vol)
-        for i in range(n):
-            t = i / sr; fade = 1.0 - i / n
-            if wave == 'square':
-                v = amp if math.sin(2*math.pi*freq*t) > 0 else -amp
-            elif wave == 'noise':
-                v = random.randint(-amp, amp)
-            elif wave == 'saw':
-                v = int(amp * (2*(freq*t % 1) - 1))
-            else:
-                v = int(amp * math.sin(2*math.pi*freq*t))
-            buf[i] = max(-32767, min(32767, int(v * fade)))
-        return pygame.mixer.Sound(buffer=buf)
-
-    SFX = {
-        'shoot':     gen_sound(800, 0.04, 0.15),
-        'hit':       gen_sound(400, 0.05, 0.2),
-        'kill':      gen_sound(600, 0.06, 0.2, 'square'),
-        'exp':       gen_sound(1000, 0.03, 0.1),
-        'levelup':   gen_sound(500, 0.3, 0.25),
-        'heal':      gen_sound(700, 0.15, 0.2),
-        'boss_roar': gen_sound(80, 0.4, 0.35, 'saw'),
-        'ice':       gen_sound(1200, 0.08, 0.15),
-        'fire':      gen_sound(200, 0.15, 0.25, 'noise'),
-        'thunder':   gen_sound(150, 0.1, 0.3, 'noise'),
-        'whip':      gen_sound(300, 0.06, 0.2, 'saw'),
-        'shield':    gen_sound(500, 0.05, 0.15),
-        'combo':     gen_sound(900, 0.04, 0.15),
-        'select':    gen_sound(600, 0.08, 0.2),
-    }
-    def play_sfx(name):
-        s = SFX.get(name)
-        if s: s.play()
-except Exception:
-    SOUND_ENABLED = False
-    def play_sfx(name): pass
+SFX = {}
+
+def gen_sound(freq=440, dur=0.1, vol=0.3, wave='sine'):
+    return synth.tone(freq, dur, vol, wave)
+
+SFX_SPECS = {
+    'shoot':     (800, 0.04, 0.15),
+    'hit':       (400, 0.05, 0.2),
+    'kill':      (600, 0.06, 0.2, 'square'),
+    'exp':       (1000, 0.03, 0.1),
+    'levelup':   (500, 0.3, 0.25),
+    'heal':      (700, 0.15, 0.2),
+    'boss_roar': (80, 0.4, 0.35, 'saw'),
+    'ice':       (1200, 0.08, 0.15),
+    'fire':      (200, 0.15, 0.25, 'noise'),
+    'thunder':   (150, 0.1, 0.3, 'noise'),
+    'whip':      (300, 0.06, 0.2, 'saw'),
+    'shield':    (500, 0.05, 0.15),
+    'combo':     (900, 0.04, 0.15),
+    'select':    (600, 0.08, 0.2),
+}
+
+def _load_sfx():
+    """后台线程生成音效; 完成前 play_sfx 静默跳过"""
+    global SOUND_ENABLED
+    with STARTUP_TRACE.phase("sfx"):
+        try:
+            for name, args in SFX_SPECS.items():
+                SFX[name] = gen_sound(*args)
+        except Exception:
+            SOUND_ENABLED = False
+
+def play_sfx(name):
+    s = SFX.get(name)
+    if s: s.play()
+
+threading.Thread(target=_load_sfx, name="sfx-loader", daemon=True).start()
 
 # ============================================================
 #  粒子系统
@@ -229,8 +210,10 @@ class Particle:
         self.life -= dt
     def draw(self, surface, sh):
         if self.life <= 0: return
-        a = max(0, min(255, int(255 * self.life / self.max_life)))
         sx = int(self.x + sh[0]); sy = int(self.y + sh[1])
+        if QUALITY.tier.cull and (sx < -20 or sx > WIDTH + 20 or sy < -20 or sy > HEIGHT + 20):
+            return
+        a = max(0, min(255, int(255 * self.life / self.max_life)))
         if self.ptype == 'spark':
             ex = sx - int(self.vx * 0.02); ey = sy - int(self.vy * 0.02)
             c = (*self.color[:3], a)
@@ -260,6 +243,12 @@ PARTICLE_PRESETS = {
 }
 
 def create_particles(x, y, count, ptype='explosion'):
+    # 画质档位: 数量按倍率缩放 (小数部分按概率取整, 少量粒子的特效平均数量不变), 并受同屏上限约束
+    tier = QUALITY.tier
+    if tier.particle_scale != 1.0:
+        count = int(count * tier.particle_scale + random.random())
+    if tier.particle_cap is not None:
+        count = min(count, tier.particle_cap - len(particles))
     cfg = PARTICLE_PRESETS.get(ptype, PARTICLE_PRESETS['explosion'])
     pt = cfg.get('pt', 'normal')
     for _ in range(count):
@@ -296,8 +285,9 @@ screen_shake = ScreenShake()
 # ============================================================
 #  导入角色和Boss模块
 # ============================================================
-import characters
-import boss as boss_module
+with STARTUP_TRACE.phase("import characters/boss"):
+    import characters
+    import boss as boss_module
 
 # ============================================================
 #  连击系统
@@ -401,10 +391,14 @@ class ExpGem:
         if self.flash and int(self.life * 6) % 2 == 0: return
         sx = int(self.x + sh[0])
         sy = int(self.y + sh[1] + math.sin(self.bob) * 3)
+        tier = QUALITY.tier
+        if tier.cull and (sx < -20 or sx > WIDTH + 20 or sy < -20 or sy > HEIGHT + 20):
+            return
         # 发光
-        gs = pygame.Surface((self.size*4+4, self.size*4+4), pygame.SRCALPHA)
-        pygame.draw.circle(gs, (*self.color, 60), (self.size*2+2, self.size*2+2), self.size*2)
-        surface.blit(gs, (sx-self.size*2-2, sy-self.size*2-2))
+        if tier.glow:
+            gs = pygame.Surface((self.size*4+4, self.size*4+4), pygame.SRCALPHA)
+            pygame.draw.circle(gs, (*self.color, 60), (self.size*2+2, self.size*2+2), self.size*2)
+            surface.blit(gs, (sx-self.size*2-2, sy-self.size*2-2))
         pygame.draw.circle(surface, self.color, (sx, sy), self.size)
         pygame.draw.circle(surface, WHITE, (sx, sy), max(1, self.size-2))
 
@@ -1204,10 +1198,13 @@ class Enemy:
         r = int(self.size)
         # 精英标记
         if self.is_elite:
-            es = pygame.Surface((r*2+10, r*2+10), pygame.SRCALPHA)
-            ea = max(0, min(120, int(80 + 40 * math.sin(self.anim_timer * 4))))
-            pygame.draw.circle(es, (255, 50, 50, ea), (r+5, r+5), r+4, 2)
-            surface.blit(es, (sx-r-5, sy-r-5))
+            if QUALITY.tier.glow:
+                es = pygame.Surface((r*2+10, r*2+10), pygame.SRCALPHA)
+                ea = max(0, min(120, int(80 + 40 * math.sin(self.anim_timer * 4))))
+                pygame.draw.circle(es, (255, 50, 50, ea), (r+5, r+5), r+4, 2)
+                surface.blit(es, (sx-r-5, sy-r-5))
+            else:
+                pygame.draw.circle(surface, (150, 30, 30), (sx, sy), r+4, 2)
         # 身体
         pygame.draw.circle(surface, c, (sx, sy), r)
         # 眼睛
@@ -1295,12 +1292,16 @@ class MaterialDrop:
         sx = int(self.x + sh[0])
         sy = int(self.y + sh[1] + math.sin(self.bob)*2)
         r = self.size
+        tier = QUALITY.tier
+        if tier.cull and (sx < -20 or sx > WIDTH + 20 or sy < -20 or sy > HEIGHT + 20):
+            return
         pts = [(sx, sy-r), (sx+r, sy), (sx, sy+r), (sx-r, sy)]
         pygame.draw.polygon(surface, self.color, pts)
         pygame.draw.polygon(surface, WHITE, pts, 1)
-        gs = pygame.Surface((r*3, r*3), pygame.SRCALPHA)
-        pygame.draw.circle(gs, (*self.color, 40), (r*3//2, r*3//2), r*3//2)
-        surface.blit(gs, (sx-r*3//2, sy-r*3//2))
+        if tier.glow:
+            gs = pygame.Surface((r*3, r*3), pygame.SRCALPHA)
+            pygame.draw.circle(gs, (*self.color, 40), (r*3//2, r*3//2), r*3//2)
+            surface.blit(gs, (sx-r*3//2, sy-r*3//2))
 
 material_drops = []
 
@@ -1421,20 +1422,31 @@ class Equipment:
         self.enhance += 1; return True
 
 
+# 各敌人类型的掉落概率与品质权重 (顺序同 RARITY_ORDER)
+EQUIP_DROP_CHANCE = {'normal': 0.008, 'enhanced': 0.025, 'elite': 0.15, 'boss': 1.0}
+EQUIP_DROP_WEIGHTS = {
+    'normal':   (70, 25, 5, 0, 0),
+    'enhanced': (40, 40, 15, 5, 0),
+    'elite':    (10, 30, 35, 20, 5),
+    'boss':     (0, 5, 25, 45, 25),
+}
+
+# 装备目录: 导入时构建一次, meta_systems 通过 equipment_db 参数取同一实例
+EQUIP_CATALOG = equipment_catalog.build_catalog(EQUIPMENT_DB, pools={
+    **{'drop_' + k: dict(zip(RARITY_ORDER, w)) for k, w in EQUIP_DROP_WEIGHTS.items()},
+    **meta_systems.EQUIP_WEIGHT_POOLS,
+})
+
+
 def roll_equipment_drop(enemy_type='normal'):
     """根据敌人类型随机生成装备"""
-    drop_chance = {'normal': 0.008, 'enhanced': 0.025, 'elite': 0.15, 'boss': 1.0}.get(enemy_type, 0.008)
-    if random.random() > drop_chance: return None
-    weights = {
-        'normal':   [70, 25, 5, 0, 0],
-        'enhanced': [40, 40, 15, 5, 0],
-        'elite':    [10, 30, 35, 20, 5],
-        'boss':     [0, 5, 25, 45, 25],
-    }.get(enemy_type, [70, 25, 5, 0, 0])
-    rarity = random.choices(RARITY_ORDER, weights=weights)[0]
-    candidates = [i for i, tpl in enumerate(EQUIPMENT_DB) if tpl[2] == rarity]
-    if not candidates: return None
-    return Equipment(random.choice(candidates))
+    if enemy_type not in EQUIP_DROP_WEIGHTS:
+        enemy_type = 'normal'
+    if random.random() > EQUIP_DROP_CHANCE[enemy_type]: return None
+    rarity = EQUIP_CATALOG.roll_rarity('drop_' + enemy_type)
+    tidx = EQUIP_CATALOG.pick(rarity)
+    if tidx is None: return None
+    return Equipment(tidx)
 
 
 # ============================================================
@@ -1522,6 +1534,10 @@ else:
     # 开发环境，保存到脚本所在目录
     SAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'save_data.json')
 
+STARTUP_REPORT_PATH = os.path.join(os.path.dirname(SAVE_PATH), 'startup_report.txt')
+
+SAVE_STORE = SaveStore(SAVE_PATH, on_error=lambda e: print(i18n.t("保存失败: {err}", err=e)))
+
 def load_save():
     default = {
         'soul_shards': 0,
@@ -1531,6 +1547,8 @@ def load_save():
         'language': 'en',
         'resolution': list(DEFAULT_RESOLUTION),
         'fullscreen': False,
+        'quality': 'auto',   # 'auto' 或 quality.TIERS 中的档位名
+        'render_scale': '100',   # 'auto' 或 render_scale.SCALES 中的百分比
         'unlocked_chars': [0],  # 索引列表
         'upgrades': {  # 永久升级
             'survival': 0,  # 0-5级
@@ -1541,51 +1559,90 @@ def load_save():
         'achievements': [],
     }
     try:
-        with open(SAVE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for k, v in default.items():
-                if k not in data:
-                    data[k] = v
-            # 合并局外系统数据
-            data = meta_systems.merge_meta_save(data)
-            return data
-    except (FileNotFoundError, json.JSONDecodeError):
+        data = SAVE_STORE.load()
+    except json.JSONDecodeError:
+        data = None
+    if data is None:
         default = meta_systems.merge_meta_save(default)
         return default
+    for k, v in default.items():
+        if k not in data:
+            data[k] = v
+    # 合并局外系统数据
+    data = meta_systems.merge_meta_save(data)
+    return data
 
 def save_game(data):
-    try:
-        with open(SAVE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        print(i18n.t("保存失败: {err}", err=e))
+    """标记存档变化; 由 SAVE_STORE 后台线程合并后原子写入"""
+    SAVE_STORE.save(data)
+
+BG_GRID = 60
+BG_TILE = None   # 预渲染的网格贴图, 分辨率变化时由 apply_display_settings 重建
+
+def rebuild_background():
+    global BG_TILE
+    BG_TILE = background.GridTile(WIDTH, HEIGHT, BG_GRID, DARK_BG, GRID_COLOR)
 
 def apply_display_settings(resolution, fullscreen):
     """应用显示设置"""
-    global screen, WIDTH, HEIGHT
-    WIDTH, HEIGHT = resolution
+    global window
     flags = pygame.FULLSCREEN if fullscreen else 0
-    screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    window = pygame.display.set_mode(resolution, flags)
     pygame.display.set_caption(i18n.t("暗夜割草者：深渊轮回"))
+    resize_canvas()
     # 重新初始化模块以适应新分辨率
     reload_fonts()
-
-save_data = load_save()
-i18n.set_language(save_data.get('language', 'en'))
-
-# 根据保存的语言重新加载字体
-reload_fonts()
-
-# 应用保存的显示设置
+    rebuild_background()
+
+def resize_canvas():
+    """按 RENDER_SCALE 当前档位重建内部画布 (screen), WIDTH / HEIGHT 随之变为内部尺寸; 返回尺寸变化量"""
+    global screen, WIDTH, HEIGHT, render_level
+    old_w, old_h = WIDTH, HEIGHT
+    screen = render_scale.configure(window, RENDER_SCALE.tier.factor)
+    render_level = RENDER_SCALE.level
+    WIDTH, HEIGHT = screen.get_size()
+    return WIDTH - old_w, HEIGHT - old_h
+
+def apply_render_scale():
+    """
+    渲染比例变化后调用 (设置界面 / 开局), 返回内部尺寸的变化量 (dw, dh)。
+    内部尺寸决定战场视野与 HUD 大小, 所以战斗中不调用: 自动调节的结果留到下一局开局时生效。
+    """
+    dw, dh = resize_canvas()
+    if dw or dh:
+        init_ui_modules()
+        rebuild_background()
+        boss_module.resize(WIDTH, HEIGHT)
+    return dw, dh
+
+def apply_quality():
+    """档位变化后同步到 Boss 模块 (其余效果在各自绘制时读取 QUALITY.tier)"""
+    boss_module.set_detail(QUALITY.tier.boss_detail)
+
+with STARTUP_TRACE.phase("load save"):
+    save_data = load_save()
+    i18n.set_language(save_data.get('language', 'en'))
+
+# 画质档位 / 渲染比例: 设置为自动时按战斗帧耗时升降 (见 quality.py, render_scale.py)
+QUALITY = quality.Governor(FPS, save_data.get('quality', 'auto'))
+RENDER_SCALE = quality.Governor(FPS, save_data.get('render_scale', '100'), render_scale.SCALES)
+render_level = 0         # 内部画布实际使用的 RENDER_SCALE 档位 (自动调节的新档位在开局时才应用)
+apply_quality()
+
+# 应用保存的显示设置; 字体按存档语言只创建一次
 saved_resolution = tuple(save_data.get('resolution', list(DEFAULT_RESOLUTION)))
 saved_fullscreen = save_data.get('fullscreen', False)
-if saved_resolution in AVAILABLE_RESOLUTIONS:
-    apply_display_settings(saved_resolution, saved_fullscreen)
-else:
-    # 如果保存的分辨率无效，使用默认值
-    save_data['resolution'] = list(DEFAULT_RESOLUTION)
-    save_data['fullscreen'] = False
-    save_game(save_data)
+with STARTUP_TRACE.phase("display settings + fonts"):
+    if saved_resolution in AVAILABLE_RESOLUTIONS and (
+            saved_resolution != (WIDTH, HEIGHT) or saved_fullscreen):
+        apply_display_settings(saved_resolution, saved_fullscreen)   # 内含 reload_fonts
+    else:
+        if saved_resolution not in AVAILABLE_RESOLUTIONS:
+            # 如果保存的分辨率无效，使用默认值
+            save_data['resolution'] = list(DEFAULT_RESOLUTION)
+            save_data['fullscreen'] = False
+            save_game(save_data)
+        reload_fonts()
 
 pygame.display.set_caption(i18n.t("暗夜割草者：深渊轮回"))
 
@@ -1660,6 +1717,17 @@ class GameState:
     LOBBY = 'lobby'
 
 
+# 场景静止的状态: 进入时冻结最后一帧战斗画面, 之后只重绘界面层
+FREEZE_STATES = (GameState.PAUSED, GameState.UPGRADE, GameState.INVENTORY, GameState.BOSS_WARNING)
+# 其中没有任何动画的状态: 一段时间无输入后降到 IDLE_FPS, 省 CPU / 电量
+IDLE_STATES = (GameState.PAUSED, GameState.UPGRADE, GameState.INVENTORY)
+IDLE_FPS = 12
+IDLE_AFTER = 0.5     # 秒
+# 局外界面由 meta_systems.UI 保留绘制, 只提交变化的区域 (display.update 代替 flip)
+RETAINED_STATES = (GameState.CODEX, GameState.DUNGEON_SELECT, GameState.CHAR_UPGRADE,
+                   GameState.GACHA, GameState.SETTLEMENT)
+
+
 # ============================================================
 #  游戏运行时数据
 # ============================================================
@@ -1901,14 +1969,41 @@ items = []  # 场景物品 (宝箱等)
 #  绘制函数
 # ============================================================
 def draw_background(surface, sh, bg_off):
-    surface.fill(DARK_BG)
-    grid = 60
-    ox = int(bg_off[0] % grid + sh[0])
-    oy = int(bg_off[1] % grid + sh[1])
-    for x in range(ox - grid, WIDTH + grid, grid):
-        pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, HEIGHT), 1)
-    for y in range(oy - grid, HEIGHT + grid, grid):
-        pygame.draw.line(surface, GRID_COLOR, (0, y), (WIDTH, y), 1)
+    if BG_TILE is None:
+        rebuild_background()
+    BG_TILE.draw(surface, int(bg_off[0] % BG_GRID + sh[0]), int(bg_off[1] % BG_GRID + sh[1]))
+
+
+# 战场小地图: 以玩家 (屏幕中心) 为中心覆盖 BATTLE_MINIMAP_SPAN 倍屏幕范围, 显示敌人密度
+BATTLE_MINIMAP_SIZE = (140, 90)
+BATTLE_MINIMAP_SPAN = 3
+battle_density = minimap.DensityGrid(42, 27, RED)
+_battle_map = None
+
+def draw_battle_minimap(surface, x, y):
+    global _battle_map
+    mw, mh = BATTLE_MINIMAP_SIZE
+    span_w, span_h = WIDTH * BATTLE_MINIMAP_SPAN, HEIGHT * BATTLE_MINIMAP_SPAN
+    x0, y0 = (WIDTH - span_w) / 2, (HEIGHT - span_h) / 2
+    if _battle_map is None or _battle_map.wx != x0 or _battle_map.wy != y0:
+        _battle_map = minimap.Minimap(BATTLE_MINIMAP_SIZE, (x0, y0, span_w, span_h), pad=4)
+
+    def bake(mm):
+        pygame.draw.rect(mm, (10, 10, 15, 170), (0, 0, mw, mh), border_radius=5)
+        pygame.draw.rect(mm, (80, 80, 100, 120), (0, 0, mw, mh), 1, border_radius=5)
+    surface.blit(_battle_map.static_layer(BATTLE_MINIMAP_SIZE, bake), (x, y))
+
+    pad = _battle_map.pad
+    battle_density.update(((e.x, e.y) for e in enemies if e.alive),
+                          x0, y0, span_w, span_h, run.game_time)
+    surface.blit(battle_density.surface((mw - pad * 2, mh - pad * 2)), (x + pad, y + pad))
+    for b in bosses:
+        _battle_map.blit_dot(surface, (x, y), b.x, b.y, (200, 80, 255, 230), 3)
+    # 视野框 + 玩家
+    vx, vy = _battle_map.to_map(0, 0)
+    vw, vh = int(WIDTH * _battle_map.scale_x), int(HEIGHT * _battle_map.scale_y)
+    surface.blit(_battle_map.frame(vw, vh, (255, 255, 255, 60)), (x + vx, y + vy))
+    _battle_map.blit_dot(surface, (x, y), WIDTH // 2, HEIGHT // 2, (255, 255, 255, 230), 2)
 
 
 def draw_hud(surface):
@@ -1980,6 +2075,10 @@ def draw_hud(surface):
             pt = _render_outlined(font_xs, f"[{i18n.t(pn)}]", PURPLE)
             surface.blit(pt, (pi_x + i * 80, pi_y))
 
+    # 战场小地图 (右下, TAB 提示上方)
+    draw_battle_minimap(surface, WIDTH - BATTLE_MINIMAP_SIZE[0] - 10,
+                        HEIGHT - BATTLE_MINIMAP_SIZE[1] - 26)
+
     # TAB提示
     tab_t = _render_outlined(font_xs, i18n.t("[TAB] 装备/材料"), (100, 100, 130))
     surface.blit(tab_t, (WIDTH - 130, HEIGHT - 18))
@@ -2014,12 +2113,15 @@ def draw_hud(surface):
             mx += 55
 
 
-def draw_inventory(surface):
-    """绘制背包/装备界面，返回按钮字典"""
+INVENTORY_DIM = 180
+
+def draw_inventory(surface, dim=True):
+    """绘制背包/装备界面，返回按钮字典 (dim=False: 背景已按 INVENTORY_DIM 暗化过)"""
     buttons = {}
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0, 0))
+    if dim:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, INVENTORY_DIM))
+        surface.blit(overlay, (0, 0))
 
     # 标题
     title = _render_outlined(font_lg, i18n.t("装备 & 材料"), CYAN)
@@ -2169,7 +2271,7 @@ def draw_start_screen(surface):
         btn_w, btn_h = 300, 58
         bx = WIDTH // 2 - btn_w // 2
         rect = pygame.Rect(bx, y, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         bc = color if hover else tuple(max(0, c-60) for c in color)
         bs = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
@@ -2260,7 +2362,7 @@ def confirm_sync(surface, text):
     pygame.draw.rect(surface, (120, 50, 50), no_rect, border_radius=6)
     surface.blit(_render_outlined(font_sm, i18n.t("是"), WHITE), (yes_rect.x + 50, yes_rect.y + 6))
     surface.blit(_render_outlined(font_sm, i18n.t("否"), WHITE), (no_rect.x + 50, no_rect.y + 6))
-    pygame.display.flip()
+    render_scale.present()
     # wait for user input
     while True:
         for ev in pygame.event.get():
@@ -2269,7 +2371,7 @@ def confirm_sync(surface, text):
             if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                 return False
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = render_scale.mouse_pos()
                 if yes_rect.collidepoint((mx, my)):
                     return True
                 if no_rect.collidepoint((mx, my)):
@@ -2305,7 +2407,7 @@ def draw_settings_screen(surface):
         by = y + (i // 2) * 60
         rect = pygame.Rect(bx, by, btn_w, btn_h)
         
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         
         color = GREEN if is_current else (CYAN if hover else (60, 60, 80))
@@ -2331,7 +2433,7 @@ def draw_settings_screen(surface):
         bx = WIDTH//2 - 250 + i * 220
         rect = pygame.Rect(bx, fs_y, btn_w, btn_h)
         
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         
         color = GREEN if is_current else (CYAN if hover else (60, 60, 80))
@@ -2344,11 +2446,45 @@ def draw_settings_screen(surface):
         
         buttons[f'fs_{mode_key}'] = (rect, is_fullscreen)
     
+    # 画质 / 渲染比例 (点击立即生效, 不需要应用); 标签在左, 选项在右
+    rows = [('q', i18n.t("画质"), QUALITY, 100), ('rs', i18n.t("渲染比例"), RENDER_SCALE, 70)]
+    row_y = fs_y + 60
+    for prefix, label, gov, btn_w in rows:
+        btn_h = 40
+        row_label = _render_outlined(font_md, label, WHITE)
+        surface.blit(row_label, (WIDTH//2 - 250, row_y + btn_h//2 - row_label.get_height()//2))
+        for i, mode in enumerate(gov.modes):
+            is_current = mode == gov.mode
+            if mode == 'auto':
+                mode_text = i18n.t("自动")
+            else:
+                mode_text = i18n.t(gov.levels[i - 1].label)
+            
+            bx = WIDTH//2 - 40 + i * (btn_w + 8)
+            rect = pygame.Rect(bx, row_y, btn_w, btn_h)
+            
+            mx, my = render_scale.mouse_pos()
+            hover = rect.collidepoint(mx, my)
+            
+            color = GREEN if is_current else (CYAN if hover else (60, 60, 80))
+            pygame.draw.rect(surface, color, rect, 0 if is_current else 2, border_radius=8)
+            
+            text = _render_outlined(font_sm, mode_text, WHITE if is_current else CYAN)
+            surface.blit(text, (bx + btn_w//2 - text.get_width()//2, row_y + btn_h//2 - text.get_height()//2))
+            
+            buttons[f'{prefix}_{mode}'] = (rect, mode)
+        row_y += btn_h + 10
+    
+    # 内部画布不小于 1280×720, 低分辨率下渲染比例选项效果有限或无效
+    rs_hint = _render_outlined(font_xs, i18n.t("内部画布不低于 1280×720, 1920×1080 以下效果有限或无效; 自动调节下一局生效"), (100, 100, 120))
+    surface.blit(rs_hint, (WIDTH//2 - rs_hint.get_width()//2, row_y))
+    row_y += rs_hint.get_height() + 6
+    
     # 应用按钮
-    apply_y = fs_y + 80
+    apply_y = row_y + 5
     apply_w, apply_h = 180, 50
     apply_rect = pygame.Rect(WIDTH//2 - apply_w//2, apply_y, apply_w, apply_h)
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
     hover = apply_rect.collidepoint(mx, my)
     
     color = GOLD if hover else ORANGE
@@ -2378,7 +2514,7 @@ def draw_language_screen(surface):
     for i, code in enumerate(langs):
         y = start_y + i * 70
         rect = pygame.Rect(WIDTH//2 - btn_w//2, y, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         bc = CYAN if hover else (100, 120, 140)
         bs = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
@@ -2393,7 +2529,7 @@ def draw_language_screen(surface):
         buttons[('lang', code)] = rect
 
     back_rect = pygame.Rect(WIDTH//2 - 120, HEIGHT - 80, 240, 40)
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
     hover = back_rect.collidepoint(mx, my)
     bc = (200, 200, 200) if hover else (120, 120, 140)
     bs = pygame.Surface((back_rect.w, back_rect.h), pygame.SRCALPHA)
@@ -2419,7 +2555,7 @@ def draw_char_select(surface):
     start_x = WIDTH // 2 - total_w // 2
 
     cards = {}
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
 
     for i in range(n):
         info = characters.get_character_info(i)
@@ -2478,12 +2614,15 @@ def draw_char_select(surface):
     return cards
 
 
-def draw_upgrade_screen(surface):
-    """升级选择界面"""
+UPGRADE_DIM = 160
+
+def draw_upgrade_screen(surface, dim=True):
+    """升级选择界面 (dim=False: 背景已按 UPGRADE_DIM 暗化过)"""
     # 暗化背景
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    surface.blit(overlay, (0, 0))
+    if dim:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, UPGRADE_DIM))
+        surface.blit(overlay, (0, 0))
 
     title = _render_outlined(font_lg, i18n.t("等级提升! Lv.{level}", level=run.level), GOLD)
     surface.blit(title, (WIDTH//2 - title.get_width()//2, 80))
@@ -2495,7 +2634,7 @@ def draw_upgrade_screen(surface):
     total_w = n * card_w + (n-1) * spacing
     start_x = WIDTH // 2 - total_w // 2
 
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
 
     for i, opt in enumerate(run.upgrade_options):
         x = start_x + i * (card_w + spacing)
@@ -2542,11 +2681,14 @@ def draw_upgrade_screen(surface):
     return cards
 
 
-def draw_pause_screen(surface):
-    """暂停界面"""
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    surface.blit(overlay, (0, 0))
+PAUSE_DIM = 160
+
+def draw_pause_screen(surface, dim=True):
+    """暂停界面 (dim=False: 背景已按 PAUSE_DIM 暗化过)"""
+    if dim:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, PAUSE_DIM))
+        surface.blit(overlay, (0, 0))
 
     title = _render_outlined(font_lg, i18n.t("已暂停"), WHITE)
     surface.blit(title, (WIDTH//2 - title.get_width()//2, 200))
@@ -2571,7 +2713,7 @@ def draw_pause_screen(surface):
         btn_w, btn_h = 220, 44
         bx = WIDTH//2 - btn_w//2
         rect = pygame.Rect(bx, y, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         bs = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         bc = color if hover else tuple(max(0, c-60) for c in color)
@@ -2617,7 +2759,7 @@ def draw_gameover_screen(surface):
         btn_w, btn_h = 220, 44
         bx = WIDTH//2 - btn_w//2
         rect = pygame.Rect(bx, y, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         bs = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         bc = color if hover else tuple(max(0, c-60) for c in color)
@@ -2660,7 +2802,7 @@ def draw_victory_screen(surface):
         btn_w, btn_h = 220, 44
         bx = WIDTH//2 - btn_w//2
         rect = pygame.Rect(bx, y, btn_w, btn_h)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = render_scale.mouse_pos()
         hover = rect.collidepoint(mx, my)
         bs = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         bc = color if hover else tuple(max(0, c-60) for c in color)
@@ -2695,7 +2837,7 @@ def draw_soul_shop(surface):
 
     path_keys = ['survival', 'combat', 'exploration', 'fate']
     buttons = {}
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
 
     for row, (path_name, upgrades, color) in enumerate(paths):
         py_start = 130 + row * 140
@@ -2753,12 +2895,45 @@ def draw_soul_shop(surface):
     return buttons
 
 
+# ============================================================
+#  世界平移
+# ============================================================
+def shift_world(dx, dy):
+    """战场实体全部平移 (dx, dy): 玩家移动时的世界滚动, 以及内部画布尺寸变化后重新居中"""
+    for e in enemies:
+        e.x += dx; e.y += dy
+    for b in bosses:
+        b.x += dx; b.y += dy
+        b.boss_bullets.shift(dx, dy)
+    for g in exp_gems:
+        g.x += dx; g.y += dy
+    for eb in enemy_bullets:
+        eb['x'] += dx; eb['y'] += dy
+    # 武器投射物/效果也随世界滚动
+    for w in run.weapons:
+        for proj in w.projectiles:
+            proj['x'] += dx; proj['y'] += dy
+        if isinstance(w, LightningCircle):
+            for c in w._circles:
+                c['x'] += dx; c['y'] += dy
+        elif isinstance(w, EarthSpikes):
+            for s in w._spikes:
+                s['x'] += dx; s['y'] += dy
+    # 材料掉落也随世界滚动
+    for md in material_drops:
+        md.x += dx; md.y += dy
+    # 粒子也随世界滚动
+    for p in particles:
+        p.x += dx; p.y += dy
+
+
 # ============================================================
 #  游戏初始化/重置
 # ============================================================
 def init_run(char_index=0):
     """初始化一局游戏"""
     global run, enemies, bosses, exp_gems, particles, enemy_bullets
+    apply_render_scale()     # 上一局自动调节出的渲染比例在开局时生效
     run = RunData()
     run.apply_character(char_index)
     run.apply_permanent_bonuses()
@@ -2782,6 +2957,8 @@ def init_run(char_index=0):
     particles.clear()
     enemy_bullets.clear()
     combo.reset()
+    QUALITY.reset()          # 开局前的帧 (选角 / 加载) 不计入画质统计
+    RENDER_SCALE.reset()
 
     # Boss模块初始化
     boss_module.init(
@@ -2853,12 +3030,16 @@ def main():
     codex_tab = 'characters'
     selected_upgrade_char = 0
     equip_scroll = 0
+    # 装备仓库筛选 (None = 全部) 与排序
+    equip_rarity = None
+    equip_slot = None
+    equip_order = meta_systems.EQUIP_ORDERS[0]
     gacha_results = None
     settlement_rewards = None
     current_dungeon = None    # 当前副本信息
     bosses_killed_this_run = 0
 
-    # 初始化局外模块
+    # 初始化局外模块 (gacha_animation / town_map 为延迟模块, 此处只记下参数)
     meta_systems.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
     dialogue_system.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
     gacha_animation.init(screen, font_lg, font_md, font_sm, font_xs, WIDTH, HEIGHT)
@@ -2868,18 +3049,32 @@ def main():
     # modal confirmation helper
     confirm_dialog = None
 
-    # 城镇玩家
-    town_player = town_map.TownPlayer(800, 500, 0)
+    # 城镇玩家 (首次进入城镇时创建)
+    town_player = None
     # 抽卡动画控制器
     gacha_anim = None
+    # 静止状态的冻结画面 / 空闲降帧
+    frozen = freeze_frame.FreezeFrame()
+    settlement_bg = freeze_frame.FreezeFrame()
+    frame_cap = FPS
+    last_input = time.perf_counter()
+
+    # 启动完成: 写出耗时报告, 后台预取延迟模块
+    STARTUP_TRACE.on_phase = None
+    STARTUP_TRACE.report(STARTUP_REPORT_PATH)
+    gacha_animation.prefetch()
+    town_map.prefetch()
 
     running = True
     while running:
-        dt = min(clock.tick(60) / 1000.0, 0.033)
-        mouse_pos = pygame.mouse.get_pos()
+        dt = min(clock.tick(frame_cap) / 1000.0, 0.033)
+        mouse_pos = render_scale.mouse_pos()
 
         # ==== 事件 ====
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if events:
+            last_input = time.perf_counter()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
@@ -2917,7 +3112,7 @@ def main():
                         if gacha_anim:
                             gacha_anim.skip()
                 if event.key == pygame.K_e:
-                    if game_state == GameState.TOWN and town_player.nearby_location:
+                    if game_state == GameState.TOWN and town_player and town_player.nearby_location:
                         loc = town_player.nearby_location
                         action = loc.action
                         if action == 'dungeon':
@@ -3043,6 +3238,24 @@ def main():
                                     save_game(save_data)
                                     play_sfx('select')
                                     break
+                            elif key.startswith('q_'):
+                                rect, mode = value
+                                if rect.collidepoint(mouse_pos):
+                                    save_data['quality'] = mode
+                                    save_game(save_data)
+                                    QUALITY.set_mode(mode)
+                                    apply_quality()
+                                    play_sfx('select')
+                                    break
+                            elif key.startswith('rs_'):
+                                rect, mode = value
+                                if rect.collidepoint(mouse_pos):
+                                    save_data['render_scale'] = mode
+                                    save_game(save_data)
+                                    RENDER_SCALE.set_mode(mode)
+                                    apply_render_scale()
+                                    play_sfx('select')
+                                    break
 
                 # ---- 角色选择 ----
                 elif game_state == GameState.LOBBY:
@@ -3295,19 +3508,19 @@ def main():
                             elif isinstance(key, tuple) and key[0] == 'equip_up':
                                 if rect.collidepoint(mouse_pos):
                                     eq_idx = key[1]
-                                    meqs = save_data.get('meta_equipment', [])
-                                    if eq_idx < len(meqs):
-                                        meq = meqs[eq_idx]
-                                        tidx = meq.get('template_idx', 0)
+                                    wh = meta_systems.get_warehouse(save_data, EQUIPMENT_DB)
+                                    if eq_idx in wh:
+                                        tidx = wh.template(eq_idx)
                                         if tidx < len(EQUIPMENT_DB):
                                             tpl = EQUIPMENT_DB[tidx]
-                                            eq_lv = meq.get('level', 1)
+                                            eq_lv = wh.level(eq_idx)
                                             cost = meta_systems.get_meta_equip_level_cost(eq_lv, tpl[2])
                                             if save_data.get('gold', 0) >= cost and eq_lv < 150:
                                                 save_data['gold'] -= cost
-                                                meq['level'] = eq_lv + 1
-                                                if meq['level'] % 10 == 0:
-                                                    meq['ascend'] = meq.get('ascend', 0) + 1
+                                                asc = wh.ascend(eq_idx)
+                                                if (eq_lv + 1) % 10 == 0:
+                                                    asc += 1
+                                                wh.set_level(eq_idx, eq_lv + 1, asc)
                                                 save_game(save_data)
                                                 play_sfx('levelup')
                                     break
@@ -3319,10 +3532,21 @@ def main():
                                     break
                             elif isinstance(key, tuple) and key[0] == 'unequip' and is_char_unlocked:
                                 if rect.collidepoint(mouse_pos):
-                                    meta_systems.unequip_meta_item(save_data, selected_upgrade_char, key[1])
+                                    meta_systems.unequip_meta_item(save_data, selected_upgrade_char, key[1], EQUIPMENT_DB)
                                     save_game(save_data)
                                     play_sfx('select')
                                     break
+                            elif isinstance(key, tuple) and key[0] == 'equip_filter':
+                                if rect.collidepoint(mouse_pos):
+                                    if key[1] == 'rarity':
+                                        equip_rarity = meta_systems.next_option(meta_systems.EQUIP_FILTER_RARITIES, equip_rarity)
+                                    elif key[1] == 'slot':
+                                        equip_slot = meta_systems.next_option(meta_systems.EQUIP_FILTER_SLOTS, equip_slot)
+                                    else:
+                                        equip_order = meta_systems.next_option(meta_systems.EQUIP_ORDERS, equip_order)
+                                    equip_scroll = 0
+                                    play_sfx('select')
+                                    break
                             elif isinstance(key, tuple) and key[0] == 'batch_sell':
                                 if rect.collidepoint(mouse_pos):
                                     sell_key = key[1]
@@ -3364,17 +3588,12 @@ def main():
                                     break
                                 save_data['diamond'] -= cost
                             # 执行抽卡
-                            gacha_results = []
-                            for _ in range(count):
-                                result = meta_systems.do_gacha_pull(pool, save_data, EQUIPMENT_DB)
-                                if result:
-                                    gacha_results.append(result)
-                                    tidx, rarity = result
-                                    save_data['meta_equipment'].append({
-                                        'template_idx': tidx, 'level': 1, 'ascend': 0
-                                    })
-                                    if tidx not in save_data.get('codex_equips', []):
-                                        save_data['codex_equips'].append(tidx)
+                            gacha_results = meta_systems.do_gacha_batch(pool, count, save_data, EQUIPMENT_DB)
+                            wh = meta_systems.get_warehouse(save_data, EQUIPMENT_DB)
+                            for tidx, rarity in gacha_results:
+                                wh.add(tidx)
+                                if tidx not in save_data.get('codex_equips', []):
+                                    save_data['codex_equips'].append(tidx)
                             save_data['gacha_total_pulls'] = save_data.get('gacha_total_pulls', 0) + count
                             save_game(save_data)
                             # 触发抽卡动画
@@ -3393,7 +3612,7 @@ def main():
                 # ---- 城镇地图 ----
                 elif game_state == GameState.TOWN:
                     # 点击互动
-                    if town_player.nearby_location:
+                    if town_player and town_player.nearby_location:
                         loc = town_player.nearby_location
                         action = loc.action
                         if action == 'dungeon':
@@ -3469,29 +3688,42 @@ def main():
                                     break
 
         # ==== 状态处理 ====
+        # 静止状态: 冻结最后一帧战斗画面; 无动画且无输入时降帧
+        if game_state in FREEZE_STATES:
+            if not frozen.active:
+                frozen.capture(screen)
+        else:
+            frozen.clear()
+        if game_state != GameState.SETTLEMENT:
+            settlement_bg.clear()
+        if game_state not in RETAINED_STATES:
+            meta_systems.UI.invalidate()     # 其他界面画过屏幕, 回到局外界面时整屏重绘
+        idle = (game_state in IDLE_STATES
+                and time.perf_counter() - last_input > IDLE_AFTER)
+        frame_cap = IDLE_FPS if idle else FPS
 
         # ---- 主菜单 ----
         if game_state == GameState.START:
             start_buttons = draw_start_screen(screen)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 显示设置 ----
         if game_state == GameState.SETTINGS:
             settings_buttons = draw_settings_screen(screen)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 语言选择 ----
         if game_state == GameState.LANG_SELECT:
             lang_buttons = draw_language_screen(screen)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 大厅 (多人) ----
         if game_state == GameState.LOBBY:
             lobby_buttons = draw_lobby_screen(screen)
-            pygame.display.flip()
+            render_scale.present()
             # if the client just received a joined notification, transition once
             if NET_CLIENT and getattr(NET_CLIENT, 'latest_join', None) is not None:
                 # consume the join event and enter game
@@ -3505,10 +3737,12 @@ def main():
         # ---- 城镇地图 ----
         if game_state == GameState.TOWN:
             keys = pygame.key.get_pressed()
+            if town_player is None:
+                town_player = town_map.TownPlayer(800, 500, 0)
             town_player.update(dt, keys)
             t = pygame.time.get_ticks() / 1000.0
             town_map.draw_town(screen, town_player, save_data, t)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 抽卡动画 ----
@@ -3521,13 +3755,13 @@ def main():
                     gacha_anim = None
             else:
                 game_state = GameState.GACHA
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- NPC城镇 ----
         if game_state == GameState.NPC_SELECT:
             npc_buttons = dialogue_system.draw_npc_select(screen, save_data)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 对话 ----
@@ -3538,13 +3772,13 @@ def main():
             dialogue_buttons = dialogue_system.draw_dialogue_box(screen, save_data)
             if not dialogue_system.dialogue_state.active:
                 game_state = GameState.TOWN
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 角色选择 ----
         if game_state == GameState.CHAR_SELECT:
             char_cards = draw_char_select(screen)
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 灵魂商店 ----
@@ -3556,109 +3790,76 @@ def main():
             particles = [p for p in particles if p.life > 0]
             for p in particles:
                 p.draw(screen, [0, 0])
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 图鉴 ----
         if game_state == GameState.CODEX:
             codex_buttons = meta_systems.draw_codex_screen(screen, save_data, codex_tab)
-            pygame.display.flip()
+            render_scale.present(meta_systems.UI.dirty)
             continue
 
         # ---- 副本选择 ----
         if game_state == GameState.DUNGEON_SELECT:
             dungeon_buttons = meta_systems.draw_dungeon_select(screen, save_data)
-            pygame.display.flip()
+            render_scale.present(meta_systems.UI.dirty)
             continue
 
         # ---- 角色升级 ----
         if game_state == GameState.CHAR_UPGRADE:
-            char_upgrade_buttons = meta_systems.draw_char_upgrade_screen(screen, save_data, selected_upgrade_char, EQUIPMENT_DB, equip_scroll)
-            pygame.display.flip()
+            char_upgrade_buttons = meta_systems.draw_char_upgrade_screen(
+                screen, save_data, selected_upgrade_char, EQUIPMENT_DB, equip_scroll,
+                equip_rarity, equip_slot, equip_order)
+            render_scale.present(meta_systems.UI.dirty)
             continue
 
         # ---- 抽卡 ----
         if game_state == GameState.GACHA:
             gacha_buttons = meta_systems.draw_gacha_screen(screen, save_data, gacha_results)
-            pygame.display.flip()
+            render_scale.present(meta_systems.UI.dirty)
             continue
 
         # ---- 结算 ----
         if game_state == GameState.SETTLEMENT:
-            draw_background(screen, screen_shake.offset, run.bg_offset)
+            # 结算期间背景不动: 画一次后做成暗化快照
+            if not settlement_bg.active:
+                draw_background(screen, screen_shake.offset, run.bg_offset)
+                settlement_bg.capture(screen)
+            backdrop = settlement_bg.frame(dim=meta_systems.SETTLEMENT_DIM)
             if settlement_rewards:
-                settlement_buttons = meta_systems.draw_settlement_screen(screen, settlement_rewards, True)
+                settlement_buttons = meta_systems.draw_settlement_screen(screen, settlement_rewards, True, backdrop)
             else:
-                settlement_buttons = meta_systems.draw_settlement_screen(screen, {'gold': 0, 'diamond': 0, 'materials': {}, 'equipment': []}, False)
-            pygame.display.flip()
+                settlement_buttons = meta_systems.draw_settlement_screen(screen, {'gold': 0, 'diamond': 0, 'materials': {}, 'equipment': []}, False, backdrop)
+            render_scale.present(meta_systems.UI.dirty)
             continue
 
         # ---- 背包/装备 ----
         if game_state == GameState.INVENTORY:
-            draw_background(screen, screen_shake.offset, run.bg_offset)
-            for g in exp_gems:
-                g.draw(screen, screen_shake.offset)
-            for md in material_drops:
-                md.draw(screen, screen_shake.offset)
-            for e in enemies:
-                e.draw(screen, screen_shake.offset)
-            if run.character:
-                run.character.x = WIDTH // 2
-                run.character.y = HEIGHT // 2
-                run.character.draw(screen, screen_shake.offset)
-            draw_hud(screen)
-            inventory_buttons = draw_inventory(screen)
-            pygame.display.flip()
+            frozen.draw(screen, dim=INVENTORY_DIM)
+            inventory_buttons = draw_inventory(screen, dim=False)
+            render_scale.present()
             continue
 
         # ---- 暂停 ----
         if game_state == GameState.PAUSED:
-            draw_background(screen, screen_shake.offset, run.bg_offset)
-            # 静态实体绘制
-            for g in exp_gems:
-                g.draw(screen, screen_shake.offset)
-            for e in enemies:
-                e.draw(screen, screen_shake.offset)
-            for b in bosses:
-                b.draw(screen, screen_shake.offset)
-            if run.character:
-                run.character.x = WIDTH // 2
-                run.character.y = HEIGHT // 2
-                run.character.draw(screen, screen_shake.offset)
-            draw_hud(screen)
-            pause_buttons = draw_pause_screen(screen)
-            pygame.display.flip()
+            frozen.draw(screen, dim=PAUSE_DIM)
+            pause_buttons = draw_pause_screen(screen, dim=False)
+            render_scale.present()
             continue
 
         # ---- 升级选择 ----
         if game_state == GameState.UPGRADE:
-            draw_background(screen, screen_shake.offset, run.bg_offset)
-            for g in exp_gems:
-                g.draw(screen, screen_shake.offset)
-            for e in enemies:
-                e.draw(screen, screen_shake.offset)
-            if run.character:
-                run.character.x = WIDTH // 2
-                run.character.y = HEIGHT // 2
-                run.character.draw(screen, screen_shake.offset)
-            draw_hud(screen)
-            upgrade_cards = draw_upgrade_screen(screen)
-            pygame.display.flip()
+            frozen.draw(screen, dim=UPGRADE_DIM)
+            upgrade_cards = draw_upgrade_screen(screen, dim=False)
+            render_scale.present()
             continue
 
         # ---- Boss警告 ----
         if game_state == GameState.BOSS_WARNING:
             boss_warning_timer -= dt
-            draw_background(screen, screen_shake.offset, run.bg_offset)
-            for g in exp_gems:
-                g.draw(screen, screen_shake.offset)
-            for e in enemies:
-                e.draw(screen, screen_shake.offset)
-            if run.character:
-                run.character.x = WIDTH // 2
-                run.character.y = HEIGHT // 2
-                run.character.draw(screen, screen_shake.offset)
-            draw_hud(screen)
+            # 冻结画面随屏幕震动整体偏移, 露出的边缘用背景色补齐
+            screen.fill(DARK_BG)
+            frozen.draw(screen, offset=screen_shake.offset)
             # 警告文字
             warn_a = max(0, min(255, int(255 * abs(math.sin(boss_warning_timer * 4)))))
             wt = _render_outlined(font_lg, i18n.t("!! BOSS来了 !!"), RED)
@@ -3675,7 +3876,7 @@ def main():
                 run.boss_active = True
                 game_state = GameState.PLAYING
                 play_sfx('boss_roar')
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 游戏结束 ----
@@ -3694,7 +3895,7 @@ def main():
                     rt = _render_outlined(font_xs, t, c)
                     screen.blit(rt, (WIDTH//2 - rt.get_width()//2, ry))
                     ry += 22
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ---- 胜利 ----
@@ -3713,7 +3914,7 @@ def main():
                     rt = _render_outlined(font_xs, t, c)
                     screen.blit(rt, (WIDTH//2 - rt.get_width()//2, ry))
                     ry += 22
-            pygame.display.flip()
+            render_scale.present()
             continue
 
         # ============================================
@@ -3721,6 +3922,16 @@ def main():
         # ============================================
         run.game_time += dt
         screen_shake.update(dt)
+        # 画质 / 渲染比例自动调节: 两者都自动时先降画质档位, 已是最低档仍超预算再降渲染比例;
+        # 回升顺序相反。画质档位立即生效 (之后渲染比例重新统计); 渲染比例会改变视野,
+        # 战斗中只记下新档位 (每局最多一档), 下一局开局时才应用
+        work = clock.get_rawtime()
+        quality_floor = QUALITY.floor
+        if QUALITY.sample(work, dt, upgrade=not RENDER_SCALE.auto or RENDER_SCALE.level == 0):
+            apply_quality()
+            RENDER_SCALE.reset()
+        elif RENDER_SCALE.level == render_level:
+            RENDER_SCALE.sample(work, dt, degrade=quality_floor)
         sh = screen_shake.offset
 
         # ---- 玩家移动 (世界滚动) ----
@@ -3737,32 +3948,7 @@ def main():
         run.bg_offset[1] += my_move * dt
 
         # 移动所有实体 (世界滚动)
-        for e in enemies:
-            e.x += mx_move * dt; e.y += my_move * dt
-        for b in bosses:
-            b.x += mx_move * dt; b.y += my_move * dt
-            for bb in b.boss_bullets:
-                bb[0] += mx_move * dt; bb[1] += my_move * dt
-        for g in exp_gems:
-            g.x += mx_move * dt; g.y += my_move * dt
-        for eb in enemy_bullets:
-            eb['x'] += mx_move * dt; eb['y'] += my_move * dt
-        # 武器投射物/效果也随世界滚动
-        for w in run.weapons:
-            for proj in w.projectiles:
-                proj['x'] += mx_move * dt; proj['y'] += my_move * dt
-            if isinstance(w, LightningCircle):
-                for c in w._circles:
-                    c['x'] += mx_move * dt; c['y'] += my_move * dt
-            elif isinstance(w, EarthSpikes):
-                for s in w._spikes:
-                    s['x'] += mx_move * dt; s['y'] += my_move * dt
-        # 材料掉落也随世界滚动
-        for md in material_drops:
-            md.x += mx_move * dt; md.y += my_move * dt
-        # 粒子也随世界滚动
-        for p in particles:
-            p.x += mx_move * dt; p.y += my_move * dt
+        shift_world(mx_move * dt, my_move * dt)
 
         # ---- 无敌计时 (已移除) ----
 
@@ -3890,12 +4076,7 @@ def main():
             b.update(dt, run.game_time)
             if b.alive:
                 alive_bosses.append(b)
-                # Boss子弹伤害
-                for bb in b.boss_bullets:
-                    d = math.hypot(bb[0] - px, bb[1] - py)
-                    if d < 15:
-                        run.take_damage(b.damage * 0.3)
-                        bb[4] = 0  # 命中后消失
+                # Boss子弹伤害已在 b.update() 内结算 (弹幕池一趟完成推进与碰撞)
             else:
                 # Boss死亡
                 create_particles(b.x, b.y, 80, 'boss_death')
@@ -4125,13 +4306,23 @@ def main():
 
         # FPS
         fps = clock.get_fps()
-        ft = _render_outlined(font_xs, f"FPS:{fps:.0f} E:{len(enemies)}", (60, 60, 80))
+        q = i18n.t(QUALITY.tier.label)
+        if QUALITY.auto:
+            q = f"{i18n.t('自动')}/{q}"
+        rs = f"{WIDTH * 100 // window.get_width()}%"     # 实际比例 (受最小内部尺寸限制)
+        if RENDER_SCALE.auto:
+            rs = f"{i18n.t('自动')}/{rs}"
+            if RENDER_SCALE.level != render_level:
+                rs += f"→{RENDER_SCALE.tier.label}"    # 下一局生效
+        ft = _render_outlined(font_xs, f"FPS:{fps:.0f} E:{len(enemies)} {i18n.t('画质')}:{q} {i18n.t('渲染比例')}:{rs}",
+                              (60, 60, 80))
         screen.blit(ft, (WIDTH - ft.get_width() - 5, HEIGHT - 18))
 
-        pygame.display.flip()
+        render_scale.present()
 
     # 退出前保存
     save_game(save_data)
+    SAVE_STORE.close()
     # 停止网络客户端（如有）
     try:
         if NET_CLIENT:
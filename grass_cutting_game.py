@@ -8,8 +8,9 @@ import pygame
 import math
 import random
 import sys
-import os
 import i18n
+import font_manager
+import background
 
 # ============================================================
 #  初始化
@@ -25,61 +26,19 @@ clock = pygame.time.Clock()
 # ============================================================
 #  音效生成器 (不需要外部音频文件!)
 # ============================================================
-import array
+import synth
 
 def generate_sound(frequency=440, duration=0.1, volume=0.3, wave_type='square'):
     """动态生成音效"""
-    sample_rate = 22050
-    n_samples = int(sample_rate * duration)
-    buf = array.array('h', [0] * n_samples)
-    max_amp = int(32767 * volume)
-    for i in range(n_samples):
-        t = i / sample_rate
-        fade = 1.0 - (i / n_samples)  # 淡出
-        if wave_type == 'square':
-            val = max_amp if math.sin(2 * math.pi * frequency * t) > 0 else -max_amp
-        elif wave_type == 'sine':
-            val = int(max_amp * math.sin(2 * math.pi * frequency * t))
-        elif wave_type == 'noise':
-            val = random.randint(-max_amp, max_amp)
-        elif wave_type == 'sawtooth':
-            val = int(max_amp * (2 * (frequency * t % 1) - 1))
-        else:
-            val = int(max_amp * math.sin(2 * math.pi * frequency * t))
-        buf[i] = int(val * fade)
-    sound = pygame.mixer.Sound(buffer=buf)
-    return sound
+    return synth.tone(frequency, duration, volume, wave_type)
 
 def generate_explosion_sound():
     """爆炸音效"""
-    sample_rate = 22050
-    duration = 0.3
-    n_samples = int(sample_rate * duration)
-    buf = array.array('h', [0] * n_samples)
-    for i in range(n_samples):
-        t = i / sample_rate
-        fade = 1.0 - (i / n_samples)
-        freq = 150 * (1.0 - t * 2)
-        val = int(16000 * fade * (
-            math.sin(2 * math.pi * freq * t) * 0.5 +
-            random.uniform(-1, 1) * 0.5
-        ))
-        buf[i] = max(-32767, min(32767, val))
-    return pygame.mixer.Sound(buffer=buf)
+    return synth.explosion(0.3, 16000, 150)
 
 def generate_powerup_sound():
     """升级音效 - 上升音调"""
-    sample_rate = 22050
-    duration = 0.4
-    n_samples = int(sample_rate * duration)
-    buf = array.array('h', [0] * n_samples)
-    for i in range(n_samples):
-        t = i / sample_rate
-        fade = 1.0 - (t / duration) * 0.3
-        freq = 400 + t * 1200  # 音调上升
-        val = int(12000 * fade * math.sin(2 * math.pi * freq * t))
-        buf[i] = max(-32767, min(32767, val))
-    return pygame.mixer.Sound(buffer=buf)
+    return synth.sweep(400, 880, 0.4, 12000, 0.3)
 
 def generate_combo_sound(combo_level):
     """连击音效 - 越高连击音越高"""
@@ -88,29 +47,10 @@ def generate_combo_sound(combo_level):
 
 def generate_boss_roar():
     """Boss出现咆哮"""
-    sample_rate = 22050
-    duration = 0.6
-    n_samples = int(sample_rate * duration)
-    buf = array.array('h', [0] * n_samples)
-    for i in range(n_samples):
-        t = i / sample_rate
-        fade = 1.0 - (i / n_samples) * 0.5
-        freq = 80 + math.sin(t * 20) * 30
-        val = int(20000 * fade * (
-            math.sin(2 * math.pi * freq * t) * 0.6 +
-            math.sin(2 * math.pi * freq * 2 * t) * 0.3 +
-            random.uniform(-1, 1) * 0.1
-        ))
-        buf[i] = max(-32767, min(32767, val))
-    return pygame.mixer.Sound(buffer=buf)
+    return synth.roar(0.6, 20000, 80, 30, 20)
 
 def generate_bgm_loop():
     """生成简单的背景音乐循环"""
-    sample_rate = 22050
-    duration = 4.0
-    n_samples = int(sample_rate * duration)
-    buf = array.array('h', [0] * n_samples)
-
     # 简单的旋律音符序列 (频率, 开始时间, 持续时间)
     melody_notes = [
         (262, 0.0, 0.4), (330, 0.5, 0.4), (392, 1.0, 0.4), (330, 1.5, 0.4),
@@ -121,29 +61,9 @@ def generate_bgm_loop():
         (131, 0.0, 0.9), (165, 1.0, 0.9),
         (147, 2.0, 0.9), (175, 3.0, 0.9),
     ]
-
-    for i in range(n_samples):
-        t = i / sample_rate
-        val = 0.0
-        # 旋律
-        for freq, start, dur in melody_notes:
-            if start <= t < start + dur:
-                local_t = t - start
-                env = math.sin(math.pi * local_t / dur)  # 包络
-                val += 4000 * env * math.sin(2 * math.pi * freq * t)
-        # 低音
-        for freq, start, dur in bass_notes:
-            if start <= t < start + dur:
-                local_t = t - start
-                env = math.sin(math.pi * local_t / dur) * 0.5
-                val += 3000 * env * math.sin(2 * math.pi * freq * t)
-        # 节拍鼓点
-        beat_pos = t % 0.5
-        if beat_pos < 0.05:
-            val += 5000 * (1 - beat_pos / 0.05) * random.uniform(-1, 1) * 0.3
-
-        buf[i] = max(-32767, min(32767, int(val)))
-    return pygame.mixer.Sound(buffer=buf)
+    # 节拍鼓点: 每 0.5 秒一次, 持续 0.05 秒
+    return synth.sequence([(4000, 1.0, melody_notes), (3000, 0.5, bass_notes)],
+                          4.0, beat=(0.5, 0.05, 1500))
 
 # 预生成音效
 try:
@@ -203,58 +123,10 @@ GRID_COLOR = (0, 51, 102)
 
 # 尝试加载支持多语言的字体
 def get_font(size, lang=None):
-    """加载支持多语言的字体，根据语言选择最佳系统字体"""
+    """加载支持多语言的字体，根据语言选择最佳系统字体 (路径索引与 Font 对象由 font_manager 缓存)"""
     if lang is None:
         lang = i18n.get_language()
-
-    # 按语言优先选择Windows自带系统字体，无需打包额外字体
-    _FONT_PRIORITY = {
-        'ko': [
-            ('Malgun Gothic',        'C:/Windows/Fonts/malgun.ttf'),
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'ja': [
-            ('Yu Gothic',            'C:/Windows/Fonts/YuGothM.ttc'),
-            ('MS Gothic',            'C:/Windows/Fonts/msgothic.ttc'),
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'zh': [
-            ('Microsoft YaHei',      'C:/Windows/Fonts/msyh.ttc'),
-            ('SimHei',               'C:/Windows/Fonts/simhei.ttf'),
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-        ],
-        'ru': [
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-            ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
-        ],
-        'en': [
-            ('Arial',                'C:/Windows/Fonts/arial.ttf'),
-            ('Segoe UI',             'C:/Windows/Fonts/segoeui.ttf'),
-        ],
-    }
-
-    candidates = _FONT_PRIORITY.get(lang, _FONT_PRIORITY['en'])
-
-    # 1) 先尝试 SysFont（按语言顺序）
-    sys_names = ','.join(name for name, _ in candidates)
-    try:
-        f = pygame.font.SysFont(sys_names, size)
-        if f:
-            return f
-    except:
-        pass
-
-    # 2) 直接按路径加载
-    for _, path in candidates:
-        if os.path.exists(path):
-            try:
-                return pygame.font.Font(path, size)
-            except:
-                continue
-
-    return pygame.font.Font(None, size)
+    return font_manager.get_font(size, lang)
 
 font_lg = get_font(60)
 font_md = get_font(32)
@@ -1279,15 +1151,15 @@ def show_upgrade_screen():
 # ============================================================
 #  绘制各种界面
 # ============================================================
+BG_TILE = None   # 预渲染的网格贴图 (本模式分辨率固定, 首次绘制时生成)
+
 def draw_background(surface, shake):
-    surface.fill(DARK_BG)
+    global BG_TILE
     grid_size = 60
-    ox = int(background_offset[0] % grid_size + shake[0])
-    oy = int(background_offset[1] % grid_size + shake[1])
-    for x in range(ox, WIDTH + grid_size, grid_size):
-        pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, HEIGHT), 1)
-    for y in range(oy, HEIGHT + grid_size, grid_size):
-        pygame.draw.line(surface, GRID_COLOR, (0, y), (WIDTH, y), 1)
+    if BG_TILE is None:
+        BG_TILE = background.GridTile(WIDTH, HEIGHT, grid_size, DARK_BG, GRID_COLOR)
+    BG_TILE.draw(surface, int(background_offset[0] % grid_size + shake[0]),
+                 int(background_offset[1] % grid_size + shake[1]))
 
 def draw_poison_field(surface, shake):
     if 'poison' not in player.weapons:
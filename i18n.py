@@ -1,7 +1,17 @@
 """
 Simple i18n helper.
+
+Translation catalogs live in locales/<lang>.json (keys are the Chinese source
+strings, Chinese output falls back to the key). A catalog is read the first
+time its language is used; each template is compiled once into a %-mapping
+formatter, and argument-free lookups are memoised until set_language().
 """
 
+import os
+import sys
+import json
+import string
+
 DEFAULT_LANG = "en"
 LANGS = ["en", "zh", "ja", "ko", "ru"]
 SUPPORTED_LANGS = ["en", "zh", "ja", "ko", "ru"]
@@ -13,7 +23,16 @@ LANG_NATIVE = {
     "ru": "Русский",
 }
 
+if getattr(sys, 'frozen', False):
+    LOCALE_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(sys.executable)), 'locales')
+else:
+    LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+
 _current_lang = DEFAULT_LANG
+_catalogs = {}          # lang → {key: text}, loaded on first use
+_compiled = {}          # (lang, key) → formatter(kwargs) -> str
+_plain = {}             # key → text for the current language (no kwargs)
+_formatter = string.Formatter()
 
 
 def set_language(lang):
@@ -22,6 +41,7 @@ def set_language(lang):
         _current_lang = lang
     else:
         _current_lang = DEFAULT_LANG
+    _plain.clear()
 
 
 def get_language():
@@ -32,2192 +52,48 @@ def available_languages():
     return list(SUPPORTED_LANGS)
 
 
-# NOTE: Keys are Chinese source strings. Chinese output falls back to key.
-TRANSLATIONS = {
-    "en": {
-        # Game title / menu
-        "暗夜割草者：深渊轮回": "Night Reaper: Abyssal Cycle",
-        "暗夜割草者": "Night Reaper",
-        "深 渊 轮 回": "ABYSSAL CYCLE",
-        "开始游戏": "Start Game",
-        "退出游戏": "Quit",
-        "语言": "Language",
-        "选择语言": "Select Language",
-        "设置": "Settings",
-        "显示设置": "Display Settings",
-        "分辨率": "Resolution",
-        "显示模式": "Display Mode",
-        "窗口模式": "Windowed",
-        "全屏模式": "Fullscreen",
-        "应用": "Apply",
-        "返回": "Back",
-        "ESC 返回主菜单": "ESC Back to Menu",
-        "ESC 返回": "ESC Back",
-        "点击角色开始游戏": "Click a character to start",
-        "选择角色": "Select Character",
-        "未解锁": "Locked",
-        "等级提升! Lv.{level}": "Level Up! Lv.{level}",
-        "新武器": "New Weapon",
-        "武器强化": "Weapon Upgrade",
-        "被动物品": "Passive",
-        "属性提升": "Stat Boost",
-        "已暂停": "Paused",
-        "继续游戏": "Resume",
-        "重新开始": "Restart",
-        "返回主菜单": "Back to Menu",
-        "深渊吞噬了你...": "The Abyss consumed you...",
-        "再来一局": "Play Again",
-        "你击败了深渊之主!": "You defeated the Abyss Lord!",
-        "灵魂商店": "Soul Shop",
-        "灵魂碎片": "Soul Shards",
-        "生存之路": "Path of Survival",
-        "战斗之路": "Path of Battle",
-        "探索之路": "Path of Exploration",
-        "命运之路": "Path of Fate",
-        "已解锁": "Unlocked",
-        "花费 {cost}": "Cost {cost}",
-        "需要 {cost}": "Need {cost}",
-        "装备 & 材料": "Equipment & Materials",
-        "装备": "Equip",
-        "材料": "Materials",
-        "背包 ({count}/8)": "Bag ({count}/8)",
-        "强化 {cost}": "Enhance {cost}",
-        "-- 空 --": "-- Empty --",
-        "等级 {level}/{max_level}": "Level {level}/{max_level}",
-        "升级需: {cost}": "Upgrade needs: {cost}",
-        "按 TAB 或 I 关闭": "Press TAB or I to close",
-        "[TAB] 装备/材料": "[TAB] Equipment/Materials",
-        "击杀:{kills}  {time}": "Kills:{kills}  {time}",
-        "存活时间: {time}": "Time Survived: {time}",
-        "击杀数: {kills}": "Kills: {kills}",
-        "最终等级: Lv.{level}": "Final Level: Lv.{level}",
-        "最高连击: {combo}": "Best Combo: {combo}",
-        "获得灵魂碎片: +{souls}": "Soul Shards +{souls}",
-        "通关时间: {time}": "Clear Time: {time}",
-        "金币: +{gold}": "Gold: +{gold}",
-        "钻石: +{diamond}": "Diamonds: +{diamond}",
-        "总局数: {runs}  最佳击杀: {best}": "Total Runs: {runs}  Best Kills: {best}",
-        "!! BOSS来了 !!": "!! BOSS Incoming !!",
-        "保存失败: {err}": "Save failed: {err}",
-        "材料不足: ": "Insufficient materials: ",
-        "装备: {name} [{rarity}]": "Equipped: {name} [{rarity}]",
-        "获得: {name} [{rarity}]": "Obtained: {name} [{rarity}]",
-
-        # Common labels
-        "确认": "Confirm",
-        "进入": "Enter",
-        "返回主菜单": "Back to Menu",
-        "已满级!": "Max Level!",
-        "升级": "Upgrade",
-        "进阶": "Ascend",
-        "已装备": "Equipped",
-        "穿戴": "Wear",
-        "卸下": "Unequip",
-        "快速出售:": "Quick Sell:",
-        "无可售": "Nothing to sell",
-        "保留传说": "Keep Legendary",
-        "保留史诗+": "Keep Epic+",
-        "保留稀有+": "Keep Rare+",
-        "装备仓库 (点击装备到当前角色)": "Armory (click to equip)",
-        "角色升级": "Character Upgrade",
-        "图 鉴": "Codex",
-        "角色": "Characters",
-        "武器": "Weapons",
-        "敌人": "Enemies",
-        "装备": "Equipment",
-        "Boss": "Boss",
-        "??? 未发现": "??? Undiscovered",
-        "??? 未遭遇": "??? Unseen",
-        "??? 未击败": "??? Unbeaten",
-        "收集进度: {done}/{total} ({pct}%)": "Collection: {done}/{total} ({pct}%)",
-        "副 本 选 择": "Dungeon Select",
-        "金币: {gold}  钻石: {diamond}": "Gold: {gold}  Diamonds: {diamond}",
-        "难度: {stars}": "Difficulty: {stars}",
-        "时限: {minutes}分钟": "Time Limit: {minutes} min",
-        "时限: 无限": "Time Limit: Unlimited",
-        "通关: {count}次": "Clears: {count}",
-        "奖励: ": "Rewards: ",
-        "🔒 未解锁": "🔒 Locked",
-        "需要累计击杀 {need}": "Need total kills {need}",
-        "🔒 角色未解锁": "🔒 Character Locked",
-        "未知": "Unknown",
-        "解锁条件: {cond}": "Unlock: {cond}",
-        "当前进度: {best}/{need}": "Progress: {best}/{need}",
-        "已装备:": "Equipped:",
-        "需要进阶(阶{tier}) 金:{gold} 钻:{diamond}": "Ascend required (Tier {tier}) G:{gold} D:{diamond}",
-        "升级: {gold}金币": "Upgrade: {gold} Gold",
-        "◀上页": "◀ Prev",
-        "下页▶": "Next ▶",
-        "装备召唤": "Equipment Summon",
-        "常规召唤": "Normal Summon",
-        "消耗金币": "Cost Gold",
-        "单抽: {c1}  十连: {c10}": "Single: {c1}  Ten: {c10}",
-        "普通50% 优秀30% 稀有15% 史诗4% 传说1%": "Common 50% Uncommon 30% Rare 15% Epic 4% Legendary 1%",
-        "保底: {pity}抽必得史诗": "Pity: {pity} pulls guaranteed Epic",
-        "超级召唤": "Super Summon",
-        "消耗钻石 (仅Boss掉钻石)": "Cost Diamonds (Boss drops only)",
-        "普通10% 优秀25% 稀有35% 史诗22% 传说8%": "Common 10% Uncommon 25% Rare 35% Epic 22% Legendary 8%",
-        "保底: {pity}抽必得传说": "Pity: {pity} pulls guaranteed Legendary",
-        "已抽: {now}/{max}": "Pity: {now}/{max}",
-        "单抽": "Single",
-        "十连抽!": "Ten Pull!",
-        "— 召唤结果 —": "— Results —",
-
-        # Town
-        "深渊城镇": "Abyss Town",
-        "与NPC交谈获取情报和建议": "Talk to NPCs for info and tips",
-        "点击交谈": "Click to Talk",
-        "按 E 或 点击 互动": "Press E or Click to interact",
-        "WASD 移动  |  E 互动  |  ESC 菜单": "WASD Move | E Interact | ESC Menu",
-        "金: {gold}  钻: {diamond}  魂: {soul}": "G: {gold}  D: {diamond}  S: {soul}",
-
-        # Boss test
-        "Boss 测试场": "Boss Test Arena",
-        "已暂停 (P键继续)": "Paused (P to resume)",
-        "--- Boss 测试场 ---": "--- Boss Test Arena ---",
-        "WASD / 方向键 : 移动": "WASD / Arrows: Move",
-        "鼠标点击 : 散弹射击": "Mouse Click: Spread Shot",
-        "1-4 : 切换Boss类型": "1-4: Switch Boss",
-        "N : 下一级Boss": "N: Next Boss",
-        "R : 重置当前Boss": "R: Reset Boss",
-        "H : 恢复满血": "H: Heal Full",
-        "P : 暂停": "P: Pause",
-        "ESC : 退出": "ESC: Exit",
-        "类型: {title} {name} (阶段 {phase})": "Type: {title} {name} (Phase {phase})",
-        "等级: Lv.{level}  阶段: {phase}": "Level: Lv.{level}  Phase: {phase}",
-        "血量: {hp}/{max_hp}": "HP: {hp}/{max_hp}",
-        "玩家血量: {hp}/{max_hp}": "Player HP: {hp}/{max_hp}",
-        "▲ 狂暴化 ▲": "▲ Enraged ▲",
-        "▲▲ 濒死暴走 ▲▲": "▲▲ Desperation ▲▲",
-
-        # Codex specifics
-        "特殊: {spec}": "Special: {spec}",
-        "基础HP: {hp}": "Base HP: {hp}",
-        "部位: {slot}": "Slot: {slot}",
-
-        # Stat boosts / UI
-        "基础属性提升": "Base stat increase",
-        "生命 +20": "HP +20",
-        "移速 +8%": "Speed +8%",
-        "护甲 +3": "Armor +3",
-        "暴击 +3%": "Crit +3%",
-        "回血 +0.3/s": "Regen +0.3/s",
-        "拾取 +20": "Pickup +20",
-        "伤害 +8%": "Damage +8%",
-        "冷却 -5%": "Cooldown -5%",
-
-        # Labels / materials
-        "金币": "Gold",
-        "钻石": "Diamonds",
-        "铁矿": "Iron",
-        "暗影": "Shadow",
-        "水晶": "Crystal",
-        "龙鳞": "Dragon",
-        "深渊": "Abyss",
-        "铁矿石": "Iron Ore",
-        "暗影精华": "Shadow Essence",
-        "魔力水晶": "Mana Crystal",
-        "龙鳞碎片": "Dragon Scale",
-        "深渊之心": "Abyss Heart",
-
-        # Equipment slots / rarities
-        "武器": "Weapon",
-        "护甲": "Armor",
-        "饰品": "Accessory",
-        "符文": "Rune",
-        "普通": "Common",
-        "优秀": "Uncommon",
-        "稀有": "Rare",
-        "史诗": "Epic",
-        "传说": "Legendary",
-
-        # Character titles / names
-        "阿什": "Ash",
-        "暗夜猎人": "Night Hunter",
-        "莉拉": "Lyra",
-        "风行者": "Windrunner",
-        "加隆": "Garon",
-        "铁壁守卫": "Iron Guard",
-        "菲奥": "Fio",
-        "炽炎法师": "Flame Mage",
-        "虚无": "Void",
-        "虚空行者": "Void Walker",
-        "死神": "Reaper",
-        "收割者": "Harvester",
-
-        # Character codex descriptions
-        "平衡型角色，起始武器:魔法飞弹": "Balanced. Starter: Magic Missile",
-        "高机动角色，起始武器:回旋镖": "High mobility. Starter: Boomerang",
-        "坦克角色，起始武器:骨盾环绕": "Tank. Starter: Bone Shield",
-        "高伤角色，起始武器:火球术": "High damage. Starter: Fireball",
-        "暗杀角色，起始武器:寒冰新星": "Assassin. Starter: Ice Nova",
-        "收割角色，起始武器:圣光鞭": "Reaper. Starter: Holy Whip",
-
-        # Weapons
-        "魔法飞弹": "Magic Missile",
-        "自动追踪最近敌人的魔法弹": "Auto-tracks the nearest enemy",
-        "圣光鞭": "Holy Whip",
-        "近身范围扇形攻击 + 击退": "Short-range cone attack + knockback",
-        "寒冰新星": "Ice Nova",
-        "以自身为中心释放寒冰冲击波": "Ice shockwave centered on you",
-        "烈焰之球": "Flame Orb",
-        "向随机方向发射穿透火球": "Piercing fireball in random direction",
-        "雷电法阵": "Lightning Sigil",
-        "在随机位置生成持续电击区域": "Creates a lingering lightning zone",
-        "白骨之盾": "Bone Shield",
-        "环绕角色旋转的骨盾": "Orbiting bone shields",
-        "回旋镖": "Boomerang",
-        "飞出再返回，穿透所有敌人": "Returns and pierces enemies",
-        "地刺术": "Earth Spikes",
-        "在敌人密集处召唤地刺": "Summon spikes under clusters",
-
-        # Weapon codex
-        "自动追踪敌人的魔法弹幕，穿透力强": "Auto-tracking missiles with high pierce",
-        "以神圣之力鞭笞前方扇形区域的敌人": "Holy lash in a forward cone",
-        "向四面八方释放冰弹，减速命中敌人": "Ice bolts in all directions, slow on hit",
-        "发射强力火球，爆炸造成范围伤害": "Powerful fireball that explodes",
-        "在周围生成雷电光圈持续电击敌人": "Lightning ring that continuously shocks",
-        "召唤骨盾环绕自身，触碰即伤": "Summon bone shields; contact damage",
-        "投掷回旋镖，去而复返双重伤害": "Boomerang out-and-back damage",
-        "在敌人脚下召唤地刺进行刺穿": "Summon spikes under enemies",
-
-        # Enemies
-        "骷髅杂兵": "Skeleton Grunt",
-        "蝙蝠群": "Bat Swarm",
-        "泥沼史莱姆": "Swamp Slime",
-        "幽灵": "Ghost",
-        "自爆蜘蛛": "Suicide Spider",
-        "骷髅弓箭手": "Skeleton Archer",
-        "暗影法师": "Shadow Mage",
-        "精英骑士": "Elite Knight",
-        "最基础的亡灵士兵，数量多但很脆弱": "Basic undead, many but fragile",
-        "高速飞行的蝙蝠群，灵活但血薄": "Fast bats, agile but weak",
-        "黏糊糊的史莱姆，死后会分裂": "Sticky slime that splits on death",
-        "飘忽不定的亡灵，伤害中等": "Elusive undead, moderate damage",
-        "靠近后自爆的危险蜘蛛": "Explodes when close",
-        "远程射击的骷髅，保持距离作战": "Ranged skeleton, keeps distance",
-        "暗影魔法攻击，高伤害远程敌人": "High damage ranged mage",
-        "全副武装的精英骑士，会冲锋": "Heavily armed, can charge",
-        "分裂": "Split",
-        "自爆": "Explode",
-        "远程": "Ranged",
-        "冲锋": "Charge",
-
-        # Bosses
-        "骷髅王": "Skeleton King",
-        "亡灵领主": "Undead Lord",
-        "召唤亡灵大军的骷髅领主，擅长范围攻击": "Summons undead hordes, excels at AoE",
-        "毒液巨兽": "Venom Behemoth",
-        "深渊之王": "Abyss King",
-        "喷射剧毒的深渊巨兽，毒雾弥漫战场": "Spews toxins, poisonous battlefield",
-        "烈焰魔将": "Flame Warlord",
-        "战场霸主": "Battle Tyrant",
-        "浑身烈焰的魔族将领，火海吞噬一切": "Infernal commander, seas of fire",
-        "虚空之眼": "Eye of the Void",
-        "次元裂隙": "Dimensional Rift",
-        "来自虚空的恐怖存在，扭曲时空法则": "Void horror that warps reality",
-
-        # Dungeons
-        "深渊之门": "Abyss Gate",
-        "通往深渊的第一道裂隙，适合初入深渊者": "First rift, good for beginners",
-        "暗影裂隙": "Shadow Rift",
-        "暗影精华弥漫的异空间，敌人更加强大": "Shadow essence realm, stronger foes",
-        "炎魔领域": "Flame Domain",
-        "烈焰魔将统治的火焰地域，高温炙烤": "Fire realm ruled by warlord",
-        "虚空核心": "Void Core",
-        "虚空之眼栖息的维度核心，终极考验": "Dimensional core, ultimate trial",
-        "无尽深渊": "Endless Abyss",
-        "没有时间限制的无尽模式，坚持越久奖励越丰": "No time limit; longer = richer",
-
-        # Passives
-        "弹射宝石": "Ricochet Gem",
-        "所有投射物 +1 弹射": "All projectiles +1 bounce",
-        "冰封之心": "Frozen Heart",
-        "接触敌人时自动减速": "Touching enemies slows them",
-        "燃烧之魂": "Burning Soul",
-        "10%击杀几率留下火焰地面": "10% kills leave burning ground",
-        "疾风护符": "Swift Charm",
-        "移速+15%  闪避+5%": "Speed +15%  Dodge +5%",
-        "大地之心": "Heart of Earth",
-        "护甲+5  击退+30%": "Armor +5  Knockback +30%",
-        "血色宝石": "Crimson Gem",
-        "暴击+8%  暴击伤害+30%": "Crit +8%  Crit Dmg +30%",
-        "吞噬之牙": "Devourer Fang",
-        "5%生命偷取": "5% Lifesteal",
-        "幸运骰子": "Lucky Dice",
-        "升级选项+1 (3→4)": "+1 upgrade option (3→4)",
-        "幽冥灯笼": "Nether Lantern",
-        "拾取范围+40%  经验+10%": "Pickup +40%  EXP +10%",
-        "战争号角": "War Horn",
-        "伤害+12%  受伤+8%": "Damage +12%  Damage Taken +8%",
-        "生命树苗": "Life Sapling",
-        "每秒回血+1  每10击杀+5血": "Regen +1/s  +5 HP per 10 kills",
-        "时空碎片": "Time Shard",
-        "全局冷却-10%": "Global cooldown -10%",
-
-        # Equipment names
-        "铁短剑": "Iron Shortsword",
-        "暗影匕首": "Shadow Dagger",
-        "碧焰长剑": "Azureflame Longsword",
-        "深渊大剑": "Abyss Greatsword",
-        "毁灭之刃": "Blade of Ruin",
-        "皮甲": "Leather Armor",
-        "锁子甲": "Chainmail",
-        "暗影铠甲": "Shadow Plate",
-        "龙鳞战甲": "Dragon Scale Armor",
-        "深渊圣甲": "Abyss Saint Armor",
-        "旅人之靴": "Traveler Boots",
-        "疾风之翼": "Swift Wings",
-        "闪光护符": "Gleam Talisman",
-        "传送之戒": "Teleport Ring",
-        "时间之冠": "Crown of Time",
-        "初级符文": "Novice Rune",
-        "聚能符文": "Channeling Rune",
-        "掠夺符文": "Plunder Rune",
-        "深渊符文": "Abyss Rune",
-        "创世符文": "Genesis Rune",
-
-        # Character screen / bonuses
-        "生命": "HP",
-        "伤害%": "Damage%",
-        "护甲": "Armor",
-        "暴击%": "Crit%",
-        "速度%": "Speed%",
-        "伤害": "Damage",
-        "暴击": "Crit",
-        "暴伤": "Crit Dmg",
-        "回复": "Regen",
-        "速度": "Speed",
-        "闪避": "Dodge",
-        "拾取": "Pickup",
-        "冷却": "Cooldown",
-        "经验": "EXP",
-        "吸血": "Lifesteal",
-
-        # Town locations / NPCs
-        "副本传送门": "Dungeon Gate",
-        "进入副本挑战": "Enter a dungeon",
-        "召唤祭坛": "Summon Altar",
-        "消耗资源召唤装备": "Spend resources to summon gear",
-        "锻造工坊": "Forge",
-        "升级角色和装备": "Upgrade characters and gear",
-        "灵魂商店": "Soul Shop",
-        "消耗灵魂碎片购物": "Spend soul shards",
-        "深渊图鉴": "Abyss Codex",
-        "查阅角色和装备图鉴": "Browse codex",
-        "冒险出发": "Begin Adventure",
-        "选择角色开始冒险": "Choose a character",
-        "商人·马库斯": "Merchant Marcus",
-        "物资交易商人": "Supplies Trader",
-        "长老·瑟拉斯": "Elder Serath",
-        "深渊知识长老": "Abyss Scholar",
-        "铁匠·布鲁诺": "Blacksmith Bruno",
-        "武器锻造大师": "Master Smith",
-        "女巫·伊薇": "Witch Ivy",
-        "神秘魔法师": "Mysterious Mage",
-
-        # Dialogue UI
-        "▼ 点击继续": "▼ Click to continue",
-        "请选择:": "Choose:",
-        "返回": "Back",
-
-        # Misc
-        "角色预览 - Characters Preview": "Character Preview",
-        "角色选择预览 (←→ 切换)": "Character Preview (←→)",
-        "点击任意处跳过": "Click anywhere to skip",
-        "剑士": "Swordsman",
-        "法师": "Mage",
-        "弓手": "Archer",
-        "刺客": "Assassin",
-        "骑士": "Knight",
-        "召唤师": "Summoner",
-        "冒险者": "Adventurer",
-
-        # Character titles / descriptions (character module)
-        "守墓人": "Gravekeeper",
-        "暗影刺客": "Shadow Assassin",
-        "铁壁骑士": "Iron Knight",
-        "炼金术士": "Alchemist",
-        "裂隙行者": "Rift Walker",
-        "均衡型角色 · 被动: 击杀敌人5%概率回复少量生命": "Balanced role · Passive: 5% chance to heal a little on kill",
-        "高速型角色 · 被动: 闪避成功后0.5秒内移速+80%": "High speed role · Passive: +80% move speed for 0.5s after dodge",
-        "防御型角色 · 被动: 血量低于30%时护甲翻倍": "Defender role · Passive: Armor doubles below 30% HP",
-        "伤害型角色 · 被动: 武器进化所需等级-2，暴击伤害+30%": "Damage role · Passive: Weapon evolution level -2, crit damage +30%",
-        "特殊角色 · 被动: 每30秒闪现到安全位置，属性随机波动": "Special role · Passive: Blink to safety every 30s, stats fluctuate",
-        "隐藏角色 · 被动: 击杀后1秒内攻击+100%，但生命极低": "Hidden role · Passive: +100% damage for 1s after kill, very low HP",
-
-        # NPC names / titles
-        "旅行商人·马库斯": "Traveling Merchant·Marcus",
-        "深渊行商": "Abyss Trader",
-        "暗夜长老·瑟拉斯": "Night Elder·Serath",
-        "先知": "Seer",
-        "锻造大师": "Master Smith",
-        "神秘女巫·伊薇": "Mystic Witch·Ivy",
-        "命运编织者": "Fate Weaver",
-
-        # Dialogue lines / choices
-        "哦? 新面孔! 欢迎来到深渊的边缘, 旅行者。": "Oh? A new face! Welcome to the edge of the Abyss, traveler.",
-        "我是马库斯, 在这片黑暗中做些小生意。": "I'm Marcus, doing a bit of trade in the dark.",
-        "别被外面的怪物吓到了, 只要你有金币, 我什么都卖。": "Don't fear the monsters outside. As long as you have gold, I sell everything.",
-        "你都卖些什么?": "What do you sell?",
-        "武器、护甲、稀有符文...只要你出得起价。": "Weapons, armor, rare runes... as long as you can pay.",
-        "去\"装备召唤\"看看吧，碰碰运气说不定有好东西！": "Check \"Equipment Summon\". You might get lucky!",
-        "这里安全吗?": "Is it safe here?",
-        "嘿嘿，只要你不欠我钱，这里就是最安全的。": "Heh. As long as you don't owe me, it's the safest place.",
-        "不过说真的，深渊的裂隙越来越不稳定了...": "But seriously, the Abyss rifts are getting more unstable...",
-        "告辞": "Goodbye",
-        "又来了? 上次教你的保命技巧用上了吗?": "Back again? Did you use the survival tips I taught you?",
-        "看你这副样子...大概没用上吧。": "Judging by your look... probably not.",
-        "教我更多技巧": "Teach me more tips",
-        "要诀只有一个: 不要停下脚步!": "One rule: never stop moving!",
-        "在深渊中站着不动就是等死。持续移动，让武器自动清场。": "Standing still in the Abyss is death. Keep moving and let your weapons clear the field.",
-        "经验宝石要尽量捡, 等级越高武器越强。": "Pick up EXP gems whenever you can. Higher level, stronger weapons.",
-        "你有什么好货?": "Any good wares?",
-        "好东西可不便宜哦～": "Good stuff isn't cheap.",
-        "去抽卡池碰碰运气, 或者攒到好装备来找铁匠升级。": "Try the summon pool, or bring good gear to the blacksmith.",
-        "下次再说": "Maybe later",
-        "欢迎回来, 老朋友!": "Welcome back, old friend!",
-        "生意如何? 最近深渊里的怪物越来越多了。": "How's business? More monsters in the Abyss lately.",
-        "最近有什么新情报?": "Any new intel?",
-        "你听说了吗? 深渊的最深处好像出现了一道新的裂隙。": "Hear this? A new rift appeared in the deepest Abyss.",
-        "据说穿过那里可以到达更危险的领域...": "They say it leads to even more dangerous realms...",
-        "不过回报也会更丰厚。试试副本挑战吧。": "But the rewards are richer. Try the dungeon challenge.",
-        "我需要更强的装备": "I need stronger gear",
-        "看你的装备...确实该升级了。": "Your gear... yeah, it needs upgrades.",
-        "多打几个Boss吧, 钻石可以用来进行超级召唤。": "Fight more bosses. Diamonds let you do Super Summons.",
-        "传说品质的装备, 可是每个战士的梦想啊!": "Legendary gear is every warrior's dream!",
-        "只是路过": "Just passing by",
-        "哇哦, 大客户驾到!": "Wow, a big spender!",
-        "看你金光闪闪的钱袋...今天想看点什么?": "That shiny purse... what are you looking for today?",
-        "随便看看": "Just browsing",
-        "有钱任性啊! 记得多去抽几次十连, 说不定能抽到传说装备!": "Money to burn! Do a few ten-pulls, you might hit a legendary!",
-        "唉, 你看起来也没什么钱的样子。": "Sigh, you don't look like you have much.",
-        "不过别灰心, 多打几局副本就有金币了。": "Don't lose heart. A few dungeon runs will get you gold.",
-        "确实没钱": "Yeah, I'm broke",
-        "去刷刷小怪吧, 实在不行还有灵魂商店。": "Farm some mobs, or try the Soul Shop.",
-        "那里用灵魂碎片也能换到不少好东西。": "You can trade soul shards for good stuff there.",
-        "哼, 走了": "Hmph, I'm out",
-        "嗨, 来了! 今天想要点什么?": "Hey there! What do you want today?",
-        "聊聊天": "Chat",
-        "深渊啊...说实话我也不知道自己为什么在这做生意。": "The Abyss... honestly I don't know why I trade here.",
-        "大概是因为只有这里的客人...嗯...不挑剔吧。": "Maybe because the customers here... aren't picky.",
-        "买东西": "Buy something",
-        "去主菜单的\"装备召唤\"或\"灵魂商店\"吧, 我这没有直接卖的。": "Use \"Equipment Summon\" or \"Soul Shop\" from the main menu. I don't sell directly.",
-        "不过如果你装备够多, 去\"角色升级\"里可以穿戴上哟。": "If you have enough gear, equip it in \"Character Upgrade\".",
-        "离开": "Leave",
-        "...你终于来了。": "...You finally came.",
-        "我等这一刻已经很久了, 暗夜猎人。": "I've waited a long time for this, Night Hunter.",
-        "深渊的力量正在侵蚀这片大地, 而你是唯一的希望。": "The Abyss is devouring this land, and you are the only hope.",
-        "我是谁?": "Who am I?",
-        "你是被深渊选中的人。每次死亡, 你都会从轮回中归来。": "You are chosen by the Abyss. Each death, you return through the cycle.",
-        "这既是诅咒, 也是祝福。": "It is both curse and blessing.",
-        "利用每次轮回积累的力量, 终有一天你能击败深渊之王。": "Use the power gained each cycle, and one day you'll defeat the Abyss King.",
-        "深渊是什么?": "What is the Abyss?",
-        "深渊...是另一个维度的裂隙。": "The Abyss... a rift to another dimension.",
-        "它吞噬生命, 扭曲现实, 不断向我们的世界渗透。": "It devours life, warps reality, and seeps into our world.",
-        "那些怪物, 都是从裂隙中涌出的深渊造物。": "Those monsters are Abyssal creations pouring from the rift.",
-        "轮回者, 你的旅程才刚刚开始。": "Reincarnator, your journey has just begun.",
-        "不要气馁, 每一次死亡都让你变得更强。": "Don't be discouraged. Every death makes you stronger.",
-        "我该怎么做?": "What should I do?",
-        "升级你的角色, 强化你的装备。": "Upgrade your character and strengthen your gear.",
-        "灵魂商店中的永久加成对你大有裨益。": "Permanent upgrades in the Soul Shop help greatly.",
-        "当你准备好了, 挑战更深层的副本。": "When ready, challenge deeper dungeons.",
-        "你是谁?": "Who are you?",
-        "我是瑟拉斯, 这片灰暗之地最后的守望者。": "I am Serath, the last watcher of this bleak land.",
-        "在深渊吞噬一切之前, 我会尽我所能指引你。": "Before the Abyss devours all, I will guide you.",
-        "我知道了": "I understand",
-        "你的力量...已经超越了我的预期。": "Your power... exceeds my expectations.",
-        "千魂之杀, 你已经证明了自己的实力。": "A thousand souls slain, you've proven your strength.",
-        "最终的敌人在哪?": "Where is the final enemy?",
-        "在深渊的最深处, 有一个存在...": "In the deepest Abyss, there is a being...",
-        "\"虚空之眼\"...它是一切混沌的源头。": "\"Eye of the Void\"... the source of all chaos.",
-        "当你的力量足够时, 它会出现在你面前。": "When your power is enough, it will appear before you.",
-        "我还能更强吗?": "Can I get stronger?",
-        "力量没有尽头, 但代价也是如此。": "Power has no end, and neither does the cost.",
-        "不断轮回下去, 你终将达到凡人的极限...": "Keep cycling and you'll reach mortal limits...",
-        "然后, 超越它。": "Then, surpass them.",
-        "老朋友, 你看起来疲惫了。": "Old friend, you look weary.",
-        "在深渊中战斗这么久, 你有没有想过放弃?": "After so long in the Abyss, have you thought of giving up?",
-        "从未想过": "Never",
-        "...好。这就是你被选中的原因。": "...Good. That is why you were chosen.",
-        "坚定的意志, 比任何武器都锋利。": "A steadfast will is sharper than any weapon.",
-        "有时候会": "Sometimes",
-        "这很正常。连我也曾动摇过。": "That's normal. Even I wavered.",
-        "但请记住, 你守护的不只是自己。": "Remember: you guard more than yourself.",
-        "每一个被深渊吞噬的灵魂, 都在等你拯救。": "Every soul devoured by the Abyss awaits your rescue.",
-        "你说多了": "You've said enough",
-        "命运的齿轮在转动...": "The gears of fate are turning...",
-        "做好准备, 暗夜猎人。": "Be ready, Night Hunter.",
-        "有什么建议?": "Any advice?",
-        "多多收集材料, 强化你的角色。": "Gather materials and strengthen your character.",
-        "铁矿、暗影精华、水晶...这些都是进阶所需。": "Iron ore, shadow essence, crystals... all needed to ascend.",
-        "副本深处有更稀有的龙鳞和深渊结晶。": "Deeper dungeons hold rarer dragon scales and abyss crystals.",
-        "嘿! 你连件像样的装备都没有?!": "Hey! You don't even have decent gear?!",
-        "赶紧去抽几件来, 我好给你打造打造!": "Go pull some so I can forge them up!",
-        "去哪弄装备?": "Where do I get gear?",
-        "主菜单有\"装备召唤\", 花点金币或钻石就行。": "Use \"Equipment Summon\" in the main menu. Spend gold or diamonds.",
-        "抽到装备后到\"角色升级\"界面, 就能穿上了!": "After you pull gear, equip it in \"Character Upgrade\".",
-        "有好装备再来找我升级!": "Come back with good gear to upgrade it!",
-        "好的": "Got it",
-        "噢! 这些装备...品质不错啊!": "Oh! This gear... pretty good quality!",
-        "想让我帮你锻造升级吗?": "Want me to forge and upgrade it?",
-        "怎么升级装备?": "How do I upgrade gear?",
-        "在\"角色升级\"界面, 每件装备旁边有升级按钮。": "In \"Character Upgrade\", each item has an upgrade button.",
-        "花点金币就能提升装备等级, 属性会越来越强。": "Spend gold to raise its level and stats.",
-        "史诗和传说品质的装备提升幅度最大!": "Epic and Legendary gear scale the most!",
-        "材料怎么获得?": "How do I get materials?",
-        "打怪会掉铁矿, 这是最基础的材料。": "Monsters drop iron ore, the basic material.",
-        "暗影精华要打更强的怪, 水晶在副本里比较多。": "Shadow essence comes from stronger enemies. Crystals are common in dungeons.",
-        "龙鳞和深渊结晶...只有高级副本的Boss才会掉。": "Dragon scales and abyss crystals drop from high-tier dungeon bosses.",
-        "改天再来": "Come back later",
-        "欢迎来到我的锻造铺! 有什么要修理的?": "Welcome to my forge! What needs fixing?",
-        "聊聊锻造": "Talk about forging",
-        "锻造嘛, 就是我的命。": "Forging is my life.",
-        "给我材料和金币, 没有我打不出的装备!": "Give me materials and gold; I can forge anything!",
-        "不过最好的装备...还是得靠召唤池碰运气。": "But the best gear... comes from the summon pool.",
-        "你看起来很壮": "You look strong",
-        "哈哈! 每天抡锤子, 想不壮都难!": "Ha! Swinging a hammer all day makes you strong.",
-        "深渊里的怪物? 给我一把好锤子, 我也能打!": "Abyss monsters? Give me a good hammer, I can fight too!",
-        "走了": "I'm off",
-        "呵呵呵...一个新的灵魂来到了深渊的边缘。": "Heh heh... a new soul has reached the Abyss edge.",
-        "命运之线在你身上缠绕...有趣。": "Threads of fate coil around you... interesting.",
-        "我? 我是伊薇, 有人叫我女巫, 有人叫我预言者。": "Me? I'm Ivy. Some call me witch, others seer.",
-        "我编织命运之线, 也解读它们的走向。": "I weave the threads of fate and read their course.",
-        "你的线...很特别。缠绕着死亡, 却每次都重新连接。": "Your thread is special. It tangles with death, yet reconnects each time.",
-        "你能帮我吗?": "Can you help me?",
-        "帮你? 我能给你的只有预言。": "Help you? I can only offer prophecy.",
-        "第一个预言: 不要贪恋经验, 有时候躲避比升级更重要。": "First prophecy: don't chase EXP blindly; sometimes dodging is more important.",
-        "第二个预言: Boss出现前, 准备好你最强的武器组合。": "Second prophecy: before a boss appears, prepare your strongest weapon set.",
-        "...有点害怕": "...I'm a little scared",
-        "呵呵呵...怕我? 你应该怕的是深渊本身。": "Heh... afraid of me? You should fear the Abyss itself.",
-        "去吧, 年轻人。命运会指引你的。": "Go, young one. Fate will guide you.",
-        "你身上的深渊气息越来越浓了...": "The Abyss aura on you grows stronger...",
-        "你知道吗? 杀戮太多深渊造物, 你自己也会被侵蚀。": "Did you know? Slaying too many Abyssal beings will corrode you too.",
-        "有办法抵抗吗?": "Is there a way to resist?",
-        "唯一的办法是...变得更强。": "The only way... is to become stronger.",
-        "当你的力量超越深渊, 侵蚀就无法触及你。": "When your power surpasses the Abyss, its corrosion cannot touch you.",
-        "角色进阶可以增强你的抗性...多收集些材料吧。": "Character ascension boosts resistance... gather more materials.",
-        "我不在乎": "I don't care",
-        "...真是无畏。或者说, 无知?": "...Truly fearless. Or ignorant?",
-        "不过, 也许正是这种无畏...才是你最强的武器。": "Yet perhaps that fearlessness... is your strongest weapon.",
-        "这么多灵魂碎片...你收割了不少生命啊。": "So many soul shards... you've reaped many lives.",
-        "灵魂商店的升级能让你获得永久的力量。": "Soul Shop upgrades grant permanent power.",
-        "哪个路线最好?": "Which path is best?",
-        "如果你喜欢硬抗, 走\"求生之道\"...": "If you like to tank, choose \"Path of Survival\"...",
-        "如果你喜欢爆发, 走\"战斗之路\"...": "If you like burst damage, choose \"Path of Battle\"...",
-        "但我个人推荐...\"命运之轮\"。": "But I recommend... \"Path of Fate\".",
-        "它很贵, 但效果是最独特的。": "It's expensive, but its effects are unique.",
-        "灵魂碎片的来源?": "Where do soul shards come from?",
-        "每次轮回结束, 你的击杀和存活时间都会化为碎片。": "After each cycle, your kills and survival time become shards.",
-        "杀的越多、活的越久, 碎片就越多。": "The more you kill and survive, the more shards.",
-        "Boss也会额外掉落一些。": "Bosses drop extra as well.",
-        "又见面了...命运之线依然缠绕在你身上。": "We meet again... the threads of fate still coil around you.",
-        "今天想知道什么?": "What do you want to know today?",
-        "今天运气如何?": "How's my luck today?",
-        "星象显示...今天适合抽卡! 去试试十连吧。": "The stars say... great day for summons! Try a ten-pull.",
-        "嗯...今天的运势一般, 还是老老实实刷副本吧。": "Hmm... luck is average today. Farm dungeons instead.",
-        "哦? 今天的命运之线异常活跃...会有好事发生!": "Oh? Fate is lively today... something good will happen!",
-        "小心...今天深渊的力量格外强烈。": "Be careful... the Abyss is especially strong today.",
-        "去升级你的角色吧, 今天适合修炼。": "Upgrade your character; today is good for training.",
-        "告诉我个秘密": "Tell me a secret",
-        "秘密? 呵呵...暴击和吸血是最强的组合。": "A secret? Heh... crit and lifesteal is the strongest combo.",
-        "你知道吗? 每8种武器都有隐藏的协同效果。": "Did you know? Every 8 weapons have hidden synergies.",
-        "深渊裂隙每10分钟会涌出一波精英怪...做好准备。": "Every 10 minutes, elite waves pour from Abyss rifts... be ready.",
-        "传说品质的符文...能让你的冷却近乎消失。": "Legendary runes... can nearly erase your cooldowns.",
-        "铁匠他...以前也是个深渊猎人, 只是不愿承认。": "The blacksmith... used to be an Abyss hunter. He won't admit it.",
-        "......": "......",
-
-        # Boss test UI additional
-        "类型: {title} {name} ({boss_type_name})": "Type: {title} {name} ({boss_type_name})",
-
-        # Combo texts
-        "超神!! x{count}": "GOD MODE!! x{count}",
-        "无双! x{count}": "UNSTOPPABLE! x{count}",
-        "连击 x{count}": "COMBO x{count}",
-
-        # Enemy names (codex)
-        "小型": "Small",
-        "中型": "Medium",
-        "大型": "Large",
-        "巨型": "Giant",
-        
-        # Special indicators
-        "阶段": "Phase",
-        
-        # Additional weapon names for codex
-        "火球术": "Fireball",
-        "雷电领域": "Lightning Field",
-        "骨盾环绕": "Bone Shield",
-        "大地尖刺": "Earth Spikes",
-    },
-
-    # TODO: ja/ko/ru translations are defined below.
-}
-
-# Additional translations (TODO: fill ja/ko/ru before enabling)
-TRANSLATIONS["ja"] = {
-    # Game title / menu
-    "暗夜割草者：深渊轮回": "ナイトリーパー:深淵の輪廻",
-    "暗夜割草者": "ナイトリーパー",
-    "深 渊 轮 回": "深淵の輪廻",
-    "开始游戏": "ゲーム開始",
-    "退出游戏": "終了",
-    "语言": "言語",
-    "选择语言": "言語選択",
-    "设置": "設定",
-    "显示设置": "ディスプレイ設定",
-    "分辨率": "解像度",
-    "显示模式": "表示モード",
-    "窗口模式": "ウィンドウ",
-    "全屏模式": "フルスクリーン",
-    "应用": "適用",
-    "ESC 返回": "ESC 戻る",
-    "返回": "戻る",
-    "ESC 返回主菜单": "ESC メニューに戻る",
-    "点击角色开始游戏": "キャラをクリックして開始",
-    "选择角色": "キャラ選択",
-    "未解锁": "未解放",
-    "等级提升! Lv.{level}": "レベルアップ! Lv.{level}",
-    "新武器": "新武器",
-    "武器强化": "武器強化",
-    "被动物品": "パッシブ",
-    "属性提升": "ステータスUP",
-    "已暂停": "一時停止",
-    "继续游戏": "再開",
-    "重新开始": "リスタート",
-    "返回主菜单": "メニューに戻る",
-    "深渊吞噬了你...": "深淵に飲み込まれた...",
-    "再来一局": "もう一度",
-    "你击败了深渊之主!": "深淵の主を倒した!",
-    "灵魂商店": "ソウルショップ",
-    "灵魂碎片": "ソウルの欠片",
-    "生存之路": "生存の道",
-    "战斗之路": "戦闘の道",
-    "探索之路": "探索の道",
-    "命运之路": "運命の道",
-    "已解锁": "解放済",
-    "花费 {cost}": "コスト {cost}",
-    "需要 {cost}": "必要 {cost}",
-    "装备 & 材料": "装備 & 素材",
-    "装备": "装備",
-    "材料": "素材",
-    "背包 ({count}/8)": "バッグ ({count}/8)",
-    "强化 {cost}": "強化 {cost}",
-    "-- 空 --": "-- 空 --",
-    "等级 {level}/{max_level}": "レベル {level}/{max_level}",
-    "升级需: {cost}": "レベルアップに必要: {cost}",
-    "按 TAB 或 I 关闭": "TABまたはIで閉じる",
-    "[TAB] 装备/材料": "[TAB] 装備/素材",
-    "击杀:{kills}  {time}": "撃破:{kills}  {time}",
-    "存活时间: {time}": "生存時間: {time}",
-    "击杀数: {kills}": "撃破数: {kills}",
-    "最终等级: Lv.{level}": "最終レベル: Lv.{level}",
-    "最高连击: {combo}": "最高コンボ: {combo}",
-    "获得灵魂碎片: +{souls}": "ソウルの欠片: +{souls}",
-    "通关时间: {time}": "クリアタイム: {time}",
-    "金币: +{gold}": "ゴールド: +{gold}",
-    "钻石: +{diamond}": "ダイヤモンド: +{diamond}",
-    "总局数: {runs}  最佳击杀: {best}": "総プレイ: {runs}  最高撃破: {best}",
-    "!! BOSS来了 !!": "!! BOSS襲来 !!",
-    "保存失败: {err}": "保存失敗: {err}",
-    "材料不足: ": "素材不足: ",
-    "装备: {name} [{rarity}]": "装備: {name} [{rarity}]",
-    "获得: {name} [{rarity}]": "獲得: {name} [{rarity}]",
-    "确认": "確認",
-    "进入": "入る",
-    "已满级!": "最大レベル!",
-    "升级": "レベルアップ",
-    "进阶": "昇格",
-    "已装备": "装備中",
-    "穿戴": "装備",
-    "卸下": "外す",
-    "快速出售:": "クイック売却:",
-    "无可售": "売却なし",
-    "保留传说": "レジェ保留",
-    "保留史诗+": "エピック+保留",
-    "保留稀有+": "レア+保留",
-    "装备仓库 (点击装备到当前角色)": "装備倉庫 (クリックで装備)",
-    "角色升级": "キャラアップグレード",
-    "图 鉴": "図鑑",
-    "角色": "キャラクター",
-    "武器": "武器",
-    "敌人": "エネミー",
-    "装备": "装備",
-    "Boss": "ボス",
-    "??? 未发现": "??? 未発見",
-    "??? 未遭遇": "??? 未遭遇",
-    "??? 未击败": "??? 未撃破",
-    "收集进度: {done}/{total} ({pct}%)": "収集進捗: {done}/{total} ({pct}%)",
-    "副 本 选 择": "ダンジョン選択",
-    "金币: {gold}  钻石: {diamond}": "ゴールド: {gold}  ダイヤ: {diamond}",
-    "难度: {stars}": "難易度: {stars}",
-    "时限: {minutes}分钟": "制限時間: {minutes}分",
-    "时限: 无限": "制限時間: 無限",
-    "通关: {count}次": "クリア: {count}回",
-    "奖励: ": "報酬: ",
-    "🔒 未解锁": "🔒 未解放",
-    "需要累计击杀 {need}": "累計撃破数 {need} 必要",
-    "🔒 角色未解锁": "🔒 キャラ未解放",
-    "未知": "不明",
-    "解锁条件: {cond}": "解放条件: {cond}",
-    "当前进度: {best}/{need}": "現在進捗: {best}/{need}",
-    "已装备:": "装備中:",
-    "需要进阶(阶{tier}) 金:{gold} 钻:{diamond}": "昇格必要(階{tier}) G:{gold} D:{diamond}",
-    "升级: {gold}金币": "レベルアップ: {gold}G",
-    "◀上页": "◀ 前",
-    "下页▶": "次 ▶",
-    "装备召唤": "装備召喚",
-    "常规召唤": "通常召喚",
-    "消耗金币": "ゴールド消費",
-    "单抽: {c1}  十连: {c10}": "単発: {c1}  10連: {c10}",
-    "普通50% 优秀30% 稀有15% 史诗4% 传说1%": "コモン50% アンコモン30% レア15% エピック4% レジェンダリー1%",
-    "保底: {pity}抽必得史诗": "天井: {pity}回でエピック確定",
-    "超级召唤": "スーパー召喚",
-    "消耗钻石 (仅Boss掉钻石)": "ダイヤ消費 (Boss限定)",
-    "普通10% 优秀25% 稀有35% 史诗22% 传说8%": "コモン10% アンコモン25% レア35% エピック22% レジェンダリー8%",
-    "保底: {pity}抽必得传说": "天井: {pity}回でレジェンダリー確定",
-    "已抽: {now}/{max}": "天井: {now}/{max}",
-    "单抽": "単発",
-    "十连抽!": "10連!",
-    "— 召唤结果 —": "— 結果 —",
-    "深渊城镇": "深淵の街",
-    "与NPC交谈获取情报和建议": "NPCと話して情報とアドバイスを得る",
-    "点击交谈": "クリックして会話",
-    "按 E 或 点击 互动": "Eまたはクリックで対話",
-    "WASD 移动  |  E 互动  |  ESC 菜单": "WASD 移動 | E 対話 | ESC メニュー",
-    "金: {gold}  钻: {diamond}  魂: {soul}": "G: {gold}  D: {diamond}  S: {soul}",
-    "Boss 测试场": "ボステストアリーナ",
-    "已暂停 (P键继续)": "一時停止 (Pで再開)",
-    "--- Boss 测试场 ---": "--- ボステストアリーナ ---",
-    "WASD / 方向键 : 移动": "WASD / 矢印: 移動",
-    "鼠标点击 : 散弹射击": "マウスクリック: ショット",
-    "1-4 : 切换Boss类型": "1-4: ボスタイプ切替",
-    "N : 下一级Boss": "N: 次レベルボス",
-    "R : 重置当前Boss": "R: 現ボスリセット",
-    "H : 恢复满血": "H: 全回復",
-    "P : 暂停": "P: 一時停止",
-    "ESC : 退出": "ESC: 終了",
-    "类型: {title} {name} (阶段 {phase})": "タイプ: {title} {name} (フェーズ {phase})",
-    "等级: Lv.{level}  阶段: {phase}": "レベル: Lv.{level}  フェーズ: {phase}",
-    "血量: {hp}/{max_hp}": "HP: {hp}/{max_hp}",
-    "玩家血量: {hp}/{max_hp}": "プレイヤーHP: {hp}/{max_hp}",
-    "▲ 狂暴化 ▲": "▲ 狂暴化 ▲",
-    "▲▲ 濒死暴走 ▲▲": "▲▲ 瀕死暴走 ▲▲",
-    "特殊: {spec}": "特殊: {spec}",
-    "基础HP: {hp}": "基礎HP: {hp}",
-    "部位: {slot}": "部位: {slot}",
-    "基础属性提升": "基礎ステータスアップ",
-    "生命 +20": "HP +20",
-    "移速 +8%": "速度 +8%",
-    "护甲 +3": "防御 +3",
-    "暴击 +3%": "会心 +3%",
-    "回血 +0.3/s": "回復 +0.3/s",
-    "拾取 +20": "回収 +20",
-    "伤害 +8%": "ダメージ +8%",
-    "冷却 -5%": "クールダウン -5%",
-    "金币": "ゴールド",
-    "钻石": "ダイヤモンド",
-    "铁矿": "鉄鉱",
-    "暗影": "影",
-    "水晶": "結晶",
-    "龙鳞": "竜鱗",
-    "深渊": "深淵",
-    "铁矿石": "鉄鉱石",
-    "暗影精华": "影の精髄",
-    "魔力水晶": "魔力結晶",
-    "龙鳞碎片": "竜鱗の欠片",
-    "深渊之心": "深淵の心臓",
-    "武器": "武器",
-    "护甲": "防具",
-    "饰品": "装飾品",
-    "符文": "ルーン",
-    "普通": "コモン",
-    "优秀": "アンコモン",
-    "稀有": "レア",
-    "史诗": "エピック",
-    "传说": "レジェンダリー",
-    "阿什": "アッシュ",
-    "暗夜猎人": "ナイトハンター",
-    "莉拉": "リラ",
-    "风行者": "ウィンドランナー",
-    "加隆": "ガロン",
-    "铁壁守卫": "アイアンガード",
-    "菲奥": "フィオ",
-    "炽炎法师": "フレイムメイジ",
-    "虚无": "ヴォイド",
-    "虚空行者": "ヴォイドウォーカー",
-    "死神": "リーパー",
-    "收割者": "ハーヴェスター",
-    "平衡型角色，起始武器:魔法飞弹": "バランス型。初期武器:マジックミサイル",
-    "高机动角色，起始武器:回旋镖": "高機動型。初期武器:ブーメラン",
-    "坦克角色，起始武器:骨盾环绕": "タンク型。初期武器:ボーンシールド",
-    "高伤角色，起始武器:火球术": "高ダメージ型。初期武器:ファイアボール",
-    "暗杀角色，起始武器:寒冰新星": "暗殺型。初期武器:アイスノヴァ",
-    "收割角色，起始武器:圣光鞭": "リーパー型。初期武器:ホーリーウィップ",
-    "魔法飞弹": "マジックミサイル",
-    "自动追踪最近敌人的魔法弹": "最も近い敵を自動追尾する魔法弾",
-    "圣光鞭": "ホーリーウィップ",
-    "近身范围扇形攻击 + 击退": "近距離扇形攻撃 + ノックバック",
-    "寒冰新星": "アイスノヴァ",
-    "以自身为中心释放寒冰冲击波": "自身中心に氷衝撃波を放つ",
-    "烈焰之球": "フレイムオーブ",
-    "向随机方向发射穿透火球": "ランダム方向に貫通火球を発射",
-    "雷电法阵": "ライトニングシジル",
-    "在随机位置生成持续电击区域": "ランダム位置に持続電撃エリアを生成",
-    "白骨之盾": "ボーンシールド",
-    "环绕角色旋转的骨盾": "キャラの周りを回転する骨盾",
-    "回旋镖": "ブーメラン",
-    "飞出再返回，穿透所有敌人": "飛んで戻る、全敵貫通",
-    "地刺术": "アーススパイク",
-    "在敌人密集处召唤地刺": "敵密集地にスパイクを召喚",
-    "自动追踪敌人的魔法弹幕，穿透力强": "自動追尾する魔法弾幕、高貫通力",
-    "以神圣之力鞭笞前方扇形区域的敌人": "神聖な力で前方扇形エリアの敵を鞭打つ",
-    "向四面八方释放冰弹，减速命中敌人": "四方八方に氷弾を放ち、命中した敵を減速",
-    "发射强力火球，爆炸造成范围伤害": "強力な火球を発射、爆発でエリアダメージ",
-    "在周围生成雷电光圈持续电击敌人": "周囲に雷電オーラを生成、持続電撃",
-    "召唤骨盾环绕自身，触碰即伤": "骨盾を召喚して自身を囲む、接触でダメージ",
-    "投掷回旋镖，去而复返双重伤害": "ブーメランを投げ、往復で2倍ダメージ",
-    "在敌人脚下召唤地刺进行刺穿": "敵の足元にスパイクを召喚して刺す",
-    "骷髅杂兵": "スケルトングラント",
-    "蝙蝠群": "バットスウォーム",
-    "泥沼史莱姆": "スワンプスライム",
-    "幽灵": "ゴースト",
-    "自爆蜘蛛": "自爆スパイダー",
-    "骷髅弓箭手": "スケルトンアーチャー",
-    "暗影法师": "シャドウメイジ",
-    "精英骑士": "エリートナイト",
-    "最基础的亡灵士兵，数量多但很脆弱": "基本的なアンデッド兵、多いが脆い",
-    "高速飞行的蝙蝠群，灵活但血薄": "高速飛行のコウモリ群、素早いが脆い",
-    "黏糊糊的史莱姆，死后会分裂": "ベトベトのスライム、死後に分裂",
-    "飘忽不定的亡灵，伤害中等": "不確定なアンデッド、中程度のダメージ",
-    "靠近后自爆的危险蜘蛛": "接近すると自爆する危険なクモ",
-    "远程射击的骷髅，保持距离作战": "遠距離射撃のスケルトン、距離を保つ",
-    "暗影魔法攻击，高伤害远程敌人": "シャドウ魔法攻撃、高ダメージ遠距離敵",
-    "全副武装的精英骑士，会冲锋": "重装備のエリートナイト、チャージ攻撃",
-    "分裂": "分裂",
-    "自爆": "自爆",
-    "远程": "遠距離",
-    "冲锋": "チャージ",
-    "骷髅王": "スケルトンキング",
-    "亡灵领主": "アンデッドロード",
-    "召唤亡灵大军的骷髅领主，擅长范围攻击": "アンデッド軍団を召喚するスケルトンロード、範囲攻撃得意",
-    "毒液巨兽": "ヴェノムビヒーモス",
-    "深渊之王": "アビスキング",
-    "喷射剧毒的深渊巨兽，毒雾弥漫战场": "猛毒を噴射する深淵の巨獣、毒霧に満ちた戦場",
-    "烈焰魔将": "フレイムウォーロード",
-    "战场霸主": "バトルタイラント",
-    "浑身烈焰的魔族将领，火海吞噬一切": "全身炎に包まれた魔族将軍、火の海がすべてを飲み込む",
-    "虚空之眼": "ヴォイドアイ",
-    "次元裂隙": "ディメンショナルリフト",
-    "来自虚空的恐怖存在，扭曲时空法则": "虚空からの恐怖の存在、時空の法則を歪める",
-    "深渊之门": "深淵の門",
-    "通往深渊的第一道裂隙，适合初入深渊者": "深淵への第一の裂け目、初心者向け",
-    "暗影裂隙": "シャドウリフト",
-    "暗影精华弥漫的异空间，敌人更加强大": "影の精髄に満ちた異空間、敵がより強力",
-    "炎魔领域": "フレイムドメイン",
-    "烈焰魔将统治的火焰地域，高温炙烤": "フレイムウォーロードが支配する炎の領域、灼熱",
-    "虚空核心": "ヴォイドコア",
-    "虚空之眼栖息的维度核心，终极考验": "ヴォイドアイが潜む次元の核心、究極の試練",
-    "无尽深渊": "エンドレスアビス",
-    "没有时间限制的无尽模式，坚持越久奖励越丰": "時間制限なしのエンドレスモード、長く持つほど報酬増",
-    "弹射宝石": "リコシェットジェム",
-    "所有投射物 +1 弹射": "全投射物 +1 跳弾",
-    "冰封之心": "フローズンハート",
-    "接触敌人时自动减速": "敵に接触時自動減速",
-    "燃烧之魂": "バーニングソウル",
-    "10%击杀几率留下火焰地面": "10%撃破確率で炎の地面を残す",
-    "疾风护符": "スウィフトチャーム",
-    "移速+15%  闪避+5%": "速度+15%  回避+5%",
-    "大地之心": "ハートオブアース",
-    "护甲+5  击退+30%": "防御+5  ノックバック+30%",
-    "血色宝石": "クリムゾンジェム",
-    "暴击+8%  暴击伤害+30%": "会心+8%  会心ダメージ+30%",
-    "吞噬之牙": "デヴァラーファング",
-    "5%生命偷取": "5%ライフスティール",
-    "幸运骰子": "ラッキーダイス",
-    "升级选项+1 (3→4)": "アップグレード選択肢+1 (3→4)",
-    "幽冥灯笼": "ネザーランタン",
-    "拾取范围+40%  经验+10%": "回収範囲+40%  経験値+10%",
-    "战争号角": "ウォーホーン",
-    "伤害+12%  受伤+8%": "ダメージ+12%  被ダメージ+8%",
-    "生命树苗": "ライフサプリング",
-    "每秒回血+1  每10击杀+5血": "毎秒回復+1  10撃破毎+5HP",
-    "时空碎片": "タイムシャード",
-    "全局冷却-10%": "グローバルクールダウン-10%",
-    "铁短剑": "アイアンショートソード",
-    "暗影匕首": "シャドウダガー",
-    "碧焰长剑": "アジュールフレイムロングソード",
-    "深渊大剑": "アビスグレートソード",
-    "毁灭之刃": "ブレイドオブルーイン",
-    "皮甲": "レザーアーマー",
-    "锁子甲": "チェインメイル",
-    "暗影铠甲": "シャドウプレート",
-    "龙鳞战甲": "ドラゴンスケールアーマー",
-    "深渊圣甲": "アビスセイントアーマー",
-    "旅人之靴": "トラベラーブーツ",
-    "疾风之翼": "スウィフトウィング",
-    "闪光护符": "グリームタリスマン",
-    "传送之戒": "テレポートリング",
-    "时间之冠": "クラウンオブタイム",
-    "初级符文": "ノービスルーン",
-    "聚能符文": "チャネリングルーン",
-    "掠夺符文": "プランダールーン",
-    "深渊符文": "アビスルーン",
-    "创世符文": "ジェネシスルーン",
-    "生命": "HP",
-    "伤害%": "ダメージ%",
-    "护甲": "防御",
-    "暴击%": "会心%",
-    "速度%": "速度%",
-    "伤害": "ダメージ",
-    "暴击": "会心",
-    "暴伤": "会心ダメ",
-    "回复": "回復",
-    "速度": "速度",
-    "闪避": "回避",
-    "拾取": "回収",
-    "冷却": "クールダウン",
-    "经验": "経験値",
-    "吸血": "ライフスティール",
-    "副本传送门": "ダンジョンゲート",
-    "进入副本挑战": "ダンジョンに入る",
-    "召唤祭坛": "召喚祭壇",
-    "消耗资源召唤装备": "リソースを消費して装備を召喚",
-    "锻造工坊": "フォージ",
-    "升级角色和装备": "キャラと装備をアップグレード",
-    "灵魂商店": "ソウルショップ",
-    "消耗灵魂碎片购物": "ソウルの欠片を消費して買い物",
-    "深渊图鉴": "アビス図鑑",
-    "查阅角色和装备图鉴": "キャラと装備の図鑑を見る",
-    "冒险出发": "冒険に出る",
-    "选择角色开始冒险": "キャラを選んで冒険開始",
-    "商人·马库斯": "マーチャント・マーカス",
-    "物资交易商人": "物資商人",
-    "长老·瑟拉斯": "エルダー・セラス",
-    "深渊知识长老": "深淵知識の長老",
-    "铁匠·布鲁诺": "ブラックスミス・ブルーノ",
-    "武器锻造大师": "武器鍛造マスター",
-    "女巫·伊薇": "ウィッチ・アイビー",
-    "神秘魔法师": "神秘なメイジ",
-    "▼ 点击继续": "▼ クリックで続ける",
-    "请选择:": "選択:",
-    "角色预览 - Characters Preview": "キャラプレビュー",
-    "角色选择预览 (←→ 切换)": "キャラプレビュー (←→)",
-    "点击任意处跳过": "どこかクリックでスキップ",
-    "剑士": "ソードマン",
-    "法师": "メイジ",
-    "弓手": "アーチャー",
-    "刺客": "アサシン",
-    "骑士": "ナイト",
-    "召唤师": "サモナー",
-    "冒险者": "アドベンチャラー",
-    "守墓人": "グレイブキーパー",
-    "暗影刺客": "シャドウアサシン",
-    "铁壁骑士": "アイアンナイト",
-    "炼金术士": "アルケミスト",
-    "裂隙行者": "リフトウォーカー",
-    "均衡型角色 · 被动: 击杀敌人5%概率回复少量生命": "バランス型 · パッシブ: 撃破時5%確率で少量HP回復",
-    "高速型角色 · 被动: 闪避成功后0.5秒内移速+80%": "高速型 · パッシブ: 回避成功後0.5秒速度+80%",
-    "防御型角色 · 被动: 血量低于30%时护甲翻倍": "防御型 · パッシブ: HP30%未満時防御2倍",
-    "伤害型角色 · 被动: 武器进化所需等级-2，暴击伤害+30%": "ダメージ型 · パッシブ: 武器進化レベル-2、会心ダメージ+30%",
-    "特殊角色 · 被动: 每30秒闪现到安全位置，属性随机波动": "特殊型 · パッシブ: 30秒毎安全位置へブリンク、ステータスランダム変動",
-    "隐藏角色 · 被动: 击杀后1秒内攻击+100%，但生命极低": "隠しキャラ · パッシブ: 撃破後1秒攻撃+100%、ただしHP極低",
-    "旅行商人·马库斯": "旅商人・マーカス",
-    "深渊行商": "深淵商人",
-    "暗夜长老·瑟拉斯": "ナイトエルダー・セラス",
-    "先知": "預言者",
-    "锻造大师": "鍛造マスター",
-    "神秘女巫·伊薇": "神秘な魔女・アイビー",
-    "命运编织者": "運命の織り手",
-    "哦? 新面孔! 欢迎来到深渊的边缘, 旅行者。": "お? 新しい顔! ようこそ深淵の縁へ、旅人よ。",
-    "我是马库斯, 在这片黑暗中做些小生意。": "私はマーカス、この闇で小さな商売をしている。",
-    "别被外面的怪物吓到了, 只要你有金币, 我什么都卖。": "外のモンスターに怯えなくていい、ゴールドさえあれば何でも売るよ。",
-    "你都卖些什么?": "何を売ってるの?",
-    "武器、护甲、稀有符文...只要你出得起价。": "武器、防具、レアルーン...払えるなら何でも。",
-    "去\"装备召唤\"看看吧，碰碰运气说不定有好东西！": "「装備召喚」を見てみな、運試しで良いものが出るかも!",
-    "这里安全吗?": "ここは安全?",
-    "嘿嘿，只要你不欠我钱，这里就是最安全的。": "へへ、借金しなければここが一番安全さ。",
-    "不过说真的，深渊的裂隙越来越不稳定了...": "でも本気で言うと、深淵の裂け目がどんどん不安定になってるよ...",
-    "告辞": "それじゃ",
-    "又来了? 上次教你的保命技巧用上了吗?": "また来たのか? 前教えた生存術は使ったか?",
-    "看你这副样子...大概没用上吧。": "その様子じゃ...多分使ってないな。",
-    "教我更多技巧": "もっと教えて",
-    "要诀只有一个: 不要停下脚步!": "コツは一つだけ: 立ち止まるな!",
-    "在深渊中站着不动就是等死。持续移动，让武器自动清场。": "深淵で立ち止まれば死ぬだけ。動き続けて、武器に任せろ。",
-    "经验宝石要尽量捡, 等级越高武器越强。": "経験値ジェムはできるだけ拾え、レベルが高いほど武器が強くなる。",
-    "你有什么好货?": "良いものは?",
-    "好东西可不便宜哦～": "良いものは高いよ～",
-    "去抽卡池碰碰运气, 或者攒到好装备来找铁匠升级。": "召喚プールで運試しするか、良い装備を集めて鍛冶屋でアップグレードしろ。",
-    "下次再说": "また今度",
-    "欢迎回来, 老朋友!": "お帰り、友よ!",
-    "生意如何? 最近深渊里的怪物越来越多了。": "商売はどう? 最近深淵のモンスターが増えてきたね。",
-    "最近有什么新情报?": "新しい情報は?",
-    "你听说了吗? 深渊的最深处好像出现了一道新的裂隙。": "聞いたか? 深淵の最深部に新しい裂け目が現れたらしい。",
-    "据说穿过那里可以到达更危险的领域...": "そこを通れば、もっと危険な領域に行けるそうだ...",
-    "不过回报也会更丰厚。试试副本挑战吧。": "でも報酬も豊富だ。ダンジョンチャレンジを試してみな。",
-    "我需要更强的装备": "もっと強い装備が欲しい",
-    "看你的装备...确实该升级了。": "その装備じゃ...確かにアップグレードが必要だな。",
-    "多打几个Boss吧, 钻石可以用来进行超级召唤。": "ボスをもっと倒せ、ダイヤでスーパー召喚ができる。",
-    "传说品质的装备, 可是每个战士的梦想啊!": "レジェンダリー装備は全戦士の夢だ!",
-    "只是路过": "通りすがり",
-    "哇哦, 大客户驾到!": "おお、大口客だ!",
-    "看你金光闪闪的钱袋...今天想看点什么?": "その輝く財布を見ると...今日は何を?",
-    "随便看看": "見るだけ",
-    "有钱任性啊! 记得多去抽几次十连, 说不定能抽到传说装备!": "金持ちだな! 10連を何回かやってみな、レジェンダリーが出るかも!",
-    "唉, 你看起来也没什么钱的样子。": "はあ、金がなさそうだな。",
-    "不过别灰心, 多打几局副本就有金币了。": "でもがっかりするな、ダンジョンを何回かやればゴールドが貯まる。",
-    "确实没钱": "確かに金がない",
-    "去刷刷小怪吧, 实在不行还有灵魂商店。": "雑魚を倒せ、無理ならソウルショップもあるぞ。",
-    "那里用灵魂碎片也能换到不少好东西。": "ソウルの欠片でいろいろ良いものが手に入る。",
-    "哼, 走了": "ふん、行くぞ",
-    "嗨, 来了! 今天想要点什么?": "やあ、来たな! 今日は何が欲しい?",
-    "聊聊天": "話そう",
-    "深渊啊...说实话我也不知道自己为什么在这做生意。": "深淵か...正直、なぜここで商売してるか自分でもわからない。",
-    "大概是因为只有这里的客人...嗯...不挑剔吧。": "多分ここの客は...うん...文句を言わないからかな。",
-    "买东西": "何か買う",
-    "去主菜单的\"装备召唤\"或\"灵魂商店\"吧, 我这没有直接卖的。": "メインメニューの「装備召喚」か「ソウルショップ」へ行け、直接売るものはない。",
-    "不过如果你装备够多, 去\"角色升级\"里可以穿戴上哟。": "でも装備が十分あれば、「キャラアップグレード」で装備できるよ。",
-    "离开": "じゃあね",
-    "...你终于来了。": "...ようやく来たな。",
-    "我等这一刻已经很久了, 暗夜猎人。": "この瞬間をずっと待っていた、ナイトハンター。",
-    "深渊的力量正在侵蚀这片大地, 而你是唯一的希望。": "深淵の力がこの大地を侵食している、君が唯一の希望だ。",
-    "我是谁?": "私は誰?",
-    "你是被深渊选中的人。每次死亡, 你都会从轮回中归来。": "君は深淵に選ばれた者だ。死ぬたびに輪廻から戻ってくる。",
-    "这既是诅咒, 也是祝福。": "それは呪いであり、祝福でもある。",
-    "利用每次轮回积累的力量, 终有一天你能击败深渊之王。": "輪廻ごとに蓄積した力を使い、いつか深淵の王を倒せる。",
-    "深渊是什么?": "深淵とは?",
-    "深渊...是另一个维度的裂隙。": "深淵...別次元の裂け目だ。",
-    "它吞噬生命, 扭曲现实, 不断向我们的世界渗透。": "命を飲み込み、現実を歪め、我々の世界に浸透し続けている。",
-    "那些怪物, 都是从裂隙中涌出的深渊造物。": "あのモンスターは、裂け目から湧き出る深淵の産物だ。",
-    "轮回者, 你的旅程才刚刚开始。": "輪廻者よ、君の旅は始まったばかりだ。",
-    "不要气馁, 每一次死亡都让你变得更强。": "落胆するな、死ぬたびに強くなる。",
-    "我该怎么做?": "どうすればいい?",
-    "升级你的角色, 强化你的装备。": "キャラをアップグレードし、装備を強化しろ。",
-    "灵魂商店中的永久加成对你大有裨益。": "ソウルショップの永続バフが大いに役立つ。",
-    "当你准备好了, 挑战更深层的副本。": "準備ができたら、もっと深いダンジョンに挑戦しろ。",
-    "你是谁?": "あなたは誰?",
-    "我是瑟拉斯, 这片灰暗之地最后的守望者。": "私はセラス、この灰色の地の最後の番人だ。",
-    "在深渊吞噬一切之前, 我会尽我所能指引你。": "深淵がすべてを飲み込む前に、できる限り君を導く。",
-    "我知道了": "わかった",
-    "你的力量...已经超越了我的预期。": "君の力は...私の予想を超えている。",
-    "千魂之杀, 你已经证明了自己的实力。": "千の魂を屠り、自らの力を証明した。",
-    "最终的敌人在哪?": "最後の敵はどこに?",
-    "在深渊的最深处, 有一个存在...": "深淵の最深部に、ある存在が...",
-    "\"虚空之眼\"...它是一切混沌的源头。": "「ヴォイドアイ」...すべての混沌の源だ。",
-    "当你的力量足够时, 它会出现在你面前。": "君の力が十分になれば、目の前に現れる。",
-    "我还能更强吗?": "もっと強くなれる?",
-    "力量没有尽头, 但代价也是如此。": "力に終わりはない、しかし代償もそうだ。",
-    "不断轮回下去, 你终将达到凡人的极限...": "輪廻を続ければ、やがて人間の限界に達する...",
-    "然后, 超越它。": "そして、それを超えろ。",
-    "老朋友, 你看起来疲惫了。": "友よ、疲れているようだな。",
-    "在深渊中战斗这么久, 你有没有想过放弃?": "深淵で長く戦って、諦めようと思ったことは?",
-    "从未想过": "一度も",
-    "...好。这就是你被选中的原因。": "...よし。それが君が選ばれた理由だ。",
-    "坚定的意志, 比任何武器都锋利。": "不屈の意志は、どんな武器よりも鋭い。",
-    "有时候会": "時々ある",
-    "这很正常。连我也曾动摇过。": "それは普通だ。私も揺らいだことがある。",
-    "但请记住, 你守护的不只是自己。": "だが覚えておけ、君が守るのは自分だけではない。",
-    "每一个被深渊吞噬的灵魂, 都在等你拯救。": "深淵に飲み込まれたすべての魂が、君の救いを待っている。",
-    "你说多了": "言いすぎだ",
-    "命运的齿轮在转动...": "運命の歯車が回っている...",
-    "做好准备, 暗夜猎人。": "準備しろ、ナイトハンター。",
-    "有什么建议?": "何かアドバイスは?",
-    "多多收集材料, 强化你的角色。": "素材を集めて、キャラを強化しろ。",
-    "铁矿、暗影精华、水晶...这些都是进阶所需。": "鉄鉱石、影の精髄、結晶...これらはすべて昇格に必要だ。",
-    "副本深处有更稀有的龙鳞和深渊结晶。": "ダンジョンの深部にはもっとレアな竜鱗と深淵結晶がある。",
-    "嘿! 你连件像样的装备都没有?!": "おい! まともな装備も持ってないのか?!",
-    "赶紧去抽几件来, 我好给你打造打造!": "早く何個か召喚してこい、鍛えてやる!",
-    "去哪弄装备?": "装備はどこで?",
-    "主菜单有\"装备召唤\", 花点金币或钻石就行。": "メインメニューに「装備召喚」がある、ゴールドかダイヤを使え。",
-    "抽到装备后到\"角色升级\"界面, 就能穿上了!": "装備を召喚したら「キャラアップグレード」で装備できる!",
-    "有好装备再来找我升级!": "良い装備を持ってきたらアップグレードしてやる!",
-    "好的": "わかった",
-    "噢! 这些装备...品质不错啊!": "おお! この装備...なかなか良いな!",
-    "想让我帮你锻造升级吗?": "鍛造してアップグレードしてやろうか?",
-    "怎么升级装备?": "装備はどうアップグレードするの?",
-    "在\"角色升级\"界面, 每件装备旁边有升级按钮。": "「キャラアップグレード」画面で、各装備の横にアップグレードボタンがある。",
-    "花点金币就能提升装备等级, 属性会越来越强。": "ゴールドを使えば装備レベルが上がり、ステータスが強くなる。",
-    "史诗和传说品质的装备提升幅度最大!": "エピックとレジェンダリー装備が最も大きく強化される!",
-    "材料怎么获得?": "素材はどうやって?",
-    "打怪会掉铁矿, 这是最基础的材料。": "モンスターを倒すと鉄鉱石が落ちる、基本素材だ。",
-    "暗影精华要打更强的怪, 水晶在副本里比较多。": "影の精髄はもっと強い敵を倒せ、結晶はダンジョンに多い。",
-    "龙鳞和深渊结晶...只有高级副本的Boss才会掉。": "竜鱗と深淵結晶は...高レベルダンジョンのボスだけが落とす。",
-    "改天再来": "また今度",
-    "欢迎来到我的锻造铺! 有什么要修理的?": "鍛造工房へようこそ! 何を修理する?",
-    "聊聊锻造": "鍛造の話",
-    "锻造嘛, 就是我的命。": "鍛造こそ、俺の命だ。",
-    "给我材料和金币, 没有我打不出的装备!": "素材とゴールドをくれ、作れない装備はない!",
-    "不过最好的装备...还是得靠召唤池碰运气。": "でも最高の装備は...召喚プールで運試しするしかない。",
-    "你看起来很壮": "強そうだね",
-    "哈哈! 每天抡锤子, 想不壮都难!": "ハハ! 毎日ハンマーを振ってれば、強くならないわけがない!",
-    "深渊里的怪物? 给我一把好锤子, 我也能打!": "深淵のモンスター? 良いハンマーをくれれば、俺も戦える!",
-    "走了": "じゃあ",
-    "呵呵呵...一个新的灵魂来到了深渊的边缘。": "ふふふ...新しい魂が深淵の縁に来た。",
-    "命运之线在你身上缠绕...有趣。": "運命の糸が君に絡んでいる...面白い。",
-    "我? 我是伊薇, 有人叫我女巫, 有人叫我预言者。": "私? 私はアイビー、魔女と呼ぶ者もいれば、預言者と呼ぶ者もいる。",
-    "我编织命运之线, 也解读它们的走向。": "運命の糸を織り、その行く末を読む。",
-    "你的线...很特别。缠绕着死亡, 却每次都重新连接。": "君の糸は...特別だ。死と絡んでいるが、毎回再び繋がる。",
-    "你能帮我吗?": "助けてくれる?",
-    "帮你? 我能给你的只有预言。": "助ける? 私が与えられるのは予言だけだ。",
-    "第一个预言: 不要贪恋经验, 有时候躲避比升级更重要。": "第一の予言: 経験値に執着するな、時には回避がレベルアップより重要だ。",
-    "第二个预言: Boss出现前, 准备好你最强的武器组合。": "第二の予言: ボスが現れる前に、最強の武器セットを準備しろ。",
-    "...有点害怕": "...少し怖い",
-    "呵呵呵...怕我? 你应该怕的是深渊本身。": "ふふふ...私が怖い? 恐れるべきは深淵そのものだ。",
-    "去吧, 年轻人。命运会指引你的。": "行け、若者よ。運命が導くだろう。",
-    "你身上的深渊气息越来越浓了...": "君の深淵の気配がどんどん濃くなってきた...",
-    "你知道吗? 杀戮太多深渊造物, 你自己也会被侵蚀。": "知っているか? 深淵の産物を殺しすぎると、君自身も侵食される。",
-    "有办法抵抗吗?": "抵抗する方法は?",
-    "唯一的办法是...变得更强。": "唯一の方法は...もっと強くなることだ。",
-    "当你的力量超越深渊, 侵蚀就无法触及你。": "君の力が深淵を超えれば、侵食は君に届かない。",
-    "角色进阶可以增强你的抗性...多收集些材料吧。": "キャラ昇格で耐性が強化される...素材を集めろ。",
-    "我不在乎": "気にしない",
-    "...真是无畏。或者说, 无知?": "...本当に恐れを知らないな。それとも、無知?",
-    "不过, 也许正是这种无畏...才是你最强的武器。": "でも、その無謀さこそが...君の最強の武器かもしれない。",
-    "这么多灵魂碎片...你收割了不少生命啊。": "こんなにソウルの欠片を...多くの命を刈り取ったのだな。",
-    "灵魂商店的升级能让你获得永久的力量。": "ソウルショップのアップグレードで永続的な力を得られる。",
-    "哪个路线最好?": "どのパスが最良?",
-    "如果你喜欢硬抗, 走\"求生之道\"...": "タンクが好きなら「生存の道」を...",
-    "如果你喜欢爆发, 走\"战斗之路\"...": "バーストが好きなら「戦闘の道」を...",
-    "但我个人推荐...\"命运之轮\"。": "でも私は...「運命の道」を薦める。",
-    "它很贵, 但效果是最独特的。": "高いが、効果は最もユニークだ。",
-    "灵魂碎片的来源?": "ソウルの欠片はどこから?",
-    "每次轮回结束, 你的击杀和存活时间都会化为碎片。": "輪廻が終わるたび、撃破数と生存時間が欠片になる。",
-    "杀的越多、活的越久, 碎片就越多。": "多く殺し、長く生きるほど、欠片が増える。",
-    "Boss也会额外掉落一些。": "ボスも追加で落とす。",
-    "又见面了...命运之线依然缠绕在你身上。": "また会ったな...運命の糸はまだ君に絡んでいる。",
-    "今天想知道什么?": "今日は何を知りたい?",
-    "今天运气如何?": "今日の運は?",
-    "星象显示...今天适合抽卡! 去试试十连吧。": "星が示す...今日は召喚日和! 10連を試せ。",
-    "嗯...今天的运势一般, 还是老老实实刷副本吧。": "うーん...運は普通だ、素直にダンジョンを回れ。",
-    "哦? 今天的命运之线异常活跃...会有好事发生!": "おや? 今日の運命の糸は異常に活発だ...良いことが起こる!",
-    "小心...今天深渊的力量格外强烈。": "気をつけろ...今日は深淵の力が特に強い。",
-    "去升级你的角色吧, 今天适合修炼。": "キャラをアップグレードしろ、今日は修練日和だ。",
-    "告诉我个秘密": "秘密を教えて",
-    "秘密? 呵呵...暴击和吸血是最强的组合。": "秘密? ふふ...会心とライフスティールは最強の組み合わせだ。",
-    "你知道吗? 每8种武器都有隐藏的协同效果。": "知っているか? 8種の武器すべてに隠されたシナジーがある。",
-    "深渊裂隙每10分钟会涌出一波精英怪...做好准备。": "深淵の裂け目は10分毎にエリート波を吐き出す...準備しろ。",
-    "传说品质的符文...能让你的冷却近乎消失。": "レジェンダリールーンは...クールダウンをほぼ消せる。",
-    "铁匠他...以前也是个深渊猎人, 只是不愿承认。": "鍛冶屋は...かつて深淵ハンターだった、認めたくないだけだ。",
-    "......": "......",
-    "类型: {title} {name} ({boss_type_name})": "タイプ: {title} {name} ({boss_type_name})",
-    "超神!! x{count}": "超神!! x{count}",
-    "无双! x{count}": "無双! x{count}",
-    "连击 x{count}": "コンボ x{count}",
-    "小型": "小型",
-    "中型": "中型",
-    "大型": "大型",
-    "巨型": "巨型",
-    "阶段": "フェーズ",
-    "火球术": "ファイアボール",
-    "雷电领域": "ライトニングフィールド",
-    "骨盾环绕": "ボーンシールド",
-    "大地尖刺": "アーススパイク",
-}
-
-TRANSLATIONS["ko"] = {
-    # Game title / menu
-    "暗夜割草者：深渊轮回": "나이트 리퍼: 심연의 윤회",
-    "暗夜割草者": "나이트 리퍼",
-    "深 渊 轮 回": "심연의 윤회",
-    "开始游戏": "게임 시작",
-    "退出游戏": "종료",
-    "语言": "언어",
-    "选择语言": "언어 선택",
-    "设置": "설정",
-    "显示设置": "화면 설정",
-    "分辨率": "해상도",
-    "显示模式": "화면 모드",
-    "窗口模式": "창 모드",
-    "全屏模式": "전체 화면",
-    "应用": "적용",
-    "ESC 返回": "ESC 돌아가기",
-    "返回": "뒤로",
-    "ESC 返回主菜单": "ESC 메뉴로 돌아가기",
-    "点击角色开始游戏": "캐릭터를 클릭하여 시작",
-    "选择角色": "캐릭터 선택",
-    "未解锁": "잠김",
-    "等级提升! Lv.{level}": "레벨 업! Lv.{level}",
-    "新武器": "새 무기",
-    "武器强化": "무기 강화",
-    "被动物品": "패시브",
-    "属性提升": "스탯 상승",
-    "已暂停": "일시정지",
-    "继续游戏": "계속하기",
-    "重新开始": "재시작",
-    "返回主菜单": "메뉴로 돌아가기",
-    "深渊吞噬了你...": "심연이 당신을 삼켰습니다...",
-    "再来一局": "다시 하기",
-    "你击败了深渊之主!": "심연의 군주를 물리쳤습니다!",
-    "灵魂商店": "영혼 상점",
-    "灵魂碎片": "영혼 파편",
-    "生存之路": "생존의 길",
-    "战斗之路": "전투의 길",
-    "探索之路": "탐험의 길",
-    "命运之路": "운명의 길",
-    "已解锁": "잠금 해제됨",
-    "花费 {cost}": "비용 {cost}",
-    "需要 {cost}": "필요 {cost}",
-    "装备 & 材料": "장비 & 재료",
-    "装备": "장비",
-    "材料": "재료",
-    "背包 ({count}/8)": "가방 ({count}/8)",
-    "强化 {cost}": "강화 {cost}",
-    "-- 空 --": "-- 비어 있음 --",
-    "等级 {level}/{max_level}": "레벨 {level}/{max_level}",
-    "升级需: {cost}": "레벨업 필요: {cost}",
-    "按 TAB 或 I 关闭": "TAB 또는 I로 닫기",
-    "[TAB] 装备/材料": "[TAB] 장비/재료",
-    "击杀:{kills}  {time}": "처치:{kills}  {time}",
-    "存活时间: {time}": "생존 시간: {time}",
-    "击杀数: {kills}": "처치 수: {kills}",
-    "最终等级: Lv.{level}": "최종 레벨: Lv.{level}",
-    "最高连击: {combo}": "최고 콤보: {combo}",
-    "获得灵魂碎片: +{souls}": "영혼 파편: +{souls}",
-    "通关时间: {time}": "클리어 시간: {time}",
-    "金币: +{gold}": "골드: +{gold}",
-    "钻石: +{diamond}": "다이아몬드: +{diamond}",
-    "总局数: {runs}  最佳击杀: {best}": "총 플레이: {runs}  최고 처치: {best}",
-    "!! BOSS来了 !!": "!! 보스 출현 !!",
-    "保存失败: {err}": "저장 실패: {err}",
-    "材料不足: ": "재료 부족: ",
-    "装备: {name} [{rarity}]": "장착: {name} [{rarity}]",
-    "获得: {name} [{rarity}]": "획득: {name} [{rarity}]",
-    "确认": "확인",
-    "进入": "입장",
-    "已满级!": "최대 레벨!",
-    "升级": "레벨업",
-    "进阶": "승급",
-    "已装备": "장착 중",
-    "穿戴": "장착",
-    "卸下": "해제",
-    "快速出售:": "빠른 판매:",
-    "无可售": "판매 없음",
-    "保留传说": "전설 보존",
-    "保留史诗+": "영웅+ 보존",
-    "保留稀有+": "희귀+ 보존",
-    "装备仓库 (点击装备到当前角色)": "장비 창고 (클릭하여 장착)",
-    "角色升级": "캐릭터 업그레이드",
-    "图 鉴": "도감",
-    "角色": "캐릭터",
-    "武器": "무기",
-    "敌人": "적",
-    "装备": "장비",
-    "Boss": "보스",
-    "??? 未发现": "??? 미발견",
-    "??? 未遭遇": "??? 미조우",
-    "??? 未击败": "??? 미격파",
-    "收集进度: {done}/{total} ({pct}%)": "수집 진행: {done}/{total} ({pct}%)",
-    "副 本 选 择": "던전 선택",
-    "金币: {gold}  钻石: {diamond}": "골드: {gold}  다이아: {diamond}",
-    "难度: {stars}": "난이도: {stars}",
-    "时限: {minutes}分钟": "제한 시간: {minutes}분",
-    "时限: 无限": "제한 시간: 무제한",
-    "通关: {count}次": "클리어: {count}회",
-    "奖励: ": "보상: ",
-    "🔒 未解锁": "🔒 잠김",
-    "需要累计击杀 {need}": "누적 처치 수 {need} 필요",
-    "🔒 角色未解锁": "🔒 캐릭터 잠김",
-    "未知": "알 수 없음",
-    "解锁条件: {cond}": "해금 조건: {cond}",
-    "当前进度: {best}/{need}": "현재 진행: {best}/{need}",
-    "已装备:": "장착 중:",
-    "需要进阶(阶{tier}) 金:{gold} 钻:{diamond}": "승급 필요(단계{tier}) G:{gold} D:{diamond}",
-    "升级: {gold}金币": "레벨업: {gold}G",
-    "◀上页": "◀ 이전",
-    "下页▶": "다음 ▶",
-    "装备召唤": "장비 소환",
-    "常规召唤": "일반 소환",
-    "消耗金币": "골드 소모",
-    "单抽: {c1}  十连: {c10}": "단발: {c1}  10연: {c10}",
-    "普通50% 优秀30% 稀有15% 史诗4% 传说1%": "일반50% 고급30% 희귀15% 영웅4% 전설1%",
-    "保底: {pity}抽必得史诗": "천장: {pity}회로 영웅 확정",
-    "超级召唤": "슈퍼 소환",
-    "消耗钻石 (仅Boss掉钻石)": "다이아 소모 (보스만 드롭)",
-    "普通10% 优秀25% 稀有35% 史诗22% 传说8%": "일반10% 고급25% 희귀35% 영웅22% 전설8%",
-    "保底: {pity}抽必得传说": "천장: {pity}회로 전설 확정",
-    "已抽: {now}/{max}": "천장: {now}/{max}",
-    "单抽": "단발",
-    "十连抽!": "10연!",
-    "— 召唤结果 —": "— 결과 —",
-    "深渊城镇": "심연 마을",
-    "与NPC交谈获取情报和建议": "NPC와 대화하여 정보와 조언 얻기",
-    "点击交谈": "클릭하여 대화",
-    "按 E 或 点击 互动": "E 또는 클릭으로 상호작용",
-    "WASD 移动  |  E 互动  |  ESC 菜单": "WASD 이동 | E 상호작용 | ESC 메뉴",
-    "金: {gold}  钻: {diamond}  魂: {soul}": "G: {gold}  D: {diamond}  S: {soul}",
-    "Boss 测试场": "보스 테스트 아레나",
-    "已暂停 (P键继续)": "일시정지 (P로 재개)",
-    "--- Boss 测试场 ---": "--- 보스 테스트 아레나 ---",
-    "WASD / 方向键 : 移动": "WASD / 방향키: 이동",
-    "鼠标点击 : 散弹射击": "마우스 클릭: 사격",
-    "1-4 : 切换Boss类型": "1-4: 보스 타입 전환",
-    "N : 下一级Boss": "N: 다음 레벨 보스",
-    "R : 重置当前Boss": "R: 현재 보스 리셋",
-    "H : 恢复满血": "H: 완전 회복",
-    "P : 暂停": "P: 일시정지",
-    "ESC : 退出": "ESC: 종료",
-    "类型: {title} {name} (阶段 {phase})": "타입: {title} {name} (페이즈 {phase})",
-    "等级: Lv.{level}  阶段: {phase}": "레벨: Lv.{level}  페이즈: {phase}",
-    "血量: {hp}/{max_hp}": "HP: {hp}/{max_hp}",
-    "玩家血量: {hp}/{max_hp}": "플레이어 HP: {hp}/{max_hp}",
-    "▲ 狂暴化 ▲": "▲ 광폭화 ▲",
-    "▲▲ 濒死暴走 ▲▲": "▲▲ 빈사 폭주 ▲▲",
-    "特殊: {spec}": "특수: {spec}",
-    "基础HP: {hp}": "기본 HP: {hp}",
-    "部位: {slot}": "부위: {slot}",
-    "基础属性提升": "기본 스탯 상승",
-    "生命 +20": "HP +20",
-    "移速 +8%": "속도 +8%",
-    "护甲 +3": "방어 +3",
-    "暴击 +3%": "치명타 +3%",
-    "回血 +0.3/s": "재생 +0.3/s",
-    "拾取 +20": "획득 +20",
-    "伤害 +8%": "피해 +8%",
-    "冷却 -5%": "쿨다운 -5%",
-    "金币": "골드",
-    "钻石": "다이아몬드",
-    "铁矿": "철",
-    "暗影": "어둠",
-    "水晶": "수정",
-    "龙鳞": "용비늘",
-    "深渊": "심연",
-    "铁矿石": "철광석",
-    "暗影精华": "어둠의 정수",
-    "魔力水晶": "마력 수정",
-    "龙鳞碎片": "용비늘 조각",
-    "深渊之心": "심연의 심장",
-    "武器": "무기",
-    "护甲": "방어구",
-    "饰品": "장신구",
-    "符文": "룬",
-    "普通": "일반",
-    "优秀": "고급",
-    "稀有": "희귀",
-    "史诗": "영웅",
-    "传说": "전설",
-    "阿什": "애쉬",
-    "暗夜猎人": "나이트 헌터",
-    "莉拉": "릴라",
-    "风行者": "윈드러너",
-    "加隆": "갈론",
-    "铁壁守卫": "아이언가드",
-    "菲奥": "피오",
-    "炽炎法师": "플레임메이지",
-    "虚无": "보이드",
-    "虚空行者": "보이드워커",
-    "死神": "리퍼",
-    "收割者": "하베스터",
-    "平衡型角色，起始武器:魔法飞弹": "밸런스형. 시작 무기: 매직 미사일",
-    "高机动角色，起始武器:回旋镖": "고기동형. 시작 무기: 부메랑",
-    "坦克角色，起始武器:骨盾环绕": "탱커형. 시작 무기: 본 실드",
-    "高伤角色，起始武器:火球术": "고화력형. 시작 무기: 파이어볼",
-    "暗杀角色，起始武器:寒冰新星": "암살형. 시작 무기: 아이스 노바",
-    "收割角色，起始武器:圣光鞭": "리퍼형. 시작 무기: 홀리 휩",
-    "魔法飞弹": "매직 미사일",
-    "自动追踪最近敌人的魔法弹": "가장 가까운 적을 자동 추적하는 마법탄",
-    "圣光鞭": "홀리 휩",
-    "近身范围扇形攻击 + 击退": "근거리 범위 부채꼴 공격 + 넉백",
-    "寒冰新星": "아이스 노바",
-    "以自身为中心释放寒冰冲击波": "자신을 중심으로 얼음 충격파 방출",
-    "烈焰之球": "플레임 오브",
-    "向随机方向发射穿透火球": "무작위 방향으로 관통 화염구 발사",
-    "雷电法阵": "라이트닝 시질",
-    "在随机位置生成持续电击区域": "무작위 위치에 지속 전격 영역 생성",
-    "白骨之盾": "본 실드",
-    "环绕角色旋转的骨盾": "캐릭터 주위를 회전하는 뼈 방패",
-    "回旋镖": "부메랑",
-    "飞出再返回，穿透所有敌人": "날아갔다 돌아옴, 모든 적 관통",
-    "地刺术": "어스 스파이크",
-    "在敌人密集处召唤地刺": "적 밀집 지역에 트랩 소환",
-    "自动追踪敌人的魔法弹幕，穿透力强": "자동 추적 마법 탄막, 강력한 관통력",
-    "以神圣之力鞭笞前方扇形区域的敌人": "신성한 힘으로 전방 부채꼴 영역의 적 타격",
-    "向四面八方释放冰弹，减速命中敌人": "사방으로 얼음탄 발사, 명중한 적 감속",
-    "发射强力火球，爆炸造成范围伤害": "강력한 화염구 발사, 폭발로 범위 피해",
-    "在周围生成雷电光圈持续电击敌人": "주변에 번개 오라 생성, 지속 전격",
-    "召唤骨盾环绕自身，触碰即伤": "뼈 방패를 소환하여 자신 둘러쌈, 접촉 시 피해",
-    "投掷回旋镖，去而复返双重伤害": "부메랑 투척, 왕복으로 2배 피해",
-    "在敌人脚下召唤地刺进行刺穿": "적 발 밑에 스파이크 소환하여 관통",
-    "骷髅杂兵": "스켈레톤 그런트",
-    "蝙蝠群": "배트 스웜",
-    "泥沼史莱姆": "스왐프 슬라임",
-    "幽灵": "고스트",
-    "自爆蜘蛛": "자폭 스파이더",
-    "骷髅弓箭手": "스켈레톤 아처",
-    "暗影法师": "섀도우 메이지",
-    "精英骑士": "엘리트 나이트",
-    "最基础的亡灵士兵，数량多但很脆弱": "기본적인 언데드 병사, 많지만 약함",
-    "高速飞行的蝙蝠群，灵活但血薄": "고속 비행 박쥐 무리, 빠르지만 약함",
-    "黏糊糊的史莱姆，死后会分裂": "끈적한 슬라임, 사망 시 분열",
-    "飘忽不定的亡灵，伤害中等": "불확실한 언데드, 중간 피해",
-    "靠近后自爆的危险蜘蛛": "접근 시 자폭하는 위험한 거미",
-    "远程射击的骷髅，保持距离作战": "원거리 사격 스켈레톤, 거리 유지",
-    "暗影魔法攻击，高伤害远程敌人": "섀도우 마법 공격, 고화력 원거리 적",
-    "全副武装的精英骑士，会冲锋": "완전무장한 엘리트 나이트, 돌진 공격",
-    "分裂": "분열",
-    "自爆": "자폭",
-    "远程": "원거리",
-    "冲锋": "돌진",
-    "骷髅王": "스켈레톤 킹",
-    "亡灵领主": "언데드 로드",
-    "召唤亡灵大军的骷髅领主，擅长范围攻击": "언데드 군단을 소환하는 스켈레톤 로드, 범위 공격 특화",
-    "毒液巨兽": "베놈 비히모스",
-    "深渊之王": "어비스 킹",
-    "喷射剧毒的深渊巨兽，毒雾弥漫战场": "맹독을 분사하는 심연의 거수, 독무가 가득한 전장",
-    "烈焰魔将": "플레임 워로드",
-    "战场霸主": "배틀 타이런트",
-    "浑身烈焰的魔族将领，火海吞噬一切": "전신이 화염에 휩싸인 마족 장군, 화염의 바다가 모든 걸 삼킴",
-    "虚空之眼": "보이드 아이",
-    "次元裂隙": "디멘션 리프트",
-    "来自虚空的恐怖存在，扭曲时空法则": "공허에서 온 공포의 존재, 시공의 법칙을 왜곡",
-    "深渊之门": "심연의 문",
-    "通往深渊的第一道裂隙，适合初入深渊者": "심연으로 가는 첫 번째 균열, 초보자용",
-    "暗影裂隙": "섀도우 리프트",
-    "暗影精华弥漫的异空间，敌人更加强大": "어둠의 정수가 가득한 이공간, 적이 더 강력함",
-    "炎魔领域": "플레임 도메인",
-    "烈焰魔将统治的火焰地域，高温炙烤": "플레임 워로드가 지배하는 화염 영역, 작열하는 열기",
-    "虚空核心": "보이드 코어",
-    "虚空之眼栖息的维度核心，终极考验": "보이드 아이가 서식하는 차원의 핵심, 최종 시련",
-    "无尽深渊": "끝없는 심연",
-    "没有时间限制的无尽模式，坚持越久奖励越丰": "시간 제한 없는 무한 모드, 오래 버틸수록 보상 증가",
-    "弹射宝石": "리코셰 젬",
-    "所有投射物 +1 弹射": "모든 투사체 +1 튕김",
-    "冰封之心": "프로즌 하트",
-    "接触敌人时自动减速": "적 접촉 시 자동 감속",
-    "燃烧之魂": "버닝 소울",
-    "10%击杀几率留下火焰地面": "10% 처치 확률로 화염 지대 남김",
-    "疾风护符": "스위프트 참",
-    "移速+15%  闪避+5%": "속도+15%  회피+5%",
-    "大地之心": "하트 오브 어스",
-    "护甲+5  击退+30%": "방어+5  넉백+30%",
-    "血色宝石": "크림슨 젬",
-    "暴击+8%  暴击伤害+30%": "치명타+8%  치명타 피해+30%",
-    "吞噬之牙": "디바우러 팽",
-    "5%生命偷取": "5% 생명력 흡수",
-    "幸运骰子": "럭키 다이스",
-    "升级选项+1 (3→4)": "업그레이드 선택지+1 (3→4)",
-    "幽冥灯笼": "네더 랜턴",
-    "拾取范围+40%  经验+10%": "획득 범위+40%  경험치+10%",
-    "战争号角": "워 혼",
-    "伤害+12%  受伤+8%": "피해+12%  받는 피해+8%",
-    "生命树苗": "라이프 새플링",
-    "每秒回血+1  每10击杀+5血": "초당 재생+1  10 처치마다 +5HP",
-    "时空碎片": "타임 샤드",
-    "全局冷却-10%": "전역 쿨다운-10%",
-    "铁短剑": "아이언 숏소드",
-    "暗影匕首": "섀도우 대거",
-    "碧焰长剑": "애저 플레임 롱소드",
-    "深渊大剑": "어비스 그레이트소드",
-    "毁灭之刃": "루인 블레이드",
-    "皮甲": "레더 아머",
-    "锁子甲": "체인메일",
-    "暗影铠甲": "섀도우 플레이트",
-    "龙鳞战甲": "드래곤스케일 아머",
-    "深渊圣甲": "어비스 세인트 아머",
-    "旅人之靴": "트래블러 부츠",
-    "疾风之翼": "스위프트 윙",
-    "闪光护符": "글림 탈리스만",
-    "传送之戒": "텔레포트 링",
-    "时间之冠": "크라운 오브 타임",
-    "初级符文": "노비스 룬",
-    "聚能符文": "채널링 룬",
-    "掠夺符文": "플런더 룬",
-    "深渊符文": "어비스 룬",
-    "创世符文": "제네시스 룬",
-    "生命": "HP",
-    "伤害%": "피해%",
-    "护甲": "방어",
-    "暴击%": "치명타%",
-    "速度%": "속도%",
-    "伤害": "피해",
-    "暴击": "치명타",
-    "暴伤": "치명피해",
-    "回复": "재생",
-    "速度": "속도",
-    "闪避": "회피",
-    "拾取": "획득",
-    "冷却": "쿨다운",
-    "经验": "경험치",
-    "吸血": "흡혈",
-    "副本传送门": "던전 게이트",
-    "进入副本挑战": "던전 입장",
-    "召唤祭坛": "소환 제단",
-    "消耗资源召唤装备": "자원을 소모하여 장비 소환",
-    "锻造工坊": "대장간",
-    "升级角色和装备": "캐릭터와 장비 업그레이드",
-    "灵魂商店": "영혼 상점",
-    "消耗灵魂碎片购物": "영혼 파편을 소모하여 구매",
-    "深渊图鉴": "심연 도감",
-    "查阅角色和装备图鉴": "캐릭터와 장비 도감 보기",
-    "冒险出发": "모험 출발",
-    "选择角色开始冒险": "캐릭터를 선택하여 모험 시작",
-    "商人·马库斯": "상인 마커스",
-    "物资交易商人": "물자 상인",
-    "长老·瑟拉斯": "장로 세라스",
-    "深渊知识长老": "심연 지식의 장로",
-    "铁匠·布鲁诺": "대장장이 브루노",
-    "武器锻造大师": "무기 단조 마스터",
-    "女巫·伊薇": "마녀 아이비",
-    "神秘魔法师": "신비한 마법사",
-    "▼ 点击继续": "▼ 클릭하여 계속",
-    "请选择:": "선택:",
-    "角色预览 - Characters Preview": "캐릭터 프리뷰",
-    "角色选择预览 (←→ 切换)": "캐릭터 프리뷰 (←→)",
-    "点击任意处跳过": "아무 곳이나 클릭하여 건너뛰기",
-    "剑士": "소드맨",
-    "法师": "메이지",
-    "弓手": "아처",
-    "刺客": "어쌔신",
-    "骑士": "나이트",
-    "召唤师": "서모너",
-    "冒险者": "어드벤처러",
-    "守墓人": "그레이브키퍼",
-    "暗影刺客": "섀도우 어쌔신",
-    "铁壁骑士": "아이언 나이트",
-    "炼金术士": "알케미스트",
-    "裂隙行者": "리프트워커",
-    "均衡型角色 · 被动: 击杀敌人5%概率回复少量生命": "밸런스형 · 패시브: 적 처치 시 5% 확률로 소량 HP 회복",
-    "高速型角色 · 被动: 闪避成功后0.5秒内移速+80%": "고속형 · 패시브: 회피 성공 후 0.5초간 속도+80%",
-    "防御型角色 · 被动: 血量低于30%时护甲翻倍": "방어형 · 패시브: HP 30% 미만일 때 방어 2배",
-    "伤害型角色 · 被动: 武器进化所需等级-2，暴击伤害+30%": "피해형 · 패시브: 무기 진화 필요 레벨-2, 치명타 피해+30%",
-    "特殊角色 · 被动: 每30秒闪现到安全位置，属性随机波动": "특수형 · 패시브: 30초마다 안전한 위치로 점멸, 스탯 무작위 변동",
-    "隐藏角色 · 被动: 击杀后1秒内攻击+100%，但生命极低": "숨겨진 캐릭터 · 패시브: 처치 후 1초간 공격+100%, 단 HP 극저",
-    "旅行商人·马库斯": "여행상인 마커스",
-    "深渊行商": "심연 상인",
-    "暗夜长老·瑟拉斯": "나이트 엘더 세라스",
-    "先知": "예언자",
-    "锻造大师": "단조 마스터",
-    "神秘女巫·伊薇": "신비한 마녀 아이비",
-    "命运编织者": "운명의 직조자",
-    "哦? 新面孔! 欢迎来到深渊的边缘, 旅行者。": "오? 새로운 얼굴! 심연의 가장자리에 오신 걸 환영합니다, 여행자.",
-    "我是马库斯, 在这片黑暗中做些小生意。": "저는 마커스, 이 어둠 속에서 작은 장사를 하고 있죠.",
-    "别被外面的怪物吓到了, 只要你有金币, 我什么都卖。": "밖의 몬스터에 겁먹지 마세요, 골드만 있다면 뭐든 팔아드립니다.",
-    "你都卖些什么?": "뭘 파나요?",
-    "武器、护甲、稀有符文...只要你出得起价。": "무기, 방어구, 희귀 룬... 값을 치를 수만 있다면요.",
-    "去\"装备召唤\"看看吧，碰碰运气说不定有好东西！": "「장비 소환」을 보세요, 운이 좋으면 좋은 게 나올 수도!",
-    "这里安全吗?": "여기 안전한가요?",
-    "嘿嘿，只要你不欠我钱，这里就是最安全的。": "헤헤, 제게 빚만 지지 않는다면 여기가 가장 안전하죠.",
-    "不过说真的，深渊的裂隙越来越不稳定了...": "하지만 진짜로, 심연의 균열이 점점 불안정해지고 있어요...",
-    "告辞": "그럼",
-    "又来了? 上次教你的保命技巧用上了吗?": "다시 왔나? 지난번에 가르쳐준 생존 기술은 썼나?",
-    "看你这副样子...大概没用上吧。": "그 모습을 보니... 아마 안 쓴 것 같군.",
-    "教我更多技巧": "더 가르쳐주세요",
-    "要诀只有一个: 不要停下脚步!": "비결은 하나뿐: 멈추지 마라!",
-    "在深渊中站着不动就是等死。持续移动，让武器自动清场。": "심연에서 가만히 서있으면 죽는 거다. 계속 움직이고, 무기가 알아서 쓸도록 해라.",
-    "经验宝石要尽量捡, 等级越高武器越强。": "경험치 젬은 최대한 먹어라, 레벨이 높을수록 무기가 강해진다.",
-    "你有什么好货?": "좋은 물건 있나요?",
-    "好东西可不便宜哦～": "좋은 건 비싸요~",
-    "去抽卡池碰碰运气, 或者攒到好装备来找铁匠升级。": "뽑기로 운 시험해보거나, 좋은 장비 모아서 대장장이한테 가서 업그레이드하세요.",
-    "下次再说": "다음에",
-    "欢迎回来, 老朋友!": "돌아오신 걸 환영합니다, 친구!",
-    "生意如何? 最近深渊里的怪物越来越多了。": "장사는 어때요? 최근 심연의 몬스터가 점점 많아지고 있어요.",
-    "最近有什么新情报?": "최근 새로운 정보는?",
-    "你听说了吗? 深渊的最深处好像出现了一道新的裂隙。": "들었나요? 심연의 최심부에 새로운 균열이 나타난 것 같아요.",
-    "据说穿过那里可以到达更危险的领域...": "거기를 통과하면 더 위험한 영역에 도달할 수 있다고...",
-    "不过回报也会更丰厚。试试副本挑战吧。": "하지만 보상도 더 풍성하죠. 던전 도전을 해보세요.",
-    "我需要更强的装备": "더 강한 장비가 필요해요",
-    "看你的装备...确实该升级了。": "그 장비로는... 확실히 업그레이드가 필요하네요.",
-    "多打几个Boss吧, 钻石可以用来进行超级召唤。": "보스를 많이 잡으세요, 다이아로 슈퍼 소환을 할 수 있어요.",
-    "传说品质的装备, 可是每个战士的梦想啊!": "전설 등급 장비는 모든 전사의 꿈이죠!",
-    "只是路过": "그냥 지나가는 길",
-    "哇哦, 大客户驾到!": "와, 큰손님이시네요!",
-    "看你金光闪闪的钱袋...今天想看点什么?": "그 반짝이는 돈주머니를 보니... 오늘은 뭘 보실까요?",
-    "随便看看": "그냥 보는 것뿐",
-    "有钱任性啊! 记得多去抽几次十连, 说不定能抽到传说装备!": "부자시네! 10연을 여러 번 해보세요, 전설 장비가 나올 수도!",
-    "唉, 你看起来也没什么钱的样子。": "휴, 돈이 없어 보이는군요.",
-    "不过别灰心, 多打几局副本就有金币了。": "하지만 실망하지 마세요, 던전 몇 번 하면 골드가 모입니다.",
-    "确实没钱": "확실히 돈이 없어요",
-    "去刷刷小怪吧, 实在不行还有灵魂商店。": "잡몹 사냥이나 하세요, 안 되면 영혼 상점도 있어요.",
-    "那里用灵魂碎片也能换到不少好东西。": "거기서 영혼 파편으로 좋은 것들을 얻을 수 있습니다.",
-    "哼, 走了": "흥, 갑니다",
-    "嗨, 来了! 今天想要点什么?": "안녕, 왔군요! 오늘은 뭘 원하시나요?",
-    "聊聊天": "이야기하자",
-    "深渊啊...说实话我也不知道自己为什么在这做生意。": "심연이라... 솔직히 내가 왜 여기서 장사하는지 모르겠어요.",
-    "大概是因为只有这里的客人...嗯...不挑剔吧。": "아마 여기 손님들만이... 음... 까다롭지 않아서겠죠.",
-    "买东西": "뭔가 살게요",
-    "去主菜单的\"装备召唤\"或\"灵魂商店\"吧, 我这没有直接卖的。": "메인 메뉴의 「장비 소환」이나 「영혼 상점」으로 가세요, 여긴 직접 파는 게 없어요.",
-    "不过如果你装备够多, 去\"角色升级\"里可以穿戴上哟。": "하지만 장비가 충분하다면, 「캐릭터 업그레이드」에서 착용할 수 있어요.",
-    "离开": "떠날게요",
-    "...你终于来了。": "...드디어 왔군.",
-    "我等这一刻已经很久了, 暗夜猎人。": "이 순간을 오래 기다렸다, 나이트 헌터.",
-    "深渊的力量正在侵蚀这片大地, 而你是唯一的希望。": "심연의 힘이 이 대지를 잠식하고 있다, 그대가 유일한 희망이다.",
-    "我是谁?": "나는 누구인가요?",
-    "你是被深渊选中的人。每次死亡, 你都会从轮回中归来。": "그대는 심연에게 선택받은 자다. 죽을 때마다 윤회에서 돌아온다.",
-    "这既是诅咒, 也是祝福。": "그것은 저주이자 축복이다.",
-    "利用每次轮回积累的力量, 终有一天你能击败深渊之王。": "매 윤회마다 쌓인 힘을 이용하면, 언젠가 심연의 왕을 물리칠 수 있다.",
-    "深渊是什么?": "심연이란?",
-    "深渊...是另一个维度的裂隙。": "심연은... 다른 차원의 균열이다.",
-    "它吞噬生命, 扭曲现实, 不断向我们的世界渗透。": "생명을 삼키고 현실을 왜곡하며, 우리 세계로 계속 침투한다.",
-    "那些怪物, 都是从裂隙中涌出的深渊造物。": "그 몬스터들은 균열에서 쏟아진 심연의 피조물이다.",
-    "轮回者, 你的旅程才刚刚开始。": "윤회자여, 그대의 여정은 이제 시작일 뿐이다.",
-    "不要气馁, 每一次死亡都让你变得更强。": "낙담하지 말라, 죽을 때마다 더 강해진다.",
-    "我该怎么做?": "어떻게 해야 하나요?",
-    "升级你的角色, 强化你的装备。": "캐릭터를 업그레이드하고, 장비를 강화하라.",
-    "灵魂商店中的永久加成对你大有裨益。": "영혼 상점의 영구 버프가 큰 도움이 될 것이다.",
-    "当你准备好了, 挑战更深层的副本。": "준비가 되면, 더 깊은 던전에 도전하라.",
-    "你是谁?": "당신은 누구죠?",
-    "我是瑟拉斯, 这片灰暗之地最后的守望者。": "나는 세라스, 이 회색 땅의 마지막 감시자다.",
-    "在深渊吞噬一切之前, 我会尽我所能指引你。": "심연이 모든 것을 삼키기 전에, 최선을 다해 그대를 인도하겠다.",
-    "我知道了": "알겠습니다",
-    "你的力量...已经超越了我的预期。": "그대의 힘은... 내 예상을 넘어섰다.",
-    "千魂之杀, 你已经证明了自己的实力。": "천 영혼을 도륙하며, 스스로의 힘을 증명했다.",
-    "最终的敌人在哪?": "최종 적은 어디에?",
-    "在深渊的最深处, 有一个存在...": "심연의 최심부에, 한 존재가...",
-    "\"虚空之眼\"...它是一切混沌的源头。": "「보이드 아이」... 그것은 모든 혼돈의 근원이다.",
-    "当你的力量足够时, 它会出现在你面前。": "그대의 힘이 충분해지면, 그것이 앞에 나타날 것이다.",
-    "我还能更强吗?": "더 강해질 수 있나요?",
-    "力量没有尽头, 但代价也是如此。": "힘에는 끝이 없지만, 대가도 그러하다.",
-    "不断轮回下去, 你终将达到凡人的极限...": "윤회를 계속하다 보면, 결국 인간의 한계에 도달할 것이다...",
-    "然后, 超越它。": "그리고, 그것을 넘어서라.",
-    "老朋友, 你看起来疲惫了。": "친구여, 피곤해 보이는군.",
-    "在深渊中战斗这么久, 你有没有想过放弃?": "심연에서 이렇게 오래 싸우면서, 포기하고 싶었던 적은?",
-    "从未想过": "한 번도 없습니다",
-    "...好。这就是你被选中的原因。": "...좋다. 그것이 그대가 선택받은 이유다.",
-    "坚定的意志, 比任何武器都锋利。": "확고한 의지는 어떤 무기보다도 날카롭다.",
-    "有时候会": "가끔 있어요",
-    "这很正常。连我也曾动摇过。": "그것은 정상이다. 나조차도 흔들린 적이 있다.",
-    "但请记住, 你守护的不只是自己。": "하지만 기억하라, 그대가 지키는 것은 자신만이 아니다.",
-    "每一个被深渊吞噬的灵魂, 都在等你拯救。": "심연에 삼켜진 모든 영혼이 그대의 구원을 기다리고 있다.",
-    "你说多了": "너무 말이 많네요",
-    "命运的齿轮在转动...": "운명의 톱니바퀴가 돌아가고 있다...",
-    "做好准备, 暗夜猎人。": "준비하라, 나이트 헌터.",
-    "有什么建议?": "조언이 있나요?",
-    "多多收集材料, 强化你的角色。": "재료를 많이 모아, 캐릭터를 강화하라.",
-    "铁矿、暗影精华、水晶...这些都是进阶所需。": "철광석, 어둠의 정수, 수정... 이것들은 모두 승급에 필요하다.",
-    "副本深处有更稀有的龙鳞和深渊结晶。": "던전 깊은 곳에 더 희귀한 용비늘과 심연 결정이 있다.",
-    "嘿! 你连件像样的装备都没有?!": "이봐! 제대로 된 장비도 없어?!",
-    "赶紧去抽几件来, 我好给你打造打造!": "빨리 몇 개 뽑아와, 내가 단조해줄 테니!",
-    "去哪弄装备?": "장비는 어디서 구하나요?",
-    "主菜单有\"装备召唤\", 花点金币或钻石就行。": "메인 메뉴에 「장비 소환」이 있어, 골드나 다이아 좀 쓰면 돼.",
-    "抽到装备后到\"角色升级\"界面, 就能穿上了!": "장비를 뽑으면 「캐릭터 업그레이드」에서 착용할 수 있어!",
-    "有好装备再来找我升级!": "좋은 장비 있으면 업그레이드하러 와!",
-    "好的": "알겠습니다",
-    "噢! 这些装备...品质不错啊!": "오! 이 장비... 품질이 괜찮은데!",
-    "想让我帮你锻造升级吗?": "내가 단조해서 업그레이드해줄까?",
-    "怎么升级装备?": "장비는 어떻게 업그레이드하나요?",
-    "在\"角色升级\"界面, 每件装备旁边有升级按钮。": "「캐릭터 업그레이드」 화면에서, 각 장비 옆에 업그레이드 버튼이 있어.",
-    "花点金币就能提升装备等级, 属性会越来越强。": "골드 좀 쓰면 장비 레벨이 올라가고, 스탯도 점점 강해져.",
-    "史诗和传说品质的装备提升幅度最大!": "영웅과 전설 등급 장비가 가장 많이 강화돼!",
-    "材料怎么获得?": "재료는 어떻게 얻나요?",
-    "打怪会掉铁矿, 这是最基础的材料。": "몬스터 잡으면 철광석 떨어져, 기본 재료야.",
-    "暗影精华要打更强的怪, 水晶在副本里比较多。": "어둠의 정수는 더 강한 적을 잡아야 하고, 수정은 던전에 많아.",
-    "龙鳞和深渊结晶...只有高级副本的Boss才会掉。": "용비늘과 심연 결정은... 고급 던전 보스만 떨어뜨려.",
-    "改天再来": "다음에 올게요",
-    "欢迎来到我的锻造铺! 有什么要修理的?": "내 대장간에 온 걸 환영해! 수리할 게 있어?",
-    "聊聊锻造": "단조 이야기",
-    "锻造嘛, 就是我的命。": "단조는, 내 목숨이지.",
-    "给我材料和金币, 没有我打不出的装备!": "재료와 골드만 주면, 못 만드는 장비가 없어!",
-    "不过最好的装备...还是得靠召唤池碰运气。": "하지만 최고의 장비는... 소환 풀로 운을 시험해야 돼.",
-    "你看起来很壮": "튼튼해 보이네요",
-    "哈哈! 每天抡锤子, 想不壮都难!": "하하! 매일 망치질하는데, 튼튼하지 않으면 이상하지!",
-    "深渊里的怪物? 给我一把好锤子, 我也能打!": "심연의 몬스터? 좋은 망치만 주면, 나도 싸울 수 있어!",
-    "走了": "갑니다",
-    "呵呵呵...一个新的灵魂来到了深渊的边缘。": "후후후... 새로운 영혼이 심연의 가장자리에 왔군.",
-    "命运之线在你身上缠绕...有趣。": "운명의 실이 그대에게 얽혀있군... 흥미롭다.",
-    "我? 我是伊薇, 有人叫我女巫, 有人叫我预言者。": "나? 나는 아이비, 마녀라 부르는 이도 있고 예언자라 부르는 이도 있지.",
-    "我编织命运之线, 也解读它们的走向。": "운명의 실을 짜고, 그것의 행방을 읽는다.",
-    "你的线...很特别。缠绕着死亡, 却每次都重新连接。": "그대의 실은... 특별하다. 죽음에 얽혀있지만, 매번 다시 연결된다.",
-    "你能帮我吗?": "도와주실 수 있나요?",
-    "帮你? 我能给你的只有预言。": "돕는다? 내가 줄 수 있는 건 예언뿐이다.",
-    "第一个预言: 不要贪恋经验, 有时候躲避比升级更重要。": "첫 번째 예언: 경험치에 집착하지 마라, 때로는 회피가 레벨업보다 중요하다.",
-    "第二个预言: Boss出现前, 准备好你最强的武器组合。": "두 번째 예언: 보스가 나타나기 전에, 최강의 무기 조합을 준비하라.",
-    "...有点害怕": "...좀 무서워요",
-    "呵呵呵...怕我? 你应该怕的是深渊本身。": "후후후... 나를 두려워하나? 두려워해야 할 것은 심연 그 자체다.",
-    "去吧, 年轻人。命运会指引你的。": "가거라, 젊은이여. 운명이 그대를 인도할 것이다.",
-    "你身上的深渊气息越来越浓了...": "그대의 심연 기운이 점점 짙어지고 있다...",
-    "你知道吗? 杀戮太多深渊造物, 你自己也会被侵蚀。": "알고 있나? 심연의 피조물을 너무 많이 죽이면, 그대도 침식된다.",
-    "有办法抵抗吗?": "저항할 방법은?",
-    "唯一的办法是...变得更强。": "유일한 방법은... 더 강해지는 것이다.",
-    "当你的力量超越深渊, 侵蚀就无法触及你。": "그대의 힘이 심연을 넘어서면, 침식은 그대에게 닿을 수 없다.",
-    "角色进阶可以增强你的抗性...多收集些材料吧。": "캐릭터 승급으로 저항력을 강화할 수 있다... 재료를 많이 모아라.",
-    "我不在乎": "신경 안 써요",
-    "...真是无畏。或者说, 无知?": "...정말 두려움이 없군. 아니면, 무지한가?",
-    "不过, 也许正是这种无畏...才是你最强的武器。": "하지만, 어쩌면 바로 그 두려움 없음이... 그대의 가장 강한 무기일 수도.",
-    "这么多灵魂碎片...你收割了不少生命啊。": "이렇게 많은 영혼 파편... 많은 생명을 거두었군.",
-    "灵魂商店的升级能让你获得永久的力量。": "영혼 상점의 업그레이드로 영구적인 힘을 얻을 수 있다.",
-    "哪个路线最好?": "어느 경로가 가장 좋나요?",
-    "如果你喜欢硬抗, 走\"求生之道\"...": "탱커를 좋아한다면, 「생존의 길」을...",
-    "如果你喜欢爆发, 走\"战斗之路\"...": "폭딜을 좋아한다면, 「전투의 길」을...",
-    "但我个人推荐...\"命运之轮\"。": "하지만 개인적으로는... 「운명의 길」을 추천한다.",
-    "它很贵, 但效果是最独特的。": "비싸지만, 효과는 가장 독특하다.",
-    "灵魂碎片的来源?": "영혼 파편은 어디서?",
-    "每次轮回结束, 你的击杀和存活时间都会化为碎片。": "매 윤회가 끝날 때마다, 처치 수와 생존 시간이 파편이 된다.",
-    "杀的越多、活的越久, 碎片就越多。": "많이 죽이고 오래 살수록, 파편도 많아진다.",
-    "Boss也会额外掉落一些。": "보스도 추가로 떨어뜨린다.",
-    "又见面了...命运之线依然缠绕在你身上。": "다시 만났군... 운명의 실은 여전히 그대에게 얽혀있다.",
-    "今天想知道什么?": "오늘은 무엇을 알고 싶은가?",
-    "今天运气如何?": "오늘 운은?",
-    "星象显示...今天适合抽卡! 去试试十连吧。": "별자리가 보여주는 건... 오늘은 뽑기하기 좋은 날! 10연을 시도해봐라.",
-    "嗯...今天的运势一般, 还是老老实实刷副本吧。": "음... 오늘 운세는 보통이다, 그냥 던전이나 돌려라.",
-    "哦? 今天的命运之线异常活跃...会有好事发生!": "오? 오늘 운명의 실이 이상하게 활발하다... 좋은 일이 일어날 것이다!",
-    "小心...今天深渊的力量格外强烈。": "조심해라... 오늘은 심연의 힘이 특히 강하다.",
-    "去升级你的角色吧, 今天适合修炼。": "캐릭터를 업그레이드해라, 오늘은 수련하기 좋은 날이다.",
-    "告诉我个秘密": "비밀을 알려주세요",
-    "秘密? 呵呵...暴击和吸血是最强的组合。": "비밀? 후후... 치명타와 흡혈은 최강의 조합이다.",
-    "你知道吗? 每8种武器都有隐藏的协同效果。": "알고 있나? 8종의 무기 모두 숨겨진 시너지가 있다.",
-    "深渊裂隙每10分钟会涌出一波精英怪...做好准备。": "심연의 균열은 10분마다 엘리트 몬스터 웨이브를 쏟아낸다... 준비하라.",
-    "传说品质的符文...能让你的冷却近乎消失。": "전설 등급 룬은... 쿨다운을 거의 사라지게 할 수 있다.",
-    "铁匠他...以前也是个深渊猎人, 只是不愿承认。": "대장장이는... 예전에 심연 헌터였다, 인정하기 싫어할 뿐이지.",
-    "......": "......",
-    "类型: {title} {name} ({boss_type_name})": "타입: {title} {name} ({boss_type_name})",
-    "超神!! x{count}": "갓모드!! x{count}",
-    "无双! x{count}": "무쌍! x{count}",
-    "连击 x{count}": "콤보 x{count}",
-    "小型": "소형",
-    "中型": "중형",
-    "大型": "대형",
-    "巨型": "거대",
-    "阶段": "페이즈",
-    "火球术": "파이어볼",
-    "雷电领域": "라이트닝 필드",
-    "骨盾环绕": "본 실드",
-    "大地尖刺": "어스 스파이크",
-}
-
-TRANSLATIONS["ru"] = {
-    "暗夜割草者：深渊轮回": "Жнец Ночи: Цикл Бездны",
-    "暗夜割草者": "Жнец Ночи",
-    "深 渊 轮 回": "ЦИКЛ БЕЗДНЫ",
-    "开始游戏": "Начать игру",
-    "退出游戏": "Выход",
-    "语言": "Язык",
-    "选择语言": "Выбор языка",
-    "设置": "Настройки",
-    "显示设置": "Настройки экрана",
-    "分辨率": "Разрешение",
-    "显示模式": "Режим экрана",
-    "窗口模式": "Оконный",
-    "全屏模式": "Полноэкранный",
-    "应用": "Применить",
-    "ESC 返回": "ESC Назад",
-    "返回": "Назад",
-    "ESC 返回主菜单": "ESC Главное меню",
-    "点击角色开始游戏": "Нажмите на персонажа для начала",
-    "选择角色": "Выбор персонажа",
-    "未解锁": "Заблокировано",
-    "等级提升! Lv.{level}": "Уровень повышен! Lv.{level}",
-    "新武器": "Новое оружие",
-    "武器强化": "Улучшение оружия",
-    "被动物品": "Пассивные предметы",
-    "属性提升": "Улучшение характеристик",
-    "已暂停": "Пауза",
-    "继续游戏": "Продолжить",
-    "重新开始": "Начать заново",
-    "返回主菜单": "В главное меню",
-    "深渊吞噬了你...": "Бездна поглотила вас...",
-    "再来一局": "Еще раз",
-    "你击败了深渊之主!": "Вы победили Владыку Бездны!",
-    "灵魂商店": "Магазин душ",
-    "灵魂碎片": "Осколки душ",
-    "生存之路": "Путь выживания",
-    "战斗之路": "Путь битвы",
-    "探索之路": "Путь исследования",
-    "命运之路": "Путь судьбы",
-    "已解锁": "Разблокировано",
-    "花费 {cost}": "Стоимость {cost}",
-    "需要 {cost}": "Требуется {cost}",
-    "装备 & 材料": "Снаряжение и материалы",
-    "装备": "Снаряжение",
-    "材料": "Материалы",
-    "背包 ({count}/8)": "Сумка ({count}/8)",
-    "强化 {cost}": "Усиление {cost}",
-    "-- 空 --": "-- Пусто --",
-    "等级 {level}/{max_level}": "Уровень {level}/{max_level}",
-    "升级需: {cost}": "Для повышения: {cost}",
-    "按 TAB 或 I 关闭": "TAB или I для закрытия",
-    "[TAB] 装备/材料": "[TAB] Снаряжение/Материалы",
-    "击杀:{kills}  {time}": "Убийств:{kills}  {time}",
-    "存活时间: {time}": "Время выживания: {time}",
-    "击杀数: {kills}": "Убийств: {kills}",
-    "最终等级: Lv.{level}": "Финальный уровень: Lv.{level}",
-    "最高连击: {combo}": "Лучшее комбо: {combo}",
-    "获得灵魂碎片: +{souls}": "Осколков душ: +{souls}",
-    "通关时间: {time}": "Время прохождения: {time}",
-    "金币: +{gold}": "Золото: +{gold}",
-    "钻石: +{diamond}": "Алмазы: +{diamond}",
-    "总局数: {runs}  最佳击杀: {best}": "Всего игр: {runs}  Лучший результат: {best}",
-    "!! BOSS来了 !!": "!! БОСС ПОЯВИЛСЯ !!",
-    "保存失败: {err}": "Сохранение не удалось: {err}",
-    "材料不足: ": "Недостаточно материалов: ",
-    "装备: {name} [{rarity}]": "Экипировано: {name} [{rarity}]",
-    "获得: {name} [{rarity}]": "Получено: {name} [{rarity}]",
-    "确认": "Подтвердить",
-    "进入": "Войти",
-    "已满级!": "Максимальный уровень!",
-    "升级": "Повысить уровень",
-    "进阶": "Восхождение",
-    "已装备": "Экипировано",
-    "穿戴": "Надеть",
-    "卸下": "Снять",
-    "快速出售:": "Быстрая продажа:",
-    "无可售": "Нечего продавать",
-    "保留传说": "Сохранить легендарное",
-    "保留史诗+": "Сохранить эпическое+",
-    "保留稀有+": "Сохранить редкое+",
-    "装备仓库 (点击装备到当前角色)": "Хранилище (клик для экипировки)",
-    "角色升级": "Улучшение персонажа",
-    "图 鉴": "Кодекс",
-    "角色": "Персонажи",
-    "武器": "Оружие",
-    "敌人": "Враги",
-    "装备": "Снаряжение",
-    "Boss": "Боссы",
-    "??? 未发现": "??? Не найдено",
-    "??? 未遭遇": "??? Не встречено",
-    "??? 未击败": "??? Не побеждено",
-    "收集进度: {done}/{total} ({pct}%)": "Прогресс: {done}/{total} ({pct}%)",
-    "副 本 选 择": "Выбор подземелья",
-    "金币: {gold}  钻石: {diamond}": "Золото: {gold}  Алмазы: {diamond}",
-    "难度: {stars}": "Сложность: {stars}",
-    "时限: {minutes}分钟": "Ограничение: {minutes} мин",
-    "时限: 无限": "Ограничение: Нет",
-    "通关: {count}次": "Прохождений: {count}",
-    "奖励: ": "Награды: ",
-    "🔒 未解锁": "🔒 Заблокировано",
-    "需要累计击杀 {need}": "Требуется {need} убийств",
-    "🔒 角色未解锁": "🔒 Персонаж заблокирован",
-    "未知": "Неизвестно",
-    "解锁条件: {cond}": "Условие: {cond}",
-    "当前进度: {best}/{need}": "Прогресс: {best}/{need}",
-    "已装备:": "Экипировано:",
-    "需要进阶(阶{tier}) 金:{gold} 钻:{diamond}": "Нужно восхождение (ур.{tier}) З:{gold} А:{diamond}",
-    "升级: {gold}金币": "Повышение: {gold}З",
-    "◀上页": "◀ Пред",
-    "下页▶": "След ▶",
-    "装备召唤": "Призыв снаряжения",
-    "常规召唤": "Обычный призыв",
-    "消耗金币": "Потратить золото",
-    "单抽: {c1}  十连: {c10}": "Один: {c1}  Десять: {c10}",
-    "普通50% 优秀30% 稀有15% 史诗4% 传说1%": "Обычное 50% Необычное 30% Редкое 15% Эпическое 4% Легендарное 1%",
-    "保底: {pity}抽必得史诗": "Гарантия: {pity} для эпического",
-    "超级召唤": "Супер призыв",
-    "消耗钻石 (仅Boss掉钻石)": "Потратить алмазы (только с боссов)",
-    "普通10% 优秀25% 稀有35% 史诗22% 传说8%": "Обычное 10% Необычное 25% Редкое 35% Эпическое 22% Легендарное 8%",
-    "保底: {pity}抽必得传说": "Гарантия: {pity} для легендарного",
-    "已抽: {now}/{max}": "Счётчик: {now}/{max}",
-    "单抽": "Один",
-    "十连抽!": "Десять!",
-    "— 召唤结果 —": "— Результаты —",
-    "深渊城镇": "Город Бездны",
-    "与NPC交谈获取情报和建议": "Говорите с NPC для информации и советов",
-    "点击交谈": "Нажмите для разговора",
-    "按 E 或 点击 互动": "E или клик для взаимодействия",
-    "WASD 移动  |  E 互动  |  ESC 菜单": "WASD Движение | E Взаимодействие | ESC Меню",
-    "金: {gold}  钻: {diamond}  魂: {soul}": "З: {gold}  А: {diamond}  Д: {soul}",
-    "Boss 测试场": "Арена тестирования боссов",
-    "已暂停 (P键继续)": "Пауза (P для продолжения)",
-    "--- Boss 测试场 ---": "--- Арена тестирования боссов ---",
-    "WASD / 方向键 : 移动": "WASD / Стрелки: Движение",
-    "鼠标点击 : 散弹射击": "Клик мыши: Выстрел",
-    "1-4 : 切换Boss类型": "1-4: Сменить тип босса",
-    "N : 下一级Boss": "N: Следующий уровень",
-    "R : 重置当前Boss": "R: Сбросить босса",
-    "H : 恢复满血": "H: Полное восстановление",
-    "P : 暂停": "P: Пауза",
-    "ESC : 退出": "ESC: Выход",
-    "类型: {title} {name} (阶段 {phase})": "Тип: {title} {name} (Фаза {phase})",
-    "等级: Lv.{level}  阶段: {phase}": "Уровень: Lv.{level}  Фаза: {phase}",
-    "血量: {hp}/{max_hp}": "HP: {hp}/{max_hp}",
-    "玩家血量: {hp}/{max_hp}": "Игрок HP: {hp}/{max_hp}",
-    "▲ 狂暴化 ▲": "▲ Берсерк ▲",
-    "▲▲ 濒死暴走 ▲▲": "▲▲ Отчаяние ▲▲",
-    "特殊: {spec}": "Особое: {spec}",
-    "基础HP: {hp}": "Базовое HP: {hp}",
-    "部位: {slot}": "Слот: {slot}",
-    "基础属性提升": "Базовое улучшение",
-    "生命 +20": "HP +20",
-    "移速 +8%": "Скорость +8%",
-    "护甲 +3": "Броня +3",
-    "暴击 +3%": "Крит +3%",
-    "回血 +0.3/s": "Реген +0.3/с",
-    "拾取 +20": "Подбор +20",
-    "伤害 +8%": "Урон +8%",
-    "冷却 -5%": "КД -5%",
-    "金币": "Золото",
-    "钻石": "Алмазы",
-    "铁矿": "Железо",
-    "暗影": "Тень",
-    "水晶": "Кристалл",
-    "龙鳞": "Чешуя",
-    "深渊": "Бездна",
-    "铁矿石": "Железная руда",
-    "暗影精华": "Эссенция тьмы",
-    "魔力水晶": "Магический кристалл",
-    "龙鳞碎片": "Осколок чешуи дракона",
-    "深渊之心": "Сердце Бездны",
-    "武器": "Оружие",
-    "护甲": "Броня",
-    "饰品": "Аксессуар",
-    "符文": "Руна",
-    "普通": "Обычный",
-    "优秀": "Необычный",
-    "稀有": "Редкий",
-    "史诗": "Эпический",
-    "传说": "Легендарный",
-    "阿什": "Эш",
-    "暗夜猎人": "Ночной Охотник",
-    "莉拉": "Лира",
-    "风行者": "Ветробежец",
-    "加隆": "Гарон",
-    "铁壁守卫": "Железный Страж",
-    "菲奥": "Фио",
-    "炽炎法师": "Огненный Маг",
-    "虚无": "Войд",
-    "虚空行者": "Хождение по Пустоте",
-    "死神": "Жнец",
-    "收割者": "Собиратель",
-    "平衡型角色，起始武器:魔法飞弹": "Сбалансированный. Стартовое оружие: Магическая ракета",
-    "高机动角色，起始武器:回旋镖": "Высокая мобильность. Стартовое оружие: Бумеранг",
-    "坦克角色，起始武器:骨盾环绕": "Танк. Стартовое оружие: Костяной щит",
-    "高伤角色，起始武器:火球术": "Высокий урон. Стартовое оружие: Огненный шар",
-    "暗杀角色，起始武器:寒冰新星": "Ассасин. Стартовое оружие: Ледяная нова",
-    "收割角色，起始武器:圣光鞭": "Жнец. Стартовое оружие: Святой хлыст", "魔法飞弹": "Магическая ракета",
-    "自动追踪最近敌人的魔法弹": "Автонаведение на ближайшего врага",
-    "圣光鞭": "Святой хлыст",
-    "近身范围扇形攻击 + 击退": "Ближний конус атаки + откидывание",
-    "寒冰新星": "Ледяная нова",
-    "以自身为中心释放寒冰冲击波": "Ледяная волна от себя",
-    "烈焰之球": "Огненная сфера",
-    "向随机方向发射穿透火球": "Огненный шар в случайном направлении",
-    "雷电法阵": "Печать молнии",
-    "在随机位置生成持续电击区域": "Зона электрошока в случайном месте",
-    "白骨之盾": "Костяной щит",
-    "环绕角色旋转的骨盾": "Вращающийся костяной щит",
-    "回旋镖": "Бумеранг",
-    "飞出再返回，穿透所有敌人": "Летит и возвращается, пробивая всех",
-    "地刺术": "Земляные шипы",
-    "在敌人密集处召唤地刺": "Призывает шипы под группой врагов",
-    "自动追踪敌人的魔法弹幕，穿透力强": "Автонаведение, высокое пробитие",
-    "以神圣之力鞭笞前方扇形区域的敌人": "Святая сила в переднем конусе",
-    "向四面八方释放冰弹，减速命中敌人": "Ледяные болты во все стороны, замедляют",
-    "发射强力火球，爆炸造成范围伤害": "Мощный огненный шар с взрывом",
-    "在周围生成雷电光圈持续电击敌人": "Электрическая аура вокруг",
-    "召唤骨盾环绕自身，触碰即伤": "Призывает костяные щиты, урон при контакте",
-    "投掷回旋镖，去而复返双重伤害": "Бросает бумеранг, двойной урон",
-    "在敌人脚下召唤地刺进行刺穿": "Призывает шипы под ногами врагов",
-    "骷髅杂兵": "Скелет-новобранец",
-    "蝙蝠群": "Стая летучих мышей",
-    "泥沼史莱姆": "Болотный слайм",
-    "幽灵": "Призрак",
-    "自爆蜘蛛": "Паук-камикадзе",
-    "骷髅弓箭手": "Скелет-лучник",
-    "暗影法师": "Теневой маг",
-    "精英骑士": "Элитный рыцарь",
-    "最基础的亡灵士兵，数量多但很脆弱": "Базовая нежить, много но слабы",
-    "高速飞行的蝙蝠群，灵活但血薄": "Быстрые летучие мыши, слабые",
-    "黏糊糊的史莱姆，死后会分裂": "Липкий слайм, делится при смерти",
-    "飘忽不定的亡灵，伤害中等": "Призрачная нежить, средний урон",
-    "靠近后自爆的危险蜘蛛": "Взрывается при приближении",
-    "远程射击的骷髅，保持距离作战": "Дальнобойный скелет, держит дистанцию",
-    "暗影魔法攻击，高伤害远程敌人": "Теневая магия, высокий урон",
-    "全副武装的精英骑士，会冲锋": "Хорошо вооружённый, атакует рывком",
-    "分裂": "Деление",
-    "自爆": "Взрыв",
-    "远程": "Дальний бой",
-    "冲锋": "Рывок",
-    "骷髅王": "Король Скелетов",
-    "亡灵领主": "Лорд Нежити",
-    "召唤亡灵大军的骷髅领主，擅长范围攻击": "Призывает нежить, мастер АОЕ",
-    "毒液巨兽": "Ядовитый Бегемот",
-    "深渊之王": "Король Бездны",
-    "喷射剧毒的深渊巨兽，毒雾弥漫战场": "Брызжет ядом, отравляет поле боя",
-    "烈焰魔将": "Огненный Военачальник",
-    "战场霸主": "Тиран Битвы",
-    "浑身烈焰的魔族将领，火海吞噬一切": "Пылающий демон, огненное море",
-    "虚空之眼": "Глаз Бездны",
-    "次元裂隙": "Разлом Измерений",
-    "来自虚空的恐怖存在，扭曲时空法则": "Ужас из пустоты, искажает реальность",
-    "深渊之门": "Врата Бездны",
-    "通往深渊的第一道裂隙，适合初入深渊者": "Первый разлом, для новичков",
-    "暗影裂隙": "Теневой Разлом",
-    "暗影精华弥漫的异空间，敌人更加强大": "Пространство тени, враги сильнее",
-    "炎魔领域": "Огненные Земли",
-    "烈焰魔将统治的火焰地域，高温炙烤": "Царство Огненного Военачальника",
-    "虚空核心": "Ядро Пустоты",
-    "虚空之眼栖息的维度核心，终极考验": "Измерение Глаза, финальное испытание",
-    "无尽深渊": "Бесконечная Бездна",
-    "没有时间限制的无尽模式，坚持越久奖励越丰": "Без лимита времени, больше наград",
-    "弹射宝石": "Самоцвет Рикошета",
-    "所有投射物 +1 弹射": "Все снаряды +1 рикошет",
-    "冰封之心": "Ледяное Сердце",
-    "接触敌人时自动减速": "Авто-замедление при касании",
-    "燃烧之魂": "Пылающая Душа",
-    "10%击杀几率留下火焰地面": "10% шанс оставить огонь",
-    "疾风护符": "Амулет Быстроты",
-    "移速+15%  闪避+5%": "Скорость +15%  Уклонение +5%",
-    "大地之心": "Сердце Земли",
-    "护甲+5  击退+30%": "Броня +5  Откидывание +30%",
-    "血色宝石": "Кровавый Самоцвет",
-    "暴击+8%  暴击伤害+30%": "Крит +8%  Урон крита +30%",
-    "吞噬之牙": "Клык Пожирателя",
-    "5%生命偷取": "5% похищение жизни",
-    "幸运骰子": "Счастливый Кубик",
-    "升级选项+1 (3→4)": "Выбор улучшений +1 (3→4)",
-    "幽冥灯笼": "Адский Фонарь",
-    "拾取范围+40%  经验+10%": "Подбор +40%  Опыт +10%",
-    "战争号角": "Рог Войны",
-    "伤害+12%  受伤+8%": "Урон +12%  Получаемый урон +8%",
-    "生命树苗": "Саженец Жизни",
-    "每秒回血+1  每10击杀+5血": "Регенесля +1  +5 HP за 10 убийств",
-    "时空碎片": "Осколок Времени",
-    "全局冷却-10%": "Глобальное КД -10%",
-    "铁短剑": "Железный меч",
-    "暗影匕首": "Теневой кинжал",
-    "碧焰长剑": "Лазурный длинный меч",
-    "深渊大剑": "Великий меч Бездны",
-    "毁灭之刃": "Клинок Разрушения",
-    "皮甲": "Кожаная броня",
-    "锁子甲": "Кольчуга",
-    "暗影铠甲": "Теневая броня",
-    "龙鳞战甲": "Драконья броня",
-    "深渊圣甲": "Святая броня Бездны",
-    "旅人之靴": "Сапоги Странника",
-    "疾风之翼": "Крылья Ветра",
-    "闪光护符": "Сверкающий Талисман",
-    "传送之戒": "Кольцо Телепортации",
-    "时间之冠": "Корона Времени",
-    "初级符文": "Руна Новичка",
-    "聚能符文": "Руна Канализации",
-    "掠夺符文": "Руна Грабежа",
-    "深渊符文": "Руна Бездны",
-    "创世符文": "Руна Генезиса",
-    "生命": "HP",
-    "伤害%": "Урон%",
-    "护甲": "Броня",
-    "暴击%": "Крит%",
-                "速度%": "Скорость%",
-    "伤害": "Урон",
-    "暴击": "Крит",
-    "暴伤": "Урон крита",
-    "回复": "Реген",
-    "速度": "Скорость",
-    "闪避": "Уклонение",
-    "拾取": "Подбор",
-    "冷却": "КД",
-    "经验": "Опыт",
-    "吸血": "Похищение жизни",
-    "副本传送门": "Портал Подземелья",
-    "进入副本挑战": "Войти в подземелье",
-    "召唤祭坛": "Алтарь Призыва",
-    "消耗资源召唤装备": "Потратить ресурсы на снаряжение",
-    "锻造工坊": "Кузница",
-    "升级角色和装备": "Улучшить персонажа и снаряжение",
-    "灵魂商店": "Магазин Душ",
-    "消耗灵魂碎片购物": "Потратить осколки душ",
-    "深渊图鉴": "Кодекс Бездны",
-    "查阅角色和装备图鉴": "Просмотр кодекса",
-    "冒险出发": "Начать приключение",
-    "选择角色开始冒险": "Выбрать персонажа",
-    "商人·马库斯": "Торговец Маркус",
-    "物资交易商人": "Торговец припасами",
-    "长老·瑟拉斯": "Старейшина Серас",
-    "深渊知识长老": "Мудрец Бездны",
-    "铁匠·布鲁诺": "Кузнец Бруно",
-    "武器锻造大师": "Мастер кузнец",
-    "女巫·伊薇": "Ведьма Айви",
-    "神秘魔法师": "Таинственный маг",
-    "▼ 点击继续": "▼ Нажмите для продолжения",
-    "请选择:": "Выберите:",
-    "角色预览 - Characters Preview": "Предпросмотр персонажа",
-    "角色选择预览 (←→ 切换)": "Предпросмотр (←→)",
-    "点击任意处跳过": "Нажмите куда-нибудь для пропуска",
-    "剑士": "Мечник",
-    "法师": "Маг",
-    "弓手": "Лучник",
-    "刺客": "Ассасин",
-    "骑士": "Рыцарь",
-    "召唤师": "Призыватель",
-    "冒险者": "Искатель приключений",
-    "守墓人": "Хранитель Могил",
-    "暗影刺客": "Теневой Убийца",
-    "铁壁骑士": "Железный Рыцарь",
-    "炼金术士": "Алхимик",
-    "裂隙行者": "Хождение по Разлому",
-    "均衡型角色 · 被动: 击杀敌人5%概率回复少量生命": "Сбалансированный · Пассив: 5% восстановить HP",
-    "高速型角色 · 被动: 闪避成功后0.5秒内移速+80%": "Быстрый · Пассив: +80% скорости на 0.5с после уклонения",
-    "防御型角色 · 被动: 血量低于30%时护甲翻倍": "Защитник · Пассив: Броня х2 ниже 30% HP",
-    "伤害型角色 · 被动: 武器进化所需等级-2，暴击伤害+30%": "Уронник · Пассив: Эволюция -2 уровня, крит урон +30%",
-    "特殊角色 · 被动: 每30秒闪现到安全位置，属性随机波动": "Особый · Пассив: Телепорт каждые 30с, случайные характеристики",
-    "隐藏角色 · 被动: 击杀后1秒内攻击+100%，но生命极低": "Скрытый · Пассив: +100% урон 1с после убийства, очень низкое HP",
-    "旅行商人·马库斯": "Странствующий торговец Маркус",
-    "深渊行商": "Торговец Бездны",
-    "暗夜长老·瑟拉斯": "Ночной Старейшина Серас",
-    "先知": "Провидец",
-    "锻造大师": "Мастер кузнец",
-    "神秘女巫·伊薇": "Таинственная Ведьма Айви",
-    "命运编织者": "Ткачиха Судеб",
-    "哦? 新面孔! 欢迎来到深渊的边缘, 旅行者。": "О? Новое лицо! Добро пожаловать на край Бездны, путник.",
-    "我是马库斯, 在这片黑暗中做些小生意。": "Я Маркус, торгую в этой тьме.",
-    "别被外面的怪物吓到了, 只要你有金币, 我什么都卖。": "Не бойся монстров, было бы золото - продам всё.",
-    "你都卖些什么?": "Что ты продаёшь?",
-    "武器、护甲、稀有符文...只要你出得起价。": "Оружие, броню, редкие руны... если заплатишь.",
-    "去\"装备召唤\"看看吧，碰碰运气说不定有好东西！": "Загляни в «Призыв снаряжения», может повезёт!",
-    "这里安全吗?": "Здесь безопасно?",
-    "嘿嘿，只要你不欠мне钱，这里就是最安全的。": "Хех, пока не должен мне - безопаснее места нет.",
-    "不过说真的，深渊的裂隙越来越不稳定了...": "Хотя серьёзно, разломы становятся всё нестабильнее...",
-    "告辞": "Прощай",
-    "又来了? 上次教你的保命技巧用上了吗?": "Снова здесь? Применил мои советы по выживанию?",
-    "看你这副样子...大概没用上吧。": "Судя по виду... наверное нет.",
-    "教我更多技巧": "Научи большему",
-    "要诀只有一个: 不要停下脚步!": "Главное правило: не стой на месте!",
-    "在深渊中站着不动就是等死。持续移动，让武器自动清场。": "Стоять в Бездне - смерть. Двигайся, пусть оружие делает дело.",
-    "经验宝石要尽量捡, 等级越高武器越强。": "Собирай опыт, выше уровень - сильнее оружие.",
-    "你有什么好货?": "Есть что-то хорошее?",
-    "好东西可不便宜哦～": "Хорошее не дёшево~",
-    "去抽卡池碰碰运气, 或者攒到好装备来找铁匠升级。": "Попробуй призыв, или копи снаряжение для кузнеца.",
-    "下次再说": "В другой раз",
-    "欢迎回来, 老朋友!": "С возвращением, друг!",
-    "生意如何? 最近深渊里的怪物越来越多了。": "Как дела? Монстров в Бездне всё больше.",
-    "最近有什么新情报?": "Есть новости?",
-    "你听说了吗? 深渊的最深处好像出现了一道新的裂隙。": "Слышал? В глубинах Бездны новый разлом появился.",
-    "据说穿过那里可以到达更危险的领域...": "Говорят, ведёт в ещё более опасные места...",
-    "不过回报也会更丰厚。试试副本挑战吧。": "Но и награды лучше. Попробуй подземелья.",
-    "我需要更强的装备": "Мне нужно снаряжение посильнее",
-    "看你的装备...确实该升级了。": "Твоё снаряжение... да, пора улучшать.",
-    "多打几个Boss吧, 钻石可以用来进行超级召唤。": "Бей боссов, алмазы нужны для супер призыва.",
-    "传说品质的装备, 可是每个战士的梦想啊!": "Легендарное снаряжение - мечта каждого воина!",
-    "只是路过": "Просто мимо проходил",
-    "哇哦, 大客户驾到!": "Ого, крупный клиент!",
-    "看你金光闪闪的钱袋...今天想看点什么?": "Какой увесистый кошелёк... что сегодня хочешь?",
-    "随便看看": "Просто смотрю",
-    "有钱任性啊! 记得多去抽几次十连, 说不定能抽到传说装备!": "Богач! Делай десятки призывов, может легенду вытянешь!",
-    "唉, 你看起来也没什么钱的样子。": "Эх, ты выглядишь бедным.",
-    "不过别灰心, 多打几局副本就有金币了。": "Не унывай, в подземельях золото найдёшь.",
-    "确实没钱": "Точно нет денег",
-    "去刷刷小怪吧, 实在不行还有灵魂商店。": "Фарми мобов, или зайди в Магазин Душ.",
-    "那里用灵魂碎片也能换到不少好东西。": "Там за осколки душ тоже можно взять что-то.",
-    "哼, 走了": "Хм, пойду",
-    "离开": "Уйти",
-    "...你终于来了。": "...Наконец-то.",
-    "我等这一刻已经очень久了, 暗夜猎人。": "Долго ждал этого момента, Ночной Охотник.",
-    "深渊的力量正在侵蚀这片大地, 而你是唯一的希望。": "Бездна пожирает эту землю, ты - единственная надежда.",
-    "我是谁?": "Кто я?",
-    "你是被深渊选中的人。每次死亡, 你都会从轮回中归来。": "Ты избран Бездной. Каждая смерть возвращает тебя из цикла.",
-    "这既是诅咒, 也是祝福。": "Это и проклятие, и благословение.",
-    "利用每次轮回积累的力量, 终有一天你能击败深渊之王。": "Используй силу циклов, однажды победишь Короля Бездны.",
-    "深渊是什么?": "Что такое Бездна?",
-    "深渊...是另一个维度的裂隙。": "Бездна... разлом в другое измерение.",
-    "它吞噬生命, 扭曲现实, 不断向我们的世界渗透。": "Пожирает жизни, искажает реальность, проникает в наш мир.",
-    "那些怪物, 都是从裂隙中涌出的深渊造物。": "Эти монстры - порождения Бездны из разломов.",
-    "我该怎么做?": "Что мне делать?",
-    "升级你的角色, 强化你的装备。": "Улучшай персонажа, усиливай снаряжение.",
-    "灵魂商店中的永久加成对你大有裨益。": "Постоянные усиления из Магазина Душ очень помогут.",
-    "当你准备好了, 挑战更深层的副本。": "Когда будешь готов, иди в глубокие подземелья.",
-    "我知道了": "Понятно",
-    "....": "......",
-    "类型: {title} {name} ({boss_type_name})": "Тип: {title} {name} ({boss_type_name})",
-    "超神!! x{count}": "БОЖЕСТВЕННО!! x{count}",
-    "无双! x{count}": "НЕПОБЕДИМ! x{count}",
-    "连击 x{count}": "КОМБО x{count}",
-    "小型": "Малый",
-    "中型": "Средний",
-    "大型": "Большой",
-    "巨型": "Гигантский",
-    "阶段": "Фаза",
-    "火球术": "Огненный шар",
-    "雷电领域": "Поле молний",
-    "骨盾环绕": "Костяной щит",
-    "大地尖刺": "Земляные шипы",
-}
+# ============================================================
+#  Catalogs
+# ============================================================
+def catalog(lang):
+    """{source key: translated text} for lang; zh and missing files give {}"""
+    cat = _catalogs.get(lang)
+    if cat is None:
+        cat = {}
+        if lang != "zh":
+            try:
+                with open(os.path.join(LOCALE_DIR, lang + ".json"), "r", encoding="utf-8") as f:
+                    cat = json.load(f)
+            except (OSError, ValueError):
+                pass
+        _catalogs[lang] = cat
+    return cat
+
+
+def _lookup(key):
+    if _current_lang == "zh":
+        return key
+    # 如果找不到翻译，回退到中文原文
+    return catalog(_current_lang).get(key, key)
+
+
+def _compile(text):
+    """
+    Template → callable(kwargs). Plain {name} fields become a %-mapping
+    template (one C-level pass per call); anything fancier keeps format_map.
+    """
+    pieces = []
+    try:
+        for literal, field, spec, conv in _formatter.parse(text):
+            pieces.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conv:
+                return text.format_map
+            pieces.append("%(" + field + ")s")
+    except ValueError:
+        return text.format_map
+    return "".join(pieces).__mod__
 
 
 SLOT_NAMES = {
@@ -2283,19 +159,19 @@ STAT_NAMES = {
 
 
 def t(key, **kwargs):
-    if _current_lang == "zh":
-        text = key
-    else:
-        text = TRANSLATIONS.get(_current_lang, {}).get(key)
+    if not kwargs:
+        text = _plain.get(key)
         if text is None:
-            # 如果找不到翻译，回退到中文原文
-            text = key
-    if kwargs:
-        try:
-            return text.format(**kwargs)
-        except Exception:
-            return text
-    return text
+            text = _plain[key] = _lookup(key)
+        return text
+    ck = (_current_lang, key)
+    fmt = _compiled.get(ck)
+    if fmt is None:
+        fmt = _compiled[ck] = _compile(_lookup(key))
+    try:
+        return fmt(kwargs)
+    except Exception:
+        return _lookup(key)
 
 
 def lang_name(code):
@@ -2320,3 +196,16 @@ def material_short(mat_key):
 
 def stat_name(stat_key):
     return STAT_NAMES.get(_current_lang, STAT_NAMES["en"]).get(stat_key, stat_key)
+
+
+def glyph_text(lang):
+    """该语言界面可能出现的全部文字 (用于字体字形预热)"""
+    parts = ["0123456789+-×%/:.,!?()[]<>"]
+    if lang == "zh":
+        parts.extend(catalog("en").keys())
+    else:
+        parts.extend(catalog(lang).values())
+    for table in (SLOT_NAMES, RARITY_NAMES, MATERIAL_NAMES, MATERIAL_SHORT, STAT_NAMES):
+        parts.extend(table.get(lang, table["en"]).values())
+    parts.append(LANG_NATIVE.get(lang, ""))
+    return "".join(parts)
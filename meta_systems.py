@@ -12,6 +12,11 @@ import os
 import json
 import characters
 import i18n
+import equipment_catalog
+import gacha_engine
+import warehouse
+import retained_ui
+import render_scale
 
 # ============================================================
 #  引用 (由 init() 注入)
@@ -51,12 +56,18 @@ def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
     return surf
 
 
+# 局外界面共用的保留模式控件层
+UI = retained_ui.Scene(_render_outlined)
+
+
 def init(screen, font_lg, font_md, font_sm, font_xs, w, h):
     global _screen, _font_lg, _font_md, _font_sm, _font_xs, WIDTH, HEIGHT
     _screen = screen
     _font_lg = font_lg; _font_md = font_md
     _font_sm = font_sm; _font_xs = font_xs
     WIDTH = w; HEIGHT = h
+    UI.reset()
+    _preview_chars.clear()
 
 
 # ============================================================
@@ -299,21 +310,46 @@ def get_meta_equip_stat_bonus(level, base_stats):
             stats[k] = round(v * mult, 4)
         else:
             stats[k] = int(v * mult)
+    return stats
+
+
+EQUIP_SELL_BASE = {'common': 15, 'uncommon': 40, 'rare': 100, 'epic': 300, 'legendary': 800}
+EQUIP_SELL_PER_LEVEL = 5   # 强化等级增加售价
+
+_warehouses = {}   # id(save_data) → Warehouse
+
 
+def get_warehouse(save_data, equipment_db):
+    """取存档对应的仓库对象 (反向索引与出售聚合常驻内存, 存档替换后重建)"""
+    state = save_data.setdefault('warehouse', warehouse.new_state())
+    equipped = save_data.setdefault('meta_equipped', {})
+    w = _warehouses.get(id(save_data))
+    if w is None or w.state is not state or w.equipped is not equipped:
+        catalog = equipment_catalog.get_catalog(equipment_db, EQUIP_WEIGHT_POOLS)
+        w = warehouse.Warehouse(state, equipped, catalog,
+                                EQUIP_SELL_BASE, EQUIP_SELL_PER_LEVEL)
+        _warehouses[id(save_data)] = w
+    return w
 
-def get_equip_sell_price(meq, equipment_db):
+
+def warehouse_size(save_data):
+    """现存装备数量: 仓库对象已建立时直接取其维护的计数, 否则数一遍存档"""
+    state = save_data.get('warehouse')
+    w = _warehouses.get(id(save_data))
+    if w is not None and w.state is state:
+        return len(w)
+    if not state:
+        return 0
+    return sum(1 for t in state.get('template', ()) if t >= 0)
+
+
+def get_equip_sell_price(save_data, item_id, equipment_db):
     """计算单件装备出售价格"""
-    tidx = meq.get('template_idx', 0)
-    if tidx >= len(equipment_db):
+    w = get_warehouse(save_data, equipment_db)
+    rarity = w.rarity(item_id)
+    if rarity is None:
         return 0
-    tpl = equipment_db[tidx]
-    rarity = tpl[2]
-    eq_lv = meq.get('level', 1)
-    base_price = {'common': 15, 'uncommon': 40, 'rare': 100, 'epic': 300, 'legendary': 800}
-    price = base_price.get(rarity, 10)
-    # 强化等级增加售价
-    price += eq_lv * 5
-    return price
+    return EQUIP_SELL_BASE.get(rarity, 10) + w.level(item_id) * EQUIP_SELL_PER_LEVEL
 
 
 def batch_sell_equipment(save_data, equipment_db, keep_rarities=None):
@@ -323,61 +359,10 @@ def batch_sell_equipment(save_data, equipment_db, keep_rarities=None):
     """
     if keep_rarities is None:
         keep_rarities = ['legendary']
-    meta_equips = save_data.get('meta_equipment', [])
-    me = save_data.get('meta_equipped', {})
-
-    # 收集所有已装备的索引
-    equipped_idxs = set()
-    for ck, cv in me.items():
-        for s, wi in cv.items():
-            equipped_idxs.add(wi)
-
-    # 找出要出售的
-    sell_count = 0
-    sell_gold = 0
-    keep_indices = set()
-    for i, meq in enumerate(meta_equips):
-        tidx = meq.get('template_idx', 0)
-        if tidx >= len(equipment_db):
-            keep_indices.add(i)
-            continue
-        tpl = equipment_db[tidx]
-        rarity = tpl[2]
-        if rarity in keep_rarities:
-            keep_indices.add(i)
-            continue
-        if i in equipped_idxs:
-            keep_indices.add(i)
-            continue
-        # 出售
-        sell_gold += get_equip_sell_price(meq, equipment_db)
-        sell_count += 1
-
+    sell_count, sell_gold = get_warehouse(save_data, equipment_db).sell(keep_rarities)
     if sell_count == 0:
         return 0, 0
-
-    # 重建装备列表，更新索引映射
-    old_to_new = {}
-    new_equips = []
-    for old_i, meq in enumerate(meta_equips):
-        if old_i in keep_indices:
-            old_to_new[old_i] = len(new_equips)
-            new_equips.append(meq)
-
-    # 更新装备绑定索引
-    new_me = {}
-    for ck, cv in me.items():
-        new_binds = {}
-        for s, wi in cv.items():
-            if wi in old_to_new:
-                new_binds[s] = old_to_new[wi]
-        if new_binds:
-            new_me[ck] = new_binds
-
-    save_data['meta_equipment'] = new_equips
-    save_data['meta_equipped'] = new_me
     save_data['gold'] = save_data.get('gold', 0) + sell_gold
-
     return sell_count, sell_gold
 
 
@@ -385,27 +370,7 @@ def count_sellable_equipment(save_data, equipment_db, keep_rarities=None):
     """统计可出售装备数量和预计金币（不实际出售）"""
     if keep_rarities is None:
         keep_rarities = ['legendary']
-    meta_equips = save_data.get('meta_equipment', [])
-    me = save_data.get('meta_equipped', {})
-    equipped_idxs = set()
-    for ck, cv in me.items():
-        for s, wi in cv.items():
-            equipped_idxs.add(wi)
-    count = 0
-    gold = 0
-    for i, meq in enumerate(meta_equips):
-        tidx = meq.get('template_idx', 0)
-        if tidx >= len(equipment_db):
-            continue
-        tpl = equipment_db[tidx]
-        if tpl[2] in keep_rarities:
-            continue
-        if i in equipped_idxs:
-            continue
-        count += 1
-        gold += get_equip_sell_price(meq, equipment_db)
-    return count, gold
-    return stats
+    return get_warehouse(save_data, equipment_db).sellable(keep_rarities)
 
 
 # ============================================================
@@ -429,42 +394,44 @@ SUPER_GACHA_WEIGHTS = {
 PITY_NORMAL_EPIC = 30       # 30抽保底史诗
 PITY_SUPER_LEGENDARY = 80   # 80抽保底传说
 
+# 交给装备目录预计算累积权重表的品质权重池
+EQUIP_WEIGHT_POOLS = {
+    'gacha_normal': NORMAL_GACHA_WEIGHTS,
+    'gacha_super': SUPER_GACHA_WEIGHTS,
+}
+
+# 卡池配置: 权重 / 保底 / 价格
+GACHA_POOLS = {
+    'normal': {
+        'weights': NORMAL_GACHA_WEIGHTS, 'pity_key': 'gacha_pity_normal',
+        'pity_limit': PITY_NORMAL_EPIC, 'pity_rarity': 'epic',
+        'cost': NORMAL_GACHA_COST, 'cost10': NORMAL_GACHA_10_COST, 'currency': 'gold',
+    },
+    'super': {
+        'weights': SUPER_GACHA_WEIGHTS, 'pity_key': 'gacha_pity_super',
+        'pity_limit': PITY_SUPER_LEGENDARY, 'pity_rarity': 'legendary',
+        'cost': SUPER_GACHA_COST, 'cost10': SUPER_GACHA_10_COST, 'currency': 'diamond',
+    },
+}
 
-def do_gacha_pull(pool='normal', save_data=None, equipment_db=None):
-    """执行一次抽卡，返回 (template_idx, rarity) 或 None"""
-    if pool == 'normal':
-        weights = dict(NORMAL_GACHA_WEIGHTS)
-        pity_key = 'gacha_pity_normal'
-        pity_limit = PITY_NORMAL_EPIC
-        pity_rarity = 'epic'
-    else:
-        weights = dict(SUPER_GACHA_WEIGHTS)
-        pity_key = 'gacha_pity_super'
-        pity_limit = PITY_SUPER_LEGENDARY
-        pity_rarity = 'legendary'
-
-    # 检查保底
-    pity_count = save_data.get(pity_key, 0) + 1
-    if pity_count >= pity_limit:
-        rarity = pity_rarity
-        pity_count = 0
-    else:
-        rarities = list(weights.keys())
-        w = list(weights.values())
-        rarity = random.choices(rarities, weights=w)[0]
-        # 抽到保底品质也重置
-        rarity_order = ['common', 'uncommon', 'rare', 'epic', 'legendary']
-        if rarity_order.index(rarity) >= rarity_order.index(pity_rarity):
-            pity_count = 0
 
-    save_data[pity_key] = pity_count
+def do_gacha_batch(pool='normal', count=10, save_data=None, equipment_db=None, seed=None):
+    """一次抽 count 发, 返回 [(template_idx, rarity), ...]; 保底计数只写回一次"""
+    pool = 'normal' if pool == 'normal' else 'super'
+    cfg = GACHA_POOLS[pool]
+    catalog = equipment_catalog.get_catalog(equipment_db, EQUIP_WEIGHT_POOLS)
+    results, pity = gacha_engine.pull_batch(
+        catalog, catalog.pool('gacha_' + pool), count,
+        pity=save_data.get(cfg['pity_key'], 0),
+        limit=cfg['pity_limit'], pity_rarity=cfg['pity_rarity'], seed=seed)
+    save_data[cfg['pity_key']] = pity
+    return results
+
 
-    # 从装备库选一个该品质的装备
-    candidates = [i for i, tpl in enumerate(equipment_db) if tpl[2] == rarity]
-    if not candidates:
-        return None
-    template_idx = random.choice(candidates)
-    return template_idx, rarity
+def do_gacha_pull(pool='normal', save_data=None, equipment_db=None):
+    """执行一次抽卡，返回 (template_idx, rarity) 或 None"""
+    results = do_gacha_batch(pool, 1, save_data, equipment_db)
+    return results[0] if results else None
 
 
 # ============================================================
@@ -480,9 +447,9 @@ def get_default_meta_save():
         'char_levels': {str(i): 1 for i in range(6)},
         # 角色进阶 {char_idx: ascend_tier}  (0=未进阶, 1=已过10级进阶...)
         'char_ascend': {str(i): 0 for i in range(6)},
-        # 局外装备仓库  [{template_idx, level, ascend}]
-        'meta_equipment': [],
-        # 角色装备绑定 {char_idx_str: {slot: equip_warehouse_index}}
+        # 局外装备仓库 (列式, 下标即装备ID) {template: [], level: [], ascend: []}
+        'warehouse': warehouse.new_state(),
+        # 角色装备绑定 {char_idx_str: {slot: 装备ID}}
         'meta_equipped': {},
         # 材料
         'meta_materials': {'iron': 0, 'shadow': 0, 'crystal': 0, 'dragon': 0, 'abyss': 0},
@@ -506,63 +473,24 @@ def get_default_meta_save():
 
 # ---- 角色装备绑定工具 ----
 def get_char_equipped(save_data, char_idx, equipment_db):
-    """获取角色已装备的局外装备, 返回 {slot: (warehouse_idx, template_tuple, level)}"""
+    """获取角色已装备的局外装备, 返回 {slot: (装备ID, template_tuple, level)}"""
+    w = get_warehouse(save_data, equipment_db)
     equipped = {}
-    me = save_data.get('meta_equipped', {})
-    char_key = str(char_idx)
-    if char_key not in me:
-        return equipped
-    meta_equips = save_data.get('meta_equipment', [])
-    for slot, widx in me[char_key].items():
-        if 0 <= widx < len(meta_equips):
-            meq = meta_equips[widx]
-            tidx = meq.get('template_idx', 0)
-            if tidx < len(equipment_db):
-                equipped[slot] = (widx, equipment_db[tidx], meq.get('level', 1))
+    for slot, iid in w.equipped_of(str(char_idx)).items():
+        tidx = w.template(iid)
+        if tidx < len(equipment_db):      # 旧存档里模板已不存在的装备跳过
+            equipped[slot] = (iid, equipment_db[tidx], w.level(iid))
     return equipped
 
 
-def equip_meta_item(save_data, char_idx, warehouse_idx, equipment_db):
-    """给角色装备一件局外装备, 返回 True/False"""
-    meta_equips = save_data.get('meta_equipment', [])
-    if warehouse_idx >= len(meta_equips):
-        return False
-    meq = meta_equips[warehouse_idx]
-    tidx = meq.get('template_idx', 0)
-    if tidx >= len(equipment_db):
-        return False
-    tpl = equipment_db[tidx]
-    slot = tpl[1]  # weapon/armor/accessory/rune
-
-    me = save_data.setdefault('meta_equipped', {})
-    char_key = str(char_idx)
-    if char_key not in me:
-        me[char_key] = {}
-
-    # 检查该装备是否被其他角色穿着
-    for ck, cv in me.items():
-        for s, wi in list(cv.items()):
-            if wi == warehouse_idx and ck != char_key:
-                del cv[s]  # 从其他角色卸下
-                break
-
-    # 如果该槽位已有装备且是同一件, 卸下
-    if me[char_key].get(slot) == warehouse_idx:
-        del me[char_key][slot]
-        return True
-
-    me[char_key][slot] = warehouse_idx
-    return True
-
-
-def unequip_meta_item(save_data, char_idx, slot):
+def equip_meta_item(save_data, char_idx, item_id, equipment_db):
+    """给角色装备一件局外装备 (已穿在该角色身上则卸下), 返回 True/False"""
+    return get_warehouse(save_data, equipment_db).equip(str(char_idx), item_id)
+
+
+def unequip_meta_item(save_data, char_idx, slot, equipment_db):
     """卸下角色某槽位装备"""
-    me = save_data.get('meta_equipped', {})
-    char_key = str(char_idx)
-    if char_key in me and slot in me[char_key]:
-        del me[char_key][slot]
-        return True
-    return False
+    return get_warehouse(save_data, equipment_db).unequip(str(char_idx), slot)
 
 
 def get_meta_equip_stats(save_data, char_idx, equipment_db):
@@ -611,6 +539,9 @@ def check_char_unlocks(save_data):
 def merge_meta_save(save_data):
     """确保存档包含所有局外字段"""
     default = get_default_meta_save()
+    # 旧存档: meta_equipment 列表 → 列式仓库, 下标即 ID, meta_equipped 无需改动
+    if 'warehouse' not in save_data and isinstance(save_data.get('meta_equipment'), list):
+        save_data['warehouse'] = warehouse.state_from_list(save_data.pop('meta_equipment'))
     for k, v in default.items():
         if k not in save_data:
             save_data[k] = v
@@ -682,15 +613,12 @@ def apply_settlement(save_data, rewards, equipment_db):
         save_data['meta_materials'][mk] = save_data['meta_materials'].get(mk, 0) + mv
 
     # 装备 → 实际生成并存入仓库
+    catalog = equipment_catalog.get_catalog(equipment_db, EQUIP_WEIGHT_POOLS)
+    w = get_warehouse(save_data, equipment_db)
     for rarity in rewards.get('equipment', []):
-        candidates = [i for i, tpl in enumerate(equipment_db) if tpl[2] == rarity]
-        if candidates:
-            tidx = random.choice(candidates)
-            save_data['meta_equipment'].append({
-                'template_idx': tidx,
-                'level': 1,
-                'ascend': 0,
-            })
+        tidx = catalog.pick(rarity)
+        if tidx is not None:
+            w.add(tidx)
             if tidx not in save_data['codex_equips']:
                 save_data['codex_equips'].append(tidx)
 
@@ -703,7 +631,7 @@ def draw_button(surface, rect, text, color, font=None, hover_check=True):
     """通用按钮绘制"""
     if font is None:
         font = _font_md
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
     hover = rect.collidepoint(mx, my) if hover_check else False
     bs = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
     bc = color if hover else tuple(max(0, c - 60) for c in color)
@@ -715,19 +643,121 @@ def draw_button(surface, rect, text, color, font=None, hover_check=True):
     return hover
 
 
+# ---- 保留模式控件辅助 ----
+# 以下界面每帧向 UI 声明控件, 贴图由 UI 缓存, 只重绘变化的区域 (见 retained_ui)
+PREVIEW_BOUNDS = (-40, -40, 80, 64)   # 角色形象相对站位点的最大绘制范围
+_preview_chars = {}                    # (角色, x, y) → 预览用角色实例
+
+# 角色升级界面的装备仓库列表
+EQUIP_ROW_W, EQUIP_ROW_H = 295, 40
+EQUIP_OVERSCAN = 4                     # 当前页之后预先烘焙的行数, 翻页时不必现做
+EQUIP_FILTER_RARITIES = (None,) + warehouse.RARITY_ORDER
+EQUIP_FILTER_SLOTS = (None,) + warehouse.SLOT_ORDER
+EQUIP_ORDERS = warehouse.ORDERS
+EQUIP_ORDER_NAMES = {warehouse.ORDER_NEW: "获得顺序", warehouse.ORDER_RARITY: "品质"}
+
+
+def next_option(options, current):
+    """筛选按钮循环切换到下一项"""
+    i = options.index(current) if current in options else -1
+    return options[(i + 1) % len(options)]
+
+
+def _frame_surface(w, h, color, fill_a, line_a, radius=5):
+    """半透明圆角框贴图 (选项卡等); fill_a 为 0 时不填充"""
+    bs = pygame.Surface((w, h), pygame.SRCALPHA)
+    if fill_a:
+        pygame.draw.rect(bs, (*color, fill_a), (0, 0, w, h), border_radius=radius)
+    pygame.draw.rect(bs, (*color, line_a), (0, 0, w, h), 2, border_radius=radius)
+    return bs
+
+
+def _ui_frame(rect, color, fill_a, line_a, radius=5):
+    key = ('frame', rect.w, rect.h, color, fill_a, line_a, radius)
+    surf = UI.cached(key, lambda: _frame_surface(rect.w, rect.h, color, fill_a, line_a, radius))
+    UI.blit(surf, rect.topleft, key)
+
+
+def _ui_weapon_icon(x, y, weapon_idx, size):
+    UI.static((x - size - 2, y - size - 2, size * 2 + 5, size * 2 + 5), ('weapon_icon', weapon_idx, size),
+              lambda target: _draw_weapon_icon(target, x, y, weapon_idx, size))
+
+
+def _ui_char_preview(cidx, x, y, anim_t, fallback=None):
+    """带动画的角色形象, 每帧重绘; fallback 为创建失败时画圆的颜色"""
+    def draw(target):
+        try:
+            ch = _preview_chars.get((cidx, x, y))
+            if ch is None:
+                ch = _preview_chars[(cidx, x, y)] = characters.create_character(cidx, x, y)
+            ch.anim_timer = anim_t
+            ch.draw(target, (0, 0))
+        except Exception:
+            if fallback is not None:
+                pygame.draw.circle(target, fallback, (x, y), 20)
+                pygame.draw.circle(target, WHITE, (x, y), 20, 2)
+    bx, by, bw, bh = PREVIEW_BOUNDS
+    UI.dynamic((x + bx, y + by, bw, bh), draw)
+
+
+def _equip_row_surface(tpl, eq_lv, is_worn, rc, slot_name, rarity_name):
+    row = pygame.Surface((EQUIP_ROW_W, EQUIP_ROW_H), pygame.SRCALPHA)
+    rect = (0, 0, EQUIP_ROW_W, EQUIP_ROW_H)
+    # 品质特效背景 (屏幕没有 alpha 通道, 原先直接画在屏幕上就是不透明的, 这里保持一致)
+    pygame.draw.rect(row, rc, rect, border_radius=4)
+    pygame.draw.rect(row, rc, rect, 2 if is_worn else 1, border_radius=4)
+    # 品质标识小点
+    rarity_idx = ['common','uncommon','rare','epic','legendary'].index(tpl[2])
+    for dot_i in range(rarity_idx + 1):
+        pygame.draw.circle(row, rc, (6 + dot_i * 8, 36), 2)
+    row.blit(UI.text(_font_xs, f"{i18n.t(tpl[0])} Lv.{eq_lv}", rc), (6, 3))
+    row.blit(UI.text(_font_xs, f"{slot_name} [{rarity_name}]", (220, 220, 235)), (6, 20))
+    # 已穿戴标记
+    if is_worn:
+        row.blit(UI.text(_font_xs, i18n.t("已装备"), GREEN), (200, 3))
+    return row
+
+
+def _lock_overlay(w, h):
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    s.fill((0, 0, 0, 120))
+    return s
+
+
+def _tooltip_surface(lines):
+    tw = max(len(l) * 9 + 20 for l in lines)
+    th = len(lines) * 18 + 12
+    tip_surf = pygame.Surface((tw, th), pygame.SRCALPHA)
+    pygame.draw.rect(tip_surf, (10, 10, 20, 230), (0, 0, tw, th), border_radius=6)
+    pygame.draw.rect(tip_surf, (200, 200, 220, 180), (0, 0, tw, th), 2, border_radius=6)
+    for li, line in enumerate(lines):
+        color = GOLD if li == 0 else (230, 230, 240)
+        lt = _render_outlined(_font_xs, line, color)
+        tip_surf.blit(lt, (8, 6 + li * 18))
+    return tip_surf
+
+
 # ---- 结算界面 ----
-def draw_settlement_screen(surface, rewards, is_victory=False):
-    """绘制结算界面, 返回按钮字典"""
+SETTLEMENT_DIM = 200    # 结算界面背景遮罩 alpha
+
+def draw_settlement_screen(surface, rewards, is_victory=False, backdrop=None):
+    """
+    绘制结算界面, 返回按钮字典
+    backdrop: 已按 SETTLEMENT_DIM 暗化的背景快照;
+              不传时在 surface 当前内容上叠加遮罩 (背景每帧都在变, 只能整屏重绘)
+    """
     buttons = {}
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    surface.blit(overlay, (0, 0))
+    if backdrop is None:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, SETTLEMENT_DIM))
+        surface.blit(overlay, (0, 0))
+        backdrop = surface.copy()
+    UI.begin(surface, 'settlement', backdrop)
 
     # 标题
     title_text = i18n.t("胜 利 !") if is_victory else i18n.t("挑 战 结 束")
     title_color = GOLD if is_victory else RED
-    title = _render_outlined(_font_lg, title_text, title_color)
-    surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 40))
+    UI.label(_font_lg, title_text, title_color, (WIDTH // 2, 40), 'midtop')
 
     # 奖励列表
     y = 120
@@ -751,17 +781,17 @@ def draw_settlement_screen(surface, rewards, is_victory=False):
             items.append((i18n.t("获得{rarity}装备!", rarity=rarity_names.get(r, r)), rarity_colors.get(r, WHITE)))
 
     for txt, color in items:
-        rt = _render_outlined(_font_sm, txt, color)
-        surface.blit(rt, (WIDTH // 2 - rt.get_width() // 2, y))
+        UI.label(_font_sm, txt, color, (WIDTH // 2, y), 'midtop')
         y += 35
 
     # 按钮
     btn_y = max(y + 40, HEIGHT - 150)
     btn_w, btn_h = 200, 44
     confirm_rect = pygame.Rect(WIDTH // 2 - btn_w // 2, btn_y, btn_w, btn_h)
-    draw_button(surface, confirm_rect, i18n.t("确认"), CYAN, _font_md)
+    UI.button(confirm_rect, i18n.t("确认"), CYAN, _font_md)
     buttons['confirm'] = confirm_rect
 
+    UI.present()
     return buttons
 
 
@@ -769,11 +799,10 @@ def draw_settlement_screen(surface, rewards, is_victory=False):
 def draw_codex_screen(surface, save_data, tab='characters'):
     """绘制图鉴界面, 返回按钮字典"""
     buttons = {}
-    surface.fill((8, 8, 14))
+    UI.begin(surface, 'codex', (8, 8, 14))
 
     # 标题
-    title = _render_outlined(_font_lg, i18n.t("图 鉴"), GOLD)
-    surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 15))
+    UI.label(_font_lg, i18n.t("图 鉴"), GOLD, (WIDTH // 2, 15), 'midtop')
 
     # 标签页
     tabs = [
@@ -789,13 +818,8 @@ def draw_codex_screen(surface, save_data, tab='characters'):
         trect = pygame.Rect(tx, tab_y, 110, 30)
         active = (tab == tk)
         tc = CYAN if active else (180, 180, 200)
-        bs = pygame.Surface((110, 30), pygame.SRCALPHA)
-        if active:
-            pygame.draw.rect(bs, (*tc, 50), (0, 0, 110, 30), border_radius=5)
-        pygame.draw.rect(bs, (*tc, 160 if active else 80), (0, 0, 110, 30), 2, border_radius=5)
-        surface.blit(bs, (tx, tab_y))
-        tt = _render_outlined(_font_xs, tname, tc)
-        surface.blit(tt, (tx + 55 - tt.get_width() // 2, tab_y + 7))
+        _ui_frame(trect, tc, 50 if active else 0, 160 if active else 80)
+        UI.label(_font_xs, tname, tc, (tx + 55, tab_y + 7), 'midtop')
         buttons[('codex_tab', tk)] = trect
 
     # 内容区
@@ -810,20 +834,16 @@ def draw_codex_screen(surface, save_data, tab='characters'):
             cy = content_y + row * 180
             card = pygame.Rect(cx, cy, 360, 160)
             is_unlocked = idx in unlocked.get('codex_chars', [])
-            pygame.draw.rect(surface, (*color, 18) if is_unlocked else (20, 20, 30), card, border_radius=8)
-            pygame.draw.rect(surface, color if is_unlocked else (55, 55, 65), card, 2, border_radius=8)
+            UI.rect((*color, 18) if is_unlocked else (20, 20, 30), card, radius=8)
+            UI.rect(color if is_unlocked else (55, 55, 65), card, 2, radius=8)
             if is_unlocked:
-                nt = _render_outlined(_font_sm, f"{i18n.t(title_str)}·{i18n.t(name)}", color)
-                surface.blit(nt, (cx + 10, cy + 10))
-                dt = _render_outlined(_font_xs, i18n.t(desc), (230, 230, 240))
-                surface.blit(dt, (cx + 10, cy + 40))
+                UI.label(_font_sm, f"{i18n.t(title_str)}·{i18n.t(name)}", color, (cx + 10, cy + 10))
+                UI.label(_font_xs, i18n.t(desc), (230, 230, 240), (cx + 10, cy + 40))
                 # 等级
                 char_lv = save_data.get('char_levels', {}).get(str(idx), 1)
-                lt = _render_outlined(_font_xs, f"Lv.{char_lv}/150", GOLD)
-                surface.blit(lt, (cx + 10, cy + 65))
+                UI.label(_font_xs, f"Lv.{char_lv}/150", GOLD, (cx + 10, cy + 65))
             else:
-                lt = _render_outlined(_font_md, "???", (120, 120, 145))
-                surface.blit(lt, (cx + 160, cy + 60))
+                UI.label(_font_md, "???", (120, 120, 145), (cx + 160, cy + 60))
 
     elif tab == 'weapons':
         for i, (name, color, desc) in enumerate(WEAPON_CODEX):
@@ -833,16 +853,13 @@ def draw_codex_screen(surface, save_data, tab='characters'):
             cy = content_y + row * 100
             card = pygame.Rect(cx, cy, 560, 85)
             is_unlocked = name in unlocked.get('codex_weapons', [])
-            pygame.draw.rect(surface, (*color, 15) if is_unlocked else (18, 18, 28), card, border_radius=6)
-            pygame.draw.rect(surface, color if is_unlocked else (50, 50, 60), card, 1, border_radius=6)
+            UI.rect((*color, 15) if is_unlocked else (18, 18, 28), card, radius=6)
+            UI.rect(color if is_unlocked else (50, 50, 60), card, 1, radius=6)
             if is_unlocked:
-                nt = _render_outlined(_font_sm, i18n.t(name), color)
-                surface.blit(nt, (cx + 10, cy + 8))
-                dt = _render_outlined(_font_xs, i18n.t(desc), (235, 235, 245))
-                surface.blit(dt, (cx + 10, cy + 38))
+                UI.label(_font_sm, i18n.t(name), color, (cx + 10, cy + 8))
+                UI.label(_font_xs, i18n.t(desc), (235, 235, 245), (cx + 10, cy + 38))
             else:
-                lt = _render_outlined(_font_sm, i18n.t("??? 未发现"), (130, 130, 155))
-                surface.blit(lt, (cx + 10, cy + 25))
+                UI.label(_font_sm, i18n.t("??? 未发现"), (130, 130, 155), (cx + 10, cy + 25))
 
     elif tab == 'enemies':
         for i, (name, color, desc, spec) in enumerate(ENEMY_CODEX):
@@ -852,37 +869,29 @@ def draw_codex_screen(surface, save_data, tab='characters'):
             cy = content_y + row * 85
             card = pygame.Rect(cx, cy, 560, 75)
             is_unlocked = i in unlocked.get('codex_enemies', [])
-            pygame.draw.rect(surface, (*color, 12) if is_unlocked else (18, 18, 28), card, border_radius=6)
-            pygame.draw.rect(surface, color if is_unlocked else (50, 50, 60), card, 1, border_radius=6)
+            UI.rect((*color, 12) if is_unlocked else (18, 18, 28), card, radius=6)
+            UI.rect(color if is_unlocked else (50, 50, 60), card, 1, radius=6)
             if is_unlocked:
-                nt = _render_outlined(_font_sm, i18n.t(name), color)
-                surface.blit(nt, (cx + 10, cy + 5))
-                dt = _render_outlined(_font_xs, i18n.t(desc), (235, 235, 245))
-                surface.blit(dt, (cx + 10, cy + 32))
+                UI.label(_font_sm, i18n.t(name), color, (cx + 10, cy + 5))
+                UI.label(_font_xs, i18n.t(desc), (235, 235, 245), (cx + 10, cy + 32))
                 if spec:
-                    st = _render_outlined(_font_xs, i18n.t("特殊: {spec}", spec=i18n.t(spec)), ORANGE)
-                    surface.blit(st, (cx + 10, cy + 52))
+                    UI.label(_font_xs, i18n.t("特殊: {spec}", spec=i18n.t(spec)), ORANGE, (cx + 10, cy + 52))
             else:
-                lt = _render_outlined(_font_sm, i18n.t("??? 未遭遇"), (130, 130, 155))
-                surface.blit(lt, (cx + 10, cy + 22))
+                UI.label(_font_sm, i18n.t("??? 未遭遇"), (130, 130, 155), (cx + 10, cy + 22))
 
     elif tab == 'bosses':
         for i, (name, title_str, color, desc, hp) in enumerate(BOSS_CODEX):
             cy = content_y + i * 140
             card = pygame.Rect(40, cy, WIDTH - 80, 120)
             is_unlocked = i in unlocked.get('codex_bosses', [])
-            pygame.draw.rect(surface, (*color, 15) if is_unlocked else (18, 18, 28), card, border_radius=8)
-            pygame.draw.rect(surface, color if is_unlocked else (50, 50, 60), card, 2, border_radius=8)
+            UI.rect((*color, 15) if is_unlocked else (18, 18, 28), card, radius=8)
+            UI.rect(color if is_unlocked else (50, 50, 60), card, 2, radius=8)
             if is_unlocked:
-                nt = _render_outlined(_font_md, f"{i18n.t(title_str)}·{i18n.t(name)}", color)
-                surface.blit(nt, (60, cy + 10))
-                dt = _render_outlined(_font_xs, i18n.t(desc), (235, 235, 245))
-                surface.blit(dt, (60, cy + 50))
-                ht = _render_outlined(_font_xs, i18n.t("基础HP: {hp}", hp=hp), RED)
-                surface.blit(ht, (60, cy + 75))
+                UI.label(_font_md, f"{i18n.t(title_str)}·{i18n.t(name)}", color, (60, cy + 10))
+                UI.label(_font_xs, i18n.t(desc), (235, 235, 245), (60, cy + 50))
+                UI.label(_font_xs, i18n.t("基础HP: {hp}", hp=hp), RED, (60, cy + 75))
             else:
-                lt = _render_outlined(_font_md, i18n.t("??? 未击败"), (130, 130, 155))
-                surface.blit(lt, (60, cy + 40))
+                UI.label(_font_md, i18n.t("??? 未击败"), (130, 130, 155), (60, cy + 40))
 
     elif tab == 'equipment':
         rarity_names = {k: i18n.rarity_name(k) for k in ['common', 'uncommon', 'rare', 'epic', 'legendary']}
@@ -901,19 +910,16 @@ def draw_codex_screen(surface, save_data, tab='characters'):
             card = pygame.Rect(cx, cy, 275, 70)
             is_unlocked = i in codex_equips
             rc = rarity_colors.get(tpl[2], WHITE)
-            pygame.draw.rect(surface, (*rc, 12) if is_unlocked else (18, 18, 28), card, border_radius=5)
-            pygame.draw.rect(surface, rc if is_unlocked else (50, 50, 60), card, 1, border_radius=5)
+            UI.rect((*rc, 12) if is_unlocked else (18, 18, 28), card, radius=5)
+            UI.rect(rc if is_unlocked else (50, 50, 60), card, 1, radius=5)
             if is_unlocked:
-                nt = _render_outlined(_font_xs, f"[{rarity_names.get(tpl[2], '')}] {i18n.t(tpl[0])}", rc)
-                surface.blit(nt, (cx + 6, cy + 5))
-                st = _render_outlined(_font_xs, i18n.t("部位: {slot}", slot=slot_names.get(tpl[1], tpl[1])), (235, 235, 245))
-                surface.blit(st, (cx + 6, cy + 25))
+                UI.label(_font_xs, f"[{rarity_names.get(tpl[2], '')}] {i18n.t(tpl[0])}", rc, (cx + 6, cy + 5))
+                UI.label(_font_xs, i18n.t("部位: {slot}", slot=slot_names.get(tpl[1], tpl[1])), (235, 235, 245),
+                         (cx + 6, cy + 25))
                 stats_str = " ".join(f"{i18n.stat_name(k)}:{v}" for k, v in tpl[3].items())
-                sst = _render_outlined(_font_xs, stats_str, (225, 225, 240))
-                surface.blit(sst, (cx + 6, cy + 45))
+                UI.label(_font_xs, stats_str, (225, 225, 240), (cx + 6, cy + 45))
             else:
-                lt = _render_outlined(_font_xs, "???", (130, 130, 155))
-                surface.blit(lt, (cx + 120, cy + 25))
+                UI.label(_font_xs, "???", (130, 130, 155), (cx + 120, cy + 25))
 
     # 收集进度
     total_chars = len(CHARACTER_CODEX)
@@ -929,14 +935,15 @@ def draw_codex_screen(surface, save_data, tab='characters'):
     total = total_chars + total_weaps + total_enem + total_boss + total_equip
     done = u_chars + u_weaps + u_enem + u_boss + u_equip
     pct = int(done / max(1, total) * 100)
-    pt = _render_outlined(_font_xs, i18n.t("收集进度: {done}/{total} ({pct}%)", done=done, total=total, pct=pct), GOLD)
-    surface.blit(pt, (WIDTH - pt.get_width() - 20, HEIGHT - 60))
+    UI.label(_font_xs, i18n.t("收集进度: {done}/{total} ({pct}%)", done=done, total=total, pct=pct), GOLD,
+             (WIDTH - 20, HEIGHT - 60), 'topright')
 
     # 返回按钮
     back_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT - 50, 200, 36)
-    draw_button(surface, back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
+    UI.button(back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
     buttons['back'] = back_rect
 
+    UI.present()
     return buttons
 
 
@@ -944,18 +951,16 @@ def draw_codex_screen(surface, save_data, tab='characters'):
 def draw_dungeon_select(surface, save_data):
     """副本选择界面, 返回按钮字典"""
     buttons = {}
-    surface.fill((8, 6, 14))
+    UI.begin(surface, 'dungeon_select', (8, 6, 14))
 
-    title = _render_outlined(_font_lg, i18n.t("副 本 选 择"), ORANGE)
-    surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
+    UI.label(_font_lg, i18n.t("副 本 选 择"), ORANGE, (WIDTH // 2, 20), 'midtop')
 
     # 金币钻石
-    ct = _render_outlined(
+    UI.label(
         _font_sm,
         i18n.t("金币: {gold}  钻石: {diamond}", gold=save_data.get('gold', 0), diamond=save_data.get('diamond', 0)),
-        GOLD,
+        GOLD, (WIDTH // 2, 70), 'midtop',
     )
-    surface.blit(ct, (WIDTH // 2 - ct.get_width() // 2, 70))
 
     total_kills = save_data.get('best_kills', 0)
 
@@ -968,33 +973,28 @@ def draw_dungeon_select(surface, save_data):
         unlocked = total_kills >= dg['unlock_need']
 
         color = dg['color']
-        pygame.draw.rect(surface, (*color, 18) if unlocked else (20, 20, 30), card, border_radius=10)
-        pygame.draw.rect(surface, color if unlocked else (60, 60, 75), card, 2, border_radius=10)
+        UI.rect((*color, 18) if unlocked else (20, 20, 30), card, radius=10)
+        UI.rect(color if unlocked else (60, 60, 75), card, 2, radius=10)
 
         if unlocked:
-            nt = _render_outlined(_font_md, i18n.t(dg['name']), color)
-            surface.blit(nt, (cx + 15, cy + 10))
+            UI.label(_font_md, i18n.t(dg['name']), color, (cx + 15, cy + 10))
             # 难度星星
             stars = "★" * dg['difficulty'] + "☆" * (5 - dg['difficulty'])
-            st = _render_outlined(_font_xs, i18n.t("难度: {stars}", stars=stars), ORANGE)
-            surface.blit(st, (cx + 15, cy + 45))
+            UI.label(_font_xs, i18n.t("难度: {stars}", stars=stars), ORANGE, (cx + 15, cy + 45))
             # 描述
             desc_txt = i18n.t(dg['desc'])
             desc_parts = [desc_txt[j:j + 20] for j in range(0, len(desc_txt), 20)]
             for j, part in enumerate(desc_parts[:3]):
-                dt = _render_outlined(_font_xs, part, (235, 235, 245))
-                surface.blit(dt, (cx + 15, cy + 70 + j * 18))
+                UI.label(_font_xs, part, (235, 235, 245), (cx + 15, cy + 70 + j * 18))
             # 时限
             if dg['time_limit'] > 0:
                 tm = dg['time_limit'] // 60
-                tlt = _render_outlined(_font_xs, i18n.t("时限: {minutes}分钟", minutes=tm), YELLOW)
+                UI.label(_font_xs, i18n.t("时限: {minutes}分钟", minutes=tm), YELLOW, (cx + 15, cy + 135))
             else:
-                tlt = _render_outlined(_font_xs, i18n.t("时限: 无限"), RED)
-            surface.blit(tlt, (cx + 15, cy + 135))
+                UI.label(_font_xs, i18n.t("时限: 无限"), RED, (cx + 15, cy + 135))
             # 通关次数
             clears = save_data.get('dungeon_clears', {}).get(dg['id'], 0)
-            clt = _render_outlined(_font_xs, i18n.t("通关: {count}次", count=clears), (235, 235, 245))
-            surface.blit(clt, (cx + 15, cy + 160))
+            UI.label(_font_xs, i18n.t("通关: {count}次", count=clears), (235, 235, 245), (cx + 15, cy + 160))
             # 奖励预览
             rew_parts = []
             for k, v in dg['rewards'].items():
@@ -1010,44 +1010,46 @@ def draw_dungeon_select(surface, save_data):
                     rn = {'gold': i18n.t('金币'), 'diamond': i18n.t('钻石')}.get(k, k)
                     rew_parts.append(f"{rn}:{v}")
             if rew_parts:
-                rwt = _render_outlined(_font_xs, i18n.t("奖励: ") + " ".join(rew_parts), GOLD)
-                surface.blit(rwt, (cx + 15, cy + 185))
+                UI.label(_font_xs, i18n.t("奖励: ") + " ".join(rew_parts), GOLD, (cx + 15, cy + 185))
             # 进入按钮
             enter_rect = pygame.Rect(cx + 120, cy + 220, 130, 36)
-            draw_button(surface, enter_rect, i18n.t("进入"), color, _font_sm)
+            UI.button(enter_rect, i18n.t("进入"), color, _font_sm)
             buttons[('dungeon', i)] = enter_rect
         else:
-            lt = _render_outlined(_font_md, i18n.t("🔒 未解锁"), (140, 140, 165))
-            surface.blit(lt, (cx + 100, cy + 100))
-            need = _render_outlined(_font_xs, i18n.t("需要累计击杀 {need}", need=dg['unlock_need']), (170, 170, 200))
-            surface.blit(need, (cx + 80, cy + 150))
+            UI.label(_font_md, i18n.t("🔒 未解锁"), (140, 140, 165), (cx + 100, cy + 100))
+            UI.label(_font_xs, i18n.t("需要累计击杀 {need}", need=dg['unlock_need']), (170, 170, 200),
+                     (cx + 80, cy + 150))
 
     # 返回
     back_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT - 50, 200, 36)
-    draw_button(surface, back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
+    UI.button(back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
     buttons['back'] = back_rect
+
+    UI.present()
     return buttons
 
 
 # ---- 角色升级界面 ----
-def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=None, equip_scroll=0):
-    """角色局外升级界面, 返回按钮字典"""
+def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=None, equip_scroll=0,
+                             rarity_filter=None, slot_filter=None, sort_order=warehouse.ORDER_NEW):
+    """
+    角色局外升级界面, 返回按钮字典
+    仓库列表只取 (过滤 / 排序后) 当前页的装备, 每行贴图按装备状态缓存
+    """
     buttons = {}
     hover_tooltip = None  # (text_lines, x, y)
-    surface.fill((8, 8, 14))
+    UI.begin(surface, 'char_upgrade', (8, 8, 14))
 
-    title = _render_outlined(_font_lg, i18n.t("角色升级"), CYAN)
-    surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 15))
+    UI.label(_font_lg, i18n.t("角色升级"), CYAN, (WIDTH // 2, 15), 'midtop')
 
     # 货币
-    ct = _render_outlined(
+    UI.label(
         _font_sm,
         i18n.t("金币: {gold}  钻石: {diamond}", gold=save_data.get('gold', 0), diamond=save_data.get('diamond', 0)),
-        GOLD,
+        GOLD, (WIDTH // 2, 60), 'midtop',
     )
-    surface.blit(ct, (WIDTH // 2 - ct.get_width() // 2, 60))
 
-    mx, my = pygame.mouse.get_pos()
+    mx, my = render_scale.mouse_pos()
 
     # 角色选项卡
     unlocked_chars = save_data.get('unlocked_chars', [0])
@@ -1057,13 +1059,9 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
         active = (selected_char == i)
         is_char_unlocked = idx in unlocked_chars
         tc = color if active else (170, 170, 190) if is_char_unlocked else (80, 80, 100)
-        bs = pygame.Surface((180, 32), pygame.SRCALPHA)
-        pygame.draw.rect(bs, (*tc, 40 if active else 15), (0, 0, 180, 32), border_radius=5)
-        pygame.draw.rect(bs, (*tc, 160 if active else 70), (0, 0, 180, 32), 2, border_radius=5)
-        surface.blit(bs, (tx, 95))
+        _ui_frame(trect, tc, 40 if active else 15, 160 if active else 70)
         label = f"{i18n.t(title_str)}·{i18n.t(name)}" if is_char_unlocked else f"🔒 {i18n.t(name)}"
-        nt = _render_outlined(_font_xs, label, tc)
-        surface.blit(nt, (tx + 90 - nt.get_width() // 2, 100))
+        UI.label(_font_xs, label, tc, (tx + 90, 100), 'midtop')
         buttons[('char_tab', i)] = trect
 
     # 选中角色信息
@@ -1077,48 +1075,35 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
     # 角色大卡
     info_y = 145
     panel = pygame.Rect(30, info_y, 500, 350)
-    pygame.draw.rect(surface, (*ccolor, 12), panel, border_radius=10)
-    pygame.draw.rect(surface, ccolor, panel, 2, border_radius=10)
+    UI.rect((*ccolor, 12), panel, radius=10)
+    UI.rect(ccolor, panel, 2, radius=10)
 
-    nt = _render_outlined(_font_md, f"{i18n.t(ctitle)}·{i18n.t(cname)}", ccolor)
-    surface.blit(nt, (50, info_y + 10))
+    UI.label(_font_md, f"{i18n.t(ctitle)}·{i18n.t(cname)}", ccolor, (50, info_y + 10))
 
     # 角色形象预览 (右上角)
     char_preview_x = 430
     char_preview_y = info_y + 80
-    try:
-        temp_char = characters.create_character(cidx, char_preview_x, char_preview_y)
-        temp_char.anim_timer = pygame.time.get_ticks() / 1000.0
-        temp_char.draw(surface, (0, 0))
-    except Exception:
-        pygame.draw.circle(surface, ccolor, (char_preview_x, char_preview_y), 20)
-        pygame.draw.circle(surface, WHITE, (char_preview_x, char_preview_y), 20, 2)
+    _ui_char_preview(cidx, char_preview_x, char_preview_y, pygame.time.get_ticks() / 1000.0, ccolor)
 
     # 初始武器图标
     widx = CHAR_STARTER_WEAPON.get(cidx, 0)
     wname, wcolor_w, _ = WEAPON_CODEX[widx]
-    _draw_weapon_icon(surface, char_preview_x, char_preview_y + 40, widx, 18)
-    wnt = _render_outlined(_font_xs, i18n.t(wname), wcolor_w)
-    surface.blit(wnt, (char_preview_x - wnt.get_width() // 2, char_preview_y + 55))
+    _ui_weapon_icon(char_preview_x, char_preview_y + 40, widx, 18)
+    UI.label(_font_xs, i18n.t(wname), wcolor_w, (char_preview_x, char_preview_y + 55), 'midtop')
 
     if not is_selected_unlocked:
         # 未解锁角色 - 显示解锁条件
-        lock_overlay = pygame.Surface((500, 350), pygame.SRCALPHA)
-        lock_overlay.fill((0, 0, 0, 120))
-        surface.blit(lock_overlay, (30, info_y))
-        lt = _render_outlined(_font_md, i18n.t("🔒 角色未解锁"), (180, 80, 80))
-        surface.blit(lt, (150, info_y + 100))
+        lock_overlay = UI.cached(('lock_overlay', 500, 350), lambda: _lock_overlay(500, 350))
+        UI.blit(lock_overlay, (30, info_y), ('lock_overlay', 500, 350))
+        UI.label(_font_md, i18n.t("🔒 角色未解锁"), (180, 80, 80), (150, info_y + 100))
         cond = CHAR_UNLOCK_CONDITIONS.get(real_idx, {})
         cond_desc = i18n.t(cond.get('desc', '未知'))
-        ct2 = _render_outlined(_font_sm, i18n.t("解锁条件: {cond}", cond=cond_desc), (200, 200, 220))
-        surface.blit(ct2, (150, info_y + 145))
+        UI.label(_font_sm, i18n.t("解锁条件: {cond}", cond=cond_desc), (200, 200, 220), (150, info_y + 145))
         best = save_data.get('best_kills', 0)
         need = cond.get('need', 0)
-        pt = _render_outlined(_font_xs, i18n.t("当前进度: {best}/{need}", best=best, need=need), GOLD)
-        surface.blit(pt, (150, info_y + 180))
+        UI.label(_font_xs, i18n.t("当前进度: {best}/{need}", best=best, need=need), GOLD, (150, info_y + 180))
     else:
-        lt = _render_outlined(_font_sm, f"Lv.{char_lv} / 150   {i18n.t('进阶')}:{char_asc}", GOLD)
-        surface.blit(lt, (50, info_y + 50))
+        UI.label(_font_sm, f"Lv.{char_lv} / 150   {i18n.t('进阶')}:{char_asc}", GOLD, (50, info_y + 50))
 
         # 属性加成
         bonus = get_char_stat_bonus(char_lv)
@@ -1128,8 +1113,7 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
         for sk, sv in bonus.items():
             sn = stat_cn.get(sk, sk)
             sv_str = f"+{sv}" if isinstance(sv, int) else f"+{sv*100:.1f}%"
-            st = _render_outlined(_font_xs, f"{sn}: {sv_str}", (240, 245, 255))
-            surface.blit(st, (50, sy))
+            UI.label(_font_xs, f"{sn}: {sv_str}", (240, 245, 255), (50, sy))
             sy += 22
 
         # 已装备的局外装备显示
@@ -1139,8 +1123,7 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
             rarity_colors = {'common': (200,200,200), 'uncommon': (100,220,100),
                              'rare': (80,150,255), 'epic': (180,80,255), 'legendary': (255,200,50)}
             eq_y = info_y + 200
-            et_label = _render_outlined(_font_xs, i18n.t("已装备:"), (200, 200, 220))
-            surface.blit(et_label, (50, eq_y))
+            UI.label(_font_xs, i18n.t("已装备:"), (200, 200, 220), (50, eq_y))
             eq_y += 20
             for slot in ['weapon', 'armor', 'accessory', 'rune']:
                 slot_rect = pygame.Rect(50, eq_y, 200, 20)
@@ -1148,8 +1131,7 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
                     widx, tpl, eq_lv = char_eq[slot]
                     rc = rarity_colors.get(tpl[2], WHITE)
                     txt = f"{slot_cn[slot]}: {i18n.t(tpl[0])} Lv.{eq_lv}"
-                    st = _render_outlined(_font_xs, txt, rc)
-                    surface.blit(st, (50, eq_y))
+                    UI.label(_font_xs, txt, rc, (50, eq_y))
                     # hover tooltip
                     if slot_rect.inflate(100, 4).collidepoint(mx, my):
                         stat_cn2 = {
@@ -1167,11 +1149,10 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
                         hover_tooltip = (lines, mx + 15, my)
                     # 卸下按钮
                     ubtn = pygame.Rect(260, eq_y, 50, 18)
-                    draw_button(surface, ubtn, i18n.t("卸下"), (200, 100, 100), _font_xs)
+                    UI.button(ubtn, i18n.t("卸下"), (200, 100, 100), _font_xs)
                     buttons[('unequip', slot)] = ubtn
                 else:
-                    st = _render_outlined(_font_xs, f"{slot_cn[slot]}: {i18n.t('-- 空 --')}", (100, 100, 130))
-                    surface.blit(st, (50, eq_y))
+                    UI.label(_font_xs, f"{slot_cn[slot]}: {i18n.t('-- 空 --')}", (100, 100, 130), (50, eq_y))
                 eq_y += 22
 
         # 需要进阶?
@@ -1183,12 +1164,11 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
             if need_ascend:
                 asc_tier = char_asc
                 gold_cost, dia_cost, mat_cost = get_char_ascend_cost(asc_tier)
-                at = _render_outlined(
+                UI.label(
                     _font_xs,
                     i18n.t("需要进阶(阶{tier}) 金:{gold} 钻:{diamond}", tier=asc_tier + 1, gold=gold_cost, diamond=dia_cost),
-                    ORANGE,
+                    ORANGE, (50, btn_y),
                 )
-                surface.blit(at, (50, btn_y))
                 # 显示材料消耗
                 mat_cn = {
                     'iron': i18n.material_short('iron'),
@@ -1205,39 +1185,35 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
                     enough = have >= mv
                     mc = mat_clr.get(mk, ORANGE)
                     mtxt = f"{mat_cn.get(mk, mk)}:{have}/{mv}"
-                    mt_r = _render_outlined(_font_xs, mtxt, mc if enough else (180, 60, 60))
-                    surface.blit(mt_r, (mat_x, btn_y + 16))
-                    mat_x += mt_r.get_width() + 12
+                    mt_r = UI.label(_font_xs, mtxt, mc if enough else (180, 60, 60), (mat_x, btn_y + 16))
+                    mat_x += mt_r.w + 12
                 can_asc = (save_data.get('gold',0) >= gold_cost and
                            save_data.get('diamond',0) >= dia_cost and
                            all(save_data.get('meta_materials',{}).get(m,0)>=c for m,c in mat_cost.items()))
                 asc_rect = pygame.Rect(50, btn_y + 34, 130, 30)
-                draw_button(surface, asc_rect, i18n.t("进阶"), ORANGE if can_asc else (80,80,80), _font_sm)
+                UI.button(asc_rect, i18n.t("进阶"), ORANGE if can_asc else (80,80,80), _font_sm)
                 if can_asc:
                     buttons['char_ascend'] = asc_rect
             else:
                 gold_cost = get_char_level_cost(char_lv)
                 can_up = save_data.get('gold',0) >= gold_cost
-                ut = _render_outlined(_font_xs, i18n.t("升级: {gold}金币", gold=gold_cost), GOLD)
-                surface.blit(ut, (50, btn_y))
+                UI.label(_font_xs, i18n.t("升级: {gold}金币", gold=gold_cost), GOLD, (50, btn_y))
                 up_rect = pygame.Rect(50, btn_y + 20, 100, 30)
-                draw_button(surface, up_rect, i18n.t("升级"), GREEN if can_up else (80,80,80), _font_sm)
+                UI.button(up_rect, i18n.t("升级"), GREEN if can_up else (80,80,80), _font_sm)
                 if can_up:
                     buttons['char_levelup'] = up_rect
                 cost10 = sum(get_char_level_cost(char_lv + j) for j in range(min(10, 150 - char_lv))
                              if (char_lv + j) % 10 != 0 or char_asc >= (char_lv + j) // 10)
                 if cost10 > 0 and save_data.get('gold',0) >= cost10:
                     up10_rect = pygame.Rect(170, btn_y + 20, 140, 30)
-                    draw_button(surface, up10_rect, f"x10({cost10})", GREEN, _font_sm)
+                    UI.button(up10_rect, f"x10({cost10})", GREEN, _font_sm)
                     buttons['char_levelup10'] = up10_rect
         else:
-            mt = _render_outlined(_font_sm, i18n.t("已满级!"), GOLD)
-            surface.blit(mt, (50, btn_y))
+            UI.label(_font_sm, i18n.t("已满级!"), GOLD, (50, btn_y))
 
     # ---- 右侧: 装备仓库 (可穿戴) ----
     right_x = 560
-    et = _render_outlined(_font_sm, i18n.t("装备仓库 (点击装备到当前角色)"), YELLOW)
-    surface.blit(et, (right_x, info_y + 5))
+    UI.label(_font_sm, i18n.t("装备仓库 (点击装备到当前角色)"), YELLOW, (right_x, info_y + 5))
 
     # ---- 批量出售按钮组 ----
     sell_filter_options = [
@@ -1246,8 +1222,7 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
         ('sell_keep_rare', i18n.t('保留稀有+'),  ['rare', 'epic', 'legendary']),
     ]
     sell_bx = right_x + 330
-    sell_label = _render_outlined(_font_xs, i18n.t("快速出售:"), (220, 160, 80))
-    surface.blit(sell_label, (sell_bx, info_y + 6))
+    UI.label(_font_xs, i18n.t("快速出售:"), (220, 160, 80), (sell_bx, info_y + 6))
     for si, (sell_key, sell_text, keep_list) in enumerate(sell_filter_options):
         s_count, s_gold = count_sellable_equipment(save_data, equipment_db, keep_list)
         sbx = sell_bx + si * 115
@@ -1256,89 +1231,76 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
         if s_count > 0:
             # 有可出售的
             btn_col = (200, 100, 60)
-            draw_button(surface, sb_rect, sell_text, btn_col, _font_xs)
+            UI.button(sb_rect, sell_text, btn_col, _font_xs)
             # 显示数量和金额
-            count_txt = _render_outlined(_font_xs, i18n.t("{count}件→{gold}金", count=s_count, gold=s_gold), (255, 200, 100))
-            surface.blit(count_txt, (sbx + 2, sby + 17))
+            UI.label(_font_xs, i18n.t("{count}件→{gold}金", count=s_count, gold=s_gold), (255, 200, 100),
+                     (sbx + 2, sby + 17))
             buttons[('batch_sell', sell_key)] = sb_rect
         else:
             # 灰色不可点
-            draw_button(surface, sb_rect, sell_text, (60, 60, 70), _font_xs, hover_check=False)
-            no_txt = _render_outlined(_font_xs, i18n.t("无可售"), (100, 100, 110))
-            surface.blit(no_txt, (sbx + 30, sby + 17))
+            UI.button(sb_rect, sell_text, (60, 60, 70), _font_xs, hover_check=False)
+            UI.label(_font_xs, i18n.t("无可售"), (100, 100, 110), (sbx + 30, sby + 17))
 
-    meta_equips = save_data.get('meta_equipment', [])
     slot_names = {s: i18n.slot_name(s) for s in ['weapon', 'armor', 'accessory', 'rune']}
     rarity_colors = {'common': (200,200,200), 'uncommon': (100,220,100),
                      'rare': (80,150,255), 'epic': (180,80,255), 'legendary': (255,200,50)}
     rarity_names = {k: i18n.rarity_name(k) for k in ['common', 'uncommon', 'rare', 'epic', 'legendary']}
 
-    # 检查哪些装备已被穿戴
-    all_equipped_idxs = set()
-    me = save_data.get('meta_equipped', {})
-    for ck, cv in me.items():
-        for s, wi in cv.items():
-            all_equipped_idxs.add(wi)
-
-    # 分页显示, 每页14件
+    # 分页显示, 每页14件; 只取当前页 (另预烘焙下一页开头几行)
     page_size = 14
-    total_equips = len(meta_equips)
+    wh = get_warehouse(save_data, equipment_db) if equipment_db is not None else None
+    view = wh.view(rarity_filter, slot_filter, sort_order) if wh is not None else None
+    total_equips = len(view) if view is not None else 0
     max_scroll = max(0, total_equips - page_size)
     equip_scroll = min(equip_scroll, max_scroll)
-    visible = meta_equips[equip_scroll:equip_scroll + page_size]
+    window = view.window(equip_scroll, page_size + EQUIP_OVERSCAN) if view is not None else []
+    visible = window[:page_size]
 
-    for i, meq in enumerate(visible):
-        if equipment_db is None:
-            break
-        real_idx = equip_scroll + i
-        tidx = meq.get('template_idx', 0)
+    def row_surface(real_idx):
+        """一行装备卡片 (底色、边框、品质点、名称、部位), 按装备状态缓存; 按钮另行绘制"""
+        tidx = wh.template(real_idx)
+        tpl = equipment_db[tidx]
+        eq_lv = wh.level(real_idx)
+        owner = wh.owner(real_idx)
+        key = ('equip_row', tidx, eq_lv, wh.ascend(real_idx), owner)
+        return key, UI.cached(key, lambda: _equip_row_surface(
+            tpl, eq_lv, owner is not None, rarity_colors.get(tpl[2], WHITE),
+            slot_names.get(tpl[1], tpl[1]), rarity_names.get(tpl[2], '')))
+
+    for real_idx in window[page_size:]:
+        if wh.template(real_idx) < len(equipment_db):
+            row_surface(real_idx)
+
+    for i, real_idx in enumerate(visible):
+        tidx = wh.template(real_idx)
         if tidx >= len(equipment_db):
             continue
         tpl = equipment_db[tidx]
-        eq_lv = meq.get('level', 1)
+        eq_lv = wh.level(real_idx)
         row = i // 2
         col = i % 2
         ex = right_x + col * 310
         ey = info_y + 28 + row * 44
-        erect = pygame.Rect(ex, ey, 295, 40)
+        erect = pygame.Rect(ex, ey, EQUIP_ROW_W, EQUIP_ROW_H)
         rc = rarity_colors.get(tpl[2], WHITE)
-        is_worn = real_idx in all_equipped_idxs
-
-        # 品质特效背景
-        bg_alpha = 15 if not is_worn else 25
-        pygame.draw.rect(surface, (*rc, bg_alpha), erect, border_radius=4)
-        border_w = 2 if is_worn else 1
-        pygame.draw.rect(surface, rc, erect, border_w, border_radius=4)
-
-        # 品质标识小点
-        rarity_idx = ['common','uncommon','rare','epic','legendary'].index(tpl[2])
-        for dot_i in range(rarity_idx + 1):
-            dot_x = ex + 6 + dot_i * 8
-            pygame.draw.circle(surface, rc, (dot_x, ey + 36), 2)
-
-        nt = _render_outlined(_font_xs, f"{i18n.t(tpl[0])} Lv.{eq_lv}", rc)
-        surface.blit(nt, (ex + 6, ey + 3))
+        is_worn = wh.owner(real_idx) is not None
         sns = slot_names.get(tpl[1], tpl[1])
         rn = rarity_names.get(tpl[2], '')
-        st = _render_outlined(_font_xs, f"{sns} [{rn}]", (220, 220, 235))
-        surface.blit(st, (ex + 6, ey + 20))
 
-        # 已穿戴标记
-        if is_worn:
-            worn_label = _render_outlined(_font_xs, i18n.t("已装备"), GREEN)
-            surface.blit(worn_label, (ex + 200, ey + 3))
+        key, surf = row_surface(real_idx)
+        UI.blit(surf, (ex, ey), key)
 
         # 穿戴/升级按钮
         if is_selected_unlocked and not is_worn:
             eq_btn = pygame.Rect(ex + 200, ey + 2, 55, 18)
-            draw_button(surface, eq_btn, i18n.t("穿戴"), rc, _font_xs)
+            UI.button(eq_btn, i18n.t("穿戴"), rc, _font_xs)
             buttons[('meta_equip', real_idx)] = eq_btn
 
         eq_cost = get_meta_equip_level_cost(eq_lv, tpl[2])
         if eq_lv < 150 and eq_cost > 0:
             can = save_data.get('gold', 0) >= eq_cost
             up_btn = pygame.Rect(ex + 200, ey + 22, 80, 16)
-            draw_button(surface, up_btn, f"↑{eq_cost}", GREEN if can else (60,60,60), _font_xs)
+            UI.button(up_btn, f"↑{eq_cost}", GREEN if can else (60,60,60), _font_xs)
             if can:
                 buttons[('equip_up', real_idx)] = up_btn
 
@@ -1361,15 +1323,27 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
     # 翻页按钮
     if equip_scroll > 0:
         prev_btn = pygame.Rect(right_x + 200, info_y + page_size // 2 * 44 + 36, 80, 24)
-        draw_button(surface, prev_btn, i18n.t("◀上页"), (180,180,200), _font_xs)
+        UI.button(prev_btn, i18n.t("◀上页"), (180,180,200), _font_xs)
         buttons['equip_prev'] = prev_btn
     if equip_scroll + page_size < total_equips:
         next_btn = pygame.Rect(right_x + 290, info_y + page_size // 2 * 44 + 36, 80, 24)
-        draw_button(surface, next_btn, i18n.t("下页▶"), (180,180,200), _font_xs)
+        UI.button(next_btn, i18n.t("下页▶"), (180,180,200), _font_xs)
         buttons['equip_next'] = next_btn
 
-    pg_text = _render_outlined(_font_xs, f"{equip_scroll+1}-{min(equip_scroll+page_size, total_equips)}/{total_equips}", (160,160,180))
-    surface.blit(pg_text, (right_x + 400, info_y + page_size // 2 * 44 + 40))
+    UI.label(_font_xs, f"{equip_scroll+1}-{min(equip_scroll+page_size, total_equips)}/{total_equips}", (160,160,180),
+             (right_x + 400, info_y + page_size // 2 * 44 + 40))
+
+    # 筛选 / 排序 (点击循环切换)
+    bar_y = info_y + page_size // 2 * 44 + 66
+    filter_labels = [
+        ('rarity', i18n.t("品质: {rarity}", rarity=i18n.rarity_name(rarity_filter) if rarity_filter else i18n.t("全部"))),
+        ('slot', i18n.t("部位: {slot}", slot=i18n.slot_name(slot_filter) if slot_filter else i18n.t("全部"))),
+        ('order', i18n.t("排序: {order}", order=i18n.t(EQUIP_ORDER_NAMES[sort_order]))),
+    ]
+    for fi, (fkey, ftext) in enumerate(filter_labels):
+        frect = pygame.Rect(right_x + fi * 160, bar_y, 150, 26)
+        UI.button(frect, ftext, (180, 180, 200), _font_xs)
+        buttons[('equip_filter', fkey)] = frect
 
     # 材料显示
     mi_y = HEIGHT - 70
@@ -1385,34 +1359,28 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
     mmx = 20
     for mk in ['iron', 'shadow', 'crystal', 'dragon', 'abyss']:
         cnt = save_data.get('meta_materials', {}).get(mk, 0)
-        mnt = _render_outlined(_font_xs, f"{mat_names[mk]}:{cnt}", mat_colors[mk])
-        surface.blit(mnt, (mmx, mi_y))
+        UI.label(_font_xs, f"{mat_names[mk]}:{cnt}", mat_colors[mk], (mmx, mi_y))
         mmx += 120
 
     # 返回
     back_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT - 45, 200, 36)
-    draw_button(surface, back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
+    UI.button(back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
     buttons['back'] = back_rect
 
     # ---- 绘制悬浮提示 (最后绘制, 在最上层) ----
     if hover_tooltip:
         lines, tx, ty = hover_tooltip
-        tw = max(len(l) * 9 + 20 for l in lines)
-        th = len(lines) * 18 + 12
+        key = ('tooltip', tuple(lines))
+        tip_surf = UI.cached(key, lambda: _tooltip_surface(lines))
+        tw, th = tip_surf.get_size()
         # 防止超出屏幕
         if tx + tw > WIDTH:
             tx = WIDTH - tw - 5
         if ty + th > HEIGHT:
             ty = HEIGHT - th - 5
-        tip_surf = pygame.Surface((tw, th), pygame.SRCALPHA)
-        pygame.draw.rect(tip_surf, (10, 10, 20, 230), (0, 0, tw, th), border_radius=6)
-        pygame.draw.rect(tip_surf, (200, 200, 220, 180), (0, 0, tw, th), 2, border_radius=6)
-        for li, line in enumerate(lines):
-            color = GOLD if li == 0 else (230, 230, 240)
-            lt = _render_outlined(_font_xs, line, color)
-            tip_surf.blit(lt, (8, 6 + li * 18))
-        surface.blit(tip_surf, (tx, ty))
+        UI.blit(tip_surf, (tx, ty), key)
 
+    UI.present()
     return buttons
 
 
@@ -1420,18 +1388,16 @@ def draw_char_upgrade_screen(surface, save_data, selected_char=0, equipment_db=N
 def draw_gacha_screen(surface, save_data, gacha_results=None):
     """抽卡界面, 返回按钮字典"""
     buttons = {}
-    surface.fill((8, 5, 14))
+    UI.begin(surface, 'gacha', (8, 5, 14))
 
-    title = _render_outlined(_font_lg, i18n.t("装备召唤"), PURPLE)
-    surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
+    UI.label(_font_lg, i18n.t("装备召唤"), PURPLE, (WIDTH // 2, 20), 'midtop')
 
     # 货币
-    ct = _render_outlined(
+    UI.label(
         _font_sm,
         i18n.t("金币: {gold}  钻石: {diamond}", gold=save_data.get('gold', 0), diamond=save_data.get('diamond', 0)),
-        GOLD,
+        GOLD, (WIDTH // 2, 70), 'midtop',
     )
-    surface.blit(ct, (WIDTH // 2 - ct.get_width() // 2, 70))
 
     # 两个卡池
     pools = [
@@ -1445,46 +1411,38 @@ def draw_gacha_screen(surface, save_data, gacha_results=None):
          i18n.t("保底: {pity}抽必得传说", pity=PITY_SUPER_LEGENDARY)),
     ]
 
+    anim_t = pygame.time.get_ticks() / 1000.0
     for pi, (pool_key, pool_name, color, sub, cost_str, rate_str, pity_str) in enumerate(pools):
         px = 40 + pi * 580
         py = 110
         pw, ph = 550, 280
         panel = pygame.Rect(px, py, pw, ph)
-        pygame.draw.rect(surface, (*color, 12), panel, border_radius=10)
-        pygame.draw.rect(surface, color, panel, 2, border_radius=10)
-
-        nt = _render_outlined(_font_md, pool_name, color)
-        surface.blit(nt, (px + pw // 2 - nt.get_width() // 2, py + 10))
-        st = _render_outlined(_font_xs, sub, (240, 240, 248))
-        surface.blit(st, (px + pw // 2 - st.get_width() // 2, py + 45))
-        cst = _render_outlined(_font_xs, cost_str, GOLD)
-        surface.blit(cst, (px + pw // 2 - cst.get_width() // 2, py + 70))
-        rt = _render_outlined(_font_xs, rate_str, (235, 235, 245))
-        surface.blit(rt, (px + pw // 2 - rt.get_width() // 2, py + 95))
-        pit = _render_outlined(_font_xs, pity_str, ORANGE)
-        surface.blit(pit, (px + pw // 2 - pit.get_width() // 2, py + 118))
+        UI.rect((*color, 12), panel, radius=10)
+        UI.rect(color, panel, 2, radius=10)
+
+        mid = px + pw // 2
+        UI.label(_font_md, pool_name, color, (mid, py + 10), 'midtop')
+        UI.label(_font_xs, sub, (240, 240, 248), (mid, py + 45), 'midtop')
+        UI.label(_font_xs, cost_str, GOLD, (mid, py + 70), 'midtop')
+        UI.label(_font_xs, rate_str, (235, 235, 245), (mid, py + 95), 'midtop')
+        UI.label(_font_xs, pity_str, ORANGE, (mid, py + 118), 'midtop')
 
         # 当前保底计数
         pity_key = f'gacha_pity_{pool_key}'
         pity_now = save_data.get(pity_key, 0)
         pity_max = PITY_NORMAL_EPIC if pool_key == 'normal' else PITY_SUPER_LEGENDARY
-        pt = _render_outlined(_font_xs, i18n.t("已抽: {now}/{max}", now=pity_now, max=pity_max), (235, 235, 245))
-        surface.blit(pt, (px + pw // 2 - pt.get_width() // 2, py + 142))
+        UI.label(_font_xs, i18n.t("已抽: {now}/{max}", now=pity_now, max=pity_max), (235, 235, 245),
+                 (mid, py + 142), 'midtop')
 
         # 角色装饰形象 (卡池展示)
         showcase_chars = [0, 3, 5] if pi == 0 else [1, 2, 4]
         for sci, sc_idx in enumerate(showcase_chars):
             sc_x = px + 60 + sci * 160
             sc_y = py + 250
-            try:
-                sc_char = characters.create_character(sc_idx, sc_x, sc_y)
-                sc_char.anim_timer = pygame.time.get_ticks() / 1000.0 + sci * 0.5
-                sc_char.draw(surface, (0, 0))
-            except Exception:
-                pass
+            _ui_char_preview(sc_idx, sc_x, sc_y, anim_t + sci * 0.5)
             # 武器图标
             sc_widx = CHAR_STARTER_WEAPON.get(sc_idx, 0)
-            _draw_weapon_icon(surface, sc_x, sc_y + 30, sc_widx, 12)
+            _ui_weapon_icon(sc_x, sc_y + 30, sc_widx, 12)
 
         # 按钮
         pull1_rect = pygame.Rect(px + 40, py + 175, 200, 40)
@@ -1497,8 +1455,8 @@ def draw_gacha_screen(surface, save_data, gacha_results=None):
             can1 = save_data.get('diamond', 0) >= SUPER_GACHA_COST
             can10 = save_data.get('diamond', 0) >= SUPER_GACHA_10_COST
 
-        draw_button(surface, pull1_rect, i18n.t("单抽"), color if can1 else (60, 60, 60), _font_sm)
-        draw_button(surface, pull10_rect, i18n.t("十连抽!"), color if can10 else (60, 60, 60), _font_sm)
+        UI.button(pull1_rect, i18n.t("单抽"), color if can1 else (60, 60, 60), _font_sm)
+        UI.button(pull10_rect, i18n.t("十连抽!"), color if can10 else (60, 60, 60), _font_sm)
         if can1:
             buttons[(pool_key, 'pull1')] = pull1_rect
         if can10:
@@ -1507,8 +1465,7 @@ def draw_gacha_screen(surface, save_data, gacha_results=None):
     # 抽卡结果
     if gacha_results:
         ry = 420
-        result_title = _render_outlined(_font_sm, i18n.t("— 召唤结果 —"), GOLD)
-        surface.blit(result_title, (WIDTH // 2 - result_title.get_width() // 2, ry))
+        UI.label(_font_sm, i18n.t("— 召唤结果 —"), GOLD, (WIDTH // 2, ry), 'midtop')
         ry += 35
         rarity_names = {k: i18n.rarity_name(k) for k in ['common', 'uncommon', 'rare', 'epic', 'legendary']}
         rarity_colors = {'common': (200, 200, 200), 'uncommon': (100, 220, 100),
@@ -1522,25 +1479,24 @@ def draw_gacha_screen(surface, save_data, gacha_results=None):
             tpl = EQUIPMENT_DB[tidx]
             rc = rarity_colors.get(rarity, WHITE)
             card_rect = pygame.Rect(rx, ry2, 200, 50)
-            pygame.draw.rect(surface, (*rc, 15), card_rect, border_radius=5)
-            pygame.draw.rect(surface, rc, card_rect, 1, border_radius=5)
+            UI.rect((*rc, 15), card_rect, radius=5)
+            UI.rect(rc, card_rect, 1, radius=5)
             # 品质小点
             rarity_i = ['common','uncommon','rare','epic','legendary'].index(rarity) if rarity in ['common','uncommon','rare','epic','legendary'] else 0
             for dot_j in range(rarity_i + 1):
-                pygame.draw.circle(surface, rc, (rx + 8 + dot_j * 7, ry2 + 46), 2)
+                UI.circle(rc, (rx + 8 + dot_j * 7, ry2 + 46), 2)
             # 装备部位图标
             slot_icon_map = {'weapon': 3, 'armor': 5, 'accessory': 0, 'rune': 2}
             slot_widx = slot_icon_map.get(tpl[1], 0)
-            _draw_weapon_icon(surface, rx + 185, ry2 + 25, slot_widx, 12)
-            nt = _render_outlined(_font_xs, f"[{rarity_names.get(rarity, '')}] {i18n.t(tpl[0])}", rc)
-            surface.blit(nt, (rx + 6, ry2 + 6))
+            _ui_weapon_icon(rx + 185, ry2 + 25, slot_widx, 12)
+            UI.label(_font_xs, f"[{rarity_names.get(rarity, '')}] {i18n.t(tpl[0])}", rc, (rx + 6, ry2 + 6))
             stats_str = " ".join(f"{i18n.stat_name(k)}:{v}" for k, v in tpl[3].items())
-            st = _render_outlined(_font_xs, stats_str, (235, 235, 245))
-            surface.blit(st, (rx + 6, ry2 + 28))
+            UI.label(_font_xs, stats_str, (235, 235, 245), (rx + 6, ry2 + 28))
 
     # 返回
     back_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT - 50, 200, 36)
-    draw_button(surface, back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
+    UI.button(back_rect, i18n.t("返回"), (200, 200, 220), _font_sm)
     buttons['back'] = back_rect
 
+    UI.present()
     return buttons
@@ -0,0 +1,108 @@
+"""
+《暗夜割草者：深渊轮回》 — 小地图
+========================================
+Minimap      静态层 (底板、路径、地点等) 按 key 烘焙一次, 之后每帧只 blit 一次,
+             再叠加玩家点 / 视野框等动态标记 (标记贴图同样按参数缓存)。
+DensityGrid  把大量实体降采样到 cols×rows 的计数网格, 每隔 interval 秒重算一次,
+             渲染成半透明热度图, 用于局内战场的敌人密度显示。
+========================================
+"""
+
+import pygame
+
+
+class Minimap:
+    def __init__(self, size, world_rect, pad=5):
+        self.w, self.h = size
+        self.pad = pad
+        self.wx, self.wy, ww, wh = world_rect
+        self.scale_x = (self.w - pad * 2) / ww
+        self.scale_y = (self.h - pad * 2) / wh
+        self._static = None
+        self._static_key = None
+        self._sprites = {}
+
+    def to_map(self, x, y):
+        """世界坐标 → 小地图内像素坐标"""
+        return (int(self.pad + (x - self.wx) * self.scale_x),
+                int(self.pad + (y - self.wy) * self.scale_y))
+
+    def static_layer(self, key, bake):
+        """key 变化时调用 bake(surf) 重新烘焙静态层"""
+        if self._static is None or key != self._static_key:
+            surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+            bake(surf)
+            self._static = surf
+            self._static_key = key
+        return self._static
+
+    def dot(self, color, radius):
+        """圆点标记贴图 (color 可带 alpha)"""
+        key = ('dot', color, radius)
+        s = self._sprites.get(key)
+        if s is None:
+            s = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(s, color, (radius, radius), radius)
+            self._sprites[key] = s
+        return s
+
+    def frame(self, w, h, color):
+        """矩形线框贴图 (视野框)"""
+        key = ('frame', w, h, color)
+        s = self._sprites.get(key)
+        if s is None:
+            s = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+            pygame.draw.rect(s, color, (0, 0, w, h), 1)
+            self._sprites[key] = s
+        return s
+
+    def blit_dot(self, surface, origin, x, y, color, radius):
+        mx, my = self.to_map(x, y)
+        surface.blit(self.dot(color, radius), (origin[0] + mx - radius, origin[1] + my - radius))
+
+
+class DensityGrid:
+    def __init__(self, cols, rows, color, saturate=6, max_alpha=200, interval=0.2):
+        self.cols = cols
+        self.rows = rows
+        self.color = color
+        self.saturate = saturate        # 一格达到这么多实体时颜色最深
+        self.max_alpha = max_alpha
+        self.interval = interval
+        self._next = None
+        self._small = pygame.Surface((cols, rows), pygame.SRCALPHA)
+        self._scaled = None
+
+    def update(self, points, x0, y0, span_w, span_h, now):
+        """
+        points: 可迭代的 (x, y); (x0, y0, span_w, span_h) 为网格覆盖的世界范围。
+        距上次重算不足 interval 时直接返回 False (now 倒退视为新一局, 立即重算)。
+        """
+        if self._next is not None and self._next - self.interval <= now < self._next:
+            return False
+        self._next = now + self.interval
+        cols, rows = self.cols, self.rows
+        kx = cols / span_w
+        ky = rows / span_h
+        counts = [0] * (cols * rows)
+        for x, y in points:
+            fx = (x - x0) * kx
+            fy = (y - y0) * ky
+            if 0 <= fx < cols and 0 <= fy < rows:
+                counts[int(fy) * cols + int(fx)] += 1
+        small = self._small
+        small.fill((0, 0, 0, 0))
+        cr, cg, cb = self.color
+        sat = self.saturate
+        for i, n in enumerate(counts):
+            if n:
+                a = self.max_alpha * min(n, sat) // sat
+                small.set_at((i % cols, i // cols), (cr, cg, cb, a))
+        self._scaled = None
+        return True
+
+    def surface(self, size):
+        """放大到 size 的热度图 (重算后才重新缩放)"""
+        if self._scaled is None or self._scaled.get_size() != size:
+            self._scaled = pygame.transform.smoothscale(self._small, size)
+        return self._scaled
@@ -0,0 +1,117 @@
+"""
+《暗夜割草者：深渊轮回》 — 画质档位
+========================================
+QualityTier  一个画质档位: 粒子数量倍率 / 同屏粒子上限 / 发光贴图 / Boss 装饰效果 / 屏幕外剔除。
+Governor     按设置选择档位。'auto' 时在滚动窗口里统计每帧实际耗时
+             (clock.get_rawtime(), 不含 tick 的等待):
+               平均耗时超过帧预算                      → 降一档
+               平均耗时低于预算的 UPGRADE_RATIO 并持续 UPGRADE_HOLD 秒 → 升一档
+             升降阈值相差较大 (滞回), 换档后清空窗口并冷却 COOLDOWN 秒,
+             避免在两档之间来回跳。
+设置 (存档 'quality') 为 'auto' 或某个档位名。
+Governor 只关心档位序号, levels 可换成其他按开销从高到低排列的档位 (render_scale.SCALES)。
+========================================
+"""
+
+from collections import deque
+
+WINDOW = 45              # 滚动窗口帧数 (60 FPS 下约 0.75 秒)
+DEGRADE_RATIO = 1.0      # 平均耗时 / 帧预算 超过此值降档
+UPGRADE_RATIO = 0.55     # 低于此值开始累计升档时间 (升档后负载会回升, 留足余量)
+UPGRADE_HOLD = 4.0       # 秒
+COOLDOWN = 1.5           # 秒
+
+
+class QualityTier:
+    def __init__(self, name, label, particle_scale, particle_cap, glow, boss_detail, cull):
+        self.name = name
+        self.label = label                    # 显示名 (i18n key)
+        self.particle_scale = particle_scale  # create_particles 数量倍率
+        self.particle_cap = particle_cap      # 同屏粒子上限, None = 不限
+        self.glow = glow                      # 宝石 / 材料 / 精英敌人的发光贴图
+        self.boss_detail = boss_detail        # Boss 光环与装饰粒子
+        self.cull = cull                      # 跳过屏幕外的宝石 / 材料 / 粒子绘制
+
+
+TIERS = [
+    QualityTier('high',   '高', 1.0,  None, True,  True,  False),
+    QualityTier('medium', '中', 0.6,  600,  True,  True,  True),
+    QualityTier('low',    '低', 0.3,  250,  False, False, True),
+]
+MODES = ['auto'] + [t.name for t in TIERS]
+
+
+class Governor:
+    def __init__(self, fps, mode='auto', levels=TIERS):
+        """levels: 带 name 属性的档位列表, 0 号开销最高"""
+        self.levels = levels
+        self.modes = ['auto'] + [lv.name for lv in levels]
+        self.budget = 1000.0 / fps        # 毫秒
+        self._samples = deque(maxlen=WINDOW)
+        self._calm = 0.0                  # 连续低于升档阈值的时间
+        self._cooldown = 0.0
+        self.level = 0
+        self.mode = 'auto'
+        self.set_mode(mode)
+
+    @property
+    def tier(self):
+        return self.levels[self.level]
+
+    @property
+    def auto(self):
+        return self.mode == 'auto'
+
+    @property
+    def floor(self):
+        """已经不能再自动降档 (固定档位或已是最低档)"""
+        return self.mode != 'auto' or self.level == len(self.levels) - 1
+
+    def set_mode(self, mode):
+        """切换设置; 固定档位立即生效, 'auto' 从当前档位开始调节"""
+        if mode not in self.modes:
+            mode = 'auto'
+        self.mode = mode
+        if mode != 'auto':
+            self.level = self.modes.index(mode) - 1
+        self.reset()
+
+    def reset(self):
+        """丢弃已统计的帧 (开局 / 切换界面后的首帧耗时不具代表性)"""
+        self._samples.clear()
+        self._calm = 0.0
+        self._cooldown = 0.0
+
+    def sample(self, work_ms, dt, degrade=True, upgrade=True):
+        """
+        记录一帧耗时, 档位变化时返回 True。
+        degrade / upgrade 为 False 时不向该方向换档 (多个 Governor 串联时由调用方决定先后)。
+        """
+        if self.mode != 'auto':
+            return False
+        samples = self._samples
+        samples.append(work_ms)
+        if self._cooldown > 0:
+            self._cooldown -= dt
+            return False
+        if len(samples) < WINDOW:
+            return False
+        avg = sum(samples) / WINDOW
+        if avg > self.budget * DEGRADE_RATIO:
+            self._calm = 0.0
+            if degrade and self.level < len(self.levels) - 1:
+                return self._shift(1)
+        elif avg < self.budget * UPGRADE_RATIO:
+            self._calm += dt
+            if upgrade and self._calm >= UPGRADE_HOLD and self.level > 0:
+                return self._shift(-1)
+        else:
+            self._calm = 0.0
+        return False
+
+    def _shift(self, step):
+        self.level += step
+        self._samples.clear()
+        self._calm = 0.0
+        self._cooldown = COOLDOWN
+        return True
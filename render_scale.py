@@ -0,0 +1,81 @@
+"""
+《暗夜割草者：深渊轮回》 — 内部渲染分辨率
+========================================
+窗口按设置的分辨率创建, 但各界面画到 target (内部画布) 上, 每帧 present() 时一次性放大到窗口。
+  比例 100% 时 target 就是窗口 Surface 本身, 没有额外拷贝。
+  内部尺寸 = 窗口尺寸 × 比例, 但不小于 MIN_SIZE: 界面布局与字号按 1280×720 设计, 再小就放不下,
+  所以 1280×720 窗口下比例不起作用, 分辨率越高可降的幅度越大。
+  放大用 pygame.transform.scale (最近邻, 1280×720 → 1920×1080 约 2.7ms;
+  smoothscale 约 7ms, 抵掉了大半节省)。
+鼠标: mouse_pos() 把窗口坐标换算为内部画布坐标, 所有按钮命中判断都通过它取鼠标位置。
+========================================
+"""
+
+import pygame
+
+MIN_SIZE = (1280, 720)
+
+
+class ScaleLevel:
+    def __init__(self, name, factor):
+        self.name = name          # 存档值
+        self.factor = factor
+        self.label = f"{name}%"
+
+
+# 按开销从高到低, 供 quality.Governor 自动调节
+SCALES = [
+    ScaleLevel('100', 1.0),
+    ScaleLevel('85', 0.85),
+    ScaleLevel('75', 0.75),
+    ScaleLevel('67', 2 / 3),
+    ScaleLevel('50', 0.5),
+]
+
+_display = None          # 窗口 Surface
+_target = None           # 内部画布 (比例 100% 时即 _display)
+_to_target = (1.0, 1.0)  # 窗口坐标 → 内部坐标
+
+
+def configure(display, factor):
+    """窗口重建或比例变化后调用, 返回内部画布"""
+    global _display, _target, _to_target
+    dw, dh = display.get_size()
+    w = min(dw, max(MIN_SIZE[0], int(dw * factor)))
+    h = min(dh, max(MIN_SIZE[1], int(dh * factor)))
+    if (w, h) == (dw, dh):
+        _target = display
+    elif not scaled() or _target.get_size() != (w, h):
+        _target = pygame.Surface((w, h)).convert(display)
+    _display = display
+    _to_target = (w / dw, h / dh)
+    return _target
+
+
+def scaled():
+    return _target is not None and _target is not _display
+
+
+def mouse_pos():
+    """鼠标位置 (内部画布坐标)"""
+    x, y = pygame.mouse.get_pos()
+    if _target is None or _target is _display:
+        return x, y
+    return int(x * _to_target[0]), int(y * _to_target[1])
+
+
+def present(rects=None):
+    """
+    提交一帧。rects 为内部坐标的脏矩形 (None = 整屏)。
+    缩放时任何变化都整屏放大提交; 没有脏矩形则什么都不做。
+    """
+    if _target is None or _target is _display:
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        return
+    if rects is not None and not rects:
+        return
+    pygame.transform.scale(_target, _display.get_size(), _display)
+    pygame.display.flip()
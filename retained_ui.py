@@ -0,0 +1,210 @@
+"""
+《暗夜割草者：深渊轮回》 — 保留模式界面层
+========================================
+局外界面 (图鉴 / 副本选择 / 角色升级 / 抽卡 / 结算) 的控件层。
+
+Scene  每帧由界面函数重新声明控件 (label / button / rect / blit ...),
+       控件贴图 (描边文字、按钮底板、自定义贴图) 按内容 key 缓存, 只有内容或悬停状态变化才重新渲染;
+       声明完成后 present() 与上一帧的控件集合比较, 只重绘发生变化的区域,
+       并把这些区域记入 dirty, 主循环据此调用 pygame.display.update(dirty) 代替整屏 flip。
+       dynamic() 声明的控件 (带动画的角色预览等) 每帧都算作脏区域。
+
+以下情况整屏重绘: 首帧、切换界面、换了目标 Surface / 背景、invalidate() 之后 (其他状态画过屏幕),
+以及脏区域总面积超过 FULL_RATIO。
+========================================
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+import render_scale
+
+FULL_RATIO = 0.5        # 脏区域超过屏幕面积的这个比例时直接整屏重绘
+SURFACE_CACHE = 768     # 缓存的控件贴图数量上限
+
+
+def _blit(target, surf, pos):
+    target.blit(surf, pos)
+
+
+def _rect(target, color, rect, width, radius):
+    pygame.draw.rect(target, color, rect, width, border_radius=radius)
+
+
+def _circle(target, color, center, radius, width):
+    pygame.draw.circle(target, color, center, radius, width)
+
+
+def _call(target, draw):
+    draw(target)
+
+
+class Scene:
+    def __init__(self, render_text):
+        """render_text(font, text, color) → Surface, 即各模块的描边文字渲染"""
+        self._render_text = render_text
+        self._cache = OrderedDict()
+        self._ops = []          # 本帧声明: (rect, fn, args)
+        self._keys = set()      # 本帧静态控件: (key, rect 元组)
+        self._prev = set()
+        self._dynamic = []
+        self._surface = None
+        self._name = None
+        self._bg = None
+        self._full = True
+        self.dirty = []
+
+    # ==== 状态 ====
+    def invalidate(self):
+        """屏幕被其他界面画过, 下一帧整屏重绘"""
+        self._full = True
+
+    def reset(self):
+        """字体/分辨率变化: 清空贴图缓存并整屏重绘"""
+        self._cache.clear()
+        self._prev = set()
+        self._full = True
+
+    def begin(self, surface, name, bg):
+        """
+        开始声明一帧。name 标识界面; bg 为底色 (RGB) 或整屏背景 Surface。
+        """
+        if surface is not self._surface or name != self._name or bg != self._bg:
+            self._full = True
+        self._surface = surface
+        self._name = name
+        self._bg = bg
+        self._ops = []
+        self._keys = set()
+        self._dynamic = []
+
+    # ==== 贴图缓存 ====
+    def cached(self, key, build):
+        """按 key 缓存 build() 生成的贴图"""
+        cache = self._cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = build()
+            cache[key] = surf
+            if len(cache) > SURFACE_CACHE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surf
+
+    def text(self, font, text, color):
+        return self.cached(('text', id(font), text, color),
+                           lambda: self._render_text(font, text, color))
+
+    # ==== 控件声明 ====
+    def blit(self, surf, pos, key):
+        """key 描述 surf 的内容; key 与位置都不变的控件不会重绘"""
+        rect = surf.get_rect(topleft=pos)
+        self._ops.append((rect, _blit, (surf, rect.topleft)))
+        self._keys.add((key, tuple(rect)))
+        return rect
+
+    def label(self, font, text, color, pos, anchor='topleft'):
+        """描边文字; pos 为 anchor 指定的锚点 (topleft / midtop / topright / center)"""
+        surf = self.text(font, text, color)
+        rect = surf.get_rect(**{anchor: pos})
+        self._ops.append((rect, _blit, (surf, rect.topleft)))
+        self._keys.add((('text', id(font), text, color), tuple(rect)))
+        return rect
+
+    def rect(self, color, rect, width=0, radius=0):
+        rect = pygame.Rect(rect)
+        self._ops.append((rect, _rect, (color, rect, width, radius)))
+        self._keys.add((('rect', color, width, radius), tuple(rect)))
+        return rect
+
+    def circle(self, color, center, radius, width=0):
+        bounds = pygame.Rect(center[0] - radius, center[1] - radius, radius * 2 + 1, radius * 2 + 1)
+        self._ops.append((bounds, _circle, (color, center, radius, width)))
+        self._keys.add((('circle', color, tuple(center), radius, width), tuple(bounds)))
+        return bounds
+
+    def static(self, rect, key, draw):
+        """自定义绘制 draw(surface), 结果只由 key 决定; rect 需覆盖全部绘制范围"""
+        rect = pygame.Rect(rect)
+        self._ops.append((rect, _call, (draw,)))
+        self._keys.add((key, tuple(rect)))
+        return rect
+
+    def dynamic(self, rect, draw):
+        """每帧都要重绘的控件 (动画); rect 需覆盖全部绘制范围"""
+        rect = pygame.Rect(rect)
+        self._ops.append((rect, _call, (draw,)))
+        self._dynamic.append(rect)
+        return rect
+
+    def button(self, rect, text, color, font, hover_check=True):
+        """与 meta_systems.draw_button 外观一致的按钮, 返回是否悬停"""
+        hover = rect.collidepoint(render_scale.mouse_pos()) if hover_check else False
+        bc = color if hover else tuple(max(0, c - 60) for c in color)
+        w, h = rect.size
+
+        def build():
+            bs = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(bs, (*bc, 80 if hover else 30), (0, 0, w, h), border_radius=8)
+            pygame.draw.rect(bs, (*bc, 200 if hover else 100), (0, 0, w, h), 2, border_radius=8)
+            return bs
+
+        self.blit(self.cached(('button', w, h, bc, hover), build), rect.topleft,
+                  ('button', w, h, bc, hover))
+        self.label(font, text, color, rect.center, 'center')
+        return hover
+
+    # ==== 提交 ====
+    def _paint(self, clip):
+        surface = self._surface
+        surface.set_clip(clip)
+        if isinstance(self._bg, pygame.Surface):
+            surface.blit(self._bg, (0, 0))
+        else:
+            surface.fill(self._bg)
+        for rect, fn, args in self._ops:
+            if clip is None or rect.colliderect(clip):
+                fn(surface, *args)
+        surface.set_clip(None)
+
+    def present(self):
+        """重绘变化的区域, 返回 (并记入 self.dirty) 需要提交到显示器的矩形列表"""
+        surface = self._surface
+        screen_rect = surface.get_rect()
+        keys = self._keys
+        if self._full:
+            rects = None
+        else:
+            rects = [pygame.Rect(r) for _, r in self._prev ^ keys]
+            rects.extend(self._dynamic)
+            rects = _merge([r.clip(screen_rect) for r in rects if r.colliderect(screen_rect)])
+            if sum(r.w * r.h for r in rects) > screen_rect.w * screen_rect.h * FULL_RATIO:
+                rects = None
+        if rects is None:
+            self._paint(None)
+            rects = [screen_rect]
+        else:
+            for r in rects:
+                self._paint(r)
+        self._prev = keys
+        self._full = False
+        self.dirty = rects
+        return rects
+
+
+def _merge(rects):
+    """把相交的矩形合并成外接矩形, 避免重叠区域重复绘制"""
+    out = []
+    for r in rects:
+        merged = True
+        while merged:
+            merged = False
+            for i, o in enumerate(out):
+                if o.colliderect(r):
+                    r = r.union(out.pop(i))
+                    merged = True
+                    break
+        out.append(r)
+    return out
@@ -0,0 +1,182 @@
+"""
+《暗夜割草者：深渊轮回》 — 存档存储
+========================================
+save_data.json   快照 (紧凑 JSON)
+save_data.json.log  追加日志, 每行一次保存中发生变化的顶层键:
+                    {"set": {key: value, ...}, "del": [key, ...]}
+读取 = 快照 + 按顺序重放日志 (末尾写了一半的行直接丢弃)。
+
+save() 在调用线程上把各顶层键编码成快照 (此刻的完整状态, 不会捕获到多键修改的中间态),
+后台线程只做 I/O, 在 debounce 时间后合并写入最新快照:
+  每个快照带 save() 的序号, 比已写入的旧就丢弃 (后台线程与 flush() 可能交错, 旧快照不能覆盖新的);
+  与上次写入的编码逐键比较, 只把变化的键追加到日志;
+  日志超过阈值时压缩: 快照写临时文件 → fsync → os.replace 原子替换 → 清空日志。
+========================================
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+
+DEBOUNCE = 0.5               # 秒: 这段时间内的多次 save() 合并为一次写入
+MAX_DELAY = 2.0              # 秒: 连续 save() 时最长推迟这么久也要落盘
+COMPACT_LOG_BYTES = 256 * 1024
+COMPACT_LOG_RECORDS = 200
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _write_atomic(path, text):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class SaveStore:
+    def __init__(self, path, debounce=DEBOUNCE, on_error=None):
+        self.path = path
+        self.log_path = path + '.log'
+        self.debounce = debounce
+        self.on_error = on_error
+        self._pending = None     # 最近一次 save() 的 (序号, 快照 {key: 编码后的字符串})
+        self._seq = 0            # save() 次数
+        self._written_seq = 0    # 已落盘快照的序号
+        self._last = {}          # 已落盘的 {key: 编码后的字符串}
+        self._log_bytes = 0
+        self._log_records = 0
+        self._dirty_at = None    # 最近一次 save() 的时间
+        self._first_dirty = None # 本轮第一次 save() 的时间
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    # ---- 读取 ----
+    def load(self):
+        """读取快照并重放日志, 返回 dict; 没有存档返回 None, 快照损坏抛 json.JSONDecodeError"""
+        data = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            lines = []
+        for n, line in enumerate(lines):
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                # 崩溃时写了一半的最后一行: 截掉, 免得后续追加接在残行后面
+                lines = lines[:n]
+                _write_atomic(self.log_path, ''.join(lines))
+                break
+            if data is None:
+                data = {}
+            data.update(rec.get('set', {}))
+            for k in rec.get('del', ()):
+                data.pop(k, None)
+        if data is not None:
+            self._last = {k: _encode(v) for k, v in data.items()}
+            self._log_bytes = sum(len(l.encode('utf-8')) for l in lines)
+            self._log_records = len(lines)
+        return data
+
+    # ---- 写入 ----
+    def save(self, data):
+        """在调用线程上编码快照, 由后台线程合并写入"""
+        try:
+            enc = {k: _encode(v) for k, v in data.items()}
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
+            return
+        with self._cond:
+            self._seq += 1
+            self._pending = (self._seq, enc)
+            self._dirty_at = time.monotonic()
+            if self._first_dirty is None:
+                self._first_dirty = self._dirty_at
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            self._cond.notify()
+
+    def flush(self):
+        """立即写入尚未落盘的变化 (退出前调用)"""
+        with self._cond:
+            pending = self._dirty_at is not None
+            self._dirty_at = self._first_dirty = None
+            snapshot = self._pending
+        if pending:
+            self._write(*snapshot)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._dirty_at is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                now = time.monotonic()
+                wait = min(self._dirty_at + self.debounce,
+                           self._first_dirty + MAX_DELAY) - now
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                self._dirty_at = self._first_dirty = None
+                snapshot = self._pending
+            self._write(*snapshot)
+
+    def _write(self, seq, enc):
+        """enc 为第 seq 次 save() 编码好的快照, 这里不再访问存档 dict"""
+        with self._io_lock:
+            if seq <= self._written_seq:
+                return           # 更新的快照已由另一线程写入
+            try:
+                changed = [k for k, e in enc.items() if self._last.get(k) != e]
+                removed = [k for k in self._last if k not in enc]
+                if not changed and not removed:
+                    self._written_seq = seq
+                    return
+                # 先追加日志再视情况压缩: 日志末态始终等于最新快照, 任意时刻崩溃都可完整恢复
+                sets = ','.join(f'{_encode(k)}:{enc[k]}' for k in changed)
+                line = f'{{"set":{{{sets}}},"del":{_encode(removed)}}}\n'
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._log_bytes += len(line.encode('utf-8'))
+                self._log_records += 1
+                if (self._log_records >= COMPACT_LOG_RECORDS
+                        or self._log_bytes >= COMPACT_LOG_BYTES):
+                    self._compact(enc)
+                self._last = enc
+                self._written_seq = seq
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+
+    def _compact(self, enc):
+        body = ','.join(f'{_encode(k)}:{v}' for k, v in enc.items())
+        _write_atomic(self.path, '{' + body + '}')
+        # 快照已包含日志中的全部变化; 清空前崩溃的话重放日志得到的仍是同一状态
+        _write_atomic(self.log_path, '')
+        self._log_bytes = 0
+        self._log_records = 0
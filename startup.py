@@ -0,0 +1,144 @@
+"""
+《暗夜割草者：深渊轮回》 — 启动流程
+========================================
+StartupTrace  记录各启动阶段耗时, 写出 startup_report.txt
+LoadingScreen 窗口创建后立即显示的加载界面 (只用默认字体, 不依赖系统字体扫描)
+LazyModule    首次用到时才导入的模块代理, 可在后台线程预取
+========================================
+"""
+
+import time
+import importlib
+import threading
+
+import pygame
+
+
+class StartupTrace:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases = []        # [(名称, 开始偏移, 耗时, 线程名)]
+        self._lock = threading.Lock()
+        self.on_phase = None    # 每个阶段开始时回调 (用于刷新加载界面)
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def record(self, name, start, elapsed):
+        with self._lock:
+            self.phases.append((name, start - self.t0, elapsed,
+                                threading.current_thread().name))
+
+    def report(self, path, title="startup"):
+        total = time.perf_counter() - self.t0
+        lines = [f"{title}: {total * 1000:.1f} ms since trace start", ""]
+        lines.append(f"{'phase':<28}{'start ms':>10}{'wall ms':>10}  thread")
+        for name, start, elapsed, thread in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"{name:<28}{start * 1000:>10.1f}{elapsed * 1000:>10.1f}  {thread}")
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            pass
+        return lines
+
+
+class _Phase:
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        if self.trace.on_phase and threading.current_thread() is threading.main_thread():
+            self.trace.on_phase(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class LoadingScreen:
+    """
+    启动期间的简易加载条。phases 为加载条出现后主线程依次进入的阶段名,
+    进入第 k 个阶段时加载条走到 k / len(phases); 不在列表中的阶段 (延迟导入等) 只刷新画面。
+    """
+    def __init__(self, screen, phases):
+        self.screen = screen
+        self.phases = list(phases)
+        self.total = max(1, len(self.phases))
+        self.step = 0
+        self.font = pygame.font.Font(None, 28)
+
+    def advance(self, name=None):
+        if name in self.phases:
+            self.step = max(self.step, self.phases.index(name) + 1)
+        self.draw()
+
+    def draw(self):
+        surf = pygame.display.get_surface() or self.screen
+        w, h = surf.get_size()
+        surf.fill((12, 12, 20))
+        bw, bh = min(480, w - 80), 10
+        bx, by = (w - bw) // 2, h // 2 + 20
+        pygame.draw.rect(surf, (40, 40, 60), (bx, by, bw, bh), border_radius=5)
+        fill = int(bw * self.step / self.total)
+        if fill > 0:
+            pygame.draw.rect(surf, (180, 80, 255), (bx, by, fill, bh), border_radius=5)
+        txt = self.font.render("Loading...", True, (200, 200, 220))
+        surf.blit(txt, ((w - txt.get_width()) // 2, by - 34))
+        pygame.display.flip()
+        pygame.event.pump()   # 保持窗口响应, 避免系统判定"未响应"
+
+
+class LazyModule:
+    """
+    模块代理: 第一次访问属性时才导入。
+    导入前对 init() 的调用只记下参数, 导入后自动补调最近一次。
+    """
+    def __init__(self, name, trace=None):
+        self._name = name
+        self._trace = trace
+        self._mod = None
+        self._init_args = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._mod is None:
+                if self._trace is not None:
+                    with self._trace.phase(f"import {self._name}"):
+                        mod = importlib.import_module(self._name)
+                else:
+                    mod = importlib.import_module(self._name)
+                if self._init_args is not None:
+                    mod.init(*self._init_args)
+                self._mod = mod
+        return self._mod
+
+    def init(self, *args):
+        if self._mod is None:
+            self._init_args = args
+        else:
+            self._mod.init(*args)
+
+    def prefetch(self):
+        """在后台线程导入 (只导入, init 仍在首次访问时补调, 保证在主线程执行)"""
+        def run():
+            try:
+                if self._trace is not None:
+                    with self._trace.phase(f"prefetch {self._name}"):
+                        importlib.import_module(self._name)
+                else:
+                    importlib.import_module(self._name)
+            except Exception:
+                pass
+        threading.Thread(target=run, name=f"prefetch-{self._name}", daemon=True).start()
+
+    @property
+    def loaded(self):
+        return self._mod is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
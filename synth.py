@@ -0,0 +1,220 @@
+"""
+《暗夜割草者：深渊轮回》 — 程序化音效合成
+========================================
+波形 / 包络 / 音符序列按整段缓冲一次算完 (装有 NumPy 时为数组运算),
+渲染出的 16bit PCM 以 参数哈希 为文件名缓存到磁盘,
+之后启动直接读字节交给 pygame.mixer.Sound(buffer=...), 不再重新合成。
+
+每种音色是一个 build(xp, t, i, n) 函数:
+  xp  运算命名空间: NumPy 时 t/i 为整段数组; 无 NumPy 时逐采样调用, t/i 为标量
+  t   时间(秒)  i 采样序号  n 总采样数
+同一个表达式在两种后端下结果一致, 纯 Python 回退只在首次生成缓存时付出代价。
+========================================
+"""
+
+import os
+import sys
+import math
+import array
+import random
+import hashlib
+import json
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SAMPLE_RATE = 22050
+SYNTH_VERSION = 1   # 改动合成算法时递增, 让旧缓存失效
+
+if getattr(sys, 'frozen', False):
+    CACHE_DIR = os.path.join(os.path.dirname(sys.executable), 'sfx_cache')
+else:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sfx_cache')
+
+
+# ============================================================
+#  运算后端
+# ============================================================
+class _ArrayOps:
+    """整段缓冲: 所有量都是长度 n 的数组"""
+    pi = math.pi
+
+    def __init__(self, n, seed):
+        self._n = n
+        self._rng = np.random.default_rng(seed)
+        self.sin = np.sin
+
+    @staticmethod
+    def where(cond, a, b):
+        return np.where(cond, a, b)
+
+    @staticmethod
+    def frac(x):
+        return np.mod(x, 1.0)
+
+    @staticmethod
+    def between(x, lo, hi):
+        return (x >= lo) & (x < hi)
+
+    def uniform(self, lo, hi):
+        return self._rng.uniform(lo, hi, self._n)
+
+
+class _ScalarOps:
+    """无 NumPy 时的逐采样回退"""
+    pi = math.pi
+    sin = staticmethod(math.sin)
+
+    def __init__(self, n, seed):
+        self._rng = random.Random(seed)
+
+    @staticmethod
+    def where(cond, a, b):
+        return a if cond else b
+
+    @staticmethod
+    def frac(x):
+        return x % 1.0
+
+    @staticmethod
+    def between(x, lo, hi):
+        return lo <= x < hi
+
+    def uniform(self, lo, hi):
+        return self._rng.uniform(lo, hi)
+
+
+def _render_pcm(build, dur, seed):
+    """执行 build, 截断取整并限幅到 int16, 返回 PCM 字节"""
+    n = int(SAMPLE_RATE * dur)
+    if np is not None:
+        i = np.arange(n, dtype=np.float64)
+        v = build(_ArrayOps(n, seed), i / SAMPLE_RATE, i, n)
+        v = np.clip(np.trunc(np.broadcast_to(v, (n,))), -32767, 32767)
+        return v.astype('<i2').tobytes()
+    ops = _ScalarOps(n, seed)
+    buf = array.array('h', bytes(2 * n))
+    for i in range(n):
+        v = int(build(ops, i / SAMPLE_RATE, i, n))
+        buf[i] = max(-32767, min(32767, v))
+    if sys.byteorder != 'little':
+        buf.byteswap()
+    return buf.tobytes()
+
+
+# ============================================================
+#  磁盘缓存
+# ============================================================
+def _cache_key(name, params):
+    raw = json.dumps([SYNTH_VERSION, SAMPLE_RATE, name, params], sort_keys=True)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def _cached_pcm(name, params, build, dur):
+    key = _cache_key(name, params)
+    path = os.path.join(CACHE_DIR, f"{name}_{key}.pcm")
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    # 噪声用参数哈希做种子, 保证缓存内容与参数一一对应
+    pcm = _render_pcm(build, dur, int(key, 16) & 0xFFFFFFFF)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(pcm)
+        os.replace(tmp, path)
+    except OSError:
+        pass   # 只读目录等情况下不缓存, 照常返回
+    return pcm
+
+
+def sound(name, params, build, dur):
+    """按参数取 (或合成并缓存) 一段 PCM, 包装为 pygame Sound"""
+    return pygame.mixer.Sound(buffer=_cached_pcm(name, params, build, dur))
+
+
+# ============================================================
+#  音色
+# ============================================================
+def _wave(xp, wave, phase):
+    """phase 为周期数 (频率×时间)"""
+    if wave == 'square':
+        return xp.where(xp.sin(2 * xp.pi * phase) > 0, 1.0, -1.0)
+    if wave in ('saw', 'sawtooth'):
+        return 2 * xp.frac(phase) - 1
+    return xp.sin(2 * xp.pi * phase)
+
+
+def tone(freq=440, dur=0.1, vol=0.3, wave='sine'):
+    """单音 + 线性淡出; wave: sine / square / saw(sawtooth) / noise"""
+    amp = int(32767 * vol)
+
+    def build(xp, t, i, n):
+        fade = 1.0 - i / n
+        if wave == 'noise':
+            v = xp.uniform(-amp, amp)
+        else:
+            v = amp * _wave(xp, wave, freq * t)
+        return v * fade
+    return sound('tone', [freq, dur, vol, wave], build, dur)
+
+
+def explosion(dur=0.3, amp=16000, freq=150):
+    """下滑正弦 + 白噪声各半"""
+    def build(xp, t, i, n):
+        fade = 1.0 - i / n
+        f = freq * (1.0 - t * 2)
+        return amp * fade * (xp.sin(2 * xp.pi * f * t) * 0.5 + xp.uniform(-1, 1) * 0.5)
+    return sound('explosion', [dur, amp, freq], build, dur)
+
+
+def sweep(f0, f1, dur, amp, fade_depth=0.3):
+    """音调从 f0 线性升到 f1 (按原算法 f(t)·t 计相位)"""
+    rate = (f1 - f0) / dur
+
+    def build(xp, t, i, n):
+        fade = 1.0 - (t / dur) * fade_depth
+        return amp * fade * xp.sin(2 * xp.pi * (f0 + t * rate) * t)
+    return sound('sweep', [f0, f1, dur, amp, fade_depth], build, dur)
+
+
+def roar(dur=0.6, amp=20000, base=80, wobble=30, wobble_rate=20):
+    """低频颤音 + 二次谐波 + 少量噪声, 淡出到一半音量"""
+    def build(xp, t, i, n):
+        fade = 1.0 - (i / n) * 0.5
+        f = base + xp.sin(t * wobble_rate) * wobble
+        return amp * fade * (xp.sin(2 * xp.pi * f * t) * 0.6 +
+                             xp.sin(2 * xp.pi * f * 2 * t) * 0.3 +
+                             xp.uniform(-1, 1) * 0.1)
+    return sound('roar', [dur, amp, base, wobble, wobble_rate], build, dur)
+
+
+def sequence(voices, dur, beat=None):
+    """
+    音符序列循环。
+    voices: [(amp, env_scale, [(freq, start, note_dur), ...]), ...]
+            每个音符用半个正弦窗做包络
+    beat:   (间隔, 长度, 幅度) 噪声鼓点, 可省略
+    """
+    def build(xp, t, i, n):
+        v = 0.0
+        for amp, env_scale, notes in voices:
+            for freq, start, nd in notes:
+                local = t - start
+                on = xp.between(local, 0, nd)
+                env = xp.sin(xp.pi * local / nd) * env_scale
+                v = v + xp.where(on, amp * env * xp.sin(2 * xp.pi * freq * t), 0.0)
+        if beat:
+            period, length, bamp = beat
+            pos = t % period
+            v = v + xp.where(pos < length,
+                             bamp * (1 - pos / length) * xp.uniform(-1, 1), 0.0)
+        return v
+    return sound('sequence', [voices, dur, beat], build, dur)
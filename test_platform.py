@@ -395,9 +395,7 @@ while running:
     for b in bosses_list:
         b.x += mx_move * dt
         b.y += my_move * dt
-        for bb in b.boss_bullets:
-            bb[0] += mx_move * dt
-            bb[1] += my_move * dt
+        b.boss_bullets.shift(mx_move * dt, my_move * dt)
     for b in bullets:
         b.x += mx_move * dt
         b.y += my_move * dt
@@ -0,0 +1,16 @@
+"""存档存储: 后台线程写入与退出时 flush() 交错, 旧快照不能覆盖新快照"""
+import sys
+sys.path.insert(0, '.')
+from save_store import SaveStore
+
+
+def test_stale_snapshot_after_close(tmp_path):
+    path = str(tmp_path / 'save_data.json')
+    store = SaveStore(path, debounce=60)     # 后台线程在测试期间不会自行写入
+    store.save({'gold': 1})                  # A
+    stale = store._pending                   # 后台线程取走 A 后被挂起
+    store.save({'gold': 2})                  # B
+    store.close()                            # flush() 先写入 B
+    store._write(*stale)                     # 后台线程恢复, 再写 A
+
+    assert SaveStore(path).load() == {'gold': 2}
@@ -10,7 +10,9 @@ import pygame
 import math
 import random
 import os
+from collections import OrderedDict
 import i18n
+import minimap
 
 # ---- 描边文字渲染 ----
 def _render_outlined(font, text, color, outline_color=(0, 0, 0), offset=1):
@@ -48,7 +50,7 @@ MAP_H = 1600
 
 
 def init(screen, font_lg, font_md, font_sm, font_xs, w, h):
-    global _screen, _font_lg, _font_md, _font_sm, _font_xs, WIDTH, HEIGHT
+    global _screen, _font_lg, _font_md, _font_sm, _font_xs, WIDTH, HEIGHT, _minimap_title
     _screen = screen
     _font_lg = font_lg
     _font_md = font_md
@@ -56,6 +58,7 @@ def init(screen, font_lg, font_md, font_sm, font_xs, w, h):
     _font_xs = font_xs
     WIDTH = w
     HEIGHT = h
+    _minimap_title = None   # 字体变化后重新渲染小地图标题
 
 
 # ========== 互动点定义 ==========
@@ -489,58 +492,134 @@ def draw_location_building(surface, loc, cam_x, cam_y, t):
 
 
 # ========== 地面绘制 ==========
-def draw_ground(surface, cam_x, cam_y, t):
-    """绘制城镇地面"""
-    # 基本地面
-    surface.fill((18, 22, 15))
-
-    # 地面纹理（草地格子）
-    tile_size = 60
-    start_tx = int(cam_x // tile_size) - 1
-    start_ty = int(cam_y // tile_size) - 1
-    end_tx = start_tx + WIDTH // tile_size + 3
-    end_ty = start_ty + HEIGHT // tile_size + 3
-
-    for tx in range(start_tx, end_tx):
-        for ty in range(start_ty, end_ty):
-            wx = tx * tile_size
-            wy = ty * tile_size
-            sx = wx - int(cam_x)
-            sy = wy - int(cam_y)
-
-            # 检查是否在地图内
+# ========== 地面分块缓存 ==========
+# 静态地面 (草地棋盘格、石板路、不动的装饰) 按 CHUNK_SIZE 见方烘焙成整块,
+# 首次进入视野时生成, 超过上限按最久未用淘汰; 每帧只需几次整块 blit。
+# 有动画的装饰 (树摇动 / 灯闪烁) 仍逐帧绘制。
+CHUNK_SIZE = 256
+CHUNK_LRU = 96          # 常驻块上限 (256×256 约 256KB/块)
+GROUND_TILE = 60
+OUTSIDE_COLOR = (8, 8, 12)
+STATIC_DECORATIONS = ('rock', 'wall_h')
+
+# 各装饰相对锚点的绘制范围 (x, y, w, h), 用于判断能否与动画装饰分层
+_DECO_BOUNDS = {
+    'tree':   (-20, -45, 40, 70),
+    'lamp':   (-25, -49, 50, 54),
+    'rock':   (-13, -7, 32, 14),
+    'wall_h': (-51, -16, 102, 32),
+}
+
+_chunks = OrderedDict()     # (cx, cy) → Surface
+_path_surfs = {}            # TOWN_PATHS 项 → 石板路 Surface
+_deco_split = None          # (烘焙进地面的装饰, 逐帧绘制的装饰)
+
+
+def _deco_rect(x, y, dec_type):
+    bx, by, bw, bh = _DECO_BOUNDS.get(dec_type, (-100, -100, 200, 200))
+    return pygame.Rect(x + bx, y + by, bw, bh)
+
+
+def _split_decorations():
+    """
+    静态装饰只有在不与任何动画装饰重叠时才烘焙,
+    否则继续按原列表顺序逐帧绘制, 保证遮挡关系不变。
+    """
+    global _deco_split
+    if _deco_split is None:
+        animated = [_deco_rect(x, y, d) for x, y, d in TOWN_DECORATIONS
+                    if d not in STATIC_DECORATIONS]
+        baked, live = [], []
+        for dec in TOWN_DECORATIONS:
+            if dec[2] in STATIC_DECORATIONS and _deco_rect(*dec).collidelist(animated) < 0:
+                baked.append(dec)
+            else:
+                live.append(dec)
+        _deco_split = (baked, live)
+    return _deco_split
+
+
+def _path_surface(path):
+    surf = _path_surfs.get(path)
+    if surf is not None:
+        return surf
+    px, py, pw, ph = path
+    surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (45, 42, 38, 200), (0, 0, pw, ph), border_radius=3)
+    # 石板纹理
+    stone_size = 28
+    for si in range(0, pw, stone_size):
+        for sj in range(0, ph, stone_size):
+            offset = (sj // stone_size % 2) * stone_size // 2
+            sx2 = si + offset
+            if sx2 < pw and sj < ph:
+                sw = min(stone_size - 2, pw - sx2 - 1)
+                sh = min(stone_size - 2, ph - sj - 1)
+                if sw > 2 and sh > 2:
+                    shade = random.Random(si * 100 + sj).randint(0, 8)
+                    pygame.draw.rect(surf, (50 + shade, 47 + shade, 42 + shade, 180),
+                                     (sx2, sj, sw, sh), border_radius=1)
+    _path_surfs[path] = surf
+    return surf
+
+
+def _render_chunk(cx, cy):
+    size = CHUNK_SIZE
+    wx0, wy0 = cx * size, cy * size
+    surf = pygame.Surface((size, size))
+    # 地图外 — 暗色
+    surf.fill(OUTSIDE_COLOR)
+
+    # 棋盘格草地
+    ts = GROUND_TILE
+    for tx in range(wx0 // ts, (wx0 + size - 1) // ts + 1):
+        for ty in range(wy0 // ts, (wy0 + size - 1) // ts + 1):
+            wx = tx * ts
+            wy = ty * ts
             if wx < 0 or wx >= MAP_W or wy < 0 or wy >= MAP_H:
-                # 地图外 — 暗色
-                pygame.draw.rect(surface, (8, 8, 12), (sx, sy, tile_size, tile_size))
                 continue
-
-            # 棋盘格草地
             shade = 3 if (tx + ty) % 2 == 0 else 0
             grass_color = (22 + shade, 28 + shade, 18 + shade)
-            pygame.draw.rect(surface, grass_color, (sx, sy, tile_size, tile_size))
+            pygame.draw.rect(surf, grass_color, (wx - wx0, wy - wy0, ts, ts))
 
     # 石板路径
-    for px, py, pw, ph in TOWN_PATHS:
-        psx = int(px - cam_x)
-        psy = int(py - cam_y)
-        if psx > WIDTH + 100 or psx + pw < -100 or psy > HEIGHT + 100 or psy + ph < -100:
-            continue
-        path_surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
-        pygame.draw.rect(path_surf, (45, 42, 38, 200), (0, 0, pw, ph), border_radius=3)
-        # 石板纹理
-        stone_size = 28
-        for si in range(0, pw, stone_size):
-            for sj in range(0, ph, stone_size):
-                offset = (sj // stone_size % 2) * stone_size // 2
-                sx2 = si + offset
-                if sx2 < pw and sj < ph:
-                    sw = min(stone_size - 2, pw - sx2 - 1)
-                    sh = min(stone_size - 2, ph - sj - 1)
-                    if sw > 2 and sh > 2:
-                        shade = random.Random(si * 100 + sj).randint(0, 8)
-                        pygame.draw.rect(path_surf, (50 + shade, 47 + shade, 42 + shade, 180),
-                                         (sx2, sj, sw, sh), border_radius=1)
-        surface.blit(path_surf, (psx, psy))
+    area = pygame.Rect(wx0, wy0, size, size)
+    for path in TOWN_PATHS:
+        if area.colliderect(path):
+            surf.blit(_path_surface(path), (path[0] - wx0, path[1] - wy0))
+
+    # 静态装饰
+    for x, y, dec_type in _split_decorations()[0]:
+        if area.colliderect(_deco_rect(x, y, dec_type)):
+            draw_decoration(surf, x, y, dec_type, wx0, wy0, 0)
+
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return surf
+
+
+def _get_chunk(key, limit):
+    surf = _chunks.get(key)
+    if surf is not None:
+        _chunks.move_to_end(key)
+        return surf
+    surf = _chunks[key] = _render_chunk(*key)
+    while len(_chunks) > limit:
+        _chunks.popitem(last=False)
+    return surf
+
+
+def draw_ground(surface, cam_x, cam_y, t):
+    """绘制城镇地面 (按块缓存的静态层)"""
+    size = CHUNK_SIZE
+    ix, iy = int(cam_x), int(cam_y)
+    cxs = range(ix // size, (ix + WIDTH - 1) // size + 1)
+    cys = range(iy // size, (iy + HEIGHT - 1) // size + 1)
+    # 上限至少容纳一屏, 避免大分辨率下同一帧内互相淘汰
+    limit = max(CHUNK_LRU, len(cxs) * len(cys))
+    for cy in cys:
+        for cx in cxs:
+            surface.blit(_get_chunk((cx, cy), limit), (cx * size - ix, cy * size - iy))
 
 
 # ========== 互动提示 ==========
@@ -582,52 +661,59 @@ def draw_interaction_prompt(surface, loc, cam_x, cam_y, t):
 
 
 # ========== 小地图 ==========
-def draw_minimap(surface, player, t):
-    """绘制右上角小地图"""
-    mm_w, mm_h = 180, 120
-    mm_x, mm_y = WIDTH - mm_w - 15, 15
+MINIMAP_SIZE = (180, 120)
+_minimap = None
+_minimap_title = None
+
 
-    mm = pygame.Surface((mm_w, mm_h), pygame.SRCALPHA)
+def _bake_minimap(mm):
+    mm_w, mm_h = MINIMAP_SIZE
     pygame.draw.rect(mm, (10, 10, 15, 180), (0, 0, mm_w, mm_h), border_radius=5)
     pygame.draw.rect(mm, (80, 80, 100, 120), (0, 0, mm_w, mm_h), 1, border_radius=5)
 
-    # 缩放比例
-    scale_x = (mm_w - 10) / MAP_W
-    scale_y = (mm_h - 10) / MAP_H
-
     # 路径
     for px, py, pw, ph in TOWN_PATHS:
-        rx = int(5 + px * scale_x)
-        ry = int(5 + py * scale_y)
-        rw = max(2, int(pw * scale_x))
-        rh = max(2, int(ph * scale_y))
+        rx, ry = _minimap.to_map(px, py)
+        rw = max(2, int(pw * _minimap.scale_x))
+        rh = max(2, int(ph * _minimap.scale_y))
         pygame.draw.rect(mm, (50, 48, 42, 150), (rx, ry, rw, rh))
 
     # 互动点
     for loc in TOWN_LOCATIONS:
-        lx = int(5 + loc.x * scale_x)
-        ly = int(5 + loc.y * scale_y)
-        pygame.draw.circle(mm, (*loc.color, 200), (lx, ly), 3)
+        pygame.draw.circle(mm, (*loc.color, 200), _minimap.to_map(loc.x, loc.y), 3)
+
+
+def draw_minimap(surface, player, t):
+    """绘制右上角小地图 (静态层缓存, 每帧只叠加玩家和视野框)"""
+    global _minimap, _minimap_title
+    mm_w, mm_h = MINIMAP_SIZE
+    mm_x, mm_y = WIDTH - mm_w - 15, 15
+
+    if _minimap is None:
+        _minimap = minimap.Minimap(MINIMAP_SIZE, (0, 0, MAP_W, MAP_H))
+    surface.blit(_minimap.static_layer((MAP_W, MAP_H), _bake_minimap), (mm_x, mm_y))
 
     # 玩家
-    pp_x = int(5 + player.x * scale_x)
-    pp_y = int(5 + player.y * scale_y)
     pulse = (math.sin(t * 5) + 1) * 0.5
-    pygame.draw.circle(mm, (255, 255, 255, 220), (pp_x, pp_y), int(3 + pulse))
+    _minimap.blit_dot(surface, (mm_x, mm_y), player.x, player.y,
+                      (255, 255, 255, 220), int(3 + pulse))
 
     # 视野框
-    vw = int(WIDTH * scale_x)
-    vh = int(HEIGHT * scale_y)
+    vw = int(WIDTH * _minimap.scale_x)
+    vh = int(HEIGHT * _minimap.scale_y)
     cam_x = player.x - WIDTH // 2
     cam_y = player.y - HEIGHT // 2
-    vx = int(5 + max(0, cam_x) * scale_x)
-    vy = int(5 + max(0, cam_y) * scale_y)
-    pygame.draw.rect(mm, (255, 255, 255, 60), (vx, vy, vw, vh), 1)
-
-    surface.blit(mm, (mm_x, mm_y))
+    vx, vy = _minimap.to_map(max(0, cam_x), max(0, cam_y))
+    # 靠近地图右 / 下边缘时视野框会超出小地图, 裁剪到小地图范围内
+    old_clip = surface.get_clip()
+    surface.set_clip(pygame.Rect(mm_x, mm_y, mm_w, mm_h).clip(old_clip))
+    surface.blit(_minimap.frame(vw, vh, (255, 255, 255, 60)), (mm_x + vx, mm_y + vy))
+    surface.set_clip(old_clip)
 
     # 标题
-    mt = _render_outlined(_font_xs, "深渊城镇", (120, 120, 140))
+    if _minimap_title is None:
+        _minimap_title = _render_outlined(_font_xs, "深渊城镇", (120, 120, 140))
+    mt = _minimap_title
     surface.blit(mt, (mm_x + mm_w // 2 - mt.get_width() // 2, mm_y + mm_h + 3))
 
 
@@ -665,7 +751,7 @@ def draw_town(surface, player, save_data, t):
     draw_ground(surface, cam_x, cam_y, t)
 
     # 装饰物（先画远处的）
-    for dx, dy, dt_type in TOWN_DECORATIONS:
+    for dx, dy, dt_type in _split_decorations()[1]:
         draw_decoration(surface, dx, dy, dt_type, cam_x, cam_y, t)
 
     # 互动点建筑
@@ -0,0 +1,301 @@
+"""
+《暗夜割草者：深渊轮回》 — 局外装备仓库
+========================================
+存档中的列式存储 (save_data['warehouse']):
+  {'template': [...], 'level': [...], 'ascend': [...]}
+  下标即装备 ID, 出售后该位置 template 记为 -1, 之后新装备复用空位,
+  因此 ID 在装备存续期间始终不变, meta_equipped 里记录的就是 ID。
+
+内存中额外维护 (加载时一次性构建, 之后增量更新):
+  _owner            ID → (角色key, 部位) 反向索引
+  _idle[rarity]     未穿戴的 ID 集合 (可出售候选)
+  _idle_lv[rarity]  未穿戴装备的等级和, 配合数量即可 O(1) 得到出售总价
+  _groups[(rarity, slot)]  按品质 + 部位分组的 ID (组内为获得顺序), 供筛选 / 排序视图使用
+出售 / 穿戴 / 卸下 的开销只与涉及的装备数量有关。
+
+view() 返回按品质 / 部位过滤、按获得顺序或品质排序的视图,
+界面只取当前窗口内的 ID (window), 不会遍历或排序整个仓库。
+========================================
+"""
+
+import heapq
+from itertools import islice
+
+EMPTY = -1
+
+# 视图排序方式
+ORDER_NEW = 'new'          # 获得顺序
+ORDER_RARITY = 'rarity'    # 品质从高到低, 同品质按部位, 再按获得顺序
+ORDERS = (ORDER_NEW, ORDER_RARITY)
+
+RARITY_ORDER = ('legendary', 'epic', 'rare', 'uncommon', 'common')
+SLOT_ORDER = ('weapon', 'armor', 'accessory', 'rune')
+
+
+def new_state():
+    return {'template': [], 'level': [], 'ascend': []}
+
+
+def state_from_list(meta_equipment):
+    """旧存档的 [{template_idx, level, ascend}] → 列式, 下标保持不变"""
+    st = new_state()
+    for meq in meta_equipment:
+        st['template'].append(meq.get('template_idx', 0))
+        st['level'].append(meq.get('level', 1))
+        st['ascend'].append(meq.get('ascend', 0))
+    return st
+
+
+class Warehouse:
+    def __init__(self, state, equipped, catalog, sell_base, sell_per_level):
+        self.state = state
+        self.equipped = equipped            # {char_key: {slot: id}}, 与存档共用
+        self.catalog = catalog
+        self.sell_base = sell_base          # {rarity: 基础售价}
+        self.sell_per_level = sell_per_level
+        self._tpl = state['template']
+        self._lv = state['level']
+        self._asc = state['ascend']
+        self._rarity = [None] * len(self._tpl)
+        self._slot = [None] * len(self._tpl)
+        self._seq = [0] * len(self._tpl)    # 获得序号, 筛选视图按它归并各分组
+        self._next_seq = 0
+        self._groups = {}                   # (rarity, slot) → 有序 ID 字典
+        self._owner = {}
+        self._live = {}                     # 有序: 现存 ID (字典保持插入顺序)
+        self._free = []
+        self._idle = {}
+        self._idle_lv = {}
+        n_db = len(catalog)
+        for i, t in enumerate(self._tpl):
+            if t == EMPTY:
+                self._free.append(i)
+                continue
+            self._live[i] = None
+            if 0 <= t < n_db:
+                self._rarity[i] = catalog[t][2]
+                self._slot[i] = catalog[t][1]
+            self._group_add(i)
+        self._free.reverse()                # pop() 优先复用小 ID
+        # 清理指向不存在装备的绑定
+        for ck, binds in list(equipped.items()):
+            for slot, iid in list(binds.items()):
+                if iid in self._live and iid not in self._owner:
+                    self._owner[iid] = (ck, slot)
+                else:
+                    del binds[slot]
+        for i in self._live:
+            if i not in self._owner:
+                self._mark_idle(i)
+
+    # ---- 聚合 ----
+    def _group_add(self, iid):
+        self._seq[iid] = self._next_seq
+        self._next_seq += 1
+        key = (self._rarity[iid], self._slot[iid])
+        self._groups.setdefault(key, {})[iid] = None
+
+    def _group_remove(self, iid):
+        del self._groups[(self._rarity[iid], self._slot[iid])][iid]
+
+    def _mark_idle(self, iid):
+        r = self._rarity[iid]
+        if r is None:
+            return
+        self._idle.setdefault(r, set()).add(iid)
+        self._idle_lv[r] = self._idle_lv.get(r, 0) + self._lv[iid]
+
+    def _unmark_idle(self, iid):
+        r = self._rarity[iid]
+        if r is None:
+            return
+        self._idle[r].discard(iid)
+        self._idle_lv[r] -= self._lv[iid]
+
+    # ---- 查询 ----
+    def __len__(self):
+        return len(self._live)
+
+    def __contains__(self, iid):
+        return iid in self._live
+
+    def ids(self, start=0, count=None):
+        """按显示顺序返回 ID 列表 (可分页)"""
+        stop = None if count is None else start + count
+        return list(islice(self._live, start, stop))
+
+    def view(self, rarity=None, slot=None, order=ORDER_NEW):
+        """按品质 / 部位 (None = 全部) 过滤、按 order 排序的视图"""
+        return WarehouseView(self, rarity, slot, order)
+
+    def template(self, iid):
+        return self._tpl[iid]
+
+    def level(self, iid):
+        return self._lv[iid]
+
+    def ascend(self, iid):
+        return self._asc[iid]
+
+    def rarity(self, iid):
+        return self._rarity[iid]
+
+    def slot(self, iid):
+        return self._slot[iid]
+
+    def owner(self, iid):
+        """(角色key, 部位) 或 None"""
+        return self._owner.get(iid)
+
+    def equipped_of(self, char_key):
+        return self.equipped.get(char_key, {})
+
+    def sellable(self, keep_rarities):
+        """(可出售数量, 预计金币), 只看品质数量级的聚合"""
+        count = gold = 0
+        for r, ids in self._idle.items():
+            if r in keep_rarities or not ids:
+                continue
+            count += len(ids)
+            gold += len(ids) * self.sell_base.get(r, 10) + self._idle_lv[r] * self.sell_per_level
+        return count, gold
+
+    # ---- 修改 ----
+    def add(self, template_idx, level=1, ascend=0):
+        if self._free:
+            iid = self._free.pop()
+            self._tpl[iid] = template_idx
+            self._lv[iid] = level
+            self._asc[iid] = ascend
+        else:
+            iid = len(self._tpl)
+            self._tpl.append(template_idx)
+            self._lv.append(level)
+            self._asc.append(ascend)
+            self._rarity.append(None)
+            self._slot.append(None)
+            self._seq.append(0)
+        known = 0 <= template_idx < len(self.catalog)
+        self._rarity[iid] = self.catalog[template_idx][2] if known else None
+        self._slot[iid] = self.catalog[template_idx][1] if known else None
+        self._live[iid] = None
+        self._group_add(iid)
+        self._mark_idle(iid)
+        return iid
+
+    def set_level(self, iid, level, ascend=None):
+        idle = iid not in self._owner
+        if idle:
+            self._unmark_idle(iid)
+        self._lv[iid] = level
+        if ascend is not None:
+            self._asc[iid] = ascend
+        if idle:
+            self._mark_idle(iid)
+
+    def remove(self, iid):
+        """移除一件未穿戴的装备"""
+        self._unmark_idle(iid)
+        self._group_remove(iid)
+        del self._live[iid]
+        self._tpl[iid] = EMPTY
+        self._lv[iid] = 0
+        self._asc[iid] = 0
+        self._rarity[iid] = None
+        self._slot[iid] = None
+        self._free.append(iid)
+
+    def sell(self, keep_rarities):
+        """出售所有未穿戴且品质不在保留列表中的装备, 返回 (数量, 金币)"""
+        count, gold = self.sellable(keep_rarities)
+        for r in list(self._idle):
+            if r in keep_rarities:
+                continue
+            for iid in list(self._idle[r]):
+                self.remove(iid)
+        return count, gold
+
+    def equip(self, char_key, iid):
+        """穿戴到角色对应部位; 已穿在该角色身上则卸下。返回 True/False"""
+        if iid not in self._live or self._rarity[iid] is None:
+            return False
+        slot = self.catalog[self._tpl[iid]][1]
+        binds = self.equipped.setdefault(char_key, {})
+        cur = self._owner.get(iid)
+        if cur == (char_key, slot):
+            self.unequip(char_key, slot)
+            return True
+        if cur is not None:
+            # 从其他角色身上卸下
+            del self.equipped[cur[0]][cur[1]]
+        else:
+            self._unmark_idle(iid)
+        prev = binds.get(slot)
+        if prev is not None:
+            del self._owner[prev]
+            self._mark_idle(prev)
+        binds[slot] = iid
+        self._owner[iid] = (char_key, slot)
+        return True
+
+    def unequip(self, char_key, slot):
+        binds = self.equipped.get(char_key)
+        if not binds or slot not in binds:
+            return False
+        iid = binds.pop(slot)
+        del self._owner[iid]
+        self._mark_idle(iid)
+        return True
+
+
+class WarehouseView:
+    """
+    仓库的过滤 / 排序视图。不复制 ID 列表, 只记录参与的分组;
+    len() 为各组大小之和, window() 跳过整组后只遍历窗口附近的 ID。
+    仓库增删后视图自动反映最新内容。
+    """
+
+    def __init__(self, wh, rarity=None, slot=None, order=ORDER_NEW):
+        self.wh = wh
+        self.order = order
+        self.filtered = rarity is not None or slot is not None
+        keys = [(r, s) for r in RARITY_ORDER if rarity in (None, r)
+                for s in SLOT_ORDER if slot in (None, s)]
+        self._keys = keys
+        self._keyset = set(keys)
+
+    def _group_list(self):
+        groups = self.wh._groups
+        out = [groups[k] for k in self._keys if groups.get(k)]
+        if not self.filtered:
+            # 模板失效 (品质 / 部位未知) 的装备只出现在未过滤的视图末尾
+            out.extend(g for k, g in groups.items() if k not in self._keyset and g)
+        return out
+
+    def __len__(self):
+        if not self.filtered:
+            return len(self.wh)
+        return sum(len(g) for g in self._group_list())
+
+    def window(self, start, count):
+        """视图中第 start 个起的 count 个 ID"""
+        stop = start + count
+        if self.order == ORDER_NEW:
+            if not self.filtered:
+                return list(islice(self.wh._live, start, stop))
+            groups = self._group_list()
+            if len(groups) == 1:
+                return list(islice(groups[0], start, stop))
+            merged = heapq.merge(*groups, key=self.wh._seq.__getitem__)
+            return list(islice(merged, start, stop))
+        out = []
+        for g in self._group_list():
+            n = len(g)
+            if start >= n:
+                start -= n
+                continue
+            out.extend(islice(g, start, start + count - len(out)))
+            start = 0
+            if len(out) >= count:
+                break
+        return out